@@ -0,0 +1,182 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Append-only manifests of the artifact versions of a FileArtifactService scope.
+
+A manifest is a JSONL file next to the directory of a scope (the artifacts of a
+user, or of a session). Each line records a saved version, with its metadata,
+or a deleted artifact. Lines are appended with a single `write` on a file
+opened in append mode, so concurrent writers never interleave partial records,
+and readers only read the lines appended since their last read.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from pydantic import ValidationError
+
+logger = logging.getLogger("google_adk." + __name__)
+
+MANIFEST_FILENAME = "manifest.jsonl"
+
+_SAVE_OP = "save"
+_DELETE_OP = "delete"
+
+
+def _save_record(
+    path: str, version: int, metadata: Optional[dict[str, Any]]
+) -> dict[str, Any]:
+  record: dict[str, Any] = {"op": _SAVE_OP, "path": path, "version": version}
+  if metadata is not None:
+    record["metadata"] = metadata
+  return record
+
+
+def _encode(record: dict[str, Any]) -> bytes:
+  return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class ArtifactManifest:
+  """The artifact versions of one scope, as recorded in its manifest file.
+
+  Artifacts are keyed by their path relative to the scope directory. Versions
+  map to their metadata, parsed with `parse_metadata`, or to None for versions
+  without readable metadata. This class is thread-safe.
+  """
+
+  def __init__(
+      self,
+      path: Path,
+      parse_metadata: Callable[[dict[str, Any]], Any],
+  ):
+    self.path = path
+    self._parse_metadata = parse_metadata
+    self._artifacts: dict[str, dict[int, Any]] = {}
+    self._offset = 0
+    self._inode: Optional[int] = None
+    self._lock = threading.Lock()
+
+  def refresh(self) -> bool:
+    """Reads the records appended since the last read.
+
+    Returns:
+      Whether the manifest file exists.
+    """
+    with self._lock:
+      try:
+        stat = os.stat(self.path)
+      except FileNotFoundError:
+        self._reset(None)
+        return False
+      if stat.st_ino != self._inode or stat.st_size < self._offset:
+        # The manifest was rebuilt.
+        self._reset(stat.st_ino)
+      if stat.st_size > self._offset:
+        with open(self.path, "rb") as f:
+          f.seek(self._offset)
+          data = f.read()
+        # A record being appended may not be complete yet.
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+          self._apply(line)
+        self._offset += end
+      return True
+
+  def _reset(self, inode: Optional[int]) -> None:
+    self._artifacts = {}
+    self._offset = 0
+    self._inode = inode
+
+  def _apply(self, line: bytes) -> None:
+    try:
+      record = json.loads(line)
+      path = record["path"]
+      if record["op"] == _DELETE_OP:
+        self._artifacts.pop(path, None)
+        return
+      metadata = record.get("metadata")
+      if metadata is not None:
+        metadata = self._parse_metadata(metadata)
+      self._artifacts.setdefault(path, {})[record["version"]] = metadata
+    except (ValueError, KeyError, TypeError, ValidationError) as exc:
+      logger.warning("Skipping invalid record in %s: %s", self.path, exc)
+
+  def versions(self, path: str) -> dict[int, Any]:
+    """Returns the versions of an artifact, mapped to their metadata."""
+    with self._lock:
+      return dict(self._artifacts.get(path, {}))
+
+  def latest_versions(self) -> dict[str, tuple[int, Any]]:
+    """Returns the latest version and its metadata, for every artifact."""
+    with self._lock:
+      return {
+          path: max(versions.items())
+          for path, versions in self._artifacts.items()
+          if versions
+      }
+
+  def record_save(
+      self, path: str, version: int, metadata: Optional[dict[str, Any]]
+  ) -> None:
+    """Records that a version of an artifact was saved."""
+    self._append(_save_record(path, version, metadata))
+
+  def record_delete(self, path: str) -> None:
+    """Records that an artifact was deleted with all its versions."""
+    self._append({"op": _DELETE_OP, "path": path})
+
+  def ensure_created(self) -> None:
+    """Creates the manifest file if it does not exist."""
+    self._append(None)
+
+  def _append(self, record: Optional[dict[str, Any]]) -> None:
+    self.path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+      if record is not None:
+        os.write(fd, _encode(record))
+    finally:
+      os.close(fd)
+    self.refresh()
+
+
+def write_manifest(
+    path: Path,
+    versions: list[tuple[str, int, Optional[dict[str, Any]]]],
+) -> None:
+  """Atomically replaces a manifest with records of the given versions.
+
+  Args:
+    path: The path of the manifest.
+    versions: The (artifact path, version, metadata) of each saved version.
+  """
+  path.parent.mkdir(parents=True, exist_ok=True)
+  fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+  try:
+    with os.fdopen(fd, "wb") as f:
+      for artifact_path, version, metadata in versions:
+        f.write(_encode(_save_record(artifact_path, version, metadata)))
+    os.replace(temp_path, path)
+  except BaseException:
+    os.unlink(temp_path)
+    raise
@@ -0,0 +1,122 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed storage of FileArtifactService payloads.
+
+Each distinct payload is stored once, as a blob named by its SHA-256 digest.
+Version payload files are hard links to the blobs, so the layout of the
+versions is unchanged, and the link count of a blob is its reference count: a
+blob linked only from the blob directory is garbage.
+
+Blobs are never deleted while linked from a version. A version linked to a
+blob concurrently with its deletion keeps its payload, as the payload is only
+deleted with its last link.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+import tempfile
+
+logger = logging.getLogger("google_adk." + __name__)
+
+
+class FileBlobStore:
+  """Stores payloads as hard-linked blobs keyed by their SHA-256 digest."""
+
+  def __init__(self, root: Path):
+    self.root = root
+
+  def blob_path(self, digest: str) -> Path:
+    """Returns the path of the blob with `digest`."""
+    return self.root / digest[:2] / digest
+
+  def link_bytes(self, data: bytes, target: Path) -> str:
+    """Creates `target` as a link to the blob of `data`, storing it if needed.
+
+    Returns:
+      The digest of `data`.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    try:
+      os.link(self.blob_path(digest), target)
+      return digest
+    except FileNotFoundError:
+      pass
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=".blob-")
+    try:
+      with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    except BaseException:
+      os.unlink(temp_path)
+      raise
+    self.link_file(Path(temp_path), digest, target)
+    return digest
+
+  def link_file(self, source: Path, digest: str, target: Path) -> None:
+    """Moves the payload file `source`, whose digest is `digest`, to `target`.
+
+    `target` is linked to the existing blob of the payload if there is one, and
+    `source` becomes the blob otherwise.
+    """
+    blob_path = self.blob_path(digest)
+    while True:
+      try:
+        os.link(blob_path, target)
+        source.unlink()
+        return
+      except FileNotFoundError:
+        pass
+      blob_path.parent.mkdir(parents=True, exist_ok=True)
+      try:
+        os.link(source, blob_path)
+      except FileExistsError:
+        # Stored by a concurrent save.
+        continue
+      os.replace(source, target)
+      return
+
+  def release(self, digest: str) -> bool:
+    """Deletes the blob with `digest` if no version links to it anymore.
+
+    Returns:
+      Whether the blob was deleted.
+    """
+    blob_path = self.blob_path(digest)
+    try:
+      if os.stat(blob_path).st_nlink > 1:
+        return False
+      blob_path.unlink()
+    except FileNotFoundError:
+      return False
+    logger.debug("Deleted unreferenced artifact blob %s", digest)
+    return True
+
+  def collect_garbage(self) -> int:
+    """Deletes the blobs no version links to, e.g. after a crash.
+
+    Returns:
+      The number of deleted blobs.
+    """
+    if not self.root.exists():
+      return 0
+    return sum(
+        self.release(blob_path.name)
+        for shard in self.root.iterdir()
+        if shard.is_dir()
+        for blob_path in shard.iterdir()
+    )
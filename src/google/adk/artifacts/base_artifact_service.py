@@ -15,8 +15,13 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+import asyncio
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
+from typing import Callable
 from typing import Optional
 
 from google.genai import types
@@ -60,6 +65,142 @@ class ArtifactVersion(BaseModel):
   )
 
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+"""The default size of the chunks yielded by artifact readers."""
+
+
+def _check_range(size: int, start: int, end: Optional[int]) -> int:
+  """Validates a byte range of a payload and returns its end."""
+  if end is None:
+    end = size
+  if not 0 <= start <= end <= size:
+    raise ValueError(
+        f"Invalid byte range [{start}, {end}) for a payload of {size} bytes."
+    )
+  return end
+
+
+class ArtifactReader(ABC):
+  """Reads the payload of an artifact version in chunks.
+
+  Use it as an async context manager, or call `aclose()` when done.
+
+  Attributes:
+    version: The version being read.
+    size: The size of the payload in bytes.
+    mime_type: The MIME type of the payload. None for text artifacts stored
+      without a MIME type, whose payload is UTF-8 encoded.
+  """
+
+  def __init__(self, *, version: int, size: int, mime_type: Optional[str]):
+    self.version = version
+    self.size = size
+    self.mime_type = mime_type
+
+  @abstractmethod
+  def iter_bytes(
+      self,
+      start: int = 0,
+      end: Optional[int] = None,
+      *,
+      chunk_size: int = DEFAULT_CHUNK_SIZE,
+  ) -> AsyncIterator[bytes]:
+    """Yields the payload from byte `start` up to, excluding, byte `end`.
+
+    Args:
+      start: The offset of the first byte to read.
+      end: The offset after the last byte to read. Defaults to the size of the
+        payload.
+      chunk_size: The maximum size of the yielded chunks.
+
+    Raises:
+      ValueError: If the range is not within the payload.
+    """
+
+  async def read(self) -> bytes:
+    """Reads the whole payload."""
+    return b"".join([chunk async for chunk in self.iter_bytes()])
+
+  async def aclose(self) -> None:
+    """Releases the resources held by the reader. Closing it again is a no-op."""
+
+  async def __aenter__(self) -> ArtifactReader:
+    return self
+
+  async def __aexit__(self, *exc_info: Any) -> None:
+    await self.aclose()
+
+
+class ArtifactWriter(ABC):
+  """Writes the payload of a new artifact version in chunks.
+
+  The version is saved by `commit()`, which is called when an `async with`
+  block exits without an exception. Otherwise the written payload is
+  discarded.
+  """
+
+  @abstractmethod
+  async def write(self, data: bytes) -> None:
+    """Appends `data` to the payload."""
+
+  @abstractmethod
+  async def commit(self) -> int:
+    """Saves the payload as a new version and returns the version."""
+
+  @abstractmethod
+  async def abort(self) -> None:
+    """Discards the payload."""
+
+  async def __aenter__(self) -> ArtifactWriter:
+    return self
+
+  async def __aexit__(self, exc_type: Any, *exc_info: Any) -> None:
+    if exc_type is None:
+      await self.commit()
+    else:
+      await self.abort()
+
+
+class _BytesArtifactReader(ArtifactReader):
+  """Reads a payload held in memory."""
+
+  def __init__(
+      self, data: bytes, *, version: int, mime_type: Optional[str]
+  ) -> None:
+    super().__init__(version=version, size=len(data), mime_type=mime_type)
+    self._data = memoryview(data)
+
+  async def iter_bytes(
+      self,
+      start: int = 0,
+      end: Optional[int] = None,
+      *,
+      chunk_size: int = DEFAULT_CHUNK_SIZE,
+  ) -> AsyncIterator[bytes]:
+    end = _check_range(self.size, start, end)
+    for offset in range(start, end, chunk_size):
+      yield bytes(self._data[offset : min(offset + chunk_size, end)])
+
+
+class _BufferedArtifactWriter(ArtifactWriter):
+  """Buffers a payload in memory and saves it on commit."""
+
+  def __init__(self, save: Callable[[bytes], Awaitable[int]]) -> None:
+    self._save = save
+    self._chunks: list[bytes] = []
+
+  async def write(self, data: bytes) -> None:
+    self._chunks.append(bytes(data))
+
+  async def commit(self) -> int:
+    data = b"".join(self._chunks)
+    self._chunks = []
+    return await self._save(data)
+
+  async def abort(self) -> None:
+    self._chunks = []
+
+
 class BaseArtifactService(ABC):
   """Abstract base class for artifact services."""
 
@@ -232,3 +373,132 @@ class BaseArtifactService(ABC):
       An ArtifactVersion object containing the metadata of the specified
       artifact version, or `None` if the artifact version is not found.
     """
+
+  async def load_artifacts(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filenames: Sequence[str],
+      session_id: Optional[str] = None,
+  ) -> dict[str, Optional[types.Part]]:
+    """Loads the latest versions of many artifacts.
+
+    The default implementation loads the artifacts concurrently with
+    `load_artifact()`.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      filenames: The filenames of the artifacts.
+      session_id: The session ID. If `None`, only user-scoped artifacts can be
+        loaded.
+
+    Returns:
+      The artifacts by filename, with None for artifacts that are not found.
+    """
+    artifacts = await asyncio.gather(*(
+        self.load_artifact(
+            app_name=app_name,
+            user_id=user_id,
+            filename=filename,
+            session_id=session_id,
+        )
+        for filename in filenames
+    ))
+    return dict(zip(filenames, artifacts))
+
+  async def open_artifact_reader(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    """Opens a reader of the payload of an artifact version.
+
+    The default implementation loads the whole artifact in memory. Services
+    that can read payloads in parts override it.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      filename: The filename of the artifact.
+      session_id: The session ID. If `None`, read the user-scoped artifact.
+      version: The version of the artifact. If None, the latest version will be
+        read.
+
+    Returns:
+      The reader, or None if the artifact version is not found.
+    """
+    if version is None:
+      artifact_version = await self.get_artifact_version(
+          app_name=app_name,
+          user_id=user_id,
+          filename=filename,
+          session_id=session_id,
+      )
+      if artifact_version is None:
+        return None
+      version = artifact_version.version
+    artifact = await self.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+        version=version,
+    )
+    if artifact is None:
+      return None
+    if artifact.inline_data:
+      return _BytesArtifactReader(
+          artifact.inline_data.data or b"",
+          version=version,
+          mime_type=artifact.inline_data.mime_type,
+      )
+    if artifact.text is not None:
+      return _BytesArtifactReader(
+          artifact.text.encode("utf-8"), version=version, mime_type=None
+      )
+    return None
+
+  async def open_artifact_writer(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> ArtifactWriter:
+    """Opens a writer of the payload of a new artifact version.
+
+    The default implementation buffers the payload in memory and saves it with
+    `save_artifact()`. Services that can write payloads in parts override it.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      filename: The filename of the artifact.
+      mime_type: The MIME type of the payload.
+      session_id: The session ID. If `None`, the artifact is user-scoped.
+      custom_metadata: Custom metadata to associate with the artifact.
+
+    Returns:
+      The writer. The version is saved when the writer is committed.
+    """
+
+    async def save(data: bytes) -> int:
+      return await self.save_artifact(
+          app_name=app_name,
+          user_id=user_id,
+          filename=filename,
+          artifact=types.Part.from_bytes(data=data, mime_type=mime_type),
+          session_id=session_id,
+          custom_metadata=custom_metadata,
+      )
+
+    return _BufferedArtifactWriter(save)
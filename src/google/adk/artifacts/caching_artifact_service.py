@@ -0,0 +1,570 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from google.genai import types
+from typing_extensions import override
+
+from ..utils._lru_cache import LruCache
+from ..utils.feature_decorator import experimental
+from .base_artifact_service import ArtifactReader
+from .base_artifact_service import ArtifactVersion
+from .base_artifact_service import ArtifactWriter
+from .base_artifact_service import BaseArtifactService
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_MAX_CACHED_LATEST_VERSIONS = 10_000
+
+# (app_name, user_id, session_id, filename), without session ID for
+# user-scoped artifacts.
+_ArtifactKey = tuple[str, str, Optional[str], str]
+_VersionKey = tuple[_ArtifactKey, int]
+
+
+def _artifact_key(
+    app_name: str, user_id: str, session_id: Optional[str], filename: str
+) -> _ArtifactKey:
+  if filename.startswith("user:"):
+    session_id = None
+  return (app_name, user_id, session_id, filename)
+
+
+def _encode_part(part: types.Part) -> Optional[tuple[dict[str, Any], bytes]]:
+  """Returns the header and payload of a cacheable artifact, or None."""
+  if part.inline_data is not None:
+    return (
+        {"mime_type": part.inline_data.mime_type},
+        part.inline_data.data or b"",
+    )
+  if part.text is not None:
+    return {"text": True}, part.text.encode("utf-8")
+  return None
+
+
+def _decode_part(header: dict[str, Any], payload: bytes) -> types.Part:
+  if header.get("text"):
+    return types.Part(text=payload.decode("utf-8"))
+  return types.Part(
+      inline_data=types.Blob(mime_type=header["mime_type"], data=payload)
+  )
+
+
+class _MemoryCache:
+  """A thread-safe LRU cache of artifact versions, bounded by payload bytes."""
+
+  def __init__(self, max_bytes: int):
+    self.max_bytes = max_bytes
+    self.total_bytes = 0
+    self._entries: OrderedDict[_VersionKey, tuple[types.Part, int]] = (
+        OrderedDict()
+    )
+    self._lock = threading.Lock()
+
+  def get(self, key: _VersionKey) -> Optional[types.Part]:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      self._entries.move_to_end(key)
+      return entry[0]
+
+  def put(self, key: _VersionKey, part: types.Part, size: int) -> None:
+    if size > self.max_bytes:
+      return
+    with self._lock:
+      self._remove(key)
+      self._entries[key] = (part, size)
+      self.total_bytes += size
+      while self.total_bytes > self.max_bytes:
+        self._remove(next(iter(self._entries)))
+
+  def invalidate(self, artifact_key: _ArtifactKey) -> None:
+    """Removes all cached versions of an artifact."""
+    with self._lock:
+      for key in [key for key in self._entries if key[0] == artifact_key]:
+        self._remove(key)
+
+  def _remove(self, key: _VersionKey) -> None:
+    entry = self._entries.pop(key, None)
+    if entry is not None:
+      self.total_bytes -= entry[1]
+
+
+class _DiskCache:
+  """A thread-safe LRU cache of artifact versions in a local directory.
+
+  Each version is a file holding a JSON header line followed by the payload,
+  in a directory per artifact. Recency is tracked in memory, and initialized
+  from modification times, so that the cache survives restarts.
+  """
+
+  def __init__(self, root: Path, max_bytes: int):
+    self.root = root
+    self.max_bytes = max_bytes
+    self.total_bytes = 0
+    self._entries: OrderedDict[Path, int] = OrderedDict()
+    self._lock = threading.Lock()
+    self.root.mkdir(parents=True, exist_ok=True)
+    files = []
+    for artifact_dir in self.root.iterdir():
+      if artifact_dir.is_dir():
+        for path in artifact_dir.iterdir():
+          if path.name.isdigit():
+            stat = path.stat()
+            files.append((stat.st_mtime, path, stat.st_size))
+    for _, path, size in sorted(files):
+      self._entries[path] = size
+      self.total_bytes += size
+    self._evict()
+
+  def _artifact_dir(self, artifact_key: _ArtifactKey) -> Path:
+    digest = hashlib.sha256(json.dumps(artifact_key).encode("utf-8"))
+    return self.root / digest.hexdigest()
+
+  def get(
+      self, key: _VersionKey
+  ) -> Optional[tuple[types.Part, dict[str, Any]]]:
+    """Returns a cached version and its header."""
+    path = self._artifact_dir(key[0]) / str(key[1])
+    with self._lock:
+      if path not in self._entries:
+        return None
+      self._entries.move_to_end(path)
+    try:
+      with open(path, "rb") as f:
+        header = json.loads(f.readline())
+        return _decode_part(header, f.read()), header
+    except FileNotFoundError:
+      self.remove(key)
+      return None
+
+  def put(self, key: _VersionKey, header: dict[str, Any], data: bytes) -> None:
+    header_line = json.dumps(header).encode("utf-8") + b"\n"
+    size = len(header_line) + len(data)
+    if size > self.max_bytes:
+      return
+    artifact_dir = self._artifact_dir(key[0])
+    artifact_dir.mkdir(exist_ok=True)
+    path = artifact_dir / str(key[1])
+    fd, temp_path = tempfile.mkstemp(dir=artifact_dir, prefix=".")
+    try:
+      with os.fdopen(fd, "wb") as f:
+        f.write(header_line)
+        f.write(data)
+      os.replace(temp_path, path)
+    except BaseException:
+      os.unlink(temp_path)
+      raise
+    with self._lock:
+      self._remove(path, delete_file=False)
+      self._entries[path] = size
+      self.total_bytes += size
+      self._evict()
+
+  def remove(self, key: _VersionKey) -> None:
+    """Removes a cached version."""
+    with self._lock:
+      self._remove(self._artifact_dir(key[0]) / str(key[1]))
+
+  def invalidate(self, artifact_key: _ArtifactKey) -> None:
+    """Removes all cached versions of an artifact."""
+    artifact_dir = self._artifact_dir(artifact_key)
+    with self._lock:
+      for path in [
+          path for path in self._entries if path.parent == artifact_dir
+      ]:
+        self._remove(path, delete_file=False)
+    shutil.rmtree(artifact_dir, ignore_errors=True)
+
+  def _evict(self) -> None:
+    while self.total_bytes > self.max_bytes:
+      self._remove(next(iter(self._entries)))
+
+  def _remove(self, path: Path, *, delete_file: bool = True) -> None:
+    size = self._entries.pop(path, None)
+    if size is None:
+      return
+    self.total_bytes -= size
+    if delete_file:
+      path.unlink(missing_ok=True)
+
+
+class _CachingArtifactWriter(ArtifactWriter):
+  """Forwards to a writer, and reports the committed version."""
+
+  def __init__(self, writer: ArtifactWriter, on_commit: Callable[[int], None]):
+    self._writer = writer
+    self._on_commit = on_commit
+
+  async def write(self, data: bytes) -> None:
+    await self._writer.write(data)
+
+  async def commit(self) -> int:
+    version = await self._writer.commit()
+    self._on_commit(version)
+    return version
+
+  async def abort(self) -> None:
+    await self._writer.abort()
+
+
+@experimental
+class CachingArtifactService(BaseArtifactService):
+  """An artifact service caching the artifacts loaded from another one.
+
+  Artifact versions are immutable, so loaded versions are cached until
+  evicted, in memory and optionally on local disk. The latest version of each
+  artifact is cached for `latest_version_ttl_seconds`, so that loads of the
+  latest version see versions saved through other services within that delay.
+  Versions saved and artifacts deleted through this service are seen
+  immediately.
+
+  The disk cache outlives the process, and an artifact deleted and saved again
+  through another service reuses its version numbers. Versions loaded from
+  disk are therefore checked against the creation time of the version in the
+  wrapped service, which costs a metadata lookup but no payload download.
+
+  Attributes:
+    memory_hits: The number of loads served from memory.
+    disk_hits: The number of loads served from disk.
+    misses: The number of loads forwarded to the wrapped service.
+    latest_version_hits: The number of latest version lookups served from
+      cache.
+    latest_version_misses: The number of latest version lookups forwarded to
+      the wrapped service.
+  """
+
+  def __init__(
+      self,
+      artifact_service: BaseArtifactService,
+      *,
+      max_memory_bytes: int = 64 * 1024 * 1024,
+      disk_cache_dir: Optional[Path | str] = None,
+      max_disk_bytes: int = 1024 * 1024 * 1024,
+      latest_version_ttl_seconds: float = 5.0,
+      timer: Callable[[], float] = time.monotonic,
+  ):
+    """Initializes the CachingArtifactService.
+
+    Args:
+      artifact_service: The artifact service the artifacts are loaded from.
+      max_memory_bytes: The maximum size of the payloads cached in memory.
+      disk_cache_dir: If set, the directory where payloads evicted from memory
+        remain cached.
+      max_disk_bytes: The maximum size of the payloads cached on disk.
+      latest_version_ttl_seconds: How long the latest version of an artifact
+        is cached.
+      timer: The clock used for the expiration of latest versions.
+    """
+    if max_memory_bytes <= 0 or max_disk_bytes <= 0:
+      raise ValueError("Cache sizes must be positive.")
+    if latest_version_ttl_seconds < 0:
+      raise ValueError("latest_version_ttl_seconds must not be negative.")
+    self._artifact_service = artifact_service
+    self._memory_cache = _MemoryCache(max_memory_bytes)
+    self._disk_cache = (
+        _DiskCache(Path(disk_cache_dir).expanduser(), max_disk_bytes)
+        if disk_cache_dir is not None
+        else None
+    )
+    self._latest_version_ttl_seconds = latest_version_ttl_seconds
+    self._timer = timer
+    self._latest_versions: LruCache[_ArtifactKey, tuple[int, float]] = LruCache(
+        _MAX_CACHED_LATEST_VERSIONS
+    )
+    self.memory_hits = 0
+    self.disk_hits = 0
+    self.misses = 0
+    self.latest_version_hits = 0
+    self.latest_version_misses = 0
+
+  @property
+  def artifact_service(self) -> BaseArtifactService:
+    """The artifact service the artifacts are loaded from."""
+    return self._artifact_service
+
+  @property
+  def hit_rate(self) -> float:
+    """The fraction of loads served from memory or disk."""
+    lookups = self.memory_hits + self.disk_hits + self.misses
+    return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      artifact: types.Part,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    version = await self._artifact_service.save_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        artifact=artifact,
+        session_id=session_id,
+        custom_metadata=custom_metadata,
+    )
+    self._set_latest_version(
+        _artifact_key(app_name, user_id, session_id, filename), version
+    )
+    return version
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    artifact_key = _artifact_key(app_name, user_id, session_id, filename)
+    if version is None:
+      version = await self._get_latest_version(artifact_key)
+      if version is None:
+        return None
+    key = (artifact_key, version)
+
+    # Cached parts are shared, so callers get copies they can modify.
+    artifact = self._memory_cache.get(key)
+    if artifact is not None:
+      self.memory_hits += 1
+      return artifact.model_copy(deep=True)
+    if self._disk_cache is not None:
+      cached = await asyncio.to_thread(self._disk_cache.get, key)
+      if cached is not None:
+        artifact, header = cached
+        if header.get("create_time") == await self._get_create_time(key):
+          self.disk_hits += 1
+          self._cache_in_memory(key, artifact)
+          return artifact
+        await asyncio.to_thread(self._disk_cache.remove, key)
+
+    self.misses += 1
+    artifact = await self._artifact_service.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+        version=version,
+    )
+    if artifact is None:
+      return None
+    encoded = self._cache_in_memory(key, artifact)
+    if encoded is not None and self._disk_cache is not None:
+      header, data = encoded
+      header["create_time"] = await self._get_create_time(key)
+      try:
+        await asyncio.to_thread(self._disk_cache.put, key, header, data)
+      except OSError as exc:
+        logger.warning("Failed to cache artifact %s on disk: %s", filename, exc)
+    return artifact
+
+  def _cache_in_memory(
+      self, key: _VersionKey, artifact: types.Part
+  ) -> Optional[tuple[dict[str, Any], bytes]]:
+    """Caches a copy of an artifact in memory, and returns its encoding."""
+    encoded = _encode_part(artifact)
+    if encoded is not None:
+      self._memory_cache.put(
+          key, artifact.model_copy(deep=True), len(encoded[1])
+      )
+    return encoded
+
+  async def _get_create_time(self, key: _VersionKey) -> Optional[float]:
+    """Returns the creation time of a version in the wrapped service."""
+    (app_name, user_id, session_id, filename), version = key
+    artifact_version = await self._artifact_service.get_artifact_version(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+        version=version,
+    )
+    return artifact_version.create_time if artifact_version else None
+
+  async def _get_latest_version(
+      self, artifact_key: _ArtifactKey
+  ) -> Optional[int]:
+    cached = self._latest_versions.get(artifact_key)
+    if cached is not None and cached[1] > self._timer():
+      self.latest_version_hits += 1
+      return cached[0]
+    self.latest_version_misses += 1
+    app_name, user_id, session_id, filename = artifact_key
+    versions = await self._artifact_service.list_versions(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+    )
+    if not versions:
+      return None
+    version = max(versions)
+    self._set_latest_version(artifact_key, version)
+    return version
+
+  def _set_latest_version(self, artifact_key: _ArtifactKey, version: int):
+    self._latest_versions.put(
+        artifact_key,
+        (version, self._timer() + self._latest_version_ttl_seconds),
+    )
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: Optional[str] = None
+  ) -> list[str]:
+    return await self._artifact_service.list_artifact_keys(
+        app_name=app_name, user_id=user_id, session_id=session_id
+    )
+
+  @override
+  async def delete_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> None:
+    await self._artifact_service.delete_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+    )
+    # Versions of an artifact saved again after its deletion restart from 0.
+    artifact_key = _artifact_key(app_name, user_id, session_id, filename)
+    self._latest_versions.pop(artifact_key)
+    self._memory_cache.invalidate(artifact_key)
+    if self._disk_cache is not None:
+      await asyncio.to_thread(self._disk_cache.invalidate, artifact_key)
+
+  @override
+  async def list_versions(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> list[int]:
+    return await self._artifact_service.list_versions(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+    )
+
+  @override
+  async def list_artifact_versions(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> list[ArtifactVersion]:
+    return await self._artifact_service.list_artifact_versions(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+    )
+
+  @override
+  async def get_artifact_version(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactVersion]:
+    return await self._artifact_service.get_artifact_version(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+        version=version,
+    )
+
+  @override
+  async def open_artifact_reader(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    """Opens a reader of the wrapped service.
+
+    Streamed payloads are not cached, as they are typically too large to.
+    """
+    return await self._artifact_service.open_artifact_reader(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+        version=version,
+    )
+
+  @override
+  async def open_artifact_writer(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> ArtifactWriter:
+    writer = await self._artifact_service.open_artifact_writer(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        mime_type=mime_type,
+        session_id=session_id,
+        custom_metadata=custom_metadata,
+    )
+    artifact_key = _artifact_key(app_name, user_id, session_id, filename)
+    return _CachingArtifactWriter(
+        writer, lambda version: self._set_latest_version(artifact_key, version)
+    )
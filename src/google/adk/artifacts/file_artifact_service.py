@@ -13,14 +13,22 @@
 # limitations under the License.
 from __future__ import annotations
 
+import argparse
 import asyncio
+from collections.abc import AsyncIterator
+import functools
+import hashlib
 import logging
+import mmap
 import os
 from pathlib import Path
 from pathlib import PurePosixPath
 from pathlib import PureWindowsPath
 import shutil
+import tempfile
 from typing import Any
+from typing import BinaryIO
+from typing import Callable
 from typing import Optional
 from urllib.parse import unquote
 from urllib.parse import urlparse
@@ -33,11 +41,22 @@ from pydantic import ValidationError
 from typing_extensions import override
 
 from ..errors.input_validation_error import InputValidationError
+from ..utils._lru_cache import LruCache
+from ._file_artifact_manifest import ArtifactManifest
+from ._file_artifact_manifest import MANIFEST_FILENAME
+from ._file_artifact_manifest import write_manifest
+from ._file_blob_store import FileBlobStore
+from .base_artifact_service import _check_range
+from .base_artifact_service import ArtifactReader
 from .base_artifact_service import ArtifactVersion
+from .base_artifact_service import ArtifactWriter
 from .base_artifact_service import BaseArtifactService
+from .base_artifact_service import DEFAULT_CHUNK_SIZE
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_MAX_CACHED_MANIFESTS = 256
+
 
 def _iter_artifact_dirs(root: Path) -> list[Path]:
   """Returns artifact directory paths beneath a root."""
@@ -146,6 +165,11 @@ def _session_artifacts_dir(base_root: Path, session_id: str) -> Path:
   return base_root / "sessions" / session_id / "artifacts"
 
 
+def _manifest_path(scope_root: Path) -> Path:
+  """Returns the path of the manifest of a scope, next to its directory."""
+  return scope_root.parent / MANIFEST_FILENAME
+
+
 def _versions_dir(artifact_dir: Path) -> Path:
   """Returns the directory that contains versioned payloads."""
   return artifact_dir / "versions"
@@ -182,6 +206,13 @@ class FileArtifactVersion(ArtifactVersion):
   file_name: str = Field(
       description="Original filename supplied by the caller."
   )
+  content_sha256: Optional[str] = Field(
+      default=None,
+      description=(
+          "SHA-256 digest of the payload, if it is stored as a deduplicated"
+          " blob."
+      ),
+  )
 
 
 class FileArtifactService(BaseArtifactService):
@@ -193,12 +224,14 @@ class FileArtifactService(BaseArtifactService):
   #     └── {user_id}/
   #         ├── sessions/
   #         │   └── {session_id}/
+  #         │       ├── manifest.jsonl
   #         │       └── artifacts/
   #         │           └── {artifact_path}/  # derived from filename
   #         │               └── versions/
   #         │                   └── {version}/
   #         │                       ├── {original_filename}
   #         │                       └── metadata.json
+  #         ├── manifest.jsonl
   #         └── artifacts/
   #             └── {artifact_path}/...
   #
@@ -206,15 +239,32 @@ class FileArtifactService(BaseArtifactService):
   # nested directories, and path traversal is rejected to keep the layout
   # portable across filesystems. `{artifact_path}` therefore mirrors the
   # sanitized, scope-relative path derived from each filename.
+  #
+  # Each scope has an append-only manifest recording the saved versions, with
+  # their metadata, and the deleted artifacts. Loads and listings read the
+  # manifest instead of listing directories and reading metadata files.
+  # Manifests are rebuilt from disk when missing, or by `rebuild_manifests()`.
+  #
+  # With deduplication, payload files are hard links to content-addressed
+  # blobs stored under root/blobs/sha256/, whose digest is recorded in the
+  # version metadata. Blobs are deleted with the last artifact linking to them.
 
-  def __init__(self, root_dir: Path | str):
+  def __init__(self, root_dir: Path | str, *, deduplicate: bool = False):
     """Initializes the file-based artifact service.
 
     Args:
       root_dir: The directory that will contain artifact data.
+      deduplicate: Whether to store identical payloads once, whatever the
+        artifacts and versions they are saved as. Requires a filesystem with
+        hard links.
     """
     self.root_dir = Path(root_dir).expanduser().resolve()
     self.root_dir.mkdir(parents=True, exist_ok=True)
+    self._deduplicate = deduplicate
+    self._blob_store = FileBlobStore(self.root_dir / "blobs" / "sha256")
+    self._manifests: LruCache[Path, ArtifactManifest] = LruCache(
+        _MAX_CACHED_MANIFESTS
+    )
 
   def _base_root(self, user_id: str, /) -> Path:
     """Returns the artifacts root directory for a user."""
@@ -251,6 +301,50 @@ class FileArtifactService(BaseArtifactService):
     artifact_dir, _ = _resolve_scoped_artifact_path(scope_root, filename)
     return artifact_dir
 
+  def _artifact_location(
+      self,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> tuple[Path, Path, str]:
+    """Returns the scope root, directory and manifest key of an artifact."""
+    scope_root = self._scope_root(
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
+    artifact_dir, relative = _resolve_scoped_artifact_path(scope_root, filename)
+    return scope_root, artifact_dir, relative.as_posix()
+
+  def _get_manifest(self, scope_root: Path) -> ArtifactManifest:
+    """Returns the up-to-date manifest of a scope.
+
+    Scopes with artifacts but without a manifest, e.g. written by earlier
+    versions of this service, get their manifest rebuilt from disk.
+    """
+    manifest = self._manifests.get(scope_root)
+    if manifest is None:
+      manifest = ArtifactManifest(
+          _manifest_path(scope_root), FileArtifactVersion.model_validate
+      )
+      self._manifests.put(scope_root, manifest)
+    if not manifest.refresh() and scope_root.exists():
+      _rebuild_manifest(scope_root)
+      manifest.refresh()
+    return manifest
+
+  def _get_versions(
+      self,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> dict[int, Optional[FileArtifactVersion]]:
+    """Returns the versions of an artifact, mapped to their metadata."""
+    scope_root, _, artifact_path = self._artifact_location(
+        user_id, session_id, filename
+    )
+    return self._get_manifest(scope_root).versions(artifact_path)
+
   def _build_artifact_version(
       self,
       *,
@@ -271,13 +365,14 @@ class FileArtifactService(BaseArtifactService):
             version=version,
         )
     )
-    custom_metadata_val = metadata.custom_metadata if metadata else {}
-    mime_type = metadata.mime_type if metadata else None
+    if metadata is None:
+      return ArtifactVersion(version=version, canonical_uri=canonical_uri)
     return ArtifactVersion(
         version=version,
         canonical_uri=canonical_uri,
-        custom_metadata=dict(custom_metadata_val),
-        mime_type=mime_type,
+        custom_metadata=dict(metadata.custom_metadata),
+        create_time=metadata.create_time,
+        mime_type=metadata.mime_type,
     )
 
   def _canonical_uri(
@@ -298,15 +393,6 @@ class FileArtifactService(BaseArtifactService):
     payload_path = _versions_dir(artifact_dir) / str(version) / stored_filename
     return payload_path.resolve().as_uri()
 
-  def _latest_metadata(
-      self, artifact_dir: Path
-  ) -> Optional[FileArtifactVersion]:
-    """Loads metadata for the most recent version."""
-    versions = _list_versions_on_disk(artifact_dir)
-    if not versions:
-      return None
-    return _read_metadata(_metadata_path(artifact_dir, versions[-1]))
-
   @override
   async def save_artifact(
       self,
@@ -344,37 +430,84 @@ class FileArtifactService(BaseArtifactService):
       custom_metadata: Optional[dict[str, Any]],
   ) -> int:
     """Saves an artifact to disk and returns its version."""
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    artifact_dir.mkdir(parents=True, exist_ok=True)
-
-    versions = _list_versions_on_disk(artifact_dir)
-    next_version = 0 if not versions else versions[-1] + 1
-    versions_dir = _versions_dir(artifact_dir)
-    versions_dir.mkdir(parents=True, exist_ok=True)
-    version_dir = versions_dir / str(next_version)
-    version_dir.mkdir()
-
-    stored_filename = artifact_dir.name
-    content_path = version_dir / stored_filename
-
     if artifact.inline_data:
-      content_path.write_bytes(artifact.inline_data.data)
+      data = artifact.inline_data.data
       mime_type = (
           artifact.inline_data.mime_type
           if artifact.inline_data.mime_type
           else "application/octet-stream"
       )
     elif artifact.text is not None:
-      content_path.write_text(artifact.text, encoding="utf-8")
+      data = artifact.text.encode("utf-8")
       mime_type = None
     else:
       raise InputValidationError(
           "Artifact must have either inline_data or text content."
       )
+    return self._save_version_sync(
+        user_id,
+        filename,
+        session_id,
+        custom_metadata,
+        mime_type,
+        functools.partial(self._write_payload, data),
+    )
+
+  def _write_payload(self, data: bytes, content_path: Path) -> Optional[str]:
+    """Writes a payload, and returns its digest if it is deduplicated."""
+    if self._deduplicate:
+      return self._blob_store.link_bytes(data, content_path)
+    content_path.write_bytes(data)
+    return None
+
+  def _move_payload(
+      self, temp_path: Path, digest: Optional[str], content_path: Path
+  ) -> Optional[str]:
+    """Moves a payload, and returns its digest if it is deduplicated."""
+    if digest is not None:
+      self._blob_store.link_file(temp_path, digest, content_path)
+    else:
+      os.replace(temp_path, content_path)
+    return digest
+
+  def _save_version_sync(
+      self,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str],
+      custom_metadata: Optional[dict[str, Any]],
+      mime_type: Optional[str],
+      write_payload: Callable[[Path], Optional[str]],
+  ) -> int:
+    """Saves a new version, whose payload is written by `write_payload`.
+
+    `write_payload` returns the digest of the payload if it is deduplicated.
+    """
+    scope_root, artifact_dir, artifact_path = self._artifact_location(
+        user_id, session_id, filename
+    )
+    manifest = self._get_manifest(scope_root)
+    # Created before the scope directory, so that it is not rebuilt from a
+    # partially saved version.
+    manifest.ensure_created()
+
+    versions = manifest.versions(artifact_path)
+    next_version = max(versions) + 1 if versions else 0
+    versions_dir = _versions_dir(artifact_dir)
+    versions_dir.mkdir(parents=True, exist_ok=True)
+    while True:
+      version_dir = versions_dir / str(next_version)
+      try:
+        version_dir.mkdir()
+        break
+      except FileExistsError:
+        # Taken by a concurrent save, or by a save that failed before it was
+        # recorded in the manifest.
+        next_version = max(next_version, *_list_versions_on_disk(artifact_dir))
+        next_version += 1
+
+    stored_filename = artifact_dir.name
+    content_sha256 = write_payload(version_dir / stored_filename)
 
     canonical_uri = self._canonical_uri(
         user_id=user_id,
@@ -382,14 +515,16 @@ class FileArtifactService(BaseArtifactService):
         filename=filename,
         version=next_version,
     )
-    _write_metadata(
+    metadata = _write_metadata(
         version_dir / "metadata.json",
         filename=filename,
         mime_type=mime_type,
         version=next_version,
         canonical_uri=canonical_uri,
         custom_metadata=custom_metadata,
+        content_sha256=content_sha256,
     )
+    manifest.record_save(artifact_path, next_version, _dump_metadata(metadata))
 
     logger.debug(
         "Saved artifact %s version %d to %s",
@@ -425,50 +560,147 @@ class FileArtifactService(BaseArtifactService):
       version: Optional[int],
   ) -> Optional[types.Part]:
     """Loads an artifact from disk."""
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    if not artifact_dir.exists():
+    payload = self._find_payload(user_id, filename, session_id, version)
+    if payload is None:
       return None
+    _, mime_type, content_paths = payload
+
+    # Reads are attempted directly, rather than after existence checks, to
+    # save filesystem round trips.
+    for content_path in content_paths:
+      try:
+        if mime_type:
+          data = content_path.read_bytes()
+          return types.Part(
+              inline_data=types.Blob(mime_type=mime_type, data=data)
+          )
+        return types.Part(text=content_path.read_text(encoding="utf-8"))
+      except FileNotFoundError:
+        continue
+
+    _log_missing_payload(filename, mime_type, content_paths[0])
+    return None
 
-    versions = _list_versions_on_disk(artifact_dir)
+  def _find_payload(
+      self,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str],
+      version: Optional[int],
+  ) -> Optional[tuple[int, Optional[str], list[Path]]]:
+    """Returns the version, MIME type and candidate paths of a payload."""
+    scope_root, artifact_dir, artifact_path = self._artifact_location(
+        user_id, session_id, filename
+    )
+    versions = self._get_manifest(scope_root).versions(artifact_path)
     if not versions:
       return None
 
     if version is None:
-      version_to_load = versions[-1]
+      version_to_load = max(versions)
     else:
       if version not in versions:
         return None
       version_to_load = version
 
     version_dir = _versions_dir(artifact_dir) / str(version_to_load)
-    metadata = _read_metadata(_metadata_path(artifact_dir, version_to_load))
+    metadata = versions[version_to_load]
     mime_type = metadata.mime_type if metadata else None
     stored_filename = artifact_dir.name
-    content_path = version_dir / stored_filename
-    if metadata and metadata.canonical_uri and not content_path.exists():
+    content_paths = [version_dir / stored_filename]
+    if metadata and metadata.canonical_uri:
       uri_path = _file_uri_to_path(metadata.canonical_uri)
-      if uri_path and uri_path.exists():
-        content_path = uri_path
+      if uri_path and uri_path != content_paths[0]:
+        content_paths.append(uri_path)
+    return version_to_load, mime_type, content_paths
 
-    if mime_type:
-      if not content_path.exists():
-        logger.warning(
-            "Binary artifact %s missing at %s", filename, content_path
-        )
-        return None
-      data = content_path.read_bytes()
-      return types.Part(inline_data=types.Blob(mime_type=mime_type, data=data))
+  @override
+  async def open_artifact_reader(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    """Opens a reader that memory-maps the payload of an artifact version.
+
+    Chunks are sliced from the mapping, so only the pages being read are
+    loaded in memory.
+    """
+    return await asyncio.to_thread(
+        self._open_artifact_reader_sync,
+        user_id,
+        filename,
+        session_id,
+        version,
+    )
 
-    if not content_path.exists():
-      logger.warning("Text artifact %s missing at %s", filename, content_path)
+  def _open_artifact_reader_sync(
+      self,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str],
+      version: Optional[int],
+  ) -> Optional[ArtifactReader]:
+    payload = self._find_payload(user_id, filename, session_id, version)
+    if payload is None:
       return None
+    version_to_read, mime_type, content_paths = payload
+    for content_path in content_paths:
+      try:
+        file = open(content_path, "rb")
+      except FileNotFoundError:
+        continue
+      return _FileArtifactReader(
+          file, version=version_to_read, mime_type=mime_type
+      )
+
+    _log_missing_payload(filename, mime_type, content_paths[0])
+    return None
+
+  @override
+  async def open_artifact_writer(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> ArtifactWriter:
+    """Opens a writer that streams the payload to a temporary file.
+
+    The file is moved in place as the payload of the new version on commit.
+    """
+    scope_root, artifact_dir, _ = self._artifact_location(
+        user_id, session_id, filename
+    )
+
+    def open_temp_file():
+      # Created before the scope directory, as in `_save_version_sync()`.
+      self._get_manifest(scope_root).ensure_created()
+      artifact_dir.mkdir(parents=True, exist_ok=True)
+      fd, temp_path = tempfile.mkstemp(dir=artifact_dir, prefix=".upload-")
+      return os.fdopen(fd, "wb"), Path(temp_path)
+
+    file, temp_path = await asyncio.to_thread(open_temp_file)
+
+    def commit(digest: Optional[str]) -> int:
+      return self._save_version_sync(
+          user_id,
+          filename,
+          session_id,
+          custom_metadata,
+          mime_type or "application/octet-stream",
+          functools.partial(self._move_payload, temp_path, digest),
+      )
 
-    text = content_path.read_text(encoding="utf-8")
-    return types.Part(text=text)
+    return _FileArtifactWriter(
+        file, temp_path, commit, hash_payload=self._deduplicate
+    )
 
   @override
   async def list_artifact_keys(
@@ -496,22 +728,20 @@ class FileArtifactService(BaseArtifactService):
 
     if session_id:
       session_root = _session_artifacts_dir(base_root, session_id)
-      for artifact_dir in _iter_artifact_dirs(session_root):
-        metadata = self._latest_metadata(artifact_dir)
+      manifest = self._get_manifest(session_root)
+      for path, (_, metadata) in manifest.latest_versions().items():
         if metadata and metadata.file_name:
           filenames.add(str(metadata.file_name))
         else:
-          rel = artifact_dir.relative_to(session_root)
-          filenames.add(rel.as_posix())
+          filenames.add(path)
 
     user_root = _user_artifacts_dir(base_root)
-    for artifact_dir in _iter_artifact_dirs(user_root):
-      metadata = self._latest_metadata(artifact_dir)
+    manifest = self._get_manifest(user_root)
+    for path, (_, metadata) in manifest.latest_versions().items():
       if metadata and metadata.file_name:
         filenames.add(str(metadata.file_name))
       else:
-        rel = artifact_dir.relative_to(user_root)
-        filenames.add(f"user:{rel.as_posix()}")
+        filenames.add(f"user:{path}")
 
     return sorted(filenames)
 
@@ -546,14 +776,24 @@ class FileArtifactService(BaseArtifactService):
       filename: str,
       session_id: Optional[str],
   ) -> None:
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
+    scope_root, artifact_dir, artifact_path = self._artifact_location(
+        user_id, session_id, filename
     )
+    manifest = self._get_manifest(scope_root)
+    versions = manifest.versions(artifact_path)
+    # Recorded first, so that a failed deletion leaves unlisted files rather
+    # than listed versions without files.
+    if versions:
+      manifest.record_delete(artifact_path)
     if artifact_dir.exists():
       shutil.rmtree(artifact_dir)
       logger.debug("Deleted artifact %s at %s", filename, artifact_dir)
+    for digest in {
+        metadata.content_sha256
+        for metadata in versions.values()
+        if metadata and metadata.content_sha256
+    }:
+      self._blob_store.release(digest)
 
   @override
   async def list_versions(
@@ -578,12 +818,7 @@ class FileArtifactService(BaseArtifactService):
       filename: str,
       session_id: Optional[str],
   ) -> list[int]:
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    return _list_versions_on_disk(artifact_dir)
+    return sorted(self._get_versions(user_id, session_id, filename))
 
   @override
   async def list_artifact_versions(
@@ -608,16 +843,9 @@ class FileArtifactService(BaseArtifactService):
       filename: str,
       session_id: Optional[str],
   ) -> list[ArtifactVersion]:
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    versions = _list_versions_on_disk(artifact_dir)
+    versions = self._get_versions(user_id, session_id, filename)
     artifact_versions: list[ArtifactVersion] = []
-    for version in versions:
-      metadata_path = _metadata_path(artifact_dir, version)
-      metadata = _read_metadata(metadata_path)
+    for version, metadata in sorted(versions.items()):
       artifact_versions.append(
           self._build_artifact_version(
               user_id=user_id,
@@ -655,31 +883,162 @@ class FileArtifactService(BaseArtifactService):
       session_id: Optional[str],
       version: Optional[int],
   ) -> Optional[ArtifactVersion]:
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    versions = _list_versions_on_disk(artifact_dir)
+    versions = self._get_versions(user_id, session_id, filename)
     if not versions:
       return None
     if version is None:
-      version_to_read = versions[-1]
+      version_to_read = max(versions)
     else:
       if version not in versions:
         return None
       version_to_read = version
 
-    metadata_path = _metadata_path(artifact_dir, version_to_read)
-    metadata = _read_metadata(metadata_path)
     return self._build_artifact_version(
         user_id=user_id,
         session_id=session_id,
         filename=filename,
         version=version_to_read,
-        metadata=metadata,
+        metadata=versions[version_to_read],
     )
 
+  async def rebuild_manifests(self, *, user_id: Optional[str] = None) -> None:
+    """Rebuilds the manifests of artifact scopes from the files on disk.
+
+    Use this to recover after artifact files were changed by other means, or
+    after a crash between writing a version and recording it.
+
+    Args:
+      user_id: The user whose manifests are rebuilt. Defaults to all users.
+    """
+    await asyncio.to_thread(self._rebuild_manifests_sync, user_id)
+
+  def _rebuild_manifests_sync(self, user_id: Optional[str]) -> None:
+    users_root = self.root_dir / "users"
+    if user_id is not None:
+      base_roots = [self._base_root(user_id)]
+    elif users_root.exists():
+      base_roots = [path for path in users_root.iterdir() if path.is_dir()]
+    else:
+      base_roots = []
+    for base_root in base_roots:
+      scope_roots = [_user_artifacts_dir(base_root)]
+      sessions_root = base_root / "sessions"
+      if sessions_root.exists():
+        scope_roots.extend(
+            _session_artifacts_dir(base_root, path.name)
+            for path in sessions_root.iterdir()
+            if path.is_dir()
+        )
+      for scope_root in scope_roots:
+        if scope_root.exists() or _manifest_path(scope_root).exists():
+          _rebuild_manifest(scope_root)
+          logger.info("Rebuilt artifact manifest of %s", scope_root)
+
+  async def collect_garbage(self) -> int:
+    """Deletes the deduplicated blobs no artifact version links to.
+
+    Blobs are deleted with the last artifact linking to them, so this is only
+    needed to recover after a crash, or after artifact files were deleted by
+    other means.
+
+    Returns:
+      The number of deleted blobs.
+    """
+    return await asyncio.to_thread(self._blob_store.collect_garbage)
+
+
+def _rebuild_manifest(scope_root: Path) -> None:
+  """Rewrites the manifest of a scope from the artifact versions on disk."""
+  versions = []
+  for artifact_dir in _iter_artifact_dirs(scope_root):
+    artifact_path = artifact_dir.relative_to(scope_root).as_posix()
+    for version in _list_versions_on_disk(artifact_dir):
+      metadata = _read_metadata(_metadata_path(artifact_dir, version))
+      versions.append((
+          artifact_path,
+          version,
+          _dump_metadata(metadata) if metadata else None,
+      ))
+  write_manifest(_manifest_path(scope_root), versions)
+
+
+def _log_missing_payload(
+    filename: str, mime_type: Optional[str], content_path: Path
+) -> None:
+  if mime_type:
+    logger.warning("Binary artifact %s missing at %s", filename, content_path)
+  else:
+    logger.warning("Text artifact %s missing at %s", filename, content_path)
+
+
+class _FileArtifactReader(ArtifactReader):
+  """Reads a payload file through a memory mapping."""
+
+  def __init__(
+      self, file: BinaryIO, *, version: int, mime_type: Optional[str]
+  ) -> None:
+    size = os.fstat(file.fileno()).st_size
+    super().__init__(version=version, size=size, mime_type=mime_type)
+    self._file = file
+    # Empty files cannot be mapped.
+    self._mmap = (
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+    )
+
+  async def iter_bytes(
+      self,
+      start: int = 0,
+      end: Optional[int] = None,
+      *,
+      chunk_size: int = DEFAULT_CHUNK_SIZE,
+  ) -> AsyncIterator[bytes]:
+    end = _check_range(self.size, start, end)
+    for offset in range(start, end, chunk_size):
+      # Slicing copies the chunk, which may fault its pages in from disk.
+      yield await asyncio.to_thread(
+          self._mmap.__getitem__, slice(offset, min(offset + chunk_size, end))
+      )
+
+  async def aclose(self) -> None:
+    if self._mmap is not None:
+      self._mmap.close()
+    self._file.close()
+
+
+class _FileArtifactWriter(ArtifactWriter):
+  """Writes a payload to a temporary file, saved as a version on commit."""
+
+  def __init__(
+      self,
+      file: BinaryIO,
+      temp_path: Path,
+      commit: Callable[[Optional[str]], int],
+      *,
+      hash_payload: bool,
+  ) -> None:
+    self._file = file
+    self._temp_path = temp_path
+    self._commit = commit
+    self._hash = hashlib.sha256() if hash_payload else None
+
+  async def write(self, data: bytes) -> None:
+    if self._hash is not None:
+      self._hash.update(data)
+    await asyncio.to_thread(self._file.write, data)
+
+  async def commit(self) -> int:
+    self._file.close()
+    digest = self._hash.hexdigest() if self._hash is not None else None
+    try:
+      return await asyncio.to_thread(self._commit, digest)
+    except BaseException:
+      await self.abort()
+      raise
+
+  async def abort(self) -> None:
+    self._file.close()
+    self._temp_path.unlink(missing_ok=True)
+
 
 def _write_metadata(
     path: Path,
@@ -689,7 +1048,8 @@ def _write_metadata(
     version: int,
     canonical_uri: str,
     custom_metadata: Optional[dict[str, Any]],
-) -> None:
+    content_sha256: Optional[str] = None,
+) -> FileArtifactVersion:
   """Persists metadata describing an artifact version."""
   metadata = FileArtifactVersion(
       file_name=filename,
@@ -699,11 +1059,18 @@ def _write_metadata(
       # Persist caller supplied metadata for feature parity with other
       # artifact services (e.g. GCS).
       custom_metadata=dict(custom_metadata or {}),
+      content_sha256=content_sha256,
   )
   path.write_text(
       metadata.model_dump_json(by_alias=True, exclude_none=True),
       encoding="utf-8",
   )
+  return metadata
+
+
+def _dump_metadata(metadata: FileArtifactVersion) -> dict[str, Any]:
+  """Returns the JSON form of metadata, as written to metadata files."""
+  return metadata.model_dump(mode="json", by_alias=True, exclude_none=True)
 
 
 def _read_metadata(path: Path) -> Optional[FileArtifactVersion]:
@@ -720,3 +1087,25 @@ def _read_metadata(path: Path) -> Optional[FileArtifactVersion]:
   except ValueError as exc:
     logger.warning("Invalid metadata JSON at %s: %s", path, exc)
     return None
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(
+      description=(
+          "Rebuild the artifact manifests of a FileArtifactService root"
+          " directory from the artifact files on disk."
+      )
+  )
+  parser.add_argument(
+      "--root_dir",
+      required=True,
+      help="Root directory of the FileArtifactService.",
+  )
+  parser.add_argument(
+      "--user_id",
+      help="Only rebuild the manifests of this user.",
+  )
+  args = parser.parse_args()
+  asyncio.run(
+      FileArtifactService(args.root_dir).rebuild_manifests(user_id=args.user_id)
+  )
@@ -19,37 +19,96 @@ The blob name format used depends on whether the filename has a user namespace:
     {app_name}/{user_id}/user/{filename}/{version}
   - For regular session-scoped files:
     {app_name}/{user_id}/{session_id}/{filename}/{version}
+
+With deduplication, version blobs are empty and reference, in their metadata,
+a content blob named by the SHA-256 digest of the payload:
+  .blobs/sha256/{digest}
+Each reference is recorded by an empty blob, so that content blobs are deleted
+with their last reference:
+  .blobs/sha256/{digest}.refs/{version blob name}
 """
 
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import functools
+import hashlib
 import logging
+import tempfile
 from typing import Any
+from typing import BinaryIO
+from typing import Callable
 from typing import Optional
+from typing import TypeVar
 
 from google.genai import types
 from typing_extensions import override
 
 from ..errors.input_validation_error import InputValidationError
+from .base_artifact_service import _check_range
+from .base_artifact_service import ArtifactReader
 from .base_artifact_service import ArtifactVersion
+from .base_artifact_service import ArtifactWriter
 from .base_artifact_service import BaseArtifactService
+from .base_artifact_service import DEFAULT_CHUNK_SIZE
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_T = TypeVar("_T")
+
+_MAX_SPOOLED_BYTES = 8 * 1024 * 1024
+
+# Listings only request the fields they use.
+_NAME_FIELDS = "items(name),nextPageToken"
+_VERSION_FIELDS = "items(name,timeCreated,contentType,metadata),nextPageToken"
+# The maximum number of calls in a batch request.
+_MAX_BATCH_SIZE = 100
+
+_BLOBS_PREFIX = ".blobs/sha256/"
+_CONTENT_SHA256_METADATA_KEY = "adk-content-sha256"
+
+
+def _custom_metadata(blob: Any) -> dict[str, Any]:
+  """Returns the metadata of a version blob set by the caller."""
+  return {
+      key: value
+      for key, value in (blob.metadata or {}).items()
+      if key != _CONTENT_SHA256_METADATA_KEY
+  }
+
 
 class GcsArtifactService(BaseArtifactService):
   """An artifact service implementation using Google Cloud Storage (GCS)."""
 
-  def __init__(self, bucket_name: str, **kwargs):
+  def __init__(
+      self,
+      bucket_name: str,
+      *,
+      deduplicate: bool = False,
+      max_concurrency: int = 16,
+      **kwargs,
+  ):
     """Initializes the GcsArtifactService.
 
     Args:
         bucket_name: The name of the bucket to use.
+        deduplicate: Whether to store identical payloads once, whatever the
+          artifacts and versions they are saved as.
+        max_concurrency: The maximum number of concurrent storage calls.
         **kwargs: Keyword arguments to pass to the Google Cloud Storage client.
     """
     from google.cloud import storage
 
+    if max_concurrency <= 0:
+      raise ValueError("max_concurrency must be positive.")
+    self.deduplicate = deduplicate
+    self._executor = ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="adk_gcs_artifacts"
+    )
     self.bucket_name = bucket_name
     self.storage_client = storage.Client(**kwargs)
     self.bucket = self.storage_client.bucket(self.bucket_name)
@@ -65,7 +124,7 @@ class GcsArtifactService(BaseArtifactService):
       session_id: Optional[str] = None,
       custom_metadata: Optional[dict[str, Any]] = None,
   ) -> int:
-    return await asyncio.to_thread(
+    return await self._run(
         self._save_artifact,
         app_name,
         user_id,
@@ -75,6 +134,13 @@ class GcsArtifactService(BaseArtifactService):
         custom_metadata,
     )
 
+  async def _run(self, func: Callable[..., _T], *args: Any) -> _T:
+    """Runs a blocking storage call on the executor of the service."""
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        self._executor, functools.partial(context.run, func, *args)
+    )
+
   @override
   async def load_artifact(
       self,
@@ -85,7 +151,7 @@ class GcsArtifactService(BaseArtifactService):
       session_id: Optional[str] = None,
       version: Optional[int] = None,
   ) -> Optional[types.Part]:
-    return await asyncio.to_thread(
+    return await self._run(
         self._load_artifact,
         app_name,
         user_id,
@@ -94,16 +160,38 @@ class GcsArtifactService(BaseArtifactService):
         version,
     )
 
+  @override
+  async def load_artifacts(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filenames: Sequence[str],
+      session_id: Optional[str] = None,
+  ) -> dict[str, Optional[types.Part]]:
+    """Loads the latest versions of artifacts concurrently.
+
+    At most `max_concurrency` artifacts are loaded at a time.
+    """
+    artifacts = await asyncio.gather(*(
+        self._run(
+            self._load_artifact, app_name, user_id, session_id, filename, None
+        )
+        for filename in filenames
+    ))
+    return dict(zip(filenames, artifacts))
+
   @override
   async def list_artifact_keys(
       self, *, app_name: str, user_id: str, session_id: Optional[str] = None
   ) -> list[str]:
-    return await asyncio.to_thread(
-        self._list_artifact_keys,
-        app_name,
-        user_id,
-        session_id,
+    prefixes = [f"{app_name}/{user_id}/user/"]
+    if session_id:
+      prefixes.append(f"{app_name}/{user_id}/{session_id}/")
+    filenames = await asyncio.gather(
+        *(self._run(self._list_filenames, prefix) for prefix in prefixes)
     )
+    return sorted(set().union(*filenames))
 
   @override
   async def delete_artifact(
@@ -114,7 +202,7 @@ class GcsArtifactService(BaseArtifactService):
       filename: str,
       session_id: Optional[str] = None,
   ) -> None:
-    return await asyncio.to_thread(
+    return await self._run(
         self._delete_artifact,
         app_name,
         user_id,
@@ -131,7 +219,7 @@ class GcsArtifactService(BaseArtifactService):
       filename: str,
       session_id: Optional[str] = None,
   ) -> list[int]:
-    return await asyncio.to_thread(
+    return await self._run(
         self._list_versions,
         app_name,
         user_id,
@@ -201,6 +289,115 @@ class GcsArtifactService(BaseArtifactService):
       artifact: types.Part,
       custom_metadata: Optional[dict[str, Any]] = None,
   ) -> int:
+    if artifact.inline_data:
+      data = artifact.inline_data.data
+      content_type = artifact.inline_data.mime_type
+    elif artifact.text:
+      data = artifact.text.encode("utf-8")
+      content_type = "text/plain"
+    elif artifact.file_data:
+      raise NotImplementedError(
+          "Saving artifact with file_data is not supported yet in"
+          " GcsArtifactService."
+      )
+    else:
+      raise InputValidationError(
+          "Artifact must have either inline_data or text."
+      )
+
+    version, blob = self._new_version_blob(
+        app_name, user_id, session_id, filename, custom_metadata
+    )
+    if self.deduplicate:
+      self._upload_deduplicated(
+          blob,
+          hashlib.sha256(data).hexdigest(),
+          content_type,
+          lambda content_blob: content_blob.upload_from_string(
+              data=data, content_type=content_type, if_generation_match=0
+          ),
+      )
+    else:
+      blob.upload_from_string(data=data, content_type=content_type)
+    return version
+
+  def _upload_deduplicated(
+      self,
+      blob: Any,
+      digest: str,
+      content_type: Optional[str],
+      upload_content: Callable[[Any], None],
+  ) -> None:
+    """Uploads a version blob referencing the content blob with `digest`.
+
+    The content blob is uploaded with `upload_content` if it does not exist.
+    """
+    from google.api_core.exceptions import NotFound
+    from google.api_core.exceptions import PreconditionFailed
+
+    content_blob_name = f"{_BLOBS_PREFIX}{digest}"
+    # The reference is recorded before the content blob is checked, and the
+    # check bumps the metageneration of the content blob, so that a concurrent
+    # `_delete_unreferenced_content()` either sees the reference or fails to
+    # delete it.
+    self.bucket.blob(
+        f"{content_blob_name}.refs/{blob.name}"
+    ).upload_from_string(data=b"", content_type="application/octet-stream")
+    content_blob = self.bucket.blob(content_blob_name)
+    content_blob.metadata = {"adk-last-referenced-by": blob.name}
+    try:
+      content_blob.patch()
+    except NotFound:
+      try:
+        upload_content(content_blob)
+      except PreconditionFailed:
+        # Uploaded by a concurrent save.
+        pass
+    blob.metadata = {
+        **(blob.metadata or {}),
+        _CONTENT_SHA256_METADATA_KEY: digest,
+    }
+    blob.upload_from_string(data=b"", content_type=content_type)
+
+  def _delete_unreferenced_content(self, digest: str) -> None:
+    """Deletes the content blob with `digest` if it has no references left."""
+    from google.api_core.exceptions import NotFound
+    from google.api_core.exceptions import PreconditionFailed
+
+    content_blob_name = f"{_BLOBS_PREFIX}{digest}"
+    content_blob = self.bucket.get_blob(content_blob_name)
+    if content_blob is None:
+      return
+    refs = self.storage_client.list_blobs(
+        self.bucket,
+        prefix=f"{content_blob_name}.refs/",
+        max_results=1,
+        fields=_NAME_FIELDS,
+    )
+    if any(True for _ in refs):
+      return
+    try:
+      content_blob.delete(if_metageneration_match=content_blob.metageneration)
+    except (NotFound, PreconditionFailed):
+      # Deleted, or referenced again, concurrently.
+      pass
+
+  def _get_content_blob(self, blob: Any) -> Optional[Any]:
+    """Returns the content blob referenced by a deduplicated version blob."""
+    digest = (blob.metadata or {}).get(_CONTENT_SHA256_METADATA_KEY)
+    if not digest:
+      return None
+    return self.bucket.get_blob(f"{_BLOBS_PREFIX}{digest}")
+
+  def _new_version_blob(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      custom_metadata: Optional[dict[str, Any]],
+  ) -> tuple[int, Any]:
+    """Returns the next version of an artifact and the blob to upload it to."""
     versions = self._list_versions(
         app_name=app_name,
         user_id=user_id,
@@ -215,28 +412,7 @@ class GcsArtifactService(BaseArtifactService):
     blob = self.bucket.blob(blob_name)
     if custom_metadata:
       blob.metadata = {k: str(v) for k, v in custom_metadata.items()}
-
-    if artifact.inline_data:
-      blob.upload_from_string(
-          data=artifact.inline_data.data,
-          content_type=artifact.inline_data.mime_type,
-      )
-    elif artifact.text:
-      blob.upload_from_string(
-          data=artifact.text,
-          content_type="text/plain",
-      )
-    elif artifact.file_data:
-      raise NotImplementedError(
-          "Saving artifact with file_data is not supported yet in"
-          " GcsArtifactService."
-      )
-    else:
-      raise InputValidationError(
-          "Artifact must have either inline_data or text."
-      )
-
-    return version
+    return version, blob
 
   def _load_artifact(
       self,
@@ -264,42 +440,31 @@ class GcsArtifactService(BaseArtifactService):
 
     artifact_bytes = blob.download_as_bytes()
     if not artifact_bytes:
-      return None
+      # Deduplicated version blobs are empty.
+      blob.reload()
+      content_blob = self._get_content_blob(blob)
+      if content_blob is None:
+        return None
+      artifact_bytes = content_blob.download_as_bytes()
+      if not artifact_bytes:
+        return None
     artifact = types.Part.from_bytes(
         data=artifact_bytes, mime_type=blob.content_type
     )
     return artifact
 
-  def _list_artifact_keys(
-      self, app_name: str, user_id: str, session_id: Optional[str]
-  ) -> list[str]:
+  def _list_filenames(self, prefix: str) -> set[str]:
+    """Lists the filenames of the artifacts with blobs beneath a prefix."""
     filenames = set()
-
-    if session_id:
-      session_prefix = f"{app_name}/{user_id}/{session_id}/"
-      session_blobs = self.storage_client.list_blobs(
-          self.bucket, prefix=session_prefix
-      )
-      for blob in session_blobs:
-        # blob.name is like session_prefix/filename/version
-        # or session_prefix/path/to/filename/version
-        # we need to extract filename including slashes, but remove prefix
-        # and /version
-        fn_and_version = blob.name[len(session_prefix) :]
-        filename = "/".join(fn_and_version.split("/")[:-1])
-        filenames.add(filename)
-
-    user_namespace_prefix = f"{app_name}/{user_id}/user/"
-    user_namespace_blobs = self.storage_client.list_blobs(
-        self.bucket, prefix=user_namespace_prefix
+    blobs = self.storage_client.list_blobs(
+        self.bucket, prefix=prefix, fields=_NAME_FIELDS
     )
-    for blob in user_namespace_blobs:
-      # blob.name is like user_namespace_prefix/filename/version
-      fn_and_version = blob.name[len(user_namespace_prefix) :]
-      filename = "/".join(fn_and_version.split("/")[:-1])
-      filenames.add(filename)
-
-    return sorted(list(filenames))
+    for blob in blobs:
+      # blob.name is like prefix/filename/version or
+      # prefix/path/to/filename/version.
+      fn_and_version = blob.name[len(prefix) :]
+      filenames.add("/".join(fn_and_version.split("/")[:-1]))
+    return filenames
 
   def _delete_artifact(
       self,
@@ -308,19 +473,44 @@ class GcsArtifactService(BaseArtifactService):
       session_id: Optional[str],
       filename: str,
   ) -> None:
-    versions = self._list_versions(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
+    prefix = self._get_blob_prefix(app_name, user_id, filename, session_id)
+    blobs = [
+        blob
+        for blob in self.storage_client.list_blobs(
+            self.bucket,
+            prefix=f"{prefix}/",
+            fields="items(name,metadata),nextPageToken",
+        )
+        if blob.name[len(prefix) + 1 :].isdigit()
+    ]
+    self._delete_blobs(blobs)
+
+    references = [
+        (blob.metadata[_CONTENT_SHA256_METADATA_KEY], blob.name)
+        for blob in blobs
+        if (blob.metadata or {}).get(_CONTENT_SHA256_METADATA_KEY)
+    ]
+    if not references:
+      return
+    # References may be missing after a failed save.
+    self._delete_blobs(
+        [
+            self.bucket.blob(f"{_BLOBS_PREFIX}{digest}.refs/{blob_name}")
+            for digest, blob_name in references
+        ],
+        raise_exception=False,
     )
-    for version in versions:
-      blob_name = self._get_blob_name(
-          app_name, user_id, filename, version, session_id
-      )
-      blob = self.bucket.blob(blob_name)
-      blob.delete()
-    return
+    for digest in {digest for digest, _ in references}:
+      self._delete_unreferenced_content(digest)
+
+  def _delete_blobs(
+      self, blobs: list[Any], *, raise_exception: bool = True
+  ) -> None:
+    """Deletes blobs with batch requests."""
+    for i in range(0, len(blobs), _MAX_BATCH_SIZE):
+      with self.storage_client.batch(raise_exception=raise_exception):
+        for blob in blobs[i : i + _MAX_BATCH_SIZE]:
+          blob.delete()
 
   def _list_versions(
       self,
@@ -347,7 +537,9 @@ class GcsArtifactService(BaseArtifactService):
         Returns an empty list if no versions are found.
     """
     prefix = self._get_blob_prefix(app_name, user_id, filename, session_id)
-    blobs = self.storage_client.list_blobs(self.bucket, prefix=f"{prefix}/")
+    blobs = self.storage_client.list_blobs(
+        self.bucket, prefix=f"{prefix}/", fields=_NAME_FIELDS
+    )
     versions = []
     for blob in blobs:
       *_, version = blob.name.split("/")
@@ -388,7 +580,7 @@ class GcsArtifactService(BaseArtifactService):
         canonical_uri=canonical_uri,
         create_time=blob.time_created.timestamp(),
         mime_type=blob.content_type,
-        custom_metadata=blob.metadata if blob.metadata else {},
+        custom_metadata=_custom_metadata(blob),
     )
 
   def _list_artifact_versions_sync(
@@ -400,7 +592,9 @@ class GcsArtifactService(BaseArtifactService):
   ) -> list[ArtifactVersion]:
     """Lists all versions and their metadata of an artifact."""
     prefix = self._get_blob_prefix(app_name, user_id, filename, session_id)
-    blobs = self.storage_client.list_blobs(self.bucket, prefix=f"{prefix}/")
+    blobs = self.storage_client.list_blobs(
+        self.bucket, prefix=f"{prefix}/", fields=_VERSION_FIELDS
+    )
     artifact_versions = []
     for blob in blobs:
       try:
@@ -418,7 +612,7 @@ class GcsArtifactService(BaseArtifactService):
           canonical_uri=canonical_uri,
           create_time=blob.time_created.timestamp(),
           mime_type=blob.content_type,
-          custom_metadata=blob.metadata if blob.metadata else {},
+          custom_metadata=_custom_metadata(blob),
       )
       artifact_versions.append(av)
 
@@ -434,7 +628,7 @@ class GcsArtifactService(BaseArtifactService):
       filename: str,
       session_id: Optional[str] = None,
   ) -> list[ArtifactVersion]:
-    return await asyncio.to_thread(
+    return await self._run(
         self._list_artifact_versions_sync,
         app_name,
         user_id,
@@ -452,7 +646,7 @@ class GcsArtifactService(BaseArtifactService):
       session_id: Optional[str] = None,
       version: Optional[int] = None,
   ) -> Optional[ArtifactVersion]:
-    return await asyncio.to_thread(
+    return await self._run(
         self._get_artifact_version_sync,
         app_name,
         user_id,
@@ -460,3 +654,147 @@ class GcsArtifactService(BaseArtifactService):
         filename,
         version,
     )
+
+  @override
+  async def open_artifact_reader(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    """Opens a reader that downloads each chunk with a ranged request."""
+    return await self._run(
+        self._open_artifact_reader_sync,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+        version,
+    )
+
+  def _open_artifact_reader_sync(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      version: Optional[int],
+  ) -> Optional[ArtifactReader]:
+    if version is None:
+      versions = self._list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+      )
+      if not versions:
+        return None
+      version = max(versions)
+
+    blob = self.bucket.get_blob(
+        self._get_blob_name(app_name, user_id, filename, version, session_id)
+    )
+    if blob is None:
+      return None
+    mime_type = blob.content_type
+    if not blob.size:
+      # Deduplicated version blobs are empty.
+      blob = self._get_content_blob(blob) or blob
+    return _GcsArtifactReader(blob, version=version, mime_type=mime_type)
+
+  @override
+  async def open_artifact_writer(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> ArtifactWriter:
+    """Opens a writer that spools the payload and uploads it on commit.
+
+    Payloads larger than a few megabytes are spooled to a temporary file
+    rather than held in memory.
+    """
+
+    def upload(file: BinaryIO, digest: Optional[str]) -> int:
+      version, blob = self._new_version_blob(
+          app_name, user_id, session_id, filename, custom_metadata
+      )
+      if digest is None:
+        blob.upload_from_file(file, rewind=True, content_type=mime_type)
+      else:
+        self._upload_deduplicated(
+            blob,
+            digest,
+            mime_type,
+            lambda content_blob: content_blob.upload_from_file(
+                file,
+                rewind=True,
+                content_type=mime_type,
+                if_generation_match=0,
+            ),
+        )
+      return version
+
+    return _GcsArtifactWriter(upload, hash_payload=self.deduplicate)
+
+
+class _GcsArtifactReader(ArtifactReader):
+  """Reads a blob with a ranged download per chunk."""
+
+  def __init__(
+      self, blob: Any, *, version: int, mime_type: Optional[str]
+  ) -> None:
+    super().__init__(version=version, size=blob.size or 0, mime_type=mime_type)
+    self._blob = blob
+
+  async def iter_bytes(
+      self,
+      start: int = 0,
+      end: Optional[int] = None,
+      *,
+      chunk_size: int = DEFAULT_CHUNK_SIZE,
+  ) -> AsyncIterator[bytes]:
+    end = _check_range(self.size, start, end)
+    for offset in range(start, end, chunk_size):
+      # The end of GCS ranges is inclusive.
+      yield await asyncio.to_thread(
+          self._blob.download_as_bytes,
+          start=offset,
+          end=min(offset + chunk_size, end) - 1,
+      )
+
+
+class _GcsArtifactWriter(ArtifactWriter):
+  """Spools a payload to a temporary file and uploads it on commit."""
+
+  def __init__(
+      self,
+      upload: Callable[[BinaryIO, Optional[str]], int],
+      *,
+      hash_payload: bool,
+  ) -> None:
+    self._upload = upload
+    self._file = tempfile.SpooledTemporaryFile(max_size=_MAX_SPOOLED_BYTES)
+    self._hash = hashlib.sha256() if hash_payload else None
+
+  async def write(self, data: bytes) -> None:
+    if self._hash is not None:
+      self._hash.update(data)
+    await asyncio.to_thread(self._file.write, data)
+
+  async def commit(self) -> int:
+    digest = self._hash.hexdigest() if self._hash is not None else None
+    try:
+      return await asyncio.to_thread(self._upload, self._file, digest)
+    finally:
+      self._file.close()
+
+  async def abort(self) -> None:
+    self._file.close()
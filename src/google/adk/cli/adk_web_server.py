@@ -20,6 +20,7 @@ import importlib
 import json
 import logging
 import os
+import re
 import sys
 import time
 import traceback
@@ -29,8 +30,10 @@ from typing import Callable
 from typing import List
 from typing import Literal
 from typing import Optional
+from urllib.parse import quote
 
 from fastapi import FastAPI
+from fastapi import Header
 from fastapi import HTTPException
 from fastapi import Query
 from fastapi import Response
@@ -50,6 +53,7 @@ from opentelemetry.sdk.trace import SpanProcessor
 from opentelemetry.sdk.trace import TracerProvider
 from pydantic import Field
 from pydantic import ValidationError
+from starlette.background import BackgroundTask
 from starlette.types import Lifespan
 from typing_extensions import deprecated
 from typing_extensions import override
@@ -108,6 +112,45 @@ TAG_EVALUATION = "Evaluation"
 
 _REGEX_PREFIX = "regex:"
 
+_BYTE_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def _parse_byte_range(
+    range_header: Optional[str], size: int
+) -> Optional[tuple[int, int]]:
+  """Parses a single-range `Range` header into a [start, end) byte range.
+
+  Args:
+    range_header: The value of the `Range` header.
+    size: The size of the requested content.
+
+  Returns:
+    The requested range, or None if the whole content should be served, which
+    is the case for missing, malformed and multi-range headers.
+
+  Raises:
+    HTTPException: If the range is not satisfiable.
+  """
+  match = _BYTE_RANGE_RE.fullmatch((range_header or "").strip())
+  if not match or match.group(1) == match.group(2) == "":
+    return None
+  first, last = match.groups()
+  if first:
+    start = int(first)
+    end = min(int(last) + 1, size) if last else size
+    if start > int(last or start):
+      return None
+  else:
+    # A suffix range, of the last bytes of the content.
+    start, end = max(size - int(last), 0), size
+  if start >= end:
+    raise HTTPException(
+        status_code=416,
+        detail="Requested range not satisfiable",
+        headers={"Content-Range": f"bytes */{size}"},
+    )
+  return start, end
+
 
 def _parse_cors_origins(
     allow_origins: list[str],
@@ -1371,6 +1414,67 @@ class AdkWebServer:
         raise HTTPException(status_code=404, detail="Artifact not found")
       return artifact
 
+    @app.get(
+        "/apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts/{artifact_name}/content",
+    )
+    async def stream_artifact_content(
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        artifact_name: str,
+        version: Optional[int] = Query(None),
+        range_header: Optional[str] = Header(None, alias="Range"),
+    ) -> StreamingResponse:
+      """Streams the raw payload of an artifact version.
+
+      Single byte ranges are supported, so that large artifacts can be read in
+      parts and media can be seeked without downloading them whole. Payloads
+      are served as attachments, so that browsers do not render them in the
+      origin of the server.
+      """
+      reader = await self.artifact_service.open_artifact_reader(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=artifact_name,
+          version=version,
+      )
+      if reader is None:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+      try:
+        byte_range = _parse_byte_range(range_header, reader.size)
+      except HTTPException:
+        await reader.aclose()
+        raise
+      start, end = byte_range or (0, reader.size)
+
+      async def content():
+        try:
+          async for chunk in reader.iter_bytes(start, end):
+            yield chunk
+        finally:
+          await reader.aclose()
+
+      headers = {
+          "Accept-Ranges": "bytes",
+          "Content-Length": str(end - start),
+          "Content-Disposition": (
+              f"attachment; filename*=UTF-8''{quote(artifact_name, safe='')}"
+          ),
+          "X-Content-Type-Options": "nosniff",
+      }
+      if byte_range is not None:
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{reader.size}"
+      return StreamingResponse(
+          content(),
+          status_code=206 if byte_range is not None else 200,
+          headers=headers,
+          media_type=reader.mime_type or "text/plain; charset=utf-8",
+          # Closes the reader if the content is never iterated, e.g. when the
+          # client disconnects first. Closing a reader twice is harmless.
+          background=BackgroundTask(reader.aclose),
+      )
+
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts/{artifact_name}/versions/metadata",
         response_model=list[ArtifactVersion],
@@ -0,0 +1,72 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import List
+from typing import Sequence
+
+import click
+import yaml
+
+from ..tools.google_api_tool.google_api_toolset import compile_google_api_tool_bundle
+from ..tools.openapi_tool.openapi_spec_parser.tool_bundle import compile_tool_bundle
+from ..tools.openapi_tool.openapi_spec_parser.tool_bundle import save_tool_bundle
+
+
+def _parse_google_api(google_api: str) -> tuple[str, str]:
+  api_name, sep, api_version = google_api.partition(':')
+  if not sep or not api_name or not api_version:
+    raise click.BadParameter(
+        f'Expected NAME:VERSION, e.g. calendar:v3, got {google_api!r}.',
+        param_hint='--google_api',
+    )
+  return api_name, api_version
+
+
+def run_cmd(
+    *,
+    openapi_specs: Sequence[str],
+    google_apis: Sequence[str],
+    output_dir: str,
+) -> List[str]:
+  """Runs `adk compile_tools` command to precompile tool bundles.
+
+  Args:
+    openapi_specs: Paths of OpenAPI spec files in JSON or YAML format.
+    google_apis: Google APIs in the NAME:VERSION format, e.g. calendar:v3.
+    output_dir: The directory to write the bundles to.
+
+  Returns:
+    The paths of the written bundles.
+  """
+  paths = []
+  for spec_path in openapi_specs:
+    with open(spec_path, 'r', encoding='utf-8') as f:
+      # JSON is a subset of YAML, so both formats load here.
+      spec_dict = yaml.safe_load(f)
+    bundle = compile_tool_bundle(spec_dict)
+    paths.append(save_tool_bundle(bundle, output_dir))
+    click.echo(
+        f'Compiled {len(bundle.operations)} tools from {spec_path} into'
+        f' {paths[-1]}'
+    )
+  for google_api in google_apis:
+    bundle = compile_google_api_tool_bundle(*_parse_google_api(google_api))
+    paths.append(save_tool_bundle(bundle, output_dir))
+    click.echo(
+        f'Compiled {len(bundle.operations)} tools from {google_api} into'
+        f' {paths[-1]}'
+    )
+  return paths
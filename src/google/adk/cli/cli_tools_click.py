@@ -470,6 +470,58 @@ def cli_create_cmd(
   )
 
 
+@main.command("compile_tools", cls=HelpfulCommand)
+@click.option(
+    "--openapi_spec",
+    "openapi_specs",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    multiple=True,
+    help="Optional. Path of an OpenAPI spec file in JSON or YAML format.",
+)
+@click.option(
+    "--google_api",
+    "google_apis",
+    multiple=True,
+    help=(
+        "Optional. A Google API in the NAME:VERSION format, e.g. calendar:v3."
+        " Its discovery document is fetched and converted."
+    ),
+)
+@click.option(
+    "--output_dir",
+    type=click.Path(file_okay=False, resolve_path=True),
+    required=True,
+    help="Required. The directory to write the tool bundles to.",
+)
+def cli_compile_tools(
+    openapi_specs: tuple[str, ...],
+    google_apis: tuple[str, ...],
+    output_dir: str,
+):
+  """Precompiles OpenAPI and Google API tool bundles.
+
+  Toolsets created with `bundle_dir` set to the output directory, or with the
+  ADK_TOOL_BUNDLE_DIR environment variable set to it, load these bundles
+  instead of parsing the specs at startup.
+
+  Example:
+
+    adk compile_tools --openapi_spec=api.yaml --google_api=calendar:v3
+    --output_dir=tool_bundles
+  """
+  if not openapi_specs and not google_apis:
+    raise click.UsageError(
+        "At least one of --openapi_spec or --google_api is required."
+    )
+  from . import cli_compile_tools as compile_tools
+
+  compile_tools.run_cmd(
+      openapi_specs=openapi_specs,
+      google_apis=google_apis,
+      output_dir=output_dir,
+  )
+
+
 def validate_exclusive(ctx, param, value):
   # Store the validated parameters in the context
   if not hasattr(ctx, "exclusive_opts"):
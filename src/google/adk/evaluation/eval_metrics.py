@@ -95,6 +95,16 @@ class JudgeModelOptions(EvalBaseModel):
       ),
   )
 
+  max_concurrency: int = Field(
+      default=1,
+      gt=0,
+      description=(
+          "The maximum number of judge model requests in flight at once."
+          " Raising it speeds up evaluation, at the cost of more concurrent"
+          " load on the judge model."
+      ),
+  )
+
 
 class BaseCriterion(BaseModel):
   """Base criterion to use for an Eval Metric."""
@@ -25,7 +25,6 @@ from ..models.base_llm import BaseLlm
 from ..models.llm_request import LlmRequest
 from ..models.llm_response import LlmResponse
 from ..models.registry import LLMRegistry
-from ..utils.context_utils import Aclosing
 from ..utils.feature_decorator import experimental
 from ._retry_options_utils import add_default_retry_options_if_not_present
 from .common import EvalBaseModel
@@ -133,7 +132,10 @@ class LlmAsJudge(Evaluator):
         else expected_invocations
     )
 
-    per_invocation_results = []
+    # All samples of all invocations are independent, so they are submitted to
+    # the judge model as a single batch.
+    num_samples = self._judge_model_options.num_samples
+    llm_requests = []
     for actual, expected in zip(actual_invocations, expected_invocations):
       auto_rater_prompt = self.format_auto_rater_prompt(actual, expected)
       llm_request = LlmRequest(
@@ -148,28 +150,42 @@ class LlmAsJudge(Evaluator):
           or genai_types.GenerateContentConfig(),
       )
       add_default_retry_options_if_not_present(llm_request)
-      num_samples = self._judge_model_options.num_samples
+      # Model adapters may adjust the request in place, so every sample gets
+      # its own copy.
+      llm_requests.extend(
+          llm_request.model_copy(deep=True) for _ in range(num_samples)
+      )
+
+    llm_responses = await self._judge_model.generate_content_batch(
+        llm_requests,
+        max_concurrency=self._judge_model_options.max_concurrency,
+    )
+
+    per_invocation_results = []
+    for index, (actual, expected) in enumerate(
+        zip(actual_invocations, expected_invocations)
+    ):
       invocation_result_samples = []
-      for _ in range(num_samples):
-        async with Aclosing(
-            self._judge_model.generate_content_async(llm_request)
-        ) as agen:
-          async for llm_response in agen:
-            # Non-streaming call, so there is only one response content.
-            auto_rater_score = self.convert_auto_rater_response_to_score(
-                llm_response
-            )
-            invocation_result_samples.append(
-                PerInvocationResult(
-                    actual_invocation=actual,
-                    expected_invocation=expected,
-                    score=auto_rater_score.score,
-                    eval_status=get_eval_status(
-                        auto_rater_score.score, self._eval_metric.threshold
-                    ),
-                    rubric_scores=auto_rater_score.rubric_scores,
-                )
+      for llm_response in llm_responses[
+          index * num_samples : (index + 1) * num_samples
+      ]:
+        if llm_response is None:
+          # The judge model did not respond to this sample.
+          continue
+        auto_rater_score = self.convert_auto_rater_response_to_score(
+            llm_response
+        )
+        invocation_result_samples.append(
+            PerInvocationResult(
+                actual_invocation=actual,
+                expected_invocation=expected,
+                score=auto_rater_score.score,
+                eval_status=get_eval_status(
+                    auto_rater_score.score, self._eval_metric.threshold
+                ),
+                rubric_scores=auto_rater_score.rubric_scores,
             )
+        )
       if not invocation_result_samples:
         continue
       per_invocation_results.append(
@@ -14,9 +14,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import gzip
 import logging
 import time
+from typing import Optional
 from typing import TYPE_CHECKING
+import weakref
 
 from google.genai import types
 
@@ -28,9 +33,54 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+_SUPPORTED_COMPRESSIONS = ('gzip',)
+
+
+class _AudioStream:
+  """The segment flush state of one audio cache of an invocation."""
+
+  def __init__(self):
+    self.buffer: list[RealtimeCacheEntry] | None = None
+    """The cache list the buffered byte count refers to."""
+    self.buffered_bytes = 0
+    self.pending: collections.deque[tuple[list[RealtimeCacheEntry], int]] = (
+        collections.deque()
+    )
+    """Segments waiting to be saved, with their sizes, oldest first."""
+    self.pending_bytes = 0
+    self.uploading_bytes = 0
+    self.task: asyncio.Task[None] | None = None
+    self.events: list[Event] = []
+    """Events of the saved segments, not yet returned by flush_caches."""
+
+  def track(self, cache: list[RealtimeCacheEntry], added_bytes: int) -> None:
+    if cache is self.buffer:
+      self.buffered_bytes += added_bytes
+    else:
+      # The cache was replaced or modified outside of cache_audio.
+      self.buffer = cache
+      self.buffered_bytes = sum(len(entry.data.data) for entry in cache)
+
+  @property
+  def idle(self) -> bool:
+    return (
+        not self.pending
+        and not self.events
+        and (self.task is None or self.task.done())
+    )
+
 
 class AudioCacheManager:
-  """Manages audio caching and flushing for live streaming flows."""
+  """Manages audio caching and flushing for live streaming flows.
+
+  The audio of each cache is buffered up to `max_cache_size_bytes`, or
+  `max_cache_duration_seconds` of audio. Then the buffered chunks are saved as
+  a segment in the background, and the events of the saved segments are
+  returned by the next `flush_caches`. At most one segment per cache is saved
+  at a time, and the oldest waiting segments are dropped if they exceed the
+  cap, so the memory used per cache stays within a few times the cap however
+  long the stream.
+  """
 
   def __init__(self, config: AudioCacheConfig | None = None):
     """Initialize the audio cache manager.
@@ -39,6 +89,15 @@ class AudioCacheManager:
       config: Configuration for audio caching behavior.
     """
     self.config = config or AudioCacheConfig()
+    self._streams: dict[tuple[str, str], _AudioStream] = {}
+    self.flushed_segments = 0
+    """The number of segments saved to the artifact service."""
+    self.flushed_bytes = 0
+    """The number of audio bytes saved to the artifact service."""
+    self.stored_bytes = 0
+    """The number of bytes stored for the saved audio, after compression."""
+    self.dropped_bytes = 0
+    """The number of audio bytes dropped to keep the caches within the cap."""
 
   def cache_audio(
       self,
@@ -74,6 +133,21 @@ class AudioCacheManager:
     )
     cache.append(audio_entry)
 
+    key = (invocation_context.invocation_id, cache_type)
+    stream = self._streams.get(key)
+    if stream is None:
+      stream = self._streams[key] = _AudioStream()
+      # Invocations may end without a final flush_caches, e.g. when the live
+      # connection drops, so the stream is also dropped with its context.
+      weakref.finalize(invocation_context, self._discard_stream, key, stream)
+    stream.track(cache, len(audio_blob.data))
+    if (
+        stream.buffered_bytes >= self.config.max_cache_size_bytes
+        or cache[-1].timestamp - cache[0].timestamp
+        >= self.config.max_cache_duration_seconds
+    ):
+      self._flush_segment(invocation_context, cache, cache_type, stream)
+
     logger.debug(
         'Cached %s audio chunk: %d bytes, cache size: %d',
         cache_type,
@@ -81,6 +155,78 @@ class AudioCacheManager:
         len(cache),
     )
 
+  def _flush_segment(
+      self,
+      invocation_context: InvocationContext,
+      cache: list[RealtimeCacheEntry],
+      cache_type: str,
+      stream: _AudioStream,
+  ) -> None:
+    """Moves the cached chunks to a segment saved in the background."""
+    cap = self.config.max_cache_size_bytes
+    try:
+      asyncio.get_running_loop()
+    except RuntimeError:
+      can_save = False
+    else:
+      can_save = invocation_context.artifact_service is not None
+    if not can_save:
+      # Nowhere to save the audio to: keep the most recent audio only.
+      dropped = 0
+      while len(cache) > 1 and stream.buffered_bytes > cap:
+        size = len(cache[dropped].data.data)
+        stream.buffered_bytes -= size
+        self.dropped_bytes += size
+        dropped += 1
+      del cache[:dropped]
+      return
+
+    stream.pending.append((cache.copy(), stream.buffered_bytes))
+    stream.pending_bytes += stream.buffered_bytes
+    cache.clear()
+    stream.buffered_bytes = 0
+    while len(stream.pending) > 1 and stream.pending_bytes > cap:
+      _, size = stream.pending.popleft()
+      stream.pending_bytes -= size
+      self.dropped_bytes += size
+      logger.warning(
+          'Dropped a %d byte %s audio segment: saving is too slow',
+          size,
+          cache_type,
+      )
+    if stream.task is None or stream.task.done():
+      stream.task = asyncio.create_task(
+          self._save_pending_segments(invocation_context, cache_type, stream)
+      )
+
+  def _discard_stream(self, key: tuple[str, str], stream: _AudioStream) -> None:
+    if self._streams.get(key) is stream:
+      del self._streams[key]
+
+  async def _save_pending_segments(
+      self,
+      invocation_context: InvocationContext,
+      cache_type: str,
+      stream: _AudioStream,
+  ) -> None:
+    """Saves the pending segments of a stream, oldest first."""
+    while stream.pending:
+      segment, size = stream.pending.popleft()
+      stream.pending_bytes -= size
+      stream.uploading_bytes = size
+      try:
+        audio_event = await self._flush_cache_to_services(
+            invocation_context, segment, f'{cache_type}_audio'
+        )
+      finally:
+        stream.uploading_bytes = 0
+      if not audio_event:
+        # Retried by the next segment flush, or flush_caches.
+        stream.pending.appendleft((segment, size))
+        stream.pending_bytes += size
+        return
+      stream.events.append(audio_event)
+
   async def flush_caches(
       self,
       invocation_context: InvocationContext,
@@ -95,6 +241,9 @@ class AudioCacheManager:
     f"artifact://{invocation_context.app_name}/{invocation_context.user_id}/
     {invocation_context.session.id}/_adk_live/{filename}#{revision_id}"
 
+    The events of the segments saved in the background since the last flush
+    are returned first.
+
     Note: video data is not supported yet.
 
     Args:
@@ -106,27 +255,53 @@ class AudioCacheManager:
       A list of Event objects created from the flushed caches.
     """
     flushed_events = []
-    if flush_user_audio and invocation_context.input_realtime_cache:
-      audio_event = await self._flush_cache_to_services(
-          invocation_context,
-          invocation_context.input_realtime_cache,
-          'input_audio',
+    if flush_user_audio:
+      flushed_events.extend(
+          await self._flush_stream(invocation_context, 'input')
       )
-      if audio_event:
-        flushed_events.append(audio_event)
-        invocation_context.input_realtime_cache = []
+    if flush_model_audio:
+      flushed_events.extend(
+          await self._flush_stream(invocation_context, 'output')
+      )
+    return flushed_events
 
-    if flush_model_audio and invocation_context.output_realtime_cache:
-      logger.debug('Flushed output audio cache')
+  async def _flush_stream(
+      self, invocation_context: InvocationContext, cache_type: str
+  ) -> list[Event]:
+    """Flushes one audio cache, after its pending segments."""
+    key = (invocation_context.invocation_id, cache_type)
+    stream = self._streams.get(key)
+    flushed_events = []
+    if stream:
+      # Segments flushed while waiting start a new save task.
+      while stream.task is not None and not stream.task.done():
+        await stream.task
+      if stream.pending:
+        # Retry the segments which failed to save in the background. The
+        # retry is the task of the stream, so that segments flushed meanwhile
+        # are saved by it rather than by a concurrent task.
+        stream.task = asyncio.create_task(
+            self._save_pending_segments(invocation_context, cache_type, stream)
+        )
+        await stream.task
+      flushed_events.extend(stream.events)
+      stream.events.clear()
+      if stream.pending:
+        # Keep the cache, so segments are saved in order.
+        return flushed_events
+
+    cache = getattr(invocation_context, f'{cache_type}_realtime_cache')
+    if cache:
+      if cache_type == 'output':
+        logger.debug('Flushed output audio cache')
       audio_event = await self._flush_cache_to_services(
-          invocation_context,
-          invocation_context.output_realtime_cache,
-          'output_audio',
+          invocation_context, cache, f'{cache_type}_audio'
       )
       if audio_event:
         flushed_events.append(audio_event)
-        invocation_context.output_realtime_cache = []
-
+        setattr(invocation_context, f'{cache_type}_realtime_cache', [])
+    if stream and stream.idle:
+      del self._streams[key]
     return flushed_events
 
   async def _flush_cache_to_services(
@@ -154,19 +329,25 @@ class AudioCacheManager:
 
     try:
       # Combine audio chunks into a single file
-      combined_audio_data = b''
-      mime_type = audio_cache[0].data.mime_type if audio_cache else 'audio/pcm'
-
-      for entry in audio_cache:
-        combined_audio_data += entry.data.data
+      combined_audio_data = b''.join(entry.data.data for entry in audio_cache)
+      mime_type = audio_cache[0].data.mime_type or 'audio/pcm'
 
       # Generate filename with timestamp from first audio chunk (when recording started)
       timestamp = int(audio_cache[0].timestamp * 1000)  # milliseconds
       filename = f"adk_live_audio_storage_{cache_type}_{timestamp}.{mime_type.split('/')[-1]}"
 
+      stored_audio_data = combined_audio_data
+      custom_metadata = None
+      if self.config.compression == 'gzip':
+        stored_audio_data = await asyncio.to_thread(
+            gzip.compress, combined_audio_data, compresslevel=6
+        )
+        filename += '.gz'
+        custom_metadata = {'content_encoding': 'gzip'}
+
       # Save to artifact service
       combined_audio_part = types.Part(
-          inline_data=types.Blob(data=combined_audio_data, mime_type=mime_type)
+          inline_data=types.Blob(data=stored_audio_data, mime_type=mime_type)
       )
 
       revision_id = await invocation_context.artifact_service.save_artifact(
@@ -175,7 +356,11 @@ class AudioCacheManager:
           session_id=invocation_context.session.id,
           filename=filename,
           artifact=combined_audio_part,
+          custom_metadata=custom_metadata,
       )
+      self.flushed_segments += 1
+      self.flushed_bytes += len(combined_audio_data)
+      self.stored_bytes += len(stored_audio_data)
 
       # Create artifact reference for session service
       artifact_ref = f'artifact://{invocation_context.app_name}/{invocation_context.user_id}/{invocation_context.session.id}/_adk_live/{filename}#{revision_id}'
@@ -222,6 +407,9 @@ class AudioCacheManager:
   ) -> dict[str, int]:
     """Get statistics about current cache state.
 
+    The chunk and byte counts are those of the invocation. The segment
+    counters are the totals of this manager.
+
     Args:
       invocation_context: The invocation context.
 
@@ -240,6 +428,14 @@ class AudioCacheManager:
         for entry in invocation_context.output_realtime_cache or []
     )
 
+    pending_segments = 0
+    pending_bytes = 0
+    for cache_type in ('input', 'output'):
+      stream = self._streams.get((invocation_context.invocation_id, cache_type))
+      if stream:
+        pending_segments += len(stream.pending) + bool(stream.uploading_bytes)
+        pending_bytes += stream.pending_bytes + stream.uploading_bytes
+
     return {
         'input_chunks': input_count,
         'output_chunks': output_count,
@@ -247,6 +443,12 @@ class AudioCacheManager:
         'output_bytes': output_bytes,
         'total_chunks': input_count + output_count,
         'total_bytes': input_bytes + output_bytes,
+        'pending_segments': pending_segments,
+        'pending_bytes': pending_bytes,
+        'flushed_segments': self.flushed_segments,
+        'flushed_bytes': self.flushed_bytes,
+        'stored_bytes': self.stored_bytes,
+        'dropped_bytes': self.dropped_bytes,
     }
 
 
@@ -258,6 +460,7 @@ class AudioCacheConfig:
       max_cache_size_bytes: int = 10 * 1024 * 1024,  # 10MB
       max_cache_duration_seconds: float = 300.0,  # 5 minutes
       auto_flush_threshold: int = 100,  # Number of chunks
+      compression: Optional[str] = None,
   ):
     """Initialize audio cache configuration.
 
@@ -265,7 +468,19 @@ class AudioCacheConfig:
       max_cache_size_bytes: Maximum cache size in bytes before auto-flush.
       max_cache_duration_seconds: Maximum duration to keep data in cache.
       auto_flush_threshold: Number of chunks that triggers auto-flush.
+      compression: How to compress the saved audio: None, or 'gzip'. Gzipped
+        audio keeps its mime type, and is saved with a '.gz' suffix and a
+        'content_encoding' custom metadata.
+
+    Raises:
+      ValueError: If the compression is not supported.
     """
+    if compression is not None and compression not in _SUPPORTED_COMPRESSIONS:
+      raise ValueError(
+          f'Unsupported audio compression: {compression!r}. Supported:'
+          f' {_SUPPORTED_COMPRESSIONS}.'
+      )
     self.max_cache_size_bytes = max_cache_size_bytes
     self.max_cache_duration_seconds = max_cache_duration_seconds
     self.auto_flush_threshold = auto_flush_threshold
+    self.compression = compression
@@ -25,6 +25,8 @@ import logging
 import threading
 from typing import Any
 from typing import AsyncGenerator
+from typing import Awaitable
+from typing import Callable
 from typing import cast
 from typing import Dict
 from typing import Optional
@@ -520,8 +522,13 @@ async def _execute_single_function_call_async(
     # Step 3: Otherwise, proceed calling the tool normally.
     if function_response is None:
       try:
-        function_response = await __call_tool_async(
-            tool, args=function_args, tool_context=tool_context
+        function_response = await _call_tool_memoized(
+            tool,
+            function_args,
+            tool_context,
+            lambda: __call_tool_async(
+                tool, args=function_args, tool_context=tool_context
+            ),
         )
       except Exception as tool_error:
         error_response = await _run_on_tool_error_callbacks(
@@ -877,16 +884,19 @@ async def _process_function_live_helper(
     # Check if we should run tools in thread pool to avoid blocking event loop
     thread_pool_config = invocation_context.run_config.tool_thread_pool_config
     if thread_pool_config is not None:
-      function_response = await _call_tool_in_thread_pool(
+      call_tool = lambda: _call_tool_in_thread_pool(
           tool,
           args=function_args,
           tool_context=tool_context,
           max_workers=thread_pool_config.max_workers,
       )
     else:
-      function_response = await __call_tool_async(
+      call_tool = lambda: __call_tool_async(
           tool, args=function_args, tool_context=tool_context
       )
+    function_response = await _call_tool_memoized(
+        tool, function_args, tool_context, call_tool
+    )
   return function_response
 
 
@@ -958,6 +968,40 @@ async def __call_tool_live(
       yield item
 
 
+async def _call_tool_memoized(
+    tool: BaseTool,
+    args: dict[str, Any],
+    tool_context: ToolContext,
+    call_tool: Callable[[], Awaitable[Any]],
+) -> Any:
+  """Calls the tool, reusing its memoized result if it has a policy for it."""
+  memoization = tool.memoization
+  if (
+      memoization is None
+      or tool.is_long_running
+      or memoization.should_bypass(args)
+  ):
+    return await call_tool()
+
+  key = memoization.make_key(tool.name, args, tool_context)
+  with tracer.start_as_current_span(f'tool_memoization {tool.name}') as span:
+    hit, function_response = memoization.get(key)
+    span.set_attribute('gcp.vertex.agent.tool_memoization.hit', hit)
+    span.set_attribute(
+        'gcp.vertex.agent.tool_memoization.scope', memoization.scope.value
+    )
+  if hit:
+    # Copied so that callbacks cannot alter the memoized result.
+    return copy.deepcopy(function_response)
+
+  function_response = await call_tool()
+  # Calls with side effects on the context are not memoized, as a memoized
+  # result would skip them.
+  if function_response is not None and tool_context.actions == EventActions():
+    memoization.put(key, copy.deepcopy(function_response))
+  return function_response
+
+
 async def __call_tool_async(
     tool: BaseTool,
     args: dict[str, Any],
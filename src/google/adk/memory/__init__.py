@@ -14,14 +14,24 @@
 import logging
 
 from .base_memory_service import BaseMemoryService
+from .batching_memory_service import BatchingMemoryService
+from .embedders import BaseEmbedder
+from .embedders import GoogleGenAiEmbedder
+from .embedders import HashingEmbedder
 from .in_memory_memory_service import InMemoryMemoryService
+from .sqlite_memory_service import SqliteMemoryService
 from .vertex_ai_memory_bank_service import VertexAiMemoryBankService
 
 logger = logging.getLogger('google_adk.' + __name__)
 
 __all__ = [
+    'BaseEmbedder',
     'BaseMemoryService',
+    'BatchingMemoryService',
+    'GoogleGenAiEmbedder',
+    'HashingEmbedder',
     'InMemoryMemoryService',
+    'SqliteMemoryService',
     'VertexAiMemoryBankService',
 ]
 
@@ -35,3 +45,14 @@ except ImportError:
       ' VertexAiRagMemoryService please install it. If not, you can ignore this'
       ' warning.'
   )
+
+try:
+  from .local_vector_memory_service import LocalVectorMemoryService
+
+  __all__.append('LocalVectorMemoryService')
+except ImportError:
+  logger.debug(
+      'numpy is not installed. If you want to use the'
+      ' LocalVectorMemoryService please install it. If not, you can ignore'
+      ' this warning.'
+  )
@@ -0,0 +1,133 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An incremental inverted index with BM25 ranking, used by memory services."""
+
+from __future__ import annotations
+
+from collections import Counter
+import heapq
+import itertools
+import math
+import re
+from typing import Generic
+from typing import Hashable
+from typing import Optional
+from typing import TypeVar
+
+_K = TypeVar('_K', bound=Hashable)
+_V = TypeVar('_V')
+
+_WORD_RE = re.compile(r'[A-Za-z]+')
+
+# Standard BM25 parameters.
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+  """Splits a string into lowercase words."""
+  return [word.lower() for word in _WORD_RE.findall(text)]
+
+
+class _Document(Generic[_V]):
+  __slots__ = ('seq', 'value', 'term_counts', 'length')
+
+  def __init__(self, seq: int, value: _V, term_counts: Counter[str]):
+    self.seq = seq
+    self.value = value
+    self.term_counts = term_counts
+    self.length = sum(term_counts.values())
+
+
+class KeywordIndex(Generic[_K, _V]):
+  """An inverted index of documents, searched by keywords with BM25 ranking.
+
+  Documents match a query if they contain any of its words. Updates only touch
+  the postings of the words of the updated documents, and searches only the
+  postings of the words of the query. This class is not thread-safe.
+  """
+
+  def __init__(self):
+    self._documents: dict[_K, _Document[_V]] = {}
+    self._postings: dict[str, dict[_K, int]] = {}
+    self._total_length = 0
+    self._seq = itertools.count()
+
+  def add(self, key: _K, text: str, value: _V) -> None:
+    """Indexes `text` under `key`, replacing any document with that key.
+
+    Documents without words are not indexed, as no query can match them.
+    """
+    self.remove(key)
+    term_counts = Counter(tokenize(text))
+    if not term_counts:
+      return
+    document = _Document(next(self._seq), value, term_counts)
+    self._documents[key] = document
+    self._total_length += document.length
+    for term, count in term_counts.items():
+      self._postings.setdefault(term, {})[key] = count
+
+  def remove(self, key: _K) -> None:
+    """Removes the document with `key`, if any."""
+    document = self._documents.pop(key, None)
+    if document is None:
+      return
+    self._total_length -= document.length
+    for term in document.term_counts:
+      postings = self._postings[term]
+      del postings[key]
+      if not postings:
+        del self._postings[term]
+
+  def search(self, query: str, limit: Optional[int] = None) -> list[_V]:
+    """Returns the documents matching `query`, most relevant first.
+
+    Documents with equal scores are returned in the order they were added.
+    """
+    if not self._documents:
+      return []
+    num_documents = len(self._documents)
+    average_length = self._total_length / num_documents
+    scores: dict[_K, float] = {}
+    for term in set(tokenize(query)):
+      postings = self._postings.get(term)
+      if not postings:
+        continue
+      idf = math.log(
+          1 + (num_documents - len(postings) + 0.5) / (len(postings) + 0.5)
+      )
+      for key, count in postings.items():
+        length_norm = _K1 * (
+            1 - _B + _B * self._documents[key].length / average_length
+        )
+        scores[key] = scores.get(key, 0.0) + idf * count * (_K1 + 1) / (
+            count + length_norm
+        )
+
+    ranked = (
+        (score, -self._documents[key].seq, key) for key, score in scores.items()
+    )
+    if limit is None:
+      top = sorted(ranked, reverse=True)
+    else:
+      top = heapq.nlargest(limit, ranked)
+    return [self._documents[key].value for _, _, key in top]
+
+  def __contains__(self, key: object) -> bool:
+    return key in self._documents
+
+  def __len__(self) -> int:
+    return len(self._documents)
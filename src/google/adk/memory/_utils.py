@@ -16,8 +16,59 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from ..utils._lru_cache import LruCache
+
+if TYPE_CHECKING:
+  from ..events.event import Event
+  from ..sessions.session import Session
+
+_MAX_TRACKED_SESSIONS = 10_000
 
 
 def format_timestamp(timestamp: float) -> str:
   """Formats the timestamp of the memory entry."""
   return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _session_key(session: Session) -> tuple[str, str, str]:
+  return (session.app_name, session.user_id, session.id)
+
+
+class SessionWatermarks:
+  """Tracks the events of each session already added to a memory service.
+
+  The watermark of a session is the number of its events that were added and
+  the id of the last of them, so that adding a session again only adds the
+  events appended since. The least recently added sessions are forgotten
+  beyond `max_sessions`, and are then added in full again.
+  """
+
+  def __init__(self, max_sessions: int = _MAX_TRACKED_SESSIONS):
+    self._watermarks: LruCache[tuple[str, str, str], tuple[int, str]] = (
+        LruCache(max_sessions)
+    )
+
+  def get_new_events(self, session: Session) -> Optional[list[Event]]:
+    """Returns the events of `session` appended since its watermark.
+
+    Returns None if the session is not tracked, or if its events up to the
+    watermark changed (e.g. the session was rewound). The whole session must
+    then be added again.
+    """
+    watermark = self._watermarks.get(_session_key(session))
+    if watermark is None:
+      return None
+    num_events, last_event_id = watermark
+    if num_events > len(session.events) or (
+        num_events and session.events[num_events - 1].id != last_event_id
+    ):
+      return None
+    return session.events[num_events:]
+
+  def advance(self, session: Session, num_events: int) -> None:
+    """Marks the first `num_events` events of `session` as added."""
+    last_event_id = session.events[num_events - 1].id if num_events else ''
+    self._watermarks.put(_session_key(session), (num_events, last_event_id))
@@ -0,0 +1,188 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from collections.abc import Sequence
+import logging
+from typing import Optional
+from typing import TYPE_CHECKING
+import weakref
+
+from typing_extensions import override
+
+from ..utils._event_loop_utils import call_on_loop_shutdown
+from ..utils.feature_decorator import experimental
+from .base_memory_service import BaseMemoryService
+from .base_memory_service import SearchMemoryResponse
+
+if TYPE_CHECKING:
+  from ..events.event import Event
+  from ..sessions.session import Session
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+@experimental
+class BatchingMemoryService(BaseMemoryService):
+  """A memory service that coalesces session writes to another one.
+
+  Sessions added to memory are queued, and added to the wrapped service
+  together on a timer. A session added several times before it is written is
+  written once, with its latest events, so that adding the session after every
+  turn does not write to memory after every turn.
+
+  Searches first write the queued sessions of the searched user. Other writes
+  are forwarded immediately. Queued sessions are written when the event loop
+  shuts down, e.g. at the end of `asyncio.run`; call `close()` to write them
+  earlier.
+  """
+
+  def __init__(
+      self,
+      memory_service: BaseMemoryService,
+      *,
+      flush_interval_seconds: float = 5.0,
+      max_pending_sessions: int = 100,
+  ):
+    """Initializes the BatchingMemoryService.
+
+    Args:
+      memory_service: The memory service the sessions are written to.
+      flush_interval_seconds: How long sessions are queued before they are
+        written.
+      max_pending_sessions: The number of queued sessions that triggers an
+        immediate write.
+    """
+    if flush_interval_seconds <= 0:
+      raise ValueError('flush_interval_seconds must be positive.')
+    if max_pending_sessions <= 0:
+      raise ValueError('max_pending_sessions must be positive.')
+    self._memory_service = memory_service
+    self._flush_interval_seconds = flush_interval_seconds
+    self._max_pending_sessions = max_pending_sessions
+    self._pending_sessions: dict[tuple[str, str, str], Session] = {}
+    self._flush_task: Optional[asyncio.Task[None]] = None
+    self._flushed_on_shutdown_loops: weakref.WeakSet[
+        asyncio.AbstractEventLoop
+    ] = weakref.WeakSet()
+
+  @property
+  def memory_service(self) -> BaseMemoryService:
+    """The memory service the sessions are written to."""
+    return self._memory_service
+
+  @override
+  async def add_session_to_memory(self, session: Session) -> None:
+    self._pending_sessions[(session.app_name, session.user_id, session.id)] = (
+        session
+    )
+    if len(self._pending_sessions) >= self._max_pending_sessions:
+      await self.flush()
+    elif self._flush_task is None or self._flush_task.done():
+      self._flush_task = asyncio.create_task(self._flush_later())
+      # The timer is cancelled with the event loop, so the queued sessions are
+      # also written when the loop shuts down.
+      loop = asyncio.get_running_loop()
+      if loop not in self._flushed_on_shutdown_loops:
+        self._flushed_on_shutdown_loops.add(loop)
+        call_on_loop_shutdown(self.flush)
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      events: Sequence[Event],
+      session_id: str | None = None,
+      custom_metadata: Mapping[str, object] | None = None,
+  ) -> None:
+    await self._memory_service.add_events_to_memory(
+        app_name=app_name,
+        user_id=user_id,
+        events=events,
+        session_id=session_id,
+        custom_metadata=custom_metadata,
+    )
+
+  @override
+  async def add_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      memories: Sequence[str],
+      custom_metadata: Mapping[str, object] | None = None,
+  ) -> None:
+    await self._memory_service.add_memory(
+        app_name=app_name,
+        user_id=user_id,
+        memories=memories,
+        custom_metadata=custom_metadata,
+    )
+
+  @override
+  async def search_memory(
+      self, *, app_name: str, user_id: str, query: str
+  ) -> SearchMemoryResponse:
+    await self._write_sessions([
+        key
+        for key in self._pending_sessions
+        if key[0] == app_name and key[1] == user_id
+    ])
+    return await self._memory_service.search_memory(
+        app_name=app_name, user_id=user_id, query=query
+    )
+
+  async def flush(self) -> None:
+    """Writes all queued sessions."""
+    await self._write_sessions(list(self._pending_sessions))
+
+  async def close(self) -> None:
+    """Stops the timer and writes all queued sessions."""
+    if self._flush_task is not None and not self._flush_task.done():
+      self._flush_task.cancel()
+    self._flush_task = None
+    await self.flush()
+
+  async def _flush_later(self) -> None:
+    await asyncio.sleep(self._flush_interval_seconds)
+    await self.flush()
+
+  async def _write_sessions(self, keys: list[tuple[str, str, str]]) -> None:
+    """Writes the queued sessions with `keys`, concurrently.
+
+    Failures are logged, as writes triggered by the timer have no caller to
+    report them to.
+    """
+    sessions = [self._pending_sessions.pop(key) for key in keys]
+    if not sessions:
+      return
+    results = await asyncio.gather(
+        *(
+            self._memory_service.add_session_to_memory(session)
+            for session in sessions
+        ),
+        return_exceptions=True,
+    )
+    for session, result in zip(sessions, results):
+      if isinstance(result, BaseException):
+        logger.error(
+            'Failed to add session %s to memory.',
+            session.id,
+            exc_info=result,
+        )
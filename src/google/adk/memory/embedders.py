@@ -0,0 +1,121 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Text embedders used by local memory services."""
+
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Sequence
+import hashlib
+import math
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from ..utils.feature_decorator import experimental
+from ._keyword_index import tokenize
+
+if TYPE_CHECKING:
+  from google.genai import Client
+
+
+class BaseEmbedder(ABC):
+  """Base class for text embedders."""
+
+  @abstractmethod
+  async def embed(self, texts: Sequence[str]) -> Sequence[Sequence[float]]:
+    """Embeds texts into vectors of the same dimension.
+
+    Args:
+      texts: The texts to embed.
+
+    Returns:
+      One vector per text, in the order of `texts`.
+    """
+
+
+@experimental
+class HashingEmbedder(BaseEmbedder):
+  """A deterministic embedder that hashes words into a fixed number of buckets.
+
+  Texts sharing words get similar vectors, which is enough for tests and for
+  offline prototyping, but it does not capture meaning.
+  """
+
+  def __init__(self, dimension: int = 256):
+    if dimension <= 0:
+      raise ValueError('dimension must be positive.')
+    self.dimension = dimension
+
+  def embed_text(self, text: str) -> list[float]:
+    """Embeds a single text."""
+    vector = [0.0] * self.dimension
+    for word in tokenize(text):
+      digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+      bucket = int.from_bytes(digest[:4], 'little') % self.dimension
+      vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm:
+      vector = [value / norm for value in vector]
+    return vector
+
+  @override
+  async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+    return [self.embed_text(text) for text in texts]
+
+
+@experimental
+class GoogleGenAiEmbedder(BaseEmbedder):
+  """An embedder that uses a Gemini or Vertex AI embedding model."""
+
+  def __init__(
+      self,
+      model: str = 'gemini-embedding-001',
+      *,
+      output_dimensionality: Optional[int] = None,
+      client: Optional[Client] = None,
+  ):
+    """Initializes the GoogleGenAiEmbedder.
+
+    Args:
+      model: The name of the embedding model.
+      output_dimensionality: The dimension of the vectors, if the model
+        supports reducing it.
+      client: The GenAI client. Defaults to a client configured from the
+        environment.
+    """
+    self.model = model
+    self.output_dimensionality = output_dimensionality
+    self._client = client
+
+  @override
+  async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+    from google.genai import Client
+    from google.genai import types
+
+    if not texts:
+      return []
+    if self._client is None:
+      self._client = Client()
+    response = await self._client.aio.models.embed_content(
+        model=self.model,
+        contents=list(texts),
+        config=types.EmbedContentConfig(
+            output_dimensionality=self.output_dimensionality
+        ),
+    )
+    return [list(embedding.values) for embedding in response.embeddings]
@@ -15,13 +15,16 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from collections.abc import Sequence
-import re
 import threading
+import time
+from typing import Optional
 from typing import TYPE_CHECKING
 
+from google.genai import types
 from typing_extensions import override
 
 from . import _utils
+from ._keyword_index import KeywordIndex
 from .base_memory_service import BaseMemoryService
 from .base_memory_service import SearchMemoryResponse
 from .memory_entry import MemoryEntry
@@ -31,45 +34,125 @@ if TYPE_CHECKING:
   from ..sessions.session import Session
 
 _UNKNOWN_SESSION_ID = '__unknown_session_id__'
+_MEMORIES_SESSION_ID = '__memories__'
 
 
 def _user_key(app_name: str, user_id: str) -> str:
   return f'{app_name}/{user_id}'
 
 
-def _extract_words_lower(text: str) -> set[str]:
-  """Extracts words from a string and converts them to lowercase."""
-  return set([word.lower() for word in re.findall(r'[A-Za-z]+', text)])
+def _event_text(event: Event) -> str:
+  return ' '.join([part.text for part in event.content.parts if part.text])
 
 
 class InMemoryMemoryService(BaseMemoryService):
   """An in-memory memory service for prototyping purpose only.
 
-  Uses keyword matching instead of semantic search.
+  Uses keyword matching instead of semantic search. Events are kept in an
+  inverted index per user, updated as memories are added, and matches are
+  ranked with BM25.
 
   This class is thread-safe, however, it should be used for testing and
   development only.
   """
 
-  def __init__(self):
+  def __init__(self, *, max_results: Optional[int] = None):
+    """Initializes the InMemoryMemoryService.
+
+    Args:
+      max_results: The maximum number of memories returned by a search, most
+        relevant first. None returns all matching memories.
+    """
     self._lock = threading.Lock()
+    self._max_results = max_results
 
     self._session_events: dict[str, dict[str, list[Event]]] = {}
     """Keys are "{app_name}/{user_id}". Values are dicts of session_id to
     session event lists.
     """
 
+    self._session_event_ids: dict[str, dict[str, set[str]]] = {}
+    """Ids of the events in `_session_events`, kept in sync with them so that
+    appending events does not rebuild them.
+    """
+
+    self._indexes: dict[str, KeywordIndex[tuple[str, int], Event]] = {}
+    """Keys are "{app_name}/{user_id}". Documents are keyed by session_id and
+    the position of the event in its session event list.
+    """
+
+    self._watermarks = _utils.SessionWatermarks()
+
+  def _index_events(
+      self,
+      user_key: str,
+      session_id: str,
+      events: Sequence[Event],
+      start: int,
+  ) -> None:
+    index = self._indexes.setdefault(user_key, KeywordIndex())
+    for position, event in enumerate(events, start):
+      index.add((session_id, position), _event_text(event), event)
+
+  def _unindex_session(self, user_key: str, session_id: str) -> None:
+    index = self._indexes.get(user_key)
+    existing_events = self._session_events.get(user_key, {}).get(session_id)
+    if index is None or not existing_events:
+      return
+    for position in range(len(existing_events)):
+      index.remove((session_id, position))
+
+  def _append_events(
+      self, user_key: str, session_id: str, events: Sequence[Event]
+  ) -> None:
+    self._session_events[user_key] = self._session_events.get(user_key, {})
+    existing_events = self._session_events[user_key].get(session_id, [])
+    existing_ids = self._session_event_ids.setdefault(user_key, {}).setdefault(
+        session_id, set()
+    )
+    new_events = []
+    for event in events:
+      if event.id not in existing_ids:
+        new_events.append(event)
+        existing_ids.add(event.id)
+    self._index_events(
+        user_key, session_id, new_events, start=len(existing_events)
+    )
+    existing_events.extend(new_events)
+    self._session_events[user_key][session_id] = existing_events
+
   @override
   async def add_session_to_memory(self, session: Session) -> None:
+    """Adds the events of a session to memory.
+
+    Only events appended since the session was last added are indexed. If
+    earlier events changed, the stored events of the session are replaced.
+    """
     user_key = _user_key(session.app_name, session.user_id)
 
     with self._lock:
-      self._session_events[user_key] = self._session_events.get(user_key, {})
-      self._session_events[user_key][session.id] = [
-          event
-          for event in session.events
-          if event.content and event.content.parts
-      ]
+      num_events = len(session.events)
+      new_events = self._watermarks.get_new_events(session)
+      if new_events is not None:
+        self._append_events(
+            user_key,
+            session.id,
+            [e for e in new_events if e.content and e.content.parts],
+        )
+      else:
+        events = [
+            event
+            for event in session.events
+            if event.content and event.content.parts
+        ]
+        self._unindex_session(user_key, session.id)
+        self._session_events[user_key] = self._session_events.get(user_key, {})
+        self._session_events[user_key][session.id] = events
+        self._session_event_ids.setdefault(user_key, {})[session.id] = {
+            event.id for event in events
+        }
+        self._index_events(user_key, session.id, events, start=0)
+      self._watermarks.advance(session, num_events)
 
   @override
   async def add_events_to_memory(
@@ -89,16 +172,35 @@ class InMemoryMemoryService(BaseMemoryService):
     ]
 
     with self._lock:
-      self._session_events[user_key] = self._session_events.get(user_key, {})
-      existing_events = self._session_events[user_key].get(
-          scoped_session_id, []
-      )
-      existing_ids = {event.id for event in existing_events}
-      for event in events_to_add:
-        if event.id not in existing_ids:
-          existing_events.append(event)
-          existing_ids.add(event.id)
-      self._session_events[user_key][scoped_session_id] = existing_events
+      self._append_events(user_key, scoped_session_id, events_to_add)
+
+  @override
+  async def add_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      memories: Sequence[str],
+      custom_metadata: Mapping[str, object] | None = None,
+  ) -> None:
+    from ..events.event import Event
+
+    user_key = _user_key(app_name, user_id)
+    timestamp = time.time()
+    events = [
+        Event(
+            invocation_id='',
+            author='user',
+            timestamp=timestamp,
+            content=types.Content(role='user', parts=[types.Part(text=memory)]),
+            custom_metadata=dict(custom_metadata) if custom_metadata else None,
+        )
+        for memory in memories
+        if memory
+    ]
+
+    with self._lock:
+      self._append_events(user_key, _MEMORIES_SESSION_ID, events)
 
   @override
   async def search_memory(
@@ -107,28 +209,17 @@ class InMemoryMemoryService(BaseMemoryService):
     user_key = _user_key(app_name, user_id)
 
     with self._lock:
-      session_event_lists = self._session_events.get(user_key, {})
-
-    words_in_query = _extract_words_lower(query)
-    response = SearchMemoryResponse()
-
-    for session_events in session_event_lists.values():
-      for event in session_events:
-        if not event.content or not event.content.parts:
-          continue
-        words_in_event = _extract_words_lower(
-            ' '.join([part.text for part in event.content.parts if part.text])
-        )
-        if not words_in_event:
-          continue
-
-        if any(query_word in words_in_event for query_word in words_in_query):
-          response.memories.append(
-              MemoryEntry(
-                  content=event.content,
-                  author=event.author,
-                  timestamp=_utils.format_timestamp(event.timestamp),
-              )
-          )
-
-    return response
+      index = self._indexes.get(user_key)
+      events = index.search(query, self._max_results) if index else []
+
+    return SearchMemoryResponse(
+        memories=[
+            MemoryEntry(
+                content=event.content,
+                author=event.author,
+                timestamp=_utils.format_timestamp(event.timestamp),
+                custom_metadata=event.custom_metadata or {},
+            )
+            for event in events
+        ]
+    )
@@ -0,0 +1,480 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from collections.abc import Sequence
+import json
+import logging
+import os
+import threading
+from typing import Optional
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+import uuid
+
+from google.genai import types
+from typing_extensions import override
+
+from . import _utils
+from ..utils.feature_decorator import experimental
+from .base_memory_service import BaseMemoryService
+from .base_memory_service import SearchMemoryResponse
+from .embedders import BaseEmbedder
+from .memory_entry import MemoryEntry
+
+try:
+  import numpy as np
+except ImportError as e:
+  raise ImportError(
+      'LocalVectorMemoryService requires numpy. Please install it with'
+      ' `pip install numpy`.'
+  ) from e
+
+if TYPE_CHECKING:
+  from ..events.event import Event
+  from ..sessions.session import Session
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+_UNKNOWN_SESSION_ID = '__unknown_session_id__'
+
+_META_FILE = 'meta.json'
+_VECTORS_FILE = 'vectors.f32'
+_ENTRIES_FILE = 'entries.jsonl'
+
+_MIN_CAPACITY = 64
+# IVF lists are trained once a partition has this many vectors per list.
+_MIN_VECTORS_PER_LIST = 32
+_KMEANS_ITERATIONS = 10
+_KMEANS_MAX_SAMPLES_PER_LIST = 256
+_ASSIGN_CHUNK_ROWS = 16384
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+  norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+  norms[norms == 0] = 1.0
+  return vectors / norms
+
+
+def _event_text(event: Event) -> str:
+  if not event.content or not event.content.parts:
+    return ''
+  return ' '.join([part.text for part in event.content.parts if part.text])
+
+
+class _Partition:
+  """The vectors and entries of one user, in insertion order.
+
+  Vectors are normalized and kept in one contiguous float32 array, which is
+  memory-mapped when the partition is persisted.
+  """
+
+  def __init__(self, directory: Optional[str]):
+    self._directory = directory
+    self.dimension: Optional[int] = None
+    self.size = 0
+    self.entries: list[MemoryEntry] = []
+    self.keys: set[str] = set()
+    self._vectors: Optional[np.ndarray] = None
+    # IVF index: centroids of the lists, and the list of each vector.
+    self._centroids: Optional[np.ndarray] = None
+    self._assignments: Optional[np.ndarray] = None
+    self._trained_size = 0
+    if directory is not None and os.path.exists(
+        os.path.join(directory, _META_FILE)
+    ):
+      self._load()
+
+  def _path(self, name: str) -> str:
+    return os.path.join(self._directory, name)
+
+  def _load(self) -> None:
+    with open(self._path(_META_FILE), encoding='utf-8') as f:
+      self.dimension = json.load(f)['dimension']
+    with open(self._path(_ENTRIES_FILE), encoding='utf-8') as f:
+      for line in f:
+        record = json.loads(line)
+        self.keys.add(record['key'])
+        self.entries.append(MemoryEntry.model_validate(record['entry']))
+    self.size = len(self.entries)
+    self._open_vectors()
+
+  def _open_vectors(self) -> None:
+    row_bytes = self.dimension * np.dtype(np.float32).itemsize
+    capacity = os.path.getsize(self._path(_VECTORS_FILE)) // row_bytes
+    self._vectors = np.memmap(
+        self._path(_VECTORS_FILE),
+        dtype=np.float32,
+        mode='r+',
+        shape=(capacity, self.dimension),
+    )
+
+  def _init_storage(self, dimension: int) -> None:
+    self.dimension = dimension
+    if self._directory is None:
+      self._vectors = np.empty((_MIN_CAPACITY, dimension), dtype=np.float32)
+      return
+    os.makedirs(self._directory, exist_ok=True)
+    with open(self._path(_VECTORS_FILE), 'wb') as f:
+      f.truncate(_MIN_CAPACITY * dimension * np.dtype(np.float32).itemsize)
+    open(self._path(_ENTRIES_FILE), 'w', encoding='utf-8').close()
+    with open(self._path(_META_FILE), 'w', encoding='utf-8') as f:
+      json.dump({'dimension': dimension}, f)
+    self._open_vectors()
+
+  def _ensure_capacity(self, size: int) -> None:
+    capacity = len(self._vectors)
+    if size <= capacity:
+      return
+    while capacity < size:
+      capacity *= 2
+    if self._directory is None:
+      vectors = np.empty((capacity, self.dimension), dtype=np.float32)
+      vectors[: self.size] = self._vectors[: self.size]
+      self._vectors = vectors
+    else:
+      self._vectors.flush()
+      self._vectors = None
+      os.truncate(
+          self._path(_VECTORS_FILE),
+          capacity * self.dimension * np.dtype(np.float32).itemsize,
+      )
+      self._open_vectors()
+    if self._assignments is not None:
+      assignments = np.empty(capacity, dtype=np.int32)
+      assignments[: self.size] = self._assignments[: self.size]
+      self._assignments = assignments
+
+  def append(
+      self,
+      keys: Sequence[str],
+      entries: Sequence[MemoryEntry],
+      vectors: np.ndarray,
+  ) -> None:
+    """Appends entries and their vectors."""
+    if self.dimension is None:
+      self._init_storage(vectors.shape[1])
+    elif vectors.shape[1] != self.dimension:
+      raise ValueError(
+          f'Expected vectors of dimension {self.dimension}, got'
+          f' {vectors.shape[1]}.'
+      )
+    start, end = self.size, self.size + len(entries)
+    self._ensure_capacity(end)
+    vectors = _normalize(vectors)
+    self._vectors[start:end] = vectors
+    if self._directory is not None:
+      # Vectors are written before their entries, which define the size.
+      self._vectors.flush()
+      with open(self._path(_ENTRIES_FILE), 'a', encoding='utf-8') as f:
+        for key, entry in zip(keys, entries):
+          record = {
+              'key': key,
+              'entry': entry.model_dump(mode='json', exclude_none=True),
+          }
+          f.write(json.dumps(record) + '\n')
+    if self._centroids is not None:
+      self._assignments[start:end] = self._assign(vectors)
+    self.entries.extend(entries)
+    self.keys.update(keys)
+    self.size = end
+
+  def _assign(self, vectors: np.ndarray) -> np.ndarray:
+    """Returns the nearest IVF list of each vector."""
+    return np.concatenate([
+        np.argmax(vectors[i : i + _ASSIGN_CHUNK_ROWS] @ self._centroids.T, 1)
+        for i in range(0, len(vectors), _ASSIGN_CHUNK_ROWS)
+    ]).astype(np.int32)
+
+  def _train(self, num_lists: int) -> None:
+    """Clusters the vectors into IVF lists with spherical k-means."""
+    rng = np.random.default_rng(0)
+    vectors = self._vectors[: self.size]
+    num_samples = min(self.size, num_lists * _KMEANS_MAX_SAMPLES_PER_LIST)
+    samples = vectors[rng.choice(self.size, num_samples, replace=False)]
+    centroids = samples[rng.choice(num_samples, num_lists, replace=False)]
+    for _ in range(_KMEANS_ITERATIONS):
+      labels = np.argmax(samples @ centroids.T, axis=1)
+      sums = np.zeros_like(centroids)
+      np.add.at(sums, labels, samples)
+      empty = ~sums.any(axis=1)
+      sums[empty] = centroids[empty]
+      centroids = _normalize(sums)
+    self._centroids = centroids
+    self._assignments = np.empty(len(self._vectors), dtype=np.int32)
+    self._assignments[: self.size] = self._assign(vectors)
+    self._trained_size = self.size
+
+  def search(
+      self,
+      query: np.ndarray,
+      top_k: int,
+      ivf_num_lists: Optional[int],
+      ivf_num_probes: int,
+  ) -> list[MemoryEntry]:
+    """Returns the entries most similar to `query`, by cosine similarity."""
+    if not self.size:
+      return []
+    if query.shape[0] != self.dimension:
+      raise ValueError(
+          f'Expected a query of dimension {self.dimension}, got'
+          f' {query.shape[0]}.'
+      )
+    query = query / (np.linalg.norm(query) or 1.0)
+    vectors = self._vectors[: self.size]
+    rows = None
+    if ivf_num_lists and self.size >= ivf_num_lists * _MIN_VECTORS_PER_LIST:
+      # Retrain as the partition grows, to keep lists balanced.
+      if self._centroids is None or self.size >= 2 * self._trained_size:
+        self._train(ivf_num_lists)
+      probes = np.argsort(self._centroids @ query)[-ivf_num_probes:]
+      rows = np.flatnonzero(np.isin(self._assignments[: self.size], probes))
+      vectors = vectors[rows]
+    scores = vectors @ query
+    k = min(top_k, len(scores))
+    if not k:
+      return []
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind='stable')]
+    if rows is not None:
+      top = rows[top]
+    return [self.entries[i] for i in top]
+
+
+@experimental
+class LocalVectorMemoryService(BaseMemoryService):
+  """A memory service with local semantic search over embedded memories.
+
+  Memories are embedded with a pluggable embedder and searched by cosine
+  similarity. Each user has its own partition, searched exhaustively unless an
+  IVF index is configured for large partitions. Partitions are kept in memory,
+  or in memory-mapped files under `storage_dir`, one directory per user.
+
+  This class is thread-safe within a process. A storage directory must not be
+  shared by several processes.
+  """
+
+  def __init__(
+      self,
+      embedder: BaseEmbedder,
+      *,
+      storage_dir: Optional[str] = None,
+      top_k: int = 10,
+      batch_size: int = 64,
+      ivf_num_lists: Optional[int] = None,
+      ivf_num_probes: int = 8,
+  ):
+    """Initializes the LocalVectorMemoryService.
+
+    Args:
+      embedder: The embedder of memories and queries.
+      storage_dir: The directory where memories are persisted. If None,
+        memories are only kept in memory.
+      top_k: The number of memories returned by a search.
+      batch_size: The number of texts embedded per embedder call.
+      ivf_num_lists: The number of IVF lists of the approximate index. If None,
+        searches compare the query with every memory of the user.
+      ivf_num_probes: The number of IVF lists searched per query.
+    """
+    if top_k <= 0 or batch_size <= 0 or ivf_num_probes <= 0:
+      raise ValueError('top_k, batch_size and ivf_num_probes must be positive.')
+    if ivf_num_lists is not None and ivf_num_lists <= 0:
+      raise ValueError('ivf_num_lists must be positive.')
+    self._embedder = embedder
+    self._storage_dir = storage_dir
+    self._top_k = top_k
+    self._batch_size = batch_size
+    self._ivf_num_lists = ivf_num_lists
+    self._ivf_num_probes = ivf_num_probes
+    self._partitions: dict[tuple[str, str], _Partition] = {}
+    self._lock = threading.Lock()
+    self._watermarks = _utils.SessionWatermarks()
+
+  def _get_partition(self, app_name: str, user_id: str) -> _Partition:
+    key = (app_name, user_id)
+    partition = self._partitions.get(key)
+    if partition is None:
+      directory = None
+      if self._storage_dir is not None:
+        directory = os.path.join(
+            self._storage_dir, quote(app_name, safe=''), quote(user_id, safe='')
+        )
+      partition = _Partition(directory)
+      self._partitions[key] = partition
+    return partition
+
+  async def _embed(self, texts: Sequence[str]) -> np.ndarray:
+    batches = []
+    for i in range(0, len(texts), self._batch_size):
+      batch = await self._embedder.embed(texts[i : i + self._batch_size])
+      batches.append(np.asarray(batch, dtype=np.float32))
+    return np.concatenate(batches)
+
+  def _filter_new_sync(
+      self,
+      app_name: str,
+      user_id: str,
+      items: Sequence[tuple[str, str, MemoryEntry]],
+  ) -> list[tuple[str, str, MemoryEntry]]:
+    with self._lock:
+      partition = self._get_partition(app_name, user_id)
+      return [item for item in items if item[0] not in partition.keys]
+
+  def _append_sync(
+      self,
+      app_name: str,
+      user_id: str,
+      items: Sequence[tuple[str, str, MemoryEntry]],
+      vectors: np.ndarray,
+  ) -> None:
+    with self._lock:
+      partition = self._get_partition(app_name, user_id)
+      # Items may have been added while they were embedded.
+      new_rows = [
+          i for i, item in enumerate(items) if item[0] not in partition.keys
+      ]
+      if new_rows:
+        partition.append(
+            [items[i][0] for i in new_rows],
+            [items[i][2] for i in new_rows],
+            vectors[new_rows],
+        )
+
+  def _search_sync(
+      self, app_name: str, user_id: str, query_vector: np.ndarray
+  ) -> list[MemoryEntry]:
+    with self._lock:
+      partition = self._get_partition(app_name, user_id)
+      return partition.search(
+          query_vector,
+          self._top_k,
+          self._ivf_num_lists,
+          self._ivf_num_probes,
+      )
+
+  async def _add(
+      self,
+      app_name: str,
+      user_id: str,
+      items: Sequence[tuple[str, str, MemoryEntry]],
+  ) -> None:
+    """Embeds and stores (key, text, entry) items not stored yet."""
+    # Partitions are loaded, searched and written in worker threads, as they
+    # may be large and persisted on disk.
+    items = await asyncio.to_thread(
+        self._filter_new_sync, app_name, user_id, items
+    )
+    items = list({key: (key, text, e) for key, text, e in items}.values())
+    if not items:
+      return
+    vectors = await self._embed([text for _, text, _ in items])
+    await asyncio.to_thread(
+        self._append_sync, app_name, user_id, items, vectors
+    )
+
+  def _event_items(
+      self, session_id: str, events: Sequence[Event]
+  ) -> list[tuple[str, str, MemoryEntry]]:
+    items = []
+    for event in events:
+      text = _event_text(event)
+      if not text.strip():
+        continue
+      items.append((
+          f'{session_id}/{event.id}',
+          text,
+          MemoryEntry(
+              id=event.id,
+              content=event.content,
+              author=event.author,
+              timestamp=_utils.format_timestamp(event.timestamp),
+          ),
+      ))
+    return items
+
+  @override
+  async def add_session_to_memory(self, session: Session) -> None:
+    """Adds the events of a session to memory.
+
+    Only events appended since the session was last added are embedded.
+    Sessions not added before, or whose earlier events changed, are added in
+    full, skipping the events already stored.
+    """
+    num_events = len(session.events)
+    events = self._watermarks.get_new_events(session)
+    if events is None:
+      events = session.events[:num_events]
+    await self._add(
+        session.app_name,
+        session.user_id,
+        self._event_items(session.id, events),
+    )
+    self._watermarks.advance(session, num_events)
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      events: Sequence[Event],
+      session_id: str | None = None,
+      custom_metadata: Mapping[str, object] | None = None,
+  ) -> None:
+    _ = custom_metadata
+    await self._add(
+        app_name,
+        user_id,
+        self._event_items(session_id or _UNKNOWN_SESSION_ID, events),
+    )
+
+  @override
+  async def add_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      memories: Sequence[str],
+      custom_metadata: Mapping[str, object] | None = None,
+  ) -> None:
+    items = []
+    for memory in memories:
+      if not memory.strip():
+        continue
+      memory_id = uuid.uuid4().hex
+      items.append((
+          f'memory/{memory_id}',
+          memory,
+          MemoryEntry(
+              id=memory_id,
+              content=types.Content(
+                  role='user', parts=[types.Part(text=memory)]
+              ),
+              custom_metadata=dict(custom_metadata or {}),
+          ),
+      ))
+    await self._add(app_name, user_id, items)
+
+  @override
+  async def search_memory(
+      self, *, app_name: str, user_id: str, query: str
+  ) -> SearchMemoryResponse:
+    query_vector = (await self._embed([query]))[0]
+    entries = await asyncio.to_thread(
+        self._search_sync, app_name, user_id, query_vector
+    )
+    return SearchMemoryResponse(memories=entries)
@@ -0,0 +1,338 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from collections.abc import Mapping
+from collections.abc import Sequence
+from contextlib import asynccontextmanager
+import json
+import logging
+import re
+from typing import Any
+from typing import Optional
+from typing import TYPE_CHECKING
+import uuid
+
+import aiosqlite
+from google.genai import types
+from typing_extensions import override
+
+from . import _utils
+from ..sessions.sqlite_session_service import _parse_db_path
+from ..utils.feature_decorator import experimental
+from .base_memory_service import BaseMemoryService
+from .base_memory_service import SearchMemoryResponse
+from .memory_entry import MemoryEntry
+
+if TYPE_CHECKING:
+  from ..events.event import Event
+  from ..sessions.session import Session
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_UNKNOWN_SESSION_ID = "__unknown_session_id__"
+_MEMORIES_SESSION_ID = "__memories__"
+
+# The full-text index is an external-content FTS5 table kept in sync with the
+# memories table by a trigger, so that duplicate inserts ignored by the unique
+# constraint are not indexed either.
+CREATE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS memories (
+    rowid INTEGER PRIMARY KEY,
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    author TEXT,
+    timestamp REAL,
+    text TEXT NOT NULL,
+    content TEXT NOT NULL,
+    custom_metadata TEXT NOT NULL,
+    UNIQUE (app_name, user_id, session_id, id)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+    text, content='memories', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories
+BEGIN
+  INSERT INTO memories_fts(rowid, text) VALUES (new.rowid, new.text);
+END;
+"""
+
+_INSERT_MEMORY_SQL = """
+INSERT OR IGNORE INTO memories (
+    app_name, user_id, session_id, id, author, timestamp, text, content,
+    custom_metadata
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_QUERY_WORD_RE = re.compile(r"\w+")
+
+_SNIPPET_ELLIPSIS = "..."
+
+
+def _to_match_expression(query: str) -> str:
+  """Returns an FTS5 expression matching any word of `query`.
+
+  Words are quoted so that FTS5 operators in the query are matched literally.
+  """
+  return " OR ".join(f'"{word}"' for word in _QUERY_WORD_RE.findall(query))
+
+
+def _json_path(key: str) -> str:
+  """Returns the JSON path of a top-level key."""
+  return '$."' + key.replace('"', '\\"') + '"'
+
+
+def _event_text(event: Event) -> str:
+  if not event.content or not event.content.parts:
+    return ""
+  return " ".join([part.text for part in event.content.parts if part.text])
+
+
+@experimental
+class SqliteMemoryService(BaseMemoryService):
+  """A memory service that uses an SQLite database with FTS5 for storage.
+
+  Memories are ranked by BM25 relevance to the query. Each event is stored
+  once, however many times its session is added.
+  """
+
+  def __init__(
+      self,
+      db_path: str,
+      *,
+      top_k: int = 10,
+      snippet_tokens: Optional[int] = None,
+  ):
+    """Initializes the SQLite memory service.
+
+    Args:
+      db_path: The path or SQLite URL of the database.
+      top_k: The maximum number of memories returned by a search.
+      snippet_tokens: If set, searches return the snippet of each memory around
+        the matched words, of at most this many tokens, instead of its full
+        content.
+    """
+    if top_k <= 0:
+      raise ValueError("top_k must be positive.")
+    if snippet_tokens is not None and not 0 < snippet_tokens <= 64:
+      raise ValueError("snippet_tokens must be between 1 and 64.")
+    self._db_path, self._db_connect_path, self._db_connect_uri = _parse_db_path(
+        db_path
+    )
+    self._top_k = top_k
+    self._snippet_tokens = snippet_tokens
+    self._watermarks = _utils.SessionWatermarks()
+
+  @override
+  async def add_session_to_memory(self, session: Session) -> None:
+    """Adds the events of a session to memory.
+
+    Only events appended since the session was last added by this service are
+    inserted. Sessions not added before, or whose earlier events changed, are
+    inserted in full, ignoring the events already stored.
+    """
+    num_events = len(session.events)
+    events = self._watermarks.get_new_events(session)
+    if events is None:
+      events = session.events[:num_events]
+    await self._insert_events(
+        app_name=session.app_name,
+        user_id=session.user_id,
+        session_id=session.id,
+        events=events,
+        custom_metadata=None,
+    )
+    self._watermarks.advance(session, num_events)
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      events: Sequence[Event],
+      session_id: str | None = None,
+      custom_metadata: Mapping[str, object] | None = None,
+  ) -> None:
+    """Adds events to memory, ignoring events that were already added.
+
+    `custom_metadata` is stored with each added memory, and can be used to
+    filter searches.
+    """
+    await self._insert_events(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id or _UNKNOWN_SESSION_ID,
+        events=events,
+        custom_metadata=custom_metadata,
+    )
+
+  @override
+  async def add_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      memories: Sequence[str],
+      custom_metadata: Mapping[str, object] | None = None,
+  ) -> None:
+    """Adds memories, with `custom_metadata` stored with each of them."""
+    metadata = json.dumps(dict(custom_metadata or {}))
+    rows = [
+        (
+            app_name,
+            user_id,
+            _MEMORIES_SESSION_ID,
+            str(uuid.uuid4()),
+            None,
+            None,
+            memory,
+            types.Content(
+                role="user", parts=[types.Part(text=memory)]
+            ).model_dump_json(exclude_none=True),
+            metadata,
+        )
+        for memory in memories
+        if memory.strip()
+    ]
+    await self._insert_rows(rows)
+
+  @override
+  async def search_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      query: str,
+      metadata_filter: Optional[Mapping[str, Any]] = None,
+  ) -> SearchMemoryResponse:
+    """Searches for the memories most relevant to the query.
+
+    Args:
+      app_name: The name of the application.
+      user_id: The id of the user.
+      query: The query to search for. Memories matching any of its words are
+        returned.
+      metadata_filter: If set, only memories whose custom metadata has these
+        values are returned. Values must be strings, numbers, booleans or None.
+
+    Returns:
+      A SearchMemoryResponse with the matching memories, most relevant first.
+    """
+    match_expression = _to_match_expression(query)
+    if not match_expression:
+      return SearchMemoryResponse()
+
+    conditions = ["memories_fts MATCH ?", "m.app_name=?", "m.user_id=?"]
+    params: list[Any] = [match_expression, app_name, user_id]
+    for key, value in (metadata_filter or {}).items():
+      if value is not None and not isinstance(value, (str, int, float)):
+        raise ValueError(
+            f"Unsupported metadata filter value for {key!r}: {value!r}."
+        )
+      if value is None:
+        conditions.append("json_type(m.custom_metadata, ?) = 'null'")
+        params.append(_json_path(key))
+      else:
+        conditions.append("json_extract(m.custom_metadata, ?) = ?")
+        params.extend([_json_path(key), value])
+
+    snippet_column = "NULL"
+    if self._snippet_tokens is not None:
+      snippet_column = (
+          "snippet(memories_fts, 0, '', '',"
+          f" '{_SNIPPET_ELLIPSIS}', {self._snippet_tokens})"
+      )
+    sql = f"""
+        SELECT m.id, m.author, m.timestamp, m.content, m.custom_metadata,
+               {snippet_column} AS snippet
+        FROM memories_fts JOIN memories AS m ON m.rowid = memories_fts.rowid
+        WHERE {' AND '.join(conditions)}
+        ORDER BY memories_fts.rank
+        LIMIT ?
+    """
+    params.append(self._top_k)
+
+    async with self._get_db_connection() as db:
+      async with db.execute(sql, params) as cursor:
+        rows = await cursor.fetchall()
+
+    memories = []
+    for row in rows:
+      if row["snippet"] is not None:
+        content = types.Content(
+            role="user", parts=[types.Part(text=row["snippet"])]
+        )
+      else:
+        content = types.Content.model_validate_json(row["content"])
+      memories.append(
+          MemoryEntry(
+              id=row["id"],
+              author=row["author"],
+              timestamp=_utils.format_timestamp(row["timestamp"])
+              if row["timestamp"] is not None
+              else None,
+              content=content,
+              custom_metadata=json.loads(row["custom_metadata"]),
+          )
+      )
+    return SearchMemoryResponse(memories=memories)
+
+  async def _insert_events(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+      custom_metadata: Mapping[str, object] | None,
+  ) -> None:
+    metadata = json.dumps(dict(custom_metadata or {}))
+    rows = []
+    for event in events:
+      text = _event_text(event)
+      if not text.strip():
+        continue
+      rows.append((
+          app_name,
+          user_id,
+          session_id,
+          event.id,
+          event.author,
+          event.timestamp,
+          text,
+          event.content.model_dump_json(exclude_none=True),
+          metadata,
+      ))
+    await self._insert_rows(rows)
+
+  async def _insert_rows(self, rows: list[tuple[Any, ...]]) -> None:
+    """Inserts memory rows in a single transaction."""
+    if not rows:
+      return
+    async with self._get_db_connection() as db:
+      await db.executemany(_INSERT_MEMORY_SQL, rows)
+      await db.commit()
+
+  @asynccontextmanager
+  async def _get_db_connection(self):
+    """Connects to the db and performs initial setup."""
+    async with aiosqlite.connect(
+        self._db_connect_path, uri=self._db_connect_uri
+    ) as db:
+      db.row_factory = aiosqlite.Row
+      await db.executescript(CREATE_SCHEMA_SQL)
+      yield db
@@ -61,30 +61,45 @@ class VertexAiRagMemoryService(BaseMemoryService):
         similarity_top_k=similarity_top_k,
         vector_distance_threshold=vector_distance_threshold,
     )
+    self._watermarks = _utils.SessionWatermarks()
 
   @override
   async def add_session_to_memory(self, session: Session):
+    """Uploads the events of a session to the RAG corpus.
+
+    Only events appended since the session was last added by this service are
+    uploaded, as a new file. Sessions not added before, or whose earlier events
+    changed, are uploaded in full.
+    """
+    num_events = len(session.events)
+    events = self._watermarks.get_new_events(session)
+    if events is None:
+      events = session.events
+
+    output_lines = []
+    for event in events:
+      if not event.content or not event.content.parts:
+        continue
+      text_parts = [
+          part.text.replace("\n", " ")
+          for part in event.content.parts
+          if part.text
+      ]
+      if text_parts:
+        output_lines.append(
+            json.dumps({
+                "author": event.author,
+                "timestamp": event.timestamp,
+                "text": ".".join(text_parts),
+            })
+        )
+    if not output_lines:
+      self._watermarks.advance(session, num_events)
+      return
+
     with tempfile.NamedTemporaryFile(
         mode="w", delete=False, suffix=".txt"
     ) as temp_file:
-
-      output_lines = []
-      for event in session.events:
-        if not event.content or not event.content.parts:
-          continue
-        text_parts = [
-            part.text.replace("\n", " ")
-            for part in event.content.parts
-            if part.text
-        ]
-        if text_parts:
-          output_lines.append(
-              json.dumps({
-                  "author": event.author,
-                  "timestamp": event.timestamp,
-                  "text": ".".join(text_parts),
-              })
-          )
       output_string = "\n".join(output_lines)
       temp_file.write(output_string)
       temp_file_path = temp_file.name
@@ -104,6 +119,7 @@ class VertexAiRagMemoryService(BaseMemoryService):
       )
 
     os.remove(temp_file_path)
+    self._watermarks.advance(session, num_events)
 
   @override
   async def search_memory(
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import base64
 from functools import cached_property
+import json
 import logging
 import os
 from typing import Any
@@ -37,8 +38,12 @@ from pydantic import BaseModel
 from typing_extensions import override
 
 from ..utils._google_client_headers import get_tracking_headers
+from ..utils.context_utils import Aclosing
+from ..utils.streaming_utils import StreamingResponseAggregator
 from .base_llm import BaseLlm
 from .llm_response import LlmResponse
+from .model_io_logging import log_model_io
+from .model_io_logging import should_log_model_io
 
 if TYPE_CHECKING:
   from .llm_request import LlmRequest
@@ -47,6 +52,10 @@ __all__ = ["AnthropicLlm", "Claude"]
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_EPHEMERAL_CACHE_CONTROL = anthropic_types.CacheControlEphemeralParam(
+    type="ephemeral"
+)
+
 
 class ClaudeRequest(BaseModel):
   system_instruction: str
@@ -163,6 +172,17 @@ def content_to_message_param(
           "Image data is not supported in Claude for assistant turns."
       )
       continue
+    if part.thought:
+      # Claude only accepts its own thinking back, with its signature.
+      if part.thought_signature and part.text:
+        message_block.append(
+            anthropic_types.ThinkingBlockParam(
+                type="thinking",
+                thinking=part.text,
+                signature=part.thought_signature.decode("utf-8"),
+            )
+        )
+      continue
 
     message_block.append(part_to_message_block(part))
 
@@ -184,16 +204,74 @@ def content_block_to_part(
     )
     part.function_call.id = content_block.id
     return part
+  if isinstance(content_block, anthropic_types.ThinkingBlock):
+    return types.Part(
+        text=content_block.thinking,
+        thought=True,
+        thought_signature=content_block.signature.encode("utf-8"),
+    )
   raise NotImplementedError("Not supported yet.")
 
 
+def _to_usage_metadata(
+    usage: Union[anthropic_types.Usage, anthropic_types.MessageDeltaUsage],
+    input_usage: Optional[anthropic_types.Usage] = None,
+) -> types.GenerateContentResponseUsageMetadata:
+  """Converts Anthropic usage to usage metadata.
+
+  Anthropic reports cache reads and writes separately from `input_tokens`, so
+  they are added back to get the full prompt size.
+
+  Args:
+    usage: The usage reported with a message or the final message delta.
+    input_usage: The usage from `message_start`, used when streaming because
+      the final delta may omit input token counts.
+
+  Returns:
+    The usage metadata.
+  """
+  input_usage = input_usage or usage
+  cache_read_tokens = (
+      getattr(usage, "cache_read_input_tokens", None)
+      or getattr(input_usage, "cache_read_input_tokens", None)
+      or 0
+  )
+  cache_creation_tokens = (
+      getattr(usage, "cache_creation_input_tokens", None)
+      or getattr(input_usage, "cache_creation_input_tokens", None)
+      or 0
+  )
+  input_tokens = (
+      getattr(usage, "input_tokens", None)
+      or getattr(input_usage, "input_tokens", None)
+      or 0
+  )
+  prompt_tokens = input_tokens + cache_read_tokens + cache_creation_tokens
+  output_tokens = usage.output_tokens or 0
+  return types.GenerateContentResponseUsageMetadata(
+      prompt_token_count=prompt_tokens,
+      candidates_token_count=output_tokens,
+      cached_content_token_count=cache_read_tokens or None,
+      total_token_count=prompt_tokens + output_tokens,
+  )
+
+
+def _build_message_log(message: anthropic_types.Message) -> str:
+  return "Claude response: " + message.model_dump_json(
+      indent=2, exclude_none=True
+  )
+
+
 def message_to_generate_content_response(
     message: anthropic_types.Message,
 ) -> LlmResponse:
   logger.info("Received response from Claude.")
-  logger.debug(
-      "Claude response: %s",
-      message.model_dump_json(indent=2, exclude_none=True),
+  log_model_io(
+      logger,
+      should_log_model_io(logger),
+      "response",
+      _build_message_log,
+      message,
   )
 
   return LlmResponse(
@@ -201,13 +279,7 @@ def message_to_generate_content_response(
           role="model",
           parts=[content_block_to_part(cb) for cb in message.content],
       ),
-      usage_metadata=types.GenerateContentResponseUsageMetadata(
-          prompt_token_count=message.usage.input_tokens,
-          candidates_token_count=message.usage.output_tokens,
-          total_token_count=(
-              message.usage.input_tokens + message.usage.output_tokens
-          ),
-      ),
+      usage_metadata=_to_usage_metadata(message.usage),
       # TODO: Deal with these later.
       # finish_reason=to_google_genai_finish_reason(message.stop_reason),
   )
@@ -266,16 +338,159 @@ def function_declaration_to_tool_param(
   )
 
 
+def _set_cache_breakpoint(block: dict[str, Any]) -> bool:
+  """Marks a block as the end of a cacheable prefix if the API allows it."""
+  if block.get("type") == "text" and not block.get("text"):
+    # The API rejects cache_control on empty text blocks.
+    return False
+  block["cache_control"] = _EPHEMERAL_CACHE_CONTROL
+  return True
+
+
+def add_prompt_cache_breakpoints(
+    system: Optional[str],
+    messages: list[anthropic_types.MessageParam],
+    tools: list[anthropic_types.ToolParam],
+) -> Union[str, list[anthropic_types.TextBlockParam], None]:
+  """Adds prompt cache breakpoints on the stable prefixes of a request.
+
+  Claude caches the prompt up to each `cache_control` breakpoint, in the order
+  tools, system, messages. Breakpoints are placed after the last tool, after
+  the system instruction and on the last block of the conversation so that the
+  next turn of the same conversation reads the whole history from cache. This
+  uses three of the four breakpoints the API allows.
+
+  Args:
+    system: The system instruction.
+    messages: The messages to send. Updated in place.
+    tools: The tools to send. Updated in place.
+
+  Returns:
+    The system instruction to send, converted to a cacheable text block when
+    present.
+  """
+  if tools:
+    tools[-1]["cache_control"] = _EPHEMERAL_CACHE_CONTROL
+
+  if isinstance(system, str) and system:
+    system = [
+        anthropic_types.TextBlockParam(
+            type="text", text=system, cache_control=_EPHEMERAL_CACHE_CONTROL
+        )
+    ]
+
+  for message in reversed(messages):
+    content = message.get("content")
+    if isinstance(content, list) and any(
+        _set_cache_breakpoint(block) for block in reversed(content)
+    ):
+      break
+
+  return system
+
+
+class _StreamEventConverter:
+  """Converts Anthropic stream events to `GenerateContentResponse` chunks.
+
+  The chunks are shaped like the Gemini SSE chunks so that they can be fed
+  through `StreamingResponseAggregator` and streamed Claude responses follow
+  the same partial and aggregated response semantics as Gemini.
+  """
+
+  def __init__(self):
+    self._model_version: Optional[str] = None
+    self._input_usage: Optional[anthropic_types.Usage] = None
+    self._tool_use_blocks: dict[int, anthropic_types.ToolUseBlock] = {}
+    self._tool_use_args: dict[int, str] = {}
+
+  def _model_chunk(
+      self,
+      parts: Optional[list[types.Part]] = None,
+      finish_reason: Optional[types.FinishReason] = None,
+      usage_metadata: Optional[
+          types.GenerateContentResponseUsageMetadata
+      ] = None,
+  ) -> types.GenerateContentResponse:
+    return types.GenerateContentResponse(
+        candidates=[
+            types.Candidate(
+                content=(
+                    types.Content(role="model", parts=parts) if parts else None
+                ),
+                finish_reason=finish_reason,
+            )
+        ],
+        usage_metadata=usage_metadata,
+        model_version=self._model_version,
+    )
+
+  def process_event(
+      self, event: anthropic_types.RawMessageStreamEvent
+  ) -> Optional[types.GenerateContentResponse]:
+    """Processes a stream event.
+
+    Args:
+      event: The raw event from the Anthropic stream.
+
+    Returns:
+      The chunk to aggregate, or None if the event does not produce one.
+    """
+    if event.type == "message_start":
+      self._model_version = event.message.model
+      self._input_usage = event.message.usage
+    elif event.type == "content_block_start":
+      block = event.content_block
+      if block.type == "tool_use":
+        self._tool_use_blocks[event.index] = block
+        self._tool_use_args[event.index] = ""
+      elif block.type == "text" and block.text:
+        return self._model_chunk(parts=[types.Part.from_text(text=block.text)])
+      elif block.type == "thinking" and block.thinking:
+        return self._model_chunk(
+            parts=[types.Part(text=block.thinking, thought=True)]
+        )
+    elif event.type == "content_block_delta":
+      delta = event.delta
+      if delta.type == "text_delta" and delta.text:
+        return self._model_chunk(parts=[types.Part.from_text(text=delta.text)])
+      if delta.type == "thinking_delta" and delta.thinking:
+        return self._model_chunk(
+            parts=[types.Part(text=delta.thinking, thought=True)]
+        )
+      if delta.type == "input_json_delta" and event.index in (
+          self._tool_use_args
+      ):
+        self._tool_use_args[event.index] += delta.partial_json
+    elif event.type == "content_block_stop":
+      if event.index in self._tool_use_blocks:
+        block = self._tool_use_blocks.pop(event.index)
+        raw_args = self._tool_use_args.pop(event.index)
+        args = json.loads(raw_args) if raw_args else block.input
+        part = types.Part.from_function_call(name=block.name, args=args or {})
+        part.function_call.id = block.id
+        return self._model_chunk(parts=[part])
+    elif event.type == "message_delta":
+      return self._model_chunk(
+          finish_reason=to_google_genai_finish_reason(event.delta.stop_reason),
+          usage_metadata=_to_usage_metadata(event.usage, self._input_usage),
+      )
+    return None
+
+
 class AnthropicLlm(BaseLlm):
   """Integration with Claude models via the Anthropic API.
 
   Attributes:
     model: The name of the Claude model.
     max_tokens: The maximum number of tokens to generate.
+    enable_prompt_caching: Whether to add prompt cache breakpoints on the
+      tools, the system instruction and the conversation history. Cache
+      writes are billed differently from regular input tokens.
   """
 
   model: str = "claude-sonnet-4-20250514"
   max_tokens: int = 8192
+  enable_prompt_caching: bool = False
 
   @classmethod
   @override
@@ -305,17 +520,55 @@ class AnthropicLlm(BaseLlm):
         if llm_request.tools_dict
         else NOT_GIVEN
     )
-    # TODO(b/421255973): Enable streaming for anthropic models.
-    message = await self._anthropic_client.messages.create(
+    system = llm_request.config.system_instruction
+    if self.enable_prompt_caching:
+      system = add_prompt_cache_breakpoints(
+          system, messages, tools if tools is not NOT_GIVEN else []
+      )
+    request_kwargs = dict(
         model=llm_request.model,
-        system=llm_request.config.system_instruction,
+        system=system,
         messages=messages,
         tools=tools,
         tool_choice=tool_choice,
         max_tokens=self.max_tokens,
     )
+    if stream:
+      async with Aclosing(
+          self._generate_content_stream(request_kwargs)
+      ) as agen:
+        async for llm_response in agen:
+          yield llm_response
+      return
+
+    message = await self._anthropic_client.messages.create(**request_kwargs)
     yield message_to_generate_content_response(message)
 
+  async def _generate_content_stream(
+      self, request_kwargs: dict[str, Any]
+  ) -> AsyncGenerator[LlmResponse, None]:
+    """Streams a response, yielding partial and aggregated LlmResponses."""
+    events = await self._anthropic_client.messages.create(
+        **request_kwargs, stream=True
+    )
+    converter = _StreamEventConverter()
+    aggregator = StreamingResponseAggregator()
+    try:
+      async for event in events:
+        response = converter.process_event(event)
+        if response is None:
+          continue
+        async with Aclosing(
+            aggregator.process_response(response)
+        ) as aggregator_gen:
+          async for llm_response in aggregator_gen:
+            yield llm_response
+    finally:
+      # Releases the connection if the consumer stops early.
+      await events.close()
+    if (close_result := aggregator.close()) is not None:
+      yield close_result
+
   @cached_property
   def _anthropic_client(self) -> AsyncAnthropic:
     return AsyncAnthropic()
@@ -15,19 +15,28 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+import asyncio
+import logging
 from typing import AsyncGenerator
+from typing import Optional
+from typing import Sequence
 from typing import TYPE_CHECKING
+from typing import Union
 
 from google.genai import types
 from pydantic import BaseModel
 from pydantic import ConfigDict
 
+from ..utils.context_utils import Aclosing
+from ..utils.feature_decorator import experimental
 from .base_llm_connection import BaseLlmConnection
 
 if TYPE_CHECKING:
   from .llm_request import LlmRequest
   from .llm_response import LlmResponse
 
+logger = logging.getLogger('google_adk.' + __name__)
+
 
 class BaseLlm(BaseModel):
   """The BaseLLM class."""
@@ -149,6 +158,89 @@ class BaseLlm(BaseModel):
     )
     yield  # AsyncGenerator requires a yield statement in function body.
 
+  @experimental
+  async def generate_content_batch(
+      self,
+      llm_requests: Sequence[LlmRequest],
+      *,
+      max_concurrency: int = 8,
+      max_attempts: int = 1,
+      retry_delay_seconds: float = 1.0,
+      return_exceptions: bool = False,
+  ) -> list[Union[Optional[LlmResponse], BaseException]]:
+    """Generates content for many independent requests.
+
+    The default implementation calls `generate_content_async` for each request
+    without streaming, running at most `max_concurrency` requests at a time.
+    Backends that support native batch jobs can override this method to submit
+    the requests as a single job and poll for its results.
+
+    Args:
+      llm_requests: The requests to send to the LLM. They must not depend on
+        each other's responses.
+      max_concurrency: Maximum number of requests in flight at once.
+      max_attempts: Number of times a failing request is tried before its
+        error is reported. Retries back off exponentially starting at
+        `retry_delay_seconds`.
+      retry_delay_seconds: Delay before the first retry of a request.
+      return_exceptions: If True, the error of a request that still fails after
+        all attempts is placed in the result list in place of its response.
+        Otherwise the first such error is raised once all requests finish.
+
+    Returns:
+      One entry per request, in the order of `llm_requests`: the final
+      response of the request, None if the model generated no response, or
+      its error if `return_exceptions` is True.
+    """
+    if max_concurrency <= 0:
+      raise ValueError('max_concurrency must be positive.')
+    if max_attempts <= 0:
+      raise ValueError('max_attempts must be positive.')
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _generate_one(
+        index: int, llm_request: LlmRequest
+    ) -> Union[Optional[LlmResponse], BaseException]:
+      for attempt in range(max_attempts):
+        if attempt:
+          await asyncio.sleep(retry_delay_seconds * 2 ** (attempt - 1))
+        try:
+          async with semaphore:
+            return await self._generate_final_response(llm_request)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+          logger.debug(
+              'Batch request %d failed on attempt %d/%d: %s',
+              index,
+              attempt + 1,
+              max_attempts,
+              e,
+          )
+          error = e
+      return error
+
+    results = await asyncio.gather(*(
+        _generate_one(index, llm_request)
+        for index, llm_request in enumerate(llm_requests)
+    ))
+    if not return_exceptions:
+      for result in results:
+        if isinstance(result, BaseException):
+          raise result
+    return results
+
+  async def _generate_final_response(
+      self, llm_request: LlmRequest
+  ) -> Optional[LlmResponse]:
+    """Returns the last non-partial response of a non-streaming call."""
+    final_response = None
+    async with Aclosing(
+        self.generate_content_async(llm_request, stream=False)
+    ) as agen:
+      async for llm_response in agen:
+        if not llm_response.partial:
+          final_response = llm_response
+    return final_response
+
   def _maybe_append_user_content(self, llm_request: LlmRequest):
     """Appends a user content, so that model can continue to output.
 
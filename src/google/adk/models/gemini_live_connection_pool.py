@@ -0,0 +1,272 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pool of pre-established Gemini Live API sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import hashlib
+import logging
+import time
+from typing import AsyncContextManager
+from typing import AsyncIterator
+from typing import Callable
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from google.genai import types
+
+from ..utils.feature_decorator import experimental
+
+if TYPE_CHECKING:
+  from google.genai import live
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+LiveConnectFactory = Callable[..., AsyncContextManager['live.AsyncSession']]
+"""Opens a live session, e.g. `client.aio.live.connect`."""
+
+HealthCheck = Callable[['live.AsyncSession'], bool]
+"""Returns whether an idle live session can still be handed out."""
+
+
+def _is_session_open(session: live.AsyncSession) -> bool:
+  """Default health check based on the state of the underlying websocket."""
+  websocket = getattr(session, '_ws', None)
+  state = getattr(websocket, 'state', None)
+  if state is None:
+    return True
+  return getattr(state, 'name', 'OPEN') == 'OPEN'
+
+
+def config_fingerprint(model: str, config: types.LiveConnectConfig) -> str:
+  """Returns the pool key for a model and live connect config.
+
+  Args:
+    model: The live model name.
+    config: The live connect config, after the model has filled in the system
+      instruction, tools and headers.
+
+  Returns:
+    A stable hex digest identifying sessions that can be used interchangeably.
+  """
+  hasher = hashlib.sha256(model.encode('utf-8'))
+  hasher.update(config.model_dump_json(exclude_none=True).encode('utf-8'))
+  return hasher.hexdigest()
+
+
+@dataclasses.dataclass
+class _IdleSession:
+  session: live.AsyncSession
+  exit_stack: contextlib.AsyncExitStack
+  created_at: float
+
+
+@experimental
+class GeminiLiveConnectionPool:
+  """Keeps pre-established Gemini Live sessions ready for `run_live`.
+
+  Opening a live session performs the websocket handshake and session setup,
+  which delays call pickup for voice agents. The pool keeps up to
+  `min_idle_sessions` unused sessions per (model, config fingerprint) and
+  replenishes them in the background whenever one is handed out.
+
+  Live sessions are stateful, so a session is used by exactly one connection
+  and is closed when that connection ends. Reconnects that resume a session
+  through a session resumption handle must resume that specific session and
+  therefore bypass the pool.
+
+  Sample:
+  ```python
+  pool = GeminiLiveConnectionPool(min_idle_sessions=2)
+  agent = Agent(model=Gemini(model=..., live_connection_pool=pool), ...)
+  ```
+  """
+
+  def __init__(
+      self,
+      *,
+      min_idle_sessions: int = 1,
+      max_idle_seconds: float = 120.0,
+      health_check: Optional[HealthCheck] = None,
+  ):
+    """Initializes the pool.
+
+    Args:
+      min_idle_sessions: Number of idle sessions kept ready per pool key.
+      max_idle_seconds: Idle sessions older than this are closed instead of
+        being handed out, since the server may drop idle connections.
+      health_check: Returns whether an idle session is still usable. Defaults
+        to checking that the underlying websocket is open.
+    """
+    if min_idle_sessions < 0:
+      raise ValueError('min_idle_sessions must not be negative.')
+    self.min_idle_sessions = min_idle_sessions
+    self.max_idle_seconds = max_idle_seconds
+    self._health_check = health_check or _is_session_open
+    self._idle: dict[str, collections.deque[_IdleSession]] = (
+        collections.defaultdict(collections.deque)
+    )
+    self._refill_tasks: dict[str, asyncio.Task[None]] = {}
+    self._closed = False
+    self.hits = 0
+    """Number of sessions handed out from the pool."""
+    self.misses = 0
+    """Number of sessions opened on demand because none was idle."""
+
+  def idle_count(self, model: str, config: types.LiveConnectConfig) -> int:
+    """Returns the number of idle sessions for a model and config."""
+    return len(self._idle.get(config_fingerprint(model, config), ()))
+
+  async def prewarm(
+      self,
+      connect: LiveConnectFactory,
+      model: str,
+      config: types.LiveConnectConfig,
+  ) -> None:
+    """Opens idle sessions for a model and config until the pool is full.
+
+    Args:
+      connect: Opens a live session, e.g. `client.aio.live.connect`.
+      model: The live model name.
+      config: The live connect config.
+    """
+    key = config_fingerprint(model, config)
+    await self._refill(key, connect, model, config.model_copy(deep=True))
+
+  @contextlib.asynccontextmanager
+  async def session(
+      self,
+      connect: LiveConnectFactory,
+      model: str,
+      config: types.LiveConnectConfig,
+  ) -> AsyncIterator[live.AsyncSession]:
+    """Hands out a live session, opening one if no healthy session is idle.
+
+    Args:
+      connect: Opens a live session, e.g. `client.aio.live.connect`.
+      model: The live model name.
+      config: The live connect config.
+
+    Yields:
+      A live session that is closed when the context exits.
+    """
+    key = config_fingerprint(model, config)
+    idle_session = await self._pop_healthy(key)
+    if idle_session:
+      self.hits += 1
+      exit_stack = idle_session.exit_stack
+      live_session = idle_session.session
+    else:
+      self.misses += 1
+      exit_stack = contextlib.AsyncExitStack()
+      live_session = await exit_stack.enter_async_context(
+          connect(model=model, config=config)
+      )
+    self._schedule_refill(key, connect, model, config)
+    try:
+      yield live_session
+    finally:
+      await exit_stack.aclose()
+
+  async def close(self) -> None:
+    """Cancels background refills and closes all idle sessions."""
+    self._closed = True
+    tasks = list(self._refill_tasks.values())
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    self._refill_tasks.clear()
+    for idle_sessions in self._idle.values():
+      while idle_sessions:
+        await self._discard(idle_sessions.popleft())
+    self._idle.clear()
+
+  async def _pop_healthy(self, key: str) -> Optional[_IdleSession]:
+    idle_sessions = self._idle.get(key)
+    while idle_sessions:
+      idle_session = idle_sessions.popleft()
+      if self._is_usable(idle_session):
+        return idle_session
+      await self._discard(idle_session)
+    return None
+
+  def _is_usable(self, idle_session: _IdleSession) -> bool:
+    if time.monotonic() - idle_session.created_at > self.max_idle_seconds:
+      return False
+    try:
+      return self._health_check(idle_session.session)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.warning('Live session health check failed: %s', e)
+      return False
+
+  async def _discard(self, idle_session: _IdleSession) -> None:
+    try:
+      await idle_session.exit_stack.aclose()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.debug('Error closing idle live session: %s', e)
+
+  def _schedule_refill(
+      self,
+      key: str,
+      connect: LiveConnectFactory,
+      model: str,
+      config: types.LiveConnectConfig,
+  ) -> None:
+    if self._closed or not self.min_idle_sessions:
+      return
+    task = self._refill_tasks.get(key)
+    if task and not task.done():
+      return
+    self._refill_tasks[key] = asyncio.create_task(
+        self._refill(key, connect, model, config.model_copy(deep=True))
+    )
+
+  async def _refill(
+      self,
+      key: str,
+      connect: LiveConnectFactory,
+      model: str,
+      config: types.LiveConnectConfig,
+  ) -> None:
+    idle_sessions = self._idle[key]
+    for idle_session in list(idle_sessions):
+      # Sessions may be handed out while discarding others.
+      if idle_session in idle_sessions and not self._is_usable(idle_session):
+        idle_sessions.remove(idle_session)
+        await self._discard(idle_session)
+    while not self._closed and len(idle_sessions) < self.min_idle_sessions:
+      exit_stack = contextlib.AsyncExitStack()
+      try:
+        live_session = await exit_stack.enter_async_context(
+            connect(model=model, config=config)
+        )
+      except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning('Failed to pre-establish live session: %s', e)
+        return
+      if self._closed:
+        await exit_stack.aclose()
+        return
+      idle_sessions.append(
+          _IdleSession(
+              session=live_session,
+              exit_stack=exit_stack,
+              created_at=time.monotonic(),
+          )
+      )
+      logger.debug('Pre-established live session for model %s', model)
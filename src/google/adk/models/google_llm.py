@@ -37,8 +37,11 @@ from ..utils.streaming_utils import StreamingResponseAggregator
 from ..utils.variant_utils import GoogleLLMVariant
 from .base_llm import BaseLlm
 from .base_llm_connection import BaseLlmConnection
+from .gemini_live_connection_pool import GeminiLiveConnectionPool
 from .gemini_llm_connection import GeminiLlmConnection
 from .llm_response import LlmResponse
+from .model_io_logging import log_model_io
+from .model_io_logging import should_log_model_io
 
 if TYPE_CHECKING:
   from google.genai import Client
@@ -114,6 +117,20 @@ class Gemini(BaseLlm):
   ```
   """
 
+  live_connection_pool: Optional[GeminiLiveConnectionPool] = None
+  """Pool of pre-established live sessions used by `connect`.
+
+  Sample:
+  ```python
+  agent = Agent(
+    model=Gemini(
+      model='gemini-live-2.5-flash',
+      live_connection_pool=GeminiLiveConnectionPool(min_idle_sessions=2),
+    )
+  )
+  ```
+  """
+
   retry_options: Optional[types.HttpRetryOptions] = None
   """Allow Gemini to retry failed responses.
 
@@ -208,7 +225,8 @@ class Gemini(BaseLlm):
           yield llm_response
         return
 
-      logger.debug(_build_request_log(llm_request))
+      log_io = should_log_model_io(logger)
+      log_model_io(logger, log_io, 'request', _build_request_log, llm_request)
 
       if stream:
         responses = await self.api_client.aio.models.generate_content_stream(
@@ -226,7 +244,9 @@ class Gemini(BaseLlm):
         aggregator = StreamingResponseAggregator()
         async with Aclosing(responses) as agen:
           async for response in agen:
-            logger.debug(_build_response_log(response))
+            log_model_io(
+                logger, log_io, 'response', _build_response_log, response
+            )
             async with Aclosing(
                 aggregator.process_response(response)
             ) as aggregator_gen:
@@ -248,7 +268,7 @@ class Gemini(BaseLlm):
             config=llm_request.config,
         )
         logger.info('Response received from the model.')
-        logger.debug(_build_response_log(response))
+        log_model_io(logger, log_io, 'response', _build_response_log, response)
 
         llm_response = LlmResponse.create(response)
         if cache_metadata:
@@ -403,9 +423,20 @@ class Gemini(BaseLlm):
     llm_request.live_connect_config.tools = llm_request.config.tools
     logger.debug('Connecting to live with llm_request:%s', llm_request)
     logger.debug('Live connect config: %s', llm_request.live_connect_config)
-    async with self._live_api_client.aio.live.connect(
-        model=llm_request.model, config=llm_request.live_connect_config
-    ) as live_session:
+    session_resumption = llm_request.live_connect_config.session_resumption
+    if self.live_connection_pool and not (
+        session_resumption and session_resumption.handle
+    ):
+      live_session_context = self.live_connection_pool.session(
+          self._live_api_client.aio.live.connect,
+          llm_request.model,
+          llm_request.live_connect_config,
+      )
+    else:
+      live_session_context = self._live_api_client.aio.live.connect(
+          model=llm_request.model, config=llm_request.live_connect_config
+      )
+    async with live_session_context as live_session:
       yield GeminiLlmConnection(
           live_session,
           api_backend=self._api_backend,
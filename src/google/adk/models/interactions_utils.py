@@ -31,6 +31,7 @@ conversation history.
 from __future__ import annotations
 
 import base64
+import functools
 import json
 import logging
 from typing import Any
@@ -40,6 +41,9 @@ from typing import TYPE_CHECKING
 
 from google.genai import types
 
+from .model_io_logging import log_model_io
+from .model_io_logging import should_log_model_io
+
 if TYPE_CHECKING:
   from google.genai import Client
   from google.genai._interactions.types.interaction import Output
@@ -981,8 +985,13 @@ async def generate_content_via_interactions(
       previous_interaction_id,
   )
 
-  logger.debug(
-      build_interactions_request_log(
+  log_io = should_log_model_io(logger)
+  log_model_io(
+      logger,
+      log_io,
+      'request',
+      functools.partial(
+          build_interactions_request_log,
           model=llm_request.model,
           input_turns=input_turns,
           system_instruction=system_instruction,
@@ -990,7 +999,7 @@ async def generate_content_via_interactions(
           generation_config=generation_config if generation_config else None,
           previous_interaction_id=previous_interaction_id,
           stream=stream,
-      )
+      ),
   )
 
   # Track the current interaction ID from responses
@@ -1011,7 +1020,9 @@ async def generate_content_via_interactions(
     aggregated_parts: list[types.Part] = []
     async for event in responses:
       # Log the streaming event
-      logger.debug(build_interactions_event_log(event))
+      log_model_io(
+          logger, log_io, 'response', build_interactions_event_log, event
+      )
 
       # Extract interaction ID from event if available
       if hasattr(event, 'id') and event.id:
@@ -1046,6 +1057,12 @@ async def generate_content_via_interactions(
 
     # Log the response
     logger.info('Interaction response received from the model.')
-    logger.debug(build_interactions_response_log(interaction))
+    log_model_io(
+        logger,
+        log_io,
+        'response',
+        build_interactions_response_log,
+        interaction,
+    )
 
     yield convert_interaction_to_llm_response(interaction)
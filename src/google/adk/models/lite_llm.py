@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import base64
 import copy
+import hashlib
 import importlib.util
 import json
 import logging
@@ -49,12 +50,16 @@ if not TYPE_CHECKING and importlib.util.find_spec("litellm") is None:
 
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic_core import PydanticSerializationError
 from typing_extensions import override
 
 from ..utils._google_client_headers import merge_tracking_headers
+from ..utils._lru_cache import LruCache
 from .base_llm import BaseLlm
 from .llm_request import LlmRequest
 from .llm_response import LlmResponse
+from .model_io_logging import log_model_io
+from .model_io_logging import should_log_model_io
 
 if TYPE_CHECKING:
   import litellm
@@ -139,6 +144,12 @@ _MISSING_TOOL_RESULT_MESSAGE = (
     "before a response was recorded)."
 )
 
+# Upper bounds for the per-model conversion caches. Each message entry holds a
+# converted message param (including base64 payloads of inline data), so the
+# bound keeps memory proportional to a few long conversations.
+_MESSAGE_PARAM_CACHE_MAX_ENTRIES = 1024
+_TOOL_PARAM_CACHE_MAX_ENTRIES = 32
+
 _LITELLM_IMPORTED = False
 _LITELLM_GLOBAL_SYMBOLS = (
     "ChatCompletionAssistantMessage",
@@ -711,6 +722,111 @@ async def _content_to_message_param(
     )
 
 
+def _content_fingerprint(content: types.Content) -> Optional[bytes]:
+  """Returns a digest that changes whenever the content's payload changes.
+
+  Inline data bytes are hashed directly instead of being base64-encoded as part
+  of the JSON dump, which keeps fingerprinting cheaper than the conversion.
+
+  Args:
+    content: The content to fingerprint.
+
+  Returns:
+    The SHA-256 digest of the content, or None if the content holds values
+    that are not JSON-serializable, e.g. in a function response.
+  """
+  hasher = hashlib.sha256((content.role or "").encode("utf-8"))
+  try:
+    for part in content.parts or []:
+      hasher.update(b"\x00")
+      if part.inline_data is not None and part.inline_data.data:
+        hasher.update(part.inline_data.data)
+        hasher.update(
+            part.model_dump_json(
+                exclude_none=True, exclude={"inline_data": {"data"}}
+            ).encode("utf-8")
+        )
+      else:
+        hasher.update(part.model_dump_json(exclude_none=True).encode("utf-8"))
+  except PydanticSerializationError:
+    return None
+  return hasher.digest()
+
+
+def _function_declarations_fingerprint(
+    function_declarations: Iterable[types.FunctionDeclaration],
+) -> bytes:
+  """Returns a digest identifying a set of function declarations."""
+  hasher = hashlib.sha256()
+  for function_declaration in function_declarations:
+    hasher.update(b"\x00")
+    hasher.update(
+        function_declaration.model_dump_json(exclude_none=True).encode("utf-8")
+    )
+  return hasher.digest()
+
+
+class _CompletionInputsCache:
+  """Memoizes message and tool conversions across LiteLLM calls.
+
+  Multi-step tool loops resend the same conversation prefix and tool set on
+  every call. Contents are keyed by a payload fingerprint rather than object
+  identity because the flow deep-copies session events for every request.
+  Every call gets its own copies of the cached message and tool dicts, so keys
+  set on them downstream do not leak into later requests. Nested values are
+  shared and are never mutated in place.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_messages: int = _MESSAGE_PARAM_CACHE_MAX_ENTRIES,
+      max_tool_sets: int = _TOOL_PARAM_CACHE_MAX_ENTRIES,
+  ):
+    self.messages: LruCache[
+        Tuple[bytes, str, str], Union[Message, list[Message]]
+    ] = LruCache(max_messages)
+    self.tools: LruCache[bytes, List[Dict]] = LruCache(max_tool_sets)
+
+  async def content_to_message_param(
+      self,
+      content: types.Content,
+      *,
+      provider: str = "",
+      model: str = "",
+  ) -> Union[Message, list[Message]]:
+    """Cached variant of `_content_to_message_param`."""
+    fingerprint = _content_fingerprint(content)
+    if fingerprint is None:
+      return await _content_to_message_param(
+          content, provider=provider, model=model
+      )
+    key = (fingerprint, provider, model)
+    cached = self.messages.get(key)
+    if cached is None:
+      cached = await _content_to_message_param(
+          content, provider=provider, model=model
+      )
+      self.messages.put(key, cached)
+    if isinstance(cached, list):
+      return [copy.copy(message) for message in cached]
+    return copy.copy(cached)
+
+  def function_declarations_to_tool_params(
+      self, function_declarations: List[types.FunctionDeclaration]
+  ) -> List[Dict]:
+    """Converts a tool set with `_function_declaration_to_tool_param` once."""
+    key = _function_declarations_fingerprint(function_declarations)
+    cached = self.tools.get(key)
+    if cached is None:
+      cached = [
+          _function_declaration_to_tool_param(function_declaration)
+          for function_declaration in function_declarations
+      ]
+      self.tools.put(key, cached)
+    return [copy.copy(tool) for tool in cached]
+
+
 def _ensure_tool_results(messages: List[Message]) -> List[Message]:
   """Insert placeholder tool messages for missing tool results.
 
@@ -1535,6 +1651,7 @@ def _to_litellm_response_format(
 async def _get_completion_inputs(
     llm_request: LlmRequest,
     model: str,
+    cache: Optional[_CompletionInputsCache] = None,
 ) -> Tuple[
     List[Message],
     Optional[List[Dict]],
@@ -1546,6 +1663,7 @@ async def _get_completion_inputs(
   Args:
     llm_request: The LlmRequest to convert.
     model: The model string to use for determining provider-specific behavior.
+    cache: Optional cache used to reuse conversions from previous calls.
 
   Returns:
     The litellm inputs (message list, tool dictionary, response format and
@@ -1559,9 +1677,14 @@ async def _get_completion_inputs(
   # 1. Construct messages
   messages: List[Message] = []
   for content in llm_request.contents or []:
-    message_param_or_list = await _content_to_message_param(
-        content, provider=provider, model=model
-    )
+    if cache is not None:
+      message_param_or_list = await cache.content_to_message_param(
+          content, provider=provider, model=model
+      )
+    else:
+      message_param_or_list = await _content_to_message_param(
+          content, provider=provider, model=model
+      )
     if isinstance(message_param_or_list, list):
       messages.extend(message_param_or_list)
     elif message_param_or_list:  # Ensure it's not None before appending
@@ -1584,10 +1707,14 @@ async def _get_completion_inputs(
       and llm_request.config.tools
       and llm_request.config.tools[0].function_declarations
   ):
-    tools = [
-        _function_declaration_to_tool_param(tool)
-        for tool in llm_request.config.tools[0].function_declarations
-    ]
+    function_declarations = llm_request.config.tools[0].function_declarations
+    if cache is not None:
+      tools = cache.function_declarations_to_tool_params(function_declarations)
+    else:
+      tools = [
+          _function_declaration_to_tool_param(tool)
+          for tool in function_declarations
+      ]
 
   # 3. Handle response format
   response_format: dict[str, Any] | None = None
@@ -1817,6 +1944,7 @@ class LiteLlm(BaseLlm):
   """The LLM client to use for the model."""
 
   _additional_args: Dict[str, Any] = None
+  _completion_inputs_cache: _CompletionInputsCache = None
 
   def __init__(self, model: str, **kwargs):
     """Initializes the LiteLlm class.
@@ -1839,6 +1967,7 @@ class LiteLlm(BaseLlm):
     self._additional_args.pop("stream", None)
     if drop_params is not None:
       self._additional_args["drop_params"] = drop_params
+    self._completion_inputs_cache = _CompletionInputsCache()
 
   async def generate_content_async(
       self, llm_request: LlmRequest, stream: bool = False
@@ -1856,11 +1985,19 @@ class LiteLlm(BaseLlm):
 
     self._maybe_append_user_content(llm_request)
     _append_fallback_user_content_if_missing(llm_request)
-    logger.debug(_build_request_log(llm_request))
+    log_model_io(
+        logger,
+        should_log_model_io(logger),
+        "request",
+        _build_request_log,
+        llm_request,
+    )
 
     effective_model = llm_request.model or self.model
     messages, tools, response_format, generation_params = (
-        await _get_completion_inputs(llm_request, effective_model)
+        await _get_completion_inputs(
+            llm_request, effective_model, cache=self._completion_inputs_cache
+        )
     )
     normalized_messages = _normalize_ollama_chat_messages(
         messages,
@@ -0,0 +1,153 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy, sampled logging of model requests and responses.
+
+Model adapters log full requests and responses at DEBUG level. Building those
+messages serializes every content and function declaration, so the adapters
+route them through this module, which:
+
+* skips all work when DEBUG is disabled for the adapter's logger,
+* head-samples whole requests, so the chunks of a streamed response are logged
+  together or not at all,
+* defers formatting until a handler actually emits the record,
+* applies redaction hooks and a size cap to the formatted message.
+
+Sample:
+```python
+from google.adk.models import model_io_logging
+
+model_io_logging.configure_model_io_logging(
+    model_io_logging.ModelIoLogOptions(
+        sample_rate=0.1,
+        max_chars=4000,
+        redactors=[lambda text: text.replace(api_key, '<redacted>')],
+    )
+)
+```
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import random
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+_TRUNCATION_MARKER = '\n... [truncated {omitted} chars]'
+
+Redactor = Callable[[str], str]
+"""Rewrites a formatted model I/O log message, e.g. to mask secrets."""
+
+
+@dataclasses.dataclass
+class ModelIoLogOptions:
+  """Options for model request and response logging."""
+
+  sample_rate: float = 1.0
+  """Fraction of requests whose I/O is logged, decided once per request."""
+
+  max_chars: Optional[int] = 20_000
+  """Maximum length of a single log message. None disables the cap."""
+
+  redactors: list[Redactor] = dataclasses.field(default_factory=list)
+  """Hooks applied in order to each formatted message before the size cap."""
+
+
+_options = ModelIoLogOptions()
+
+
+def configure_model_io_logging(options: ModelIoLogOptions) -> None:
+  """Sets the options used by all model adapters."""
+  global _options
+  _options = options
+
+
+def get_model_io_logging_options() -> ModelIoLogOptions:
+  """Returns the options used by all model adapters."""
+  return _options
+
+
+class LazyModelIoMessage:
+  """Formats a model I/O log message only when it is rendered."""
+
+  __slots__ = ('_build', '_args', '_options')
+
+  def __init__(
+      self,
+      build: Callable[..., str],
+      *args: Any,
+      options: Optional[ModelIoLogOptions] = None,
+  ):
+    self._build = build
+    self._args = args
+    self._options = options or _options
+
+  def __str__(self) -> str:
+    text = self._build(*self._args)
+    for redactor in self._options.redactors:
+      text = redactor(text)
+    max_chars = self._options.max_chars
+    if max_chars is not None and len(text) > max_chars:
+      omitted = len(text) - max_chars
+      text = text[:max_chars] + _TRUNCATION_MARKER.format(omitted=omitted)
+    return text
+
+
+def should_log_model_io(logger: logging.Logger) -> bool:
+  """Makes the head-sampling decision for one model request.
+
+  Call this once per request and pass the result to `log_model_io` for the
+  request and each of its responses.
+
+  Args:
+    logger: The adapter's logger.
+
+  Returns:
+    Whether the request and its responses should be logged.
+  """
+  if not logger.isEnabledFor(logging.DEBUG):
+    return False
+  sample_rate = _options.sample_rate
+  if sample_rate >= 1.0:
+    return True
+  return sample_rate > 0.0 and random.random() < sample_rate
+
+
+def log_model_io(
+    logger: logging.Logger,
+    sampled: bool,
+    direction: str,
+    build: Callable[..., str],
+    *args: Any,
+) -> None:
+  """Logs a model request or response at DEBUG level without eager formatting.
+
+  Args:
+    logger: The adapter's logger.
+    sampled: The result of `should_log_model_io` for the current request.
+    direction: Either 'request' or 'response'; attached to the log record as
+      `model_io_direction` for structured handlers.
+    build: Builds the message from `args` when the record is rendered.
+    *args: Arguments passed to `build`.
+  """
+  if not sampled:
+    return
+  logger.debug(
+      '%s',
+      LazyModelIoMessage(build, *args),
+      extra={'model_io_direction': direction},
+  )
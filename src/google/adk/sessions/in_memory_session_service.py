@@ -276,15 +276,8 @@ class InMemorySessionService(BaseSessionService):
   def _delete_session_impl(
       self, *, app_name: str, user_id: str, session_id: str
   ) -> None:
-    if (
-        self._get_session_impl(
-            app_name=app_name, user_id=user_id, session_id=session_id
-        )
-        is None
-    ):
-      return
-
-    self.sessions[app_name][user_id].pop(session_id)
+    # Looked up directly, as getting the session would copy it.
+    self.sessions.get(app_name, {}).get(user_id, {}).pop(session_id, None)
 
   @override
   async def append_event(self, session: Session, event: Event) -> Event:
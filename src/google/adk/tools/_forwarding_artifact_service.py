@@ -14,6 +14,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+import contextvars
 from typing import Any
 from typing import Optional
 from typing import TYPE_CHECKING
@@ -28,12 +31,42 @@ if TYPE_CHECKING:
   from .tool_context import ToolContext
 
 
+# The tool context of the current call, for services shared across calls.
+_current_tool_context: contextvars.ContextVar[Optional[ToolContext]] = (
+    contextvars.ContextVar("_current_tool_context", default=None)
+)
+
+
+@contextmanager
+def forward_artifacts_to(tool_context: ToolContext) -> Iterator[None]:
+  """Forwards artifacts of shared services to `tool_context` in this context."""
+  token = _current_tool_context.set(tool_context)
+  try:
+    yield
+  finally:
+    _current_tool_context.reset(token)
+
+
 class ForwardingArtifactService(BaseArtifactService):
-  """Artifact service that forwards to the parent tool context."""
+  """Artifact service that forwards to the parent tool context.
+
+  Without a tool context, artifacts are forwarded to the tool context set by
+  `forward_artifacts_to`, which lets concurrent calls share one service.
+  """
+
+  def __init__(self, tool_context: Optional[ToolContext] = None):
+    self._tool_context = tool_context
+
+  @property
+  def tool_context(self) -> ToolContext:
+    tool_context = self._tool_context or _current_tool_context.get()
+    if tool_context is None:
+      raise ValueError("No tool context to forward artifacts to.")
+    return tool_context
 
-  def __init__(self, tool_context: ToolContext):
-    self.tool_context = tool_context
-    self._invocation_context = tool_context._invocation_context
+  @property
+  def _invocation_context(self):
+    return self.tool_context._invocation_context
 
   @override
   async def save_artifact(
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import json
+from typing import Hashable
 from typing import List
 from typing import Optional
 
@@ -38,6 +39,32 @@ from ..features import FeatureName
 from .tool_context import ToolContext
 
 
+def get_credentials_key(
+    credentials: google.auth.credentials.Credentials,
+) -> Hashable:
+  """Returns a key identifying the principal of the credentials."""
+  if isinstance(credentials, google.oauth2.credentials.Credentials):
+    # OAuth credentials restored from the token cache are new objects on every
+    # tool call, but refer to the same user grant.
+    return (
+        "oauth2",
+        credentials.client_id,
+        credentials.refresh_token or credentials.token,
+    )
+  return ("object", id(credentials))
+
+
+def refresh_cached_credentials(
+    cached: google.auth.credentials.Credentials,
+    credentials: google.auth.credentials.Credentials,
+) -> None:
+  """Carries a token refreshed outside of a cached client over to it."""
+  if cached is credentials or cached.token == credentials.token:
+    return
+  cached.token = credentials.token
+  cached.expiry = credentials.expiry
+
+
 @experimental(FeatureName.GOOGLE_CREDENTIALS_CONFIG)
 class BaseGoogleCredentialsConfig(BaseModel):
   """Base Google Credentials Configuration for Google API tools (Experimental).
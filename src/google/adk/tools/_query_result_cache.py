@@ -0,0 +1,173 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-process cache of read-only SQL query results, shared by SQL tools."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import json
+import re
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import NamedTuple
+from typing import Optional
+import weakref
+
+# Matches quoted strings and identifiers, which are kept verbatim, or runs of
+# whitespace and comments, which are collapsed.
+_SQL_TOKEN_RE = re.compile(
+    r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`)"
+    r"|(?:\s|--[^\n]*|#[^\n]*|/\*.*?\*/)+",
+    re.DOTALL,
+)
+
+# All live caches, so that a write through any tool invalidates the results
+# cached by the others.
+_live_caches: weakref.WeakSet[QueryResultCache] = weakref.WeakSet()
+
+
+def normalize_sql(sql: str) -> str:
+  """Normalizes whitespace, comments and trailing semicolons of a query."""
+  normalized = _SQL_TOKEN_RE.sub(lambda m: m.group(1) or " ", sql)
+  return normalized.strip().rstrip(";").rstrip()
+
+
+class _Entry(NamedTuple):
+  scope: Hashable
+  result_json: str
+  expires_at: float
+
+
+class QueryResultCache:
+  """A TTL and memory bounded LRU cache of query results.
+
+  Results are stored as JSON, which keeps cached results immutable and makes
+  their size known. Entries belong to a scope, e.g. a project or a database,
+  through which they are invalidated.
+  """
+
+  def __init__(
+      self,
+      *,
+      ttl_seconds: float,
+      max_bytes: int,
+      timer: Callable[[], float] = time.monotonic,
+  ):
+    self.ttl_seconds = ttl_seconds
+    self.max_bytes = max_bytes
+    self.hits = 0
+    self.misses = 0
+    self._timer = timer
+    self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+    self._total_bytes = 0
+    self._lock = threading.Lock()
+    _live_caches.add(self)
+
+  @staticmethod
+  def make_key(
+      scope: Hashable,
+      principal: Hashable,
+      query: str,
+      params: Optional[dict[str, Any]] = None,
+  ) -> Hashable:
+    """Returns the cache key of a query run by a principal within a scope."""
+    params_key = (
+        json.dumps(params, sort_keys=True, default=repr) if params else None
+    )
+    return (scope, principal, normalize_sql(query), params_key)
+
+  @property
+  def hit_rate(self) -> float:
+    lookups = self.hits + self.misses
+    return self.hits / lookups if lookups else 0.0
+
+  @property
+  def total_bytes(self) -> int:
+    return self._total_bytes
+
+  def get(self, key: Hashable) -> Optional[dict[str, Any]]:
+    """Returns a copy of the cached result for `key`, if fresh."""
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None and entry.expires_at <= self._timer():
+        self._remove(key)
+        entry = None
+      if entry is None:
+        self.misses += 1
+        return None
+      self._entries.move_to_end(key)
+      self.hits += 1
+    return json.loads(entry.result_json)
+
+  def put(self, key: Hashable, result: dict[str, Any]) -> None:
+    """Stores a result, evicting the least recently used ones if needed."""
+    result_json = json.dumps(result)
+    size = len(result_json)
+    if size > self.max_bytes:
+      return
+    with self._lock:
+      if key in self._entries:
+        self._remove(key)
+      self._entries[key] = _Entry(
+          scope=key[0],
+          result_json=result_json,
+          expires_at=self._timer() + self.ttl_seconds,
+      )
+      self._total_bytes += size
+      while self._total_bytes > self.max_bytes:
+        self._remove(next(iter(self._entries)))
+
+  def invalidate(self, scope: Optional[Hashable] = None) -> None:
+    """Removes all results cached for `scope`, or all results if None.
+
+    Hit and miss counters are preserved.
+    """
+    with self._lock:
+      if scope is None:
+        self._entries.clear()
+        self._total_bytes = 0
+        return
+      for key in [k for k, e in self._entries.items() if e.scope == scope]:
+        self._remove(key)
+
+  def stats(self, *, hit: bool) -> dict[str, Any]:
+    """Returns the cache metadata added to tool responses."""
+    return {
+        "hit": hit,
+        "hits": self.hits,
+        "misses": self.misses,
+        "hit_rate": round(self.hit_rate, 4),
+    }
+
+  def _remove(self, key: Hashable) -> None:
+    entry = self._entries.pop(key)
+    self._total_bytes -= len(entry.result_json)
+
+  def __len__(self) -> int:
+    with self._lock:
+      return len(self._entries)
+
+
+def invalidate_query_results(scope: Optional[Hashable] = None) -> None:
+  """Invalidates the results cached for `scope` by all live caches.
+
+  Writes can reach any table the principal has access to, so callers that
+  cannot tell which scopes a write touched invalidate all results.
+  """
+  for cache in list(_live_caches):
+    cache.invalidate(scope)
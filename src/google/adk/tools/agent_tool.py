@@ -28,7 +28,9 @@ from ..agents.common_configs import AgentRefConfig
 from ..features import FeatureName
 from ..features import is_feature_enabled
 from ..memory.in_memory_memory_service import InMemoryMemoryService
+from ..utils._lru_cache import LruCache
 from ..utils.context_utils import Aclosing
+from ._forwarding_artifact_service import forward_artifacts_to
 from ._forwarding_artifact_service import ForwardingArtifactService
 from .base_tool import BaseTool
 from .tool_configs import BaseToolConfig
@@ -37,6 +39,13 @@ from .tool_context import ToolContext
 
 if TYPE_CHECKING:
   from ..agents.base_agent import BaseAgent
+  from ..events.event import Event
+  from ..plugins.base_plugin import BasePlugin
+  from ..runners import Runner
+
+# Runners are reused per parent app, credential service and plugins, of which
+# an agent tool typically sees only one.
+_MAX_POOLED_RUNNERS = 8
 
 
 def _get_input_schema(agent: BaseAgent) -> Optional[type[BaseModel]]:
@@ -115,6 +124,9 @@ class AgentTool(BaseTool):
     self.agent = agent
     self.skip_summarization: bool = skip_summarization
     self.include_plugins = include_plugins
+    self._runners: LruCache[tuple[Any, ...], Runner] = LruCache(
+        _MAX_POOLED_RUNNERS
+    )
 
     super().__init__(name=agent.name, description=agent.description)
 
@@ -191,9 +203,6 @@ class AgentTool(BaseTool):
       args: dict[str, Any],
       tool_context: ToolContext,
   ) -> Any:
-    from ..runners import Runner
-    from ..sessions.in_memory_session_service import InMemorySessionService
-
     if self.skip_summarization:
       tool_context.actions.skip_summarization = True
 
@@ -217,49 +226,18 @@ class AgentTool(BaseTool):
     parent_app_name = (
         invocation_context.app_name if invocation_context else None
     )
-    child_app_name = parent_app_name or self.agent.name
     plugins = (
         tool_context._invocation_context.plugin_manager.plugins
         if self.include_plugins
         else None
     )
-    runner = Runner(
-        app_name=child_app_name,
-        agent=self.agent,
-        artifact_service=ForwardingArtifactService(tool_context),
-        session_service=InMemorySessionService(),
-        memory_service=InMemoryMemoryService(),
-        credential_service=tool_context._invocation_context.credential_service,
+    runner = self._get_runner(
+        tool_context,
+        app_name=parent_app_name or self.agent.name,
         plugins=plugins,
     )
-
-    state_dict = {
-        k: v
-        for k, v in tool_context.state.to_dict().items()
-        if not k.startswith('_adk')  # Filter out adk internal states
-    }
-    session = await runner.session_service.create_session(
-        app_name=child_app_name,
-        user_id=tool_context._invocation_context.user_id,
-        state=state_dict,
-    )
-
-    last_content = None
-    async with Aclosing(
-        runner.run_async(
-            user_id=session.user_id, session_id=session.id, new_message=content
-        )
-    ) as agen:
-      async for event in agen:
-        # Forward state delta to parent session.
-        if event.actions.state_delta:
-          tool_context.state.update(event.actions.state_delta)
-        if event.content:
-          last_content = event.content
-
-    # Clean up runner resources (especially MCP sessions)
-    # to avoid "Attempted to exit cancel scope in a different task" errors
-    await runner.close()
+    last_event = await self._run_agent(runner, tool_context, content)
+    last_content = last_event.content if last_event else None
 
     if last_content is None or last_content.parts is None:
       return ''
@@ -275,6 +253,92 @@ class AgentTool(BaseTool):
       tool_result = merged_text
     return tool_result
 
+  def _get_runner(
+      self,
+      tool_context: ToolContext,
+      *,
+      app_name: str,
+      plugins: Optional[list[BasePlugin]],
+  ) -> Runner:
+    """Returns the runner reused across calls from the same parent setup.
+
+    Each call runs in its own session, and artifacts are forwarded to the
+    tool context of the call, so the runner and its services are shared.
+    """
+    from ..runners import Runner
+    from ..sessions.in_memory_session_service import InMemorySessionService
+
+    credential_service = tool_context._invocation_context.credential_service
+    # The runner references the credential service and plugins, so their ids
+    # cannot be reused while it is cached.
+    key = (
+        app_name,
+        id(credential_service),
+        None if plugins is None else tuple(id(p) for p in plugins),
+    )
+    runner = self._runners.get(key)
+    if runner is None:
+      runner = Runner(
+          app_name=app_name,
+          agent=self.agent,
+          artifact_service=ForwardingArtifactService(),
+          session_service=InMemorySessionService(),
+          memory_service=InMemoryMemoryService(),
+          credential_service=credential_service,
+          plugins=plugins,
+      )
+      self._runners.put(key, runner)
+    return runner
+
+  async def _run_agent(
+      self,
+      runner: Runner,
+      tool_context: ToolContext,
+      content: types.Content,
+  ) -> Optional[Event]:
+    """Runs the agent in a new session and returns its last event with content.
+
+    State deltas are forwarded to the parent session, and the session is
+    deleted once the run is over.
+    """
+    state_dict = {
+        k: v
+        for k, v in tool_context.state.to_dict().items()
+        if not k.startswith('_adk')  # Filter out adk internal states
+    }
+    session = await runner.session_service.create_session(
+        app_name=runner.app_name,
+        user_id=tool_context._invocation_context.user_id,
+        state=state_dict,
+    )
+
+    last_event = None
+    try:
+      with forward_artifacts_to(tool_context):
+        async with Aclosing(
+            runner.run_async(
+                user_id=session.user_id,
+                session_id=session.id,
+                new_message=content,
+            )
+        ) as agen:
+          async for event in agen:
+            # Forward state delta to parent session.
+            if event.actions.state_delta:
+              tool_context.state.update(event.actions.state_delta)
+            if event.content:
+              last_event = event
+    finally:
+      await runner.session_service.delete_session(
+          app_name=runner.app_name,
+          user_id=session.user_id,
+          session_id=session.id,
+      )
+      # Close toolsets (especially MCP sessions) in the task that used them
+      # to avoid "Attempted to exit cancel scope in a different task" errors.
+      await runner._cleanup_toolsets(runner._collect_toolset(self.agent))
+    return last_event
+
   @override
   @classmethod
   def from_config(
@@ -40,6 +40,7 @@ logger = logging.getLogger("google_adk." + __name__)
 if TYPE_CHECKING:
   from ..models.llm_request import LlmRequest
   from .tool_configs import ToolArgsConfig
+  from .tool_memoization import ToolMemoizationConfig
 
 SelfTool = TypeVar("SelfTool", bound="BaseTool")
 
@@ -65,6 +66,10 @@ class BaseTool(ABC):
   NOTE: the entire dict must be JSON serializable.
   """
 
+  memoization: Optional[ToolMemoizationConfig] = None
+  """The memoization policy of the tool, for tools whose results only depend on
+  their arguments. None disables memoization."""
+
   def __init__(
       self,
       *,
@@ -72,11 +77,13 @@ class BaseTool(ABC):
       description,
       is_long_running: bool = False,
       custom_metadata: Optional[dict[str, Any]] = None,
+      memoization: Optional[ToolMemoizationConfig] = None,
   ):
     self.name = name
     self.description = description
     self.is_long_running = is_long_running
     self.custom_metadata = custom_metadata
+    self.memoization = memoization
 
   def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
     """Gets the OpenAPI specification of this tool in the form of a FunctionDeclaration.
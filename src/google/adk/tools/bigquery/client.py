@@ -14,19 +14,50 @@
 
 from __future__ import annotations
 
+from typing import Hashable
+from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 import google.api_core.client_info
 from google.auth.credentials import Credentials
 from google.cloud import bigquery
+from google.cloud import bigquery_storage
 
 from ... import version
+from ...utils._lru_cache import LruCache
+from .._google_credentials import get_credentials_key
+from .._google_credentials import refresh_cached_credentials
 
 USER_AGENT = f"adk-bigquery-tool google-adk/{version.__version__}"
 
+_MAX_CACHED_CLIENTS = 32
 
-from typing import List
-from typing import Union
+# Clients are expensive to create, as each one sets up its own authorized HTTP
+# session. Entries keep the credentials the client was created with, so that
+# identity-based cache keys stay valid while the entry exists.
+_bigquery_clients: LruCache[Hashable, Tuple[Credentials, bigquery.Client]] = (
+    LruCache(_MAX_CACHED_CLIENTS)
+)
+_bigquery_storage_clients: LruCache[
+    Hashable, Tuple[Credentials, bigquery_storage.BigQueryReadClient]
+] = LruCache(_MAX_CACHED_CLIENTS)
+
+
+def _get_client_info(
+    user_agent: Optional[Union[str, List[str]]],
+) -> google.api_core.client_info.ClientInfo:
+  user_agents = [USER_AGENT]
+  if user_agent:
+    if isinstance(user_agent, str):
+      user_agents.append(user_agent)
+    else:
+      user_agents.extend([ua for ua in user_agent if ua])
+
+  return google.api_core.client_info.ClientInfo(
+      user_agent=" ".join(user_agents)
+  )
 
 
 def get_bigquery_client(
@@ -38,6 +69,9 @@ def get_bigquery_client(
 ) -> bigquery.Client:
   """Get a BigQuery client.
 
+  Clients are cached per project, credentials, location and user agent, and
+  reused across tool calls.
+
   Args:
     project: The GCP project ID.
     credentials: The credentials to use for the request.
@@ -47,17 +81,17 @@ def get_bigquery_client(
   Returns:
     A BigQuery client.
   """
-
-  user_agents = [USER_AGENT]
-  if user_agent:
-    if isinstance(user_agent, str):
-      user_agents.append(user_agent)
-    else:
-      user_agents.extend([ua for ua in user_agent if ua])
-
-  client_info = google.api_core.client_info.ClientInfo(
-      user_agent=" ".join(user_agents)
+  client_info = _get_client_info(user_agent)
+  key = (
+      project,
+      get_credentials_key(credentials),
+      location,
+      client_info.user_agent,
   )
+  cached = _bigquery_clients.get(key)
+  if cached is not None:
+    refresh_cached_credentials(cached[0], credentials)
+    return cached[1]
 
   bigquery_client = bigquery.Client(
       project=project,
@@ -65,5 +99,41 @@ def get_bigquery_client(
       location=location,
       client_info=client_info,
   )
-
+  _bigquery_clients.put(key, (credentials, bigquery_client))
   return bigquery_client
+
+
+def get_bigquery_storage_client(
+    *,
+    credentials: Credentials,
+    user_agent: Optional[Union[str, List[str]]] = None,
+) -> bigquery_storage.BigQueryReadClient:
+  """Get a BigQuery Storage read client, used to fetch large query results.
+
+  Clients are cached per credentials and user agent.
+
+  Args:
+    credentials: The credentials to use for the request.
+    user_agent: The user agent to use for the request.
+
+  Returns:
+    A BigQuery Storage read client.
+  """
+  client_info = _get_client_info(user_agent)
+  key = (get_credentials_key(credentials), client_info.user_agent)
+  cached = _bigquery_storage_clients.get(key)
+  if cached is not None:
+    refresh_cached_credentials(cached[0], credentials)
+    return cached[1]
+
+  storage_client = bigquery_storage.BigQueryReadClient(
+      credentials=credentials, client_info=client_info
+  )
+  _bigquery_storage_clients.put(key, (credentials, storage_client))
+  return storage_client
+
+
+def clear_client_cache() -> None:
+  """Drops all cached clients, e.g. after credentials were revoked."""
+  _bigquery_clients.clear()
+  _bigquery_storage_clients.clear()
@@ -15,14 +15,17 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Any
 from typing import Optional
 
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import field_validator
+from pydantic import PrivateAttr
 
 from ...features import experimental
 from ...features import FeatureName
+from .._query_result_cache import QueryResultCache
 
 
 class WriteMode(Enum):
@@ -76,6 +79,35 @@ class BigQueryToolConfig(BaseModel):
   By default, the query result will be limited to 50 rows.
   """
 
+  max_query_result_bytes: Optional[int] = None
+  """Maximum size of the rows returned from a query, in bytes of JSON.
+
+  If set, query results are fetched in Arrow format, through the BigQuery
+  Storage API for large results, and rows are returned until this budget is
+  reached. This keeps wide rows from flooding the agent context, while narrow
+  rows are not cut short. `max_query_result_rows` still applies. By default,
+  only the row limit applies.
+  """
+
+  query_result_cache_ttl_seconds: Optional[float] = None
+  """How long the results of read-only queries are cached, in seconds.
+
+  If set, `execute_sql` returns the cached result of a query it ran before with
+  the same project and credentials, instead of running it again. The cache is
+  shared by the tools using this config. Queries run in write modes are never
+  cached, and invalidate the results cached for their project. By default,
+  results are not cached.
+  """
+
+  query_result_cache_max_bytes: int = 16 * 1024 * 1024
+  """Maximum size of the query result cache, in bytes of JSON.
+
+  The least recently used results are evicted beyond this size. By default,
+  the cache holds up to 16 MiB of results.
+  """
+
+  _query_result_cache: Optional[QueryResultCache] = PrivateAttr(default=None)
+
   application_name: Optional[str] = None
   """Name of the application using the BigQuery tools.
 
@@ -125,6 +157,24 @@ class BigQueryToolConfig(BaseModel):
       )
     return v
 
+  @field_validator('max_query_result_bytes')
+  @classmethod
+  def validate_max_query_result_bytes(cls, v):
+    """Validate the maximum query result bytes."""
+    if v is not None and v <= 0:
+      raise ValueError('max_query_result_bytes must be positive.')
+    return v
+
+  @field_validator(
+      'query_result_cache_ttl_seconds', 'query_result_cache_max_bytes'
+  )
+  @classmethod
+  def validate_query_result_cache(cls, v, info):
+    """Validate the query result cache settings."""
+    if v is not None and v <= 0:
+      raise ValueError(f'{info.field_name} must be positive.')
+    return v
+
   @field_validator('application_name')
   @classmethod
   def validate_application_name(cls, v):
@@ -142,3 +192,10 @@ class BigQueryToolConfig(BaseModel):
         if not key:
           raise ValueError('Label keys cannot be empty.')
     return v
+
+  def model_post_init(self, context: Any, /) -> None:
+    if self.query_result_cache_ttl_seconds is not None:
+      self._query_result_cache = QueryResultCache(
+          ttl_seconds=self.query_result_cache_ttl_seconds,
+          max_bytes=self.query_result_cache_max_bytes,
+      )
@@ -14,17 +14,24 @@
 
 from __future__ import annotations
 
+import contextlib
 import functools
 import json
 import types
+from typing import Any
 from typing import Callable
+from typing import Iterable
 from typing import Optional
 import uuid
 
 from google.auth.credentials import Credentials
 from google.cloud import bigquery
+from google.cloud import bigquery_storage
 
 from . import client
+from .._google_credentials import get_credentials_key
+from .._query_result_cache import invalidate_query_results
+from .._query_result_cache import QueryResultCache
 from ..tool_context import ToolContext
 from .config import BigQueryToolConfig
 from .config import WriteMode
@@ -64,6 +71,23 @@ def _execute_sql(
         user_agent=[settings.application_name, caller_id],
     )
 
+    # Only read-only queries are cached, as the results of queries in a
+    # BigQuery session may depend on its temporary tables.
+    query_result_cache = settings._query_result_cache
+    cache_key = None
+    if (
+        query_result_cache is not None
+        and settings.write_mode == WriteMode.BLOCKED
+        and not dry_run
+    ):
+      cache_key = QueryResultCache.make_key(
+          project_id, get_credentials_key(credentials), query
+      )
+      cached_result = query_result_cache.get(cache_key)
+      if cached_result is not None:
+        cached_result["query_result_cache"] = query_result_cache.stats(hit=True)
+        return cached_result
+
     # BigQuery connection properties where applicable
     bq_connection_properties = []
 
@@ -163,30 +187,42 @@ def _execute_sql(
     )
     if settings.maximum_bytes_billed:
       job_config.maximum_bytes_billed = settings.maximum_bytes_billed
-    row_iterator = bq_client.query_and_wait(
-        query,
-        job_config=job_config,
-        project=project_id,
-        max_results=settings.max_query_result_rows,
-    )
-    rows = []
-    for row in row_iterator:
-      row_values = {}
-      for key, val in row.items():
-        try:
-          # if the json serialization of the value succeeds, use it as is
-          json.dumps(val)
-        except (TypeError, ValueError, OverflowError):
-          val = str(val)
-        row_values[key] = val
-      rows.append(row_values)
-
-    result = {"status": "SUCCESS", "rows": rows}
-    if (
-        settings.max_query_result_rows is not None
-        and len(rows) == settings.max_query_result_rows
-    ):
-      result["result_is_likely_truncated"] = True
+    if settings.max_query_result_bytes is not None:
+      # The budget is enforced while streaming, so the row limit is not sent
+      # to BigQuery, which would rule out the Storage API.
+      row_iterator = bq_client.query_and_wait(
+          query, job_config=job_config, project=project_id
+      )
+      result = _fetch_rows_within_budget(
+          row_iterator,
+          client.get_bigquery_storage_client(
+              credentials=credentials,
+              user_agent=[settings.application_name, caller_id],
+          ),
+          settings,
+      )
+    else:
+      row_iterator = bq_client.query_and_wait(
+          query,
+          job_config=job_config,
+          project=project_id,
+          max_results=settings.max_query_result_rows,
+      )
+      rows = [_to_json_safe_row(row.items()) for row in row_iterator]
+
+      result = {"status": "SUCCESS", "rows": rows}
+      if (
+          settings.max_query_result_rows is not None
+          and len(rows) == settings.max_query_result_rows
+      ):
+        result["result_is_likely_truncated"] = True
+
+    if settings.write_mode == WriteMode.ALLOWED:
+      # The query may have changed tables that cached results were read from.
+      invalidate_query_results()
+    elif cache_key is not None:
+      query_result_cache.put(cache_key, result)
+      result["query_result_cache"] = query_result_cache.stats(hit=False)
     return result
   except Exception as ex:  # pylint: disable=broad-except
     return {
@@ -195,6 +231,56 @@ def _execute_sql(
     }
 
 
+def _to_json_safe_row(items: Iterable[tuple[str, Any]]) -> dict[str, Any]:
+  row_values = {}
+  for key, val in items:
+    try:
+      # if the json serialization of the value succeeds, use it as is
+      json.dumps(val)
+    except (TypeError, ValueError, OverflowError):
+      val = str(val)
+    row_values[key] = val
+  return row_values
+
+
+def _fetch_rows_within_budget(
+    row_iterator: bigquery.table.RowIterator,
+    storage_client: bigquery_storage.BigQueryReadClient,
+    settings: BigQueryToolConfig,
+) -> dict:
+  """Streams query results as Arrow record batches within the byte budget.
+
+  Batches are only downloaded until the budget or the row limit is reached.
+  """
+  rows = []
+  # Account for the enclosing brackets of the JSON list.
+  result_bytes = 2
+  truncated = False
+  with contextlib.closing(
+      row_iterator.to_arrow_iterable(bqstorage_client=storage_client)
+  ) as record_batches:
+    for record_batch in record_batches:
+      for row in record_batch.to_pylist():
+        row_values = _to_json_safe_row(row.items())
+        # Each row adds its JSON and a separating comma.
+        row_bytes = len(json.dumps(row_values).encode()) + 1
+        if (
+            len(rows) >= settings.max_query_result_rows
+            or result_bytes + row_bytes > settings.max_query_result_bytes
+        ):
+          truncated = True
+          break
+        rows.append(row_values)
+        result_bytes += row_bytes
+      if truncated:
+        break
+
+  result = {"status": "SUCCESS", "rows": rows}
+  if truncated:
+    result["result_is_likely_truncated"] = True
+  return result
+
+
 def execute_sql(
     project_id: str,
     query: str,
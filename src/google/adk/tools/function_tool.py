@@ -31,6 +31,7 @@ from ..utils.context_utils import Aclosing
 from ._automatic_function_calling_util import build_function_declaration
 from .base_tool import BaseTool
 from .tool_context import ToolContext
+from .tool_memoization import ToolMemoizationConfig
 
 logger = logging.getLogger('google_adk.' + __name__)
 
@@ -47,6 +48,7 @@ class FunctionTool(BaseTool):
       func: Callable[..., Any],
       *,
       require_confirmation: Union[bool, Callable[..., bool]] = False,
+      memoization: Optional[ToolMemoizationConfig] = None,
   ):
     """Initializes the FunctionTool. Extracts metadata from a callable object.
 
@@ -56,6 +58,8 @@ class FunctionTool(BaseTool):
         a callable that takes the function's arguments and returns a boolean. If
         the callable returns True, the tool will require confirmation from the
         user.
+      memoization: The memoization policy, for functions whose results only
+        depend on their arguments.
     """
     name = ''
     doc = ''
@@ -78,7 +82,7 @@ class FunctionTool(BaseTool):
       # For callable objects, try to get docstring from __call__ method
       doc = inspect.cleandoc(func.__call__.__doc__)
 
-    super().__init__(name=name, description=doc)
+    super().__init__(name=name, description=doc, memoization=memoization)
     self.func = func
     self._ignore_params = ['tool_context', 'input_stream']
     self._require_confirmation = require_confirmation
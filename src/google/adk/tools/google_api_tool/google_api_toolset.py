@@ -14,6 +14,10 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -27,9 +31,60 @@ from ...auth.auth_schemes import OpenIdConnectWithConfig
 from ...tools.base_toolset import BaseToolset
 from ...tools.base_toolset import ToolPredicate
 from ..openapi_tool import OpenAPIToolset
+from ..openapi_tool.openapi_spec_parser.tool_bundle import compile_tool_bundle
+from ..openapi_tool.openapi_spec_parser.tool_bundle import get_default_bundle_dir
+from ..openapi_tool.openapi_spec_parser.tool_bundle import load_tool_bundle
+from ..openapi_tool.openapi_spec_parser.tool_bundle import save_tool_bundle
+from ..openapi_tool.openapi_spec_parser.tool_bundle import ToolBundle
 from .google_api_tool import GoogleApiTool
 from .googleapi_to_openapi_converter import GoogleApiToOpenApiConverter
 
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+def google_api_bundle_key(
+    api_name: str, api_version: str, discovery_doc: Dict[str, Any]
+) -> str:
+  """Returns the tool bundle key of a Google API.
+
+  The key includes the hash of the discovery document, so a bundle is not used
+  after the API changes.
+  """
+  canonical_doc = json.dumps(discovery_doc, sort_keys=True, default=str)
+  doc_hash = hashlib.sha256(canonical_doc.encode()).hexdigest()
+  return f'googleapi-{api_name}-{api_version}-{doc_hash}'
+
+
+def _get_default_scope(spec_dict: Dict[str, Any]) -> str:
+  return list(
+      spec_dict['components']['securitySchemes']['oauth2']['flows'][
+          'authorizationCode'
+      ]['scopes'].keys()
+  )[0]
+
+
+def compile_google_api_tool_bundle(
+    api_name: str, api_version: str
+) -> ToolBundle:
+  """Fetches the discovery document of a Google API into a tool bundle."""
+  return _compile_tool_bundle(
+      GoogleApiToOpenApiConverter(api_name, api_version), api_name, api_version
+  )
+
+
+def _compile_tool_bundle(
+    converter: GoogleApiToOpenApiConverter, api_name: str, api_version: str
+) -> ToolBundle:
+  key = google_api_bundle_key(
+      api_name, api_version, converter.get_google_api_spec()
+  )
+  spec_dict = converter.convert()
+  return compile_tool_bundle(
+      spec_dict,
+      key=key,
+      metadata={'scope': _get_default_scope(spec_dict)},
+  )
+
 
 class GoogleApiToolset(BaseToolset):
   """Google API Toolset contains tools for interacting with Google APIs.
@@ -48,6 +103,10 @@ class GoogleApiToolset(BaseToolset):
     tool_name_prefix: Optional prefix to add to all tool names in this toolset.
     additional_headers: Optional dict of HTTP headers to inject into every request
       executed by this toolset.
+    bundle_dir: Optional directory of precompiled tool bundles, e.g. written by
+      `adk compile_tools`. If it has a bundle of the current discovery document
+      of the API, the document is not converted at startup. A missing bundle is compiled and
+      saved to it. Defaults to the `ADK_TOOL_BUNDLE_DIR` environment variable.
   """
 
   def __init__(
@@ -61,6 +120,7 @@ class GoogleApiToolset(BaseToolset):
       tool_name_prefix: Optional[str] = None,
       *,
       additional_headers: Optional[Dict[str, str]] = None,
+      bundle_dir: Optional[str] = None,
   ):
     super().__init__(tool_filter=tool_filter, tool_name_prefix=tool_name_prefix)
     self.api_name = api_name
@@ -69,6 +129,7 @@ class GoogleApiToolset(BaseToolset):
     self._client_secret = client_secret
     self._service_account = service_account
     self._additional_headers = additional_headers
+    self._bundle_dir = bundle_dir or get_default_bundle_dir()
     self._openapi_toolset = self._load_toolset_with_oidc_auth()
 
   @override
@@ -90,19 +151,44 @@ class GoogleApiToolset(BaseToolset):
 
   def set_tool_filter(self, tool_filter: Union[ToolPredicate, List[str]]):
     self.tool_filter = tool_filter
+    self._openapi_toolset.tool_filter = self._get_name_filter()
+
+  def _get_name_filter(self) -> Optional[List[str]]:
+    # Forwarding name filters lets the OpenAPI toolset skip creating the tools
+    # that are not selected.
+    return self.tool_filter if isinstance(self.tool_filter, list) else None
+
+  def _load_tool_bundle(
+      self, converter: GoogleApiToOpenApiConverter
+  ) -> Optional[ToolBundle]:
+    if not self._bundle_dir:
+      return None
+    key = google_api_bundle_key(
+        self.api_name, self.api_version, converter.get_google_api_spec()
+    )
+    tool_bundle = load_tool_bundle(self._bundle_dir, key)
+    if tool_bundle is None:
+      tool_bundle = _compile_tool_bundle(
+          converter, self.api_name, self.api_version
+      )
+      path = save_tool_bundle(tool_bundle, self._bundle_dir)
+      logger.info('Saved tool bundle: %s', path)
+    return tool_bundle
 
   def _load_toolset_with_oidc_auth(self) -> OpenAPIToolset:
-    spec_dict = GoogleApiToOpenApiConverter(
-        self.api_name, self.api_version
-    ).convert()
-    scope = list(
-        spec_dict['components']['securitySchemes']['oauth2']['flows'][
-            'authorizationCode'
-        ]['scopes'].keys()
-    )[0]
+    converter = GoogleApiToOpenApiConverter(self.api_name, self.api_version)
+    tool_bundle = self._load_tool_bundle(converter)
+    if tool_bundle is not None:
+      spec_dict = None
+      scope = tool_bundle.metadata['scope']
+    else:
+      spec_dict = converter.convert()
+      scope = _get_default_scope(spec_dict)
     return OpenAPIToolset(
         spec_dict=spec_dict,
         spec_str_type='yaml',
+        tool_filter=self._get_name_filter(),
+        tool_bundle=tool_bundle,
         auth_scheme=OpenIdConnectWithConfig(
             authorization_endpoint=(
                 'https://accounts.google.com/o/oauth2/v2/auth'
@@ -76,6 +76,12 @@ class GoogleApiToOpenApiConverter:
       logger.error("Error fetching API spec: %s", e)
       raise
 
+  def get_google_api_spec(self) -> Dict[str, Any]:
+    """Returns the discovery document of the API, fetching it if needed."""
+    if not self._google_api_spec:
+      self.fetch_google_api_spec()
+    return self._google_api_spec
+
   def convert(self) -> Dict[str, Any]:
     """Convert the Google API spec to OpenAPI v3 format.
 
@@ -21,10 +21,7 @@ from google.genai import types
 from typing_extensions import override
 
 from ..agents.llm_agent import LlmAgent
-from ..memory.in_memory_memory_service import InMemoryMemoryService
 from ..models.base_llm import BaseLlm
-from ..utils.context_utils import Aclosing
-from ._forwarding_artifact_service import ForwardingArtifactService
 from .agent_tool import AgentTool
 from .google_search_tool import google_search
 from .tool_context import ToolContext
@@ -69,8 +66,6 @@ class GoogleSearchAgentTool(AgentTool):
       tool_context: ToolContext,
   ) -> Any:
     from ..agents.llm_agent import LlmAgent
-    from ..runners import Runner
-    from ..sessions.in_memory_session_service import InMemorySessionService
 
     if isinstance(self.agent, LlmAgent) and self.agent.input_schema:
       input_value = self.agent.input_schema.model_validate(args)
@@ -87,42 +82,17 @@ class GoogleSearchAgentTool(AgentTool):
           role='user',
           parts=[types.Part.from_text(text=args['request'])],
       )
-    runner = Runner(
+    runner = self._get_runner(
+        tool_context,
         app_name=self.agent.name,
-        agent=self.agent,
-        artifact_service=ForwardingArtifactService(tool_context),
-        session_service=InMemorySessionService(),
-        memory_service=InMemoryMemoryService(),
-        credential_service=tool_context._invocation_context.credential_service,
         plugins=list(tool_context._invocation_context.plugin_manager.plugins),
     )
-
-    state_dict = {
-        k: v
-        for k, v in tool_context.state.to_dict().items()
-        if not k.startswith('_adk')  # Filter out adk internal states
-    }
-    session = await runner.session_service.create_session(
-        app_name=self.agent.name,
-        user_id=tool_context._invocation_context.user_id,
-        state=state_dict,
+    last_event = await self._run_agent(runner, tool_context, content)
+    last_content = last_event.content if last_event else None
+    last_grounding_metadata = (
+        last_event.grounding_metadata if last_event else None
     )
 
-    last_content = None
-    last_grounding_metadata = None
-    async with Aclosing(
-        runner.run_async(
-            user_id=session.user_id, session_id=session.id, new_message=content
-        )
-    ) as agen:
-      async for event in agen:
-        # Forward state delta to parent session.
-        if event.actions.state_delta:
-          tool_context.state.update(event.actions.state_delta)
-        if event.content:
-          last_content = event.content
-          last_grounding_metadata = event.grounding_metadata
-
     if last_content is None or last_content.parts is None:
       return ''
     merged_text = '\n'.join(p.text for p in last_content.parts if p.text)
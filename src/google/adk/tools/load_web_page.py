@@ -16,8 +16,98 @@ from __future__ import annotations
 
 """Tool for web browse."""
 
+import asyncio
+import threading
+from typing import NamedTuple
+from typing import Optional
+import weakref
+
+import httpx
 import requests
 
+from ..utils._event_loop_utils import call_on_loop_shutdown
+from ..utils._lru_cache import LruCache
+
+_TIMEOUT_SECONDS = 10.0
+# Pages are only downloaded up to this size, the rest is not read.
+_MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+_MAX_CACHED_PAGES = 128
+_MAX_CONCURRENT_FETCHES = 8
+
+
+class _CachedPage(NamedTuple):
+  etag: Optional[str]
+  last_modified: Optional[str]
+  text: str
+
+
+# Pages are revalidated with their ETag or Last-Modified validators, so only
+# pages that have one are cached.
+_page_cache: LruCache[str, _CachedPage] = LruCache(_MAX_CACHED_PAGES)
+
+# Connections are bound to the event loop they were opened on, so there is one
+# client per event loop, closed when the loop shuts down.
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+
+def _extract_text(content: bytes) -> str:
+  from bs4 import BeautifulSoup
+
+  soup = BeautifulSoup(content, 'lxml')
+  text = soup.get_text(separator='\n', strip=True)
+  # Split the text into lines, filtering out very short lines
+  # (e.g., single words or short subtitles)
+  return '\n'.join(line for line in text.splitlines() if len(line.split()) > 3)
+
+
+def _failed(url: str) -> str:
+  return f'Failed to fetch url: {url}'
+
+
+def _get_conditional_headers(cached: Optional[_CachedPage]) -> dict[str, str]:
+  headers = {}
+  if cached is not None:
+    if cached.etag:
+      headers['If-None-Match'] = cached.etag
+    if cached.last_modified:
+      headers['If-Modified-Since'] = cached.last_modified
+  return headers
+
+
+def _cache_page(url: str, headers, text: str) -> None:
+  etag = headers.get('ETag')
+  last_modified = headers.get('Last-Modified')
+  if etag or last_modified:
+    _page_cache.put(url, _CachedPage(etag, last_modified, text))
+  else:
+    _page_cache.pop(url)
+
+
+def _get_async_client() -> httpx.AsyncClient:
+  """Returns the client shared by the fetches on the running event loop."""
+  loop = asyncio.get_running_loop()
+  with _async_clients_lock:
+    client = _async_clients.get(loop)
+    if client is None:
+      client = httpx.AsyncClient(
+          timeout=_TIMEOUT_SECONDS, follow_redirects=False
+      )
+      _async_clients[loop] = client
+      call_on_loop_shutdown(lambda: _close_async_client(loop, client))
+    return client
+
+
+async def _close_async_client(
+    loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+) -> None:
+  with _async_clients_lock:
+    if _async_clients.get(loop) is client:
+      del _async_clients[loop]
+  await client.aclose()
+
 
 def load_web_page(url: str) -> str:
   """Fetches the content in the url and returns the text in it.
@@ -28,17 +118,83 @@ def load_web_page(url: str) -> str:
   Returns:
       str: The text content of the url.
   """
-  from bs4 import BeautifulSoup
+  cached = _page_cache.get(url)
+  try:
+    # Set allow_redirects=False to prevent SSRF attacks via redirection.
+    with requests.get(
+        url,
+        allow_redirects=False,
+        headers=_get_conditional_headers(cached),
+        stream=True,
+        timeout=_TIMEOUT_SECONDS,
+    ) as response:
+      if response.status_code == 304 and cached is not None:
+        return cached.text
+      if response.status_code != 200:
+        return _failed(url)
+      content = bytearray()
+      for chunk in response.iter_content(chunk_size=64 * 1024):
+        content += chunk
+        if len(content) >= _MAX_RESPONSE_BYTES:
+          break
+  except requests.RequestException:
+    return _failed(url)
 
-  # Set allow_redirects=False to prevent SSRF attacks via redirection.
-  response = requests.get(url, allow_redirects=False)
+  text = _extract_text(bytes(content[:_MAX_RESPONSE_BYTES]))
+  _cache_page(url, response.headers, text)
+  return text
 
-  if response.status_code == 200:
-    soup = BeautifulSoup(response.content, 'lxml')
-    text = soup.get_text(separator='\n', strip=True)
-  else:
-    text = f'Failed to fetch url: {url}'
 
-  # Split the text into lines, filtering out very short lines
-  # (e.g., single words or short subtitles)
-  return '\n'.join(line for line in text.splitlines() if len(line.split()) > 3)
+async def load_web_page_async(url: str) -> str:
+  """Fetches the content in the url and returns the text in it.
+
+  Args:
+      url (str): The url to browse.
+
+  Returns:
+      str: The text content of the url.
+  """
+  cached = _page_cache.get(url)
+  try:
+    # Redirects are not followed, to prevent SSRF attacks via redirection.
+    async with _get_async_client().stream(
+        'GET', url, headers=_get_conditional_headers(cached)
+    ) as response:
+      if response.status_code == 304 and cached is not None:
+        return cached.text
+      if response.status_code != 200:
+        return _failed(url)
+      content = bytearray()
+      async for chunk in response.aiter_bytes():
+        content += chunk
+        if len(content) >= _MAX_RESPONSE_BYTES:
+          break
+  except httpx.HTTPError:
+    return _failed(url)
+
+  # Parsing is CPU bound, so it is kept off the event loop.
+  text = await asyncio.to_thread(
+      _extract_text, bytes(content[:_MAX_RESPONSE_BYTES])
+  )
+  _cache_page(url, response.headers, text)
+  return text
+
+
+async def load_web_pages(urls: list[str]) -> dict[str, str]:
+  """Fetches the content in several urls concurrently and returns their text.
+
+  Args:
+      urls (list[str]): The urls to browse.
+
+  Returns:
+      dict[str, str]: The text content of each url, keyed by url.
+  """
+  semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+
+  async def _load(url: str) -> str:
+    async with semaphore:
+      return await load_web_page_async(url)
+
+  unique_urls = list(dict.fromkeys(urls))
+  texts = await asyncio.gather(*(_load(url) for url in unique_urls))
+  return dict(zip(unique_urls, texts))
@@ -20,6 +20,8 @@ try:
   from .mcp_session_manager import SseConnectionParams
   from .mcp_session_manager import StdioConnectionParams
   from .mcp_session_manager import StreamableHTTPConnectionParams
+  from .mcp_session_pool import McpSessionPool
+  from .mcp_session_pool import McpSessionPoolOptions
   from .mcp_tool import MCPTool
   from .mcp_tool import McpTool
   from .mcp_toolset import MCPToolset
@@ -28,6 +30,8 @@ try:
   __all__.extend([
       'adk_to_mcp_tool_type',
       'gemini_to_json_schema',
+      'McpSessionPool',
+      'McpSessionPoolOptions',
       'McpTool',
       'MCPTool',
       'McpToolset',
@@ -25,6 +25,7 @@ import logging
 import sys
 import threading
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Optional
 from typing import Protocol
@@ -34,6 +35,7 @@ from typing import Union
 
 from mcp import ClientSession
 from mcp import StdioServerParameters
+from mcp import types as mcp_types
 from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import create_mcp_http_client
@@ -231,6 +233,37 @@ class MCPSessionManager:
     self._session_lock_map: dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
     self._lock_map_lock = threading.Lock()
 
+    # Callbacks notified when a server reports that its tool list changed.
+    self._tools_list_changed_listeners: list[
+        Callable[[ClientSession], None]
+    ] = []
+
+  def add_tools_list_changed_listener(
+      self, listener: Callable[[ClientSession], None]
+  ) -> None:
+    """Registers a callback for `notifications/tools/list_changed`.
+
+    Args:
+        listener: Called with the session whose server sent the notification.
+    """
+    self._tools_list_changed_listeners.append(listener)
+
+  async def _handle_session_message(self, session_key: str, message: Any):
+    """Dispatches server notifications received by a pooled session."""
+    if not isinstance(message, mcp_types.ServerNotification) or not isinstance(
+        message.root, mcp_types.ToolListChangedNotification
+    ):
+      return
+    session_entry = self._sessions.get(session_key)
+    if not session_entry:
+      return
+    logger.debug('Tool list changed for session: %s', session_key)
+    for listener in self._tools_list_changed_listeners:
+      try:
+        listener(session_entry[0])
+      except Exception as e:
+        logger.warning('Error in tools list changed listener: %s', e)
+
   @property
   def _session_lock(self) -> asyncio.Lock:
     """Returns an asyncio.Lock bound to the current event loop."""
@@ -475,6 +508,9 @@ class MCPSessionManager:
                     timeout=timeout_in_seconds,
                     sse_read_timeout=sse_read_timeout_in_seconds,
                     is_stdio=is_stdio,
+                    message_handler=functools.partial(
+                        self._handle_session_message, session_key
+                    ),
                 )
             ),
             timeout=timeout_in_seconds,
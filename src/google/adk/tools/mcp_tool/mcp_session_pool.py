@@ -0,0 +1,354 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A pool of MCP client sessions per server."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import functools
+import inspect
+import logging
+import sys
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import TextIO
+from typing import Union
+
+from mcp import ClientSession
+from mcp import StdioServerParameters
+from pydantic import BaseModel
+from pydantic import Field
+
+from ...utils.feature_decorator import experimental
+from .mcp_session_manager import MCPSessionManager
+from .mcp_session_manager import SseConnectionParams
+from .mcp_session_manager import StdioConnectionParams
+from .mcp_session_manager import StreamableHTTPConnectionParams
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+class McpSessionPoolOptions(BaseModel):
+  """Options for a pool of MCP sessions.
+
+  Attributes:
+      size: Maximum number of sessions opened per session key, i.e. per server
+        and set of headers. Sessions are opened on demand.
+      max_requests_per_session: Maximum number of concurrent requests sent over
+        one session. Further requests wait until a session has capacity. None
+        means no limit.
+      max_queued_requests: Maximum number of requests waiting for capacity per
+        session key. Requests beyond it fail with a ConnectionError. None means
+        no limit.
+      ping_interval: Seconds between liveness pings of open sessions. Sessions
+        that fail a ping are reconnected. None disables pings.
+      ping_timeout: Seconds to wait for a ping response.
+  """
+
+  size: int = Field(default=1, ge=1)
+  max_requests_per_session: Optional[int] = Field(default=None, ge=1)
+  max_queued_requests: Optional[int] = Field(default=None, ge=0)
+  ping_interval: Optional[float] = Field(default=30.0, gt=0)
+  ping_timeout: float = Field(default=5.0, gt=0)
+
+
+@dataclasses.dataclass
+class McpSessionPoolMetrics:
+  """Counters describing the activity of an `McpSessionPool`."""
+
+  requests: int = 0
+  """Number of requests dispatched to a pooled session."""
+
+  queued_requests: int = 0
+  """Number of requests that waited for a session to have capacity."""
+
+  rejected_requests: int = 0
+  """Number of requests rejected because the wait queue was full."""
+
+  ping_failures: int = 0
+  """Number of liveness pings that failed or timed out."""
+
+  reconnects: int = 0
+  """Number of sessions reopened after a failed ping."""
+
+
+class _Slot:
+  """One position in the pool, holding at most one session per session key."""
+
+  def __init__(self, manager: MCPSessionManager):
+    self.manager = manager
+    self.in_flight: collections.Counter[str] = collections.Counter()
+
+
+class _PooledClientSession:
+  """Stands in for a ClientSession and dispatches each request to the pool.
+
+  Every coroutine method of ClientSession, e.g. `call_tool` or `list_tools`,
+  runs on the least busy session of the pool for this session key.
+  """
+
+  def __init__(
+      self,
+      pool: McpSessionPool,
+      session_key: str,
+      headers: Optional[Dict[str, str]],
+  ):
+    self._pool = pool
+    self._session_key = session_key
+    self._headers = headers
+
+  def __getattr__(self, name: str) -> Any:
+    if not inspect.iscoroutinefunction(getattr(ClientSession, name, None)):
+      raise AttributeError(
+          f'{type(self).__name__} only supports the request methods of'
+          f' ClientSession, not {name!r}.'
+      )
+    return functools.partial(
+        self._pool._dispatch, self._session_key, self._headers, name
+    )
+
+
+@experimental
+class McpSessionPool(MCPSessionManager):
+  """Manages several MCP client sessions per server.
+
+  `MCPSessionManager` shares one session per session key among all
+  concurrent invocations. This pool keeps up to `options.size` sessions per
+  key and sends each request over the session with the fewest requests in
+  flight. It optionally bounds the number of concurrent requests per session
+  and the number of requests waiting for capacity. It also pings open
+  sessions in the background and reconnects those that stop responding.
+
+  `create_session` returns an object exposing the request methods of
+  ClientSession. Consecutive requests may be served by different sessions, so
+  the pool should only be used with servers whose requests do not depend on
+  per-session state.
+
+  Sample:
+  ```python
+  toolset = McpToolset(
+      connection_params=StdioConnectionParams(...),
+      session_pool_options=McpSessionPoolOptions(
+          size=4, max_requests_per_session=8
+      ),
+  )
+  ```
+  """
+
+  def __init__(
+      self,
+      connection_params: Union[
+          StdioServerParameters,
+          StdioConnectionParams,
+          SseConnectionParams,
+          StreamableHTTPConnectionParams,
+      ],
+      errlog: TextIO = sys.stderr,
+      options: Optional[McpSessionPoolOptions] = None,
+  ):
+    """Initializes the pool.
+
+    Args:
+        connection_params: Parameters for the MCP connection.
+        errlog: (Optional) TextIO stream for error logging. Use only for
+          initializing a local stdio MCP session.
+        options: Pool size, capacity and health check options.
+    """
+    super().__init__(connection_params=connection_params, errlog=errlog)
+    self.options = options or McpSessionPoolOptions()
+    self.metrics = McpSessionPoolMetrics()
+    self._slots = [
+        _Slot(MCPSessionManager(self._connection_params, errlog=errlog))
+        for _ in range(self.options.size)
+    ]
+    self._proxies: dict[str, _PooledClientSession] = {}
+    self._headers_by_key: dict[str, Optional[Dict[str, str]]] = {}
+    self._waiting: collections.Counter[str] = collections.Counter()
+    self._condition_map: dict[asyncio.AbstractEventLoop, asyncio.Condition] = {}
+    self._condition_map_lock = threading.Lock()
+    self._ping_task: Optional[asyncio.Task[None]] = None
+
+  @property
+  def _dispatch_condition(self) -> asyncio.Condition:
+    """Returns an asyncio.Condition bound to the current event loop."""
+    current_loop = asyncio.get_running_loop()
+    with self._condition_map_lock:
+      if current_loop not in self._condition_map:
+        self._condition_map[current_loop] = asyncio.Condition()
+      return self._condition_map[current_loop]
+
+  def in_flight(self, headers: Optional[Dict[str, str]] = None) -> list[int]:
+    """Returns the number of requests in flight on each session for headers."""
+    session_key = self._generate_session_key(self._merge_headers(headers))
+    return [slot.in_flight[session_key] for slot in self._slots]
+
+  def add_tools_list_changed_listener(
+      self, listener: Callable[[ClientSession], None]
+  ) -> None:
+    """Registers a callback for `notifications/tools/list_changed`.
+
+    Args:
+        listener: Called with the object returned by `create_session` for the
+          session key whose server sent the notification.
+    """
+    for slot in self._slots:
+      slot.manager.add_tools_list_changed_listener(
+          functools.partial(self._forward_tools_list_changed, slot, listener)
+      )
+
+  def _forward_tools_list_changed(
+      self,
+      slot: _Slot,
+      listener: Callable[[ClientSession], None],
+      session: ClientSession,
+  ) -> None:
+    for session_key, session_entry in slot.manager._sessions.items():
+      if session_entry[0] is session and session_key in self._proxies:
+        listener(self._proxies[session_key])
+        return
+
+  async def create_session(
+      self, headers: Optional[Dict[str, str]] = None
+  ) -> ClientSession:
+    """Returns a pooled session for the given headers.
+
+    The first session for the headers is connected eagerly, so connection
+    errors surface here as with `MCPSessionManager`.
+
+    Args:
+        headers: Optional headers to include in the session. These will be
+          merged with any existing connection headers. Only applicable for SSE
+          and StreamableHTTP connections.
+
+    Returns:
+        An object exposing the request methods of ClientSession.
+    """
+    session_key = self._generate_session_key(self._merge_headers(headers))
+    self._headers_by_key[session_key] = headers
+    self._start_pinging()
+    await self._slots[0].manager.create_session(headers)
+    if session_key not in self._proxies:
+      self._proxies[session_key] = _PooledClientSession(
+          self, session_key, headers
+      )
+    return self._proxies[session_key]
+
+  async def _dispatch(
+      self,
+      session_key: str,
+      headers: Optional[Dict[str, str]],
+      method_name: str,
+      *args: Any,
+      **kwargs: Any,
+  ) -> Any:
+    slot = await self._acquire(session_key)
+    try:
+      session = await slot.manager.create_session(headers)
+      return await getattr(session, method_name)(*args, **kwargs)
+    finally:
+      await self._release(slot, session_key)
+
+  def _least_busy(self, session_key: str) -> _Slot:
+    # Ties go to the earliest slot, so sessions are only opened under load.
+    return min(self._slots, key=lambda slot: slot.in_flight[session_key])
+
+  async def _acquire(self, session_key: str) -> _Slot:
+    capacity = self.options.max_requests_per_session
+    condition = self._dispatch_condition
+    async with condition:
+      slot = self._least_busy(session_key)
+      if capacity is not None and slot.in_flight[session_key] >= capacity:
+        max_queued = self.options.max_queued_requests
+        if max_queued is not None and self._waiting[session_key] >= max_queued:
+          self.metrics.rejected_requests += 1
+          raise ConnectionError(
+              'MCP session pool is at capacity and its wait queue is full.'
+          )
+        self.metrics.queued_requests += 1
+        self._waiting[session_key] += 1
+        try:
+          while slot.in_flight[session_key] >= capacity:
+            await condition.wait()
+            slot = self._least_busy(session_key)
+        finally:
+          self._waiting[session_key] -= 1
+      slot.in_flight[session_key] += 1
+      self.metrics.requests += 1
+      return slot
+
+  async def _release(self, slot: _Slot, session_key: str) -> None:
+    condition = self._dispatch_condition
+    async with condition:
+      slot.in_flight[session_key] -= 1
+      condition.notify()
+
+  def _start_pinging(self) -> None:
+    if self.options.ping_interval is None:
+      return
+    if self._ping_task and not self._ping_task.done():
+      return
+    self._ping_task = asyncio.create_task(self._ping_loop())
+
+  async def _ping_loop(self) -> None:
+    while True:
+      await asyncio.sleep(self.options.ping_interval)
+      await self.check_sessions()
+
+  async def check_sessions(self) -> None:
+    """Pings every open session and reconnects those that do not respond."""
+    current_loop = asyncio.get_running_loop()
+    for slot in self._slots:
+      for session_key, session_entry in list(slot.manager._sessions.items()):
+        session, exit_stack, stored_loop = session_entry
+        if stored_loop is not current_loop:
+          continue
+        try:
+          await asyncio.wait_for(
+              session.send_ping(), timeout=self.options.ping_timeout
+          )
+          continue
+        except Exception as e:  # pylint: disable=broad-exception-caught
+          self.metrics.ping_failures += 1
+          logger.warning('MCP session %s failed a ping: %s', session_key, e)
+        await slot.manager._cleanup_session(
+            session_key, exit_stack, stored_loop
+        )
+        try:
+          await slot.manager.create_session(
+              self._headers_by_key.get(session_key)
+          )
+          self.metrics.reconnects += 1
+        except Exception as e:  # pylint: disable=broad-exception-caught
+          logger.warning(
+              'Failed to reconnect MCP session %s: %s', session_key, e
+          )
+
+  async def close(self):
+    """Stops health checks and closes all pooled sessions."""
+    if self._ping_task:
+      self._ping_task.cancel()
+      try:
+        await self._ping_task
+      except (asyncio.CancelledError, Exception):  # pylint: disable=broad-exception-caught
+        pass
+      self._ping_task = None
+    for slot in self._slots:
+      await slot.manager.close()
+    self._proxies.clear()
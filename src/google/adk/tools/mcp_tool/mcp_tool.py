@@ -180,14 +180,33 @@ class McpTool(BaseAuthenticatedTool):
     self._require_confirmation = require_confirmation
     self._header_provider = header_provider
     self._progress_callback = progress_callback
+    self._declaration_cache: Optional[
+        tuple[tuple[str, str, bool], FunctionDeclaration]
+    ] = None
 
   @override
   def _get_declaration(self) -> FunctionDeclaration:
     """Gets the function declaration for the tool.
 
+    The declaration is derived from the MCP tool's JSON schema once and reused,
+    since toolsets may keep the same tool across many LLM steps.
+
     Returns:
         FunctionDeclaration: The Gemini function declaration for the tool.
     """
+    cache_key = (
+        self.name,
+        self.description,
+        is_feature_enabled(FeatureName.JSON_SCHEMA_FOR_FUNC_DECL),
+    )
+    if self._declaration_cache is None or self._declaration_cache[0] != (
+        cache_key
+    ):
+      self._declaration_cache = (cache_key, self._build_declaration())
+    # Callers such as tool name prefixing rename the returned declaration.
+    return self._declaration_cache[1].model_copy()
+
+  def _build_declaration(self) -> FunctionDeclaration:
     input_schema = self._mcp_tool.inputSchema
     output_schema = self._mcp_tool.outputSchema
     if is_feature_enabled(FeatureName.JSON_SCHEMA_FOR_FUNC_DECL):
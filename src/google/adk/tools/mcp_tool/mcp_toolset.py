@@ -16,8 +16,10 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import dataclasses
 import logging
 import sys
+import time
 from typing import Any
 from typing import Awaitable
 from typing import Callable
@@ -28,7 +30,9 @@ from typing import TextIO
 from typing import TypeVar
 from typing import Union
 import warnings
+import weakref
 
+from mcp import ClientSession
 from mcp import StdioServerParameters
 from mcp.shared.session import ProgressFnT
 from mcp.types import ListResourcesResult
@@ -52,6 +56,8 @@ from .mcp_session_manager import retry_on_errors
 from .mcp_session_manager import SseConnectionParams
 from .mcp_session_manager import StdioConnectionParams
 from .mcp_session_manager import StreamableHTTPConnectionParams
+from .mcp_session_pool import McpSessionPool
+from .mcp_session_pool import McpSessionPoolOptions
 from .mcp_tool import MCPTool
 from .mcp_tool import ProgressCallbackFactory
 
@@ -61,6 +67,14 @@ logger = logging.getLogger("google_adk." + __name__)
 T = TypeVar("T")
 
 
+@dataclasses.dataclass
+class _CachedToolList:
+  """The tools listed by one MCP session."""
+
+  tools: List[MCPTool]
+  expires_at: Optional[float]
+
+
 class McpToolset(BaseToolset):
   """Connects to a MCP Server, and retrieves MCP Tools into ADK Tools.
 
@@ -114,6 +128,9 @@ class McpToolset(BaseToolset):
           Union[ProgressFnT, ProgressCallbackFactory]
       ] = None,
       use_mcp_resources: Optional[bool] = False,
+      cache_tools: bool = True,
+      tools_cache_ttl: Optional[float] = None,
+      session_pool_options: Optional[McpSessionPoolOptions] = None,
   ):
     """Initializes the McpToolset.
 
@@ -150,6 +167,16 @@ class McpToolset(BaseToolset):
       use_mcp_resources: Whether the agent should have access to MCP resources.
         This will add a `load_mcp_resource` tool to the toolset and include
         available resources in the agent context. Defaults to False.
+      cache_tools: Whether to cache the tools listed by each MCP session, so
+        that `get_tools` does not call `list_tools` on every LLM step. A cached
+        listing is dropped when the server sends a
+        `notifications/tools/list_changed` notification, when the session is
+        reconnected, after `tools_cache_ttl`, or on `clear_tools_cache()`.
+      tools_cache_ttl: Optional number of seconds after which a cached tool
+        listing expires. None keeps it until it is invalidated otherwise.
+      session_pool_options: If set, requests are spread over a pool of MCP
+        sessions per server instead of sharing a single session. See
+        ``McpSessionPool``.
     """
 
     super().__init__(tool_filter=tool_filter, tool_name_prefix=tool_name_prefix)
@@ -163,10 +190,17 @@ class McpToolset(BaseToolset):
     self._progress_callback = progress_callback
 
     # Create the session manager that will handle the MCP connection
-    self._mcp_session_manager = MCPSessionManager(
-        connection_params=self._connection_params,
-        errlog=self._errlog,
-    )
+    if session_pool_options:
+      self._mcp_session_manager = McpSessionPool(
+          connection_params=self._connection_params,
+          errlog=self._errlog,
+          options=session_pool_options,
+      )
+    else:
+      self._mcp_session_manager = MCPSessionManager(
+          connection_params=self._connection_params,
+          errlog=self._errlog,
+      )
     self._auth_scheme = auth_scheme
     self._auth_credential = auth_credential
     self._require_confirmation = require_confirmation
@@ -182,6 +216,16 @@ class McpToolset(BaseToolset):
     )
     self._use_mcp_resources = use_mcp_resources
 
+    self._cache_tools = cache_tools
+    self._tools_cache_ttl = tools_cache_ttl
+    # Keyed by session, so a reconnected session always lists tools again.
+    self._tools_cache: weakref.WeakKeyDictionary[
+        ClientSession, _CachedToolList
+    ] = weakref.WeakKeyDictionary()
+    self._mcp_session_manager.add_tools_list_changed_listener(
+        self._on_tools_list_changed
+    )
+
   def _get_auth_headers(self) -> Optional[Dict[str, str]]:
     """Build authentication headers from exchanged credential.
 
@@ -300,30 +344,18 @@ class McpToolset(BaseToolset):
     Returns:
         List[BaseTool]: A list of tools available under the specified context.
     """
-    # Fetch available tools from the MCP server
-    tools_response: ListToolsResult = await self._execute_with_session(
-        lambda session: session.list_tools(),
+    mcp_tools: List[MCPTool] = await self._execute_with_session(
+        self._list_mcp_tools,
         "Failed to get tools from MCP server",
         readonly_context,
     )
 
     # Apply filtering based on context and tool_filter
-    tools = []
-    for tool in tools_response.tools:
-      mcp_tool = MCPTool(
-          mcp_tool=tool,
-          mcp_session_manager=self._mcp_session_manager,
-          auth_scheme=self._auth_scheme,
-          auth_credential=self._auth_credential,
-          require_confirmation=self._require_confirmation,
-          header_provider=self._header_provider,
-          progress_callback=self._progress_callback
-          if hasattr(self, "_progress_callback")
-          else None,
-      )
-
-      if self._is_tool_selected(mcp_tool, readonly_context):
-        tools.append(mcp_tool)
+    tools = [
+        mcp_tool
+        for mcp_tool in mcp_tools
+        if self._is_tool_selected(mcp_tool, readonly_context)
+    ]
 
     if self._use_mcp_resources:
       load_resource_tool = LoadMcpResourceTool(
@@ -333,6 +365,51 @@ class McpToolset(BaseToolset):
 
     return tools
 
+  async def _list_mcp_tools(self, session: ClientSession) -> List[MCPTool]:
+    """Returns the tools of a session, from the cache when possible."""
+    if self._cache_tools:
+      cached = self._tools_cache.get(session)
+      if cached and (
+          cached.expires_at is None or time.monotonic() < cached.expires_at
+      ):
+        return cached.tools
+
+    # Fetch available tools from the MCP server
+    tools_response: ListToolsResult = await session.list_tools()
+    mcp_tools = [
+        MCPTool(
+            mcp_tool=tool,
+            mcp_session_manager=self._mcp_session_manager,
+            auth_scheme=self._auth_scheme,
+            auth_credential=self._auth_credential,
+            require_confirmation=self._require_confirmation,
+            header_provider=self._header_provider,
+            progress_callback=self._progress_callback
+            if hasattr(self, "_progress_callback")
+            else None,
+        )
+        for tool in tools_response.tools
+    ]
+
+    if self._cache_tools:
+      self._tools_cache[session] = _CachedToolList(
+          tools=mcp_tools,
+          expires_at=time.monotonic() + self._tools_cache_ttl
+          if self._tools_cache_ttl is not None
+          else None,
+      )
+    return mcp_tools
+
+  def _on_tools_list_changed(self, session: ClientSession) -> None:
+    self._tools_cache.pop(session, None)
+
+  def clear_tools_cache(self) -> None:
+    """Drops all cached tool listings.
+
+    The next `get_tools` call lists the tools of the MCP server again.
+    """
+    self._tools_cache.clear()
+
   async def read_resource(
       self, name: str, readonly_context: Optional[ReadonlyContext] = None
   ) -> Any:
@@ -388,6 +465,7 @@ class McpToolset(BaseToolset):
     It's designed to be safe to call multiple times and handles cleanup errors
     gracefully to avoid blocking application shutdown.
     """
+    self.clear_tools_cache()
     try:
       await self._mcp_session_manager.close()
     except Exception as e:
@@ -430,6 +508,9 @@ class McpToolset(BaseToolset):
         auth_scheme=mcp_toolset_config.auth_scheme,
         auth_credential=mcp_toolset_config.auth_credential,
         use_mcp_resources=mcp_toolset_config.use_mcp_resources,
+        cache_tools=mcp_toolset_config.cache_tools,
+        tools_cache_ttl=mcp_toolset_config.tools_cache_ttl,
+        session_pool_options=mcp_toolset_config.session_pool_options,
     )
 
 
@@ -468,6 +549,12 @@ class McpToolsetConfig(BaseToolConfig):
 
   use_mcp_resources: bool = False
 
+  cache_tools: bool = True
+
+  tools_cache_ttl: Optional[float] = None
+
+  session_pool_options: Optional[McpSessionPoolOptions] = None
+
   @model_validator(mode="after")
   def _check_only_one_params_field(self):
     param_fields = [
@@ -22,6 +22,7 @@ from typing import AsyncContextManager
 from typing import Optional
 
 from mcp import ClientSession
+from mcp.client.session import MessageHandlerFnT
 
 logger = logging.getLogger('google_adk.' + __name__)
 
@@ -54,6 +55,7 @@ class SessionContext:
       timeout: Optional[float],
       sse_read_timeout: Optional[float],
       is_stdio: bool = False,
+      message_handler: Optional[MessageHandlerFnT] = None,
   ):
     """
     Args:
@@ -63,11 +65,14 @@ class SessionContext:
         sse_read_timeout: Timeout in seconds for reading data from the MCP SSE
             server.
         is_stdio: Whether this is a stdio connection (affects read timeout).
+        message_handler: Optional handler for server notifications and other
+            incoming messages, passed to the ClientSession.
     """
     self._client = client
     self._timeout = timeout
     self._sse_read_timeout = sse_read_timeout
     self._is_stdio = is_stdio
+    self._message_handler = message_handler
     self._session: Optional[ClientSession] = None
     self._ready_event = asyncio.Event()
     self._close_event = asyncio.Event()
@@ -165,6 +170,7 @@ class SessionContext:
                   read_timeout_seconds=timedelta(seconds=self._timeout)
                   if self._timeout is not None
                   else None,
+                  message_handler=self._message_handler,
               )
           )
         else:
@@ -176,6 +182,7 @@ class SessionContext:
                   read_timeout_seconds=timedelta(seconds=self._sse_read_timeout)
                   if self._sse_read_timeout is not None
                   else None,
+                  message_handler=self._message_handler,
               )
           )
         await asyncio.wait_for(session.initialize(), timeout=self._timeout)
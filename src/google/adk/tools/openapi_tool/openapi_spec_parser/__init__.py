@@ -21,6 +21,8 @@ from .rest_api_tool import AuthPreparationState
 from .rest_api_tool import RestApiTool
 from .rest_api_tool import snake_to_lower_camel
 from .tool_auth_handler import ToolAuthHandler
+from .tool_bundle import compile_tool_bundle
+from .tool_bundle import ToolBundle
 
 __all__ = [
     'OpenApiSpecParser',
@@ -32,4 +34,6 @@ __all__ = [
     'snake_to_lower_camel',
     'AuthPreparationState',
     'ToolAuthHandler',
+    'ToolBundle',
+    'compile_tool_bundle',
 ]
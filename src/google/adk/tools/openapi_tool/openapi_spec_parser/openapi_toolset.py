@@ -14,18 +14,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import http.cookiejar
 import json
 import logging
 import ssl
+import threading
 from typing import Any
 from typing import Callable
 from typing import Dict
-from typing import Final
 from typing import List
 from typing import Literal
 from typing import Optional
 from typing import Union
+import weakref
 
+import httpx
 from typing_extensions import override
 import yaml
 
@@ -33,13 +38,31 @@ from ....agents.readonly_context import ReadonlyContext
 from ....auth.auth_credential import AuthCredential
 from ....auth.auth_schemes import AuthScheme
 from ....auth.auth_tool import AuthConfig
+from ....utils._event_loop_utils import call_on_loop_shutdown
+from ....utils._event_loop_utils import close_on_loop
 from ...base_toolset import BaseToolset
 from ...base_toolset import ToolPredicate
 from .openapi_spec_parser import OpenApiSpecParser
+from .openapi_spec_parser import ParsedOperation
 from .rest_api_tool import RestApiTool
+from .tool_bundle import BundledOperation
+from .tool_bundle import compile_tool_bundle
+from .tool_bundle import get_default_bundle_dir
+from .tool_bundle import load_tool_bundle
+from .tool_bundle import openapi_spec_bundle_key
+from .tool_bundle import save_tool_bundle
+from .tool_bundle import ToolBundle
 
 logger = logging.getLogger("google_adk." + __name__)
 
+# Tools are typically called once per LLM step, which is often several seconds
+# apart, so idle connections are kept longer than httpx's 5 second default.
+_DEFAULT_HTTP_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
 
 class OpenAPIToolset(BaseToolset):
   """Class for parsing OpenAPI spec into a list of RestApiTool.
@@ -77,6 +100,11 @@ class OpenAPIToolset(BaseToolset):
       header_provider: Optional[
           Callable[[ReadonlyContext], Dict[str, str]]
       ] = None,
+      http_client: Optional[httpx.AsyncClient] = None,
+      http_client_limits: Optional[httpx.Limits] = None,
+      http2: bool = False,
+      tool_bundle: Optional[ToolBundle] = None,
+      bundle_dir: Optional[str] = None,
   ):
     """Initializes the OpenAPIToolset.
 
@@ -129,6 +157,23 @@ class OpenAPIToolset(BaseToolset):
         an argument, allowing dynamic header generation based on the current
         context. Useful for adding custom headers like correlation IDs,
         authentication tokens, or other request metadata.
+      http_client: Optional client shared by all tools for API calls. The
+        caller owns it and must close it; its own SSL verification settings
+        apply instead of `ssl_verify`. If not provided, the toolset creates a
+        client per event loop, closed when the loop shuts down or by
+        `close()`.
+      http_client_limits: Connection pool limits of the client created by the
+        toolset, e.g. the maximum number of connections and how long idle
+        connections are kept alive. Ignored if `http_client` is provided.
+      http2: Whether the client created by the toolset uses HTTP/2. Requires
+        the `h2` package. Ignored if `http_client` is provided.
+      tool_bundle: A precompiled bundle of the spec, see `compile_tool_bundle`.
+        If provided, the spec is not parsed and each tool is only created when
+        first used, e.g. when selected by a list `tool_filter`.
+      bundle_dir: Directory of precompiled bundles, keyed by the hash of the
+        spec. The bundle of the spec is loaded from it, or compiled and saved
+        to it if missing. Defaults to the `ADK_TOOL_BUNDLE_DIR` environment
+        variable. Ignored if `tool_bundle` is provided.
     """
     super().__init__(tool_filter=tool_filter, tool_name_prefix=tool_name_prefix)
     self._header_provider = header_provider
@@ -145,30 +190,67 @@ class OpenAPIToolset(BaseToolset):
         if auth_scheme
         else None
     )
-    if not spec_dict:
-      spec_dict = self._load_spec(spec_str, spec_str_type)
+    self._credential_key = credential_key
     self._ssl_verify = ssl_verify
-    self._tools: Final[List[RestApiTool]] = list(self._parse(spec_dict))
-    if auth_scheme or auth_credential:
-      self._configure_auth_all(auth_scheme, auth_credential)
-    if credential_key:
-      self._configure_credential_key_all(credential_key)
-
-  def _configure_auth_all(
-      self, auth_scheme: AuthScheme, auth_credential: AuthCredential
-  ):
-    """Configure auth scheme and credential for all tools."""
+    self._http_client_limits = http_client_limits or _DEFAULT_HTTP_CLIENT_LIMITS
+    self._http2 = http2
+    self._owns_http_client = http_client is None
+    self._http_client = http_client
+    # Owned clients are created on first use, since creating one validates the
+    # SSL configuration. Connections are bound to the event loop they were
+    # opened on, so there is one client per event loop, closed when the loop
+    # shuts down.
+    self._http_clients: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, httpx.AsyncClient
+    ] = weakref.WeakKeyDictionary()
+    self._retired_http_clients: List[
+        tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]
+    ] = []
+    self._http_clients_lock = threading.Lock()
+    if tool_bundle is None:
+      if not spec_dict:
+        spec_dict = self._load_spec(spec_str, spec_str_type)
+      bundle_dir = bundle_dir or get_default_bundle_dir()
+      if bundle_dir:
+        tool_bundle = self._load_or_compile_bundle(spec_dict, bundle_dir)
+    # Operations whose tools have not been created yet, by position.
+    self._pending_operations: Dict[int, BundledOperation] = {}
+    self._tool_slots: List[Optional[RestApiTool]]
+    if tool_bundle is not None:
+      self._pending_operations = dict(enumerate(tool_bundle.operations))
+      self._tool_slots = [None] * len(tool_bundle.operations)
+    else:
+      self._tool_slots = list(self._parse(spec_dict))
 
-    for tool in self._tools:
-      if auth_scheme:
-        tool.configure_auth_scheme(auth_scheme)
-      if auth_credential:
-        tool.configure_auth_credential(auth_credential)
+  @property
+  def _tools(self) -> List[RestApiTool]:
+    """All tools of the toolset, created on first access."""
+    return [self._get_tool_at(index) for index in range(len(self._tool_slots))]
+
+  def _get_tool_name_at(self, index: int) -> str:
+    if index in self._pending_operations:
+      return self._pending_operations[index].name
+    return self._tool_slots[index].name
+
+  def _get_tool_at(self, index: int) -> RestApiTool:
+    """Returns the tool at a position, creating it if needed."""
+    if index in self._pending_operations:
+      self._tool_slots[index] = self._create_tool(
+          self._pending_operations.pop(index).to_parsed_operation()
+      )
+    return self._tool_slots[index]
 
-  def _configure_credential_key_all(self, credential_key: str):
-    """Configure credential key for all tools."""
-    for tool in self._tools:
-      tool.configure_credential_key(credential_key)
+  @staticmethod
+  def _load_or_compile_bundle(
+      spec_dict: Dict[str, Any], bundle_dir: str
+  ) -> ToolBundle:
+    key = openapi_spec_bundle_key(spec_dict)
+    tool_bundle = load_tool_bundle(bundle_dir, key)
+    if tool_bundle is None:
+      tool_bundle = compile_tool_bundle(spec_dict, key=key)
+      path = save_tool_bundle(tool_bundle, bundle_dir)
+      logger.info("Saved tool bundle: %s", path)
+    return tool_bundle
 
   def configure_ssl_verify_all(
       self, ssl_verify: Optional[Union[bool, str, ssl.SSLContext]] = None
@@ -187,24 +269,71 @@ class OpenAPIToolset(BaseToolset):
           - ssl.SSLContext: Custom SSL context for advanced configuration
     """
     self._ssl_verify = ssl_verify
-    for tool in self._tools:
-      tool.configure_ssl_verify(ssl_verify)
+    for tool in self._tool_slots:
+      if tool is not None:
+        tool.configure_ssl_verify(ssl_verify)
+    with self._http_clients_lock:
+      # SSL verification is a client-level setting in httpx, so the next call
+      # creates a new client.
+      self._retired_http_clients.extend(self._http_clients.items())
+      self._http_clients.clear()
+
+  def _get_http_client(self) -> httpx.AsyncClient:
+    """Returns the client shared by the tools on the running event loop."""
+    if not self._owns_http_client:
+      return self._http_client
+    loop = asyncio.get_running_loop()
+    with self._http_clients_lock:
+      client = self._http_clients.get(loop)
+      if client is None:
+        client = httpx.AsyncClient(
+            verify=self._ssl_verify if self._ssl_verify is not None else True,
+            limits=self._http_client_limits,
+            http2=self._http2,
+            # Cookies set by one API response must not leak into other calls.
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+        )
+        self._http_clients[loop] = client
+        call_on_loop_shutdown(
+            functools.partial(self._close_http_client, loop, client)
+        )
+      return client
+
+  async def _close_http_client(
+      self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+  ) -> None:
+    with self._http_clients_lock:
+      if self._http_clients.get(loop) is client:
+        del self._http_clients[loop]
+    await client.aclose()
 
   @override
   async def get_tools(
       self, readonly_context: Optional[ReadonlyContext] = None
   ) -> List[RestApiTool]:
     """Get all tools in the toolset."""
+    indexes = range(len(self._tool_slots))
+    if isinstance(self.tool_filter, list):
+      # Only create the tools that can be selected.
+      indexes = [
+          index
+          for index in indexes
+          if self._get_tool_name_at(index) in self.tool_filter
+      ]
     return [
         tool
-        for tool in self._tools
+        for tool in map(self._get_tool_at, indexes)
         if self._is_tool_selected(tool, readonly_context)
     ]
 
   def get_tool(self, tool_name: str) -> Optional[RestApiTool]:
     """Get a tool by name."""
-    matching_tool = filter(lambda t: t.name == tool_name, self._tools)
-    return next(matching_tool, None)
+    for index in range(len(self._tool_slots)):
+      if self._get_tool_name_at(index) == tool_name:
+        return self._get_tool_at(index)
+    return None
 
   def _load_spec(
       self, spec_str: str, spec_type: Literal["json", "yaml"]
@@ -220,21 +349,34 @@ class OpenAPIToolset(BaseToolset):
   def _parse(self, openapi_spec_dict: Dict[str, Any]) -> List[RestApiTool]:
     """Parse OpenAPI spec into a list of RestApiTool."""
     operations = OpenApiSpecParser().parse(openapi_spec_dict)
+    return [self._create_tool(o) for o in operations]
 
-    tools = []
-    for o in operations:
-      tool = RestApiTool.from_parsed_operation(
-          o,
-          ssl_verify=self._ssl_verify,
-          header_provider=self._header_provider,
-      )
-      logger.info("Parsed tool: %s", tool.name)
-      tools.append(tool)
-    return tools
+  def _create_tool(self, parsed: ParsedOperation) -> RestApiTool:
+    """Creates a tool configured with the settings of this toolset."""
+    tool = RestApiTool.from_parsed_operation(
+        parsed,
+        ssl_verify=self._ssl_verify,
+        header_provider=self._header_provider,
+        http_client=self._get_http_client,
+    )
+    if self._auth_scheme:
+      tool.configure_auth_scheme(self._auth_scheme)
+    if self._auth_credential:
+      tool.configure_auth_credential(self._auth_credential)
+    if self._credential_key:
+      tool.configure_credential_key(self._credential_key)
+    logger.info("Parsed tool: %s", tool.name)
+    return tool
 
   @override
   async def close(self):
-    pass
+    """Closes the HTTP clients created by this toolset, if any."""
+    with self._http_clients_lock:
+      clients = self._retired_http_clients + list(self._http_clients.items())
+      self._retired_http_clients = []
+      self._http_clients.clear()
+    for loop, client in clients:
+      await close_on_loop(loop, client.aclose, "OpenAPI toolset HTTP client")
 
   @override
   def get_auth_config(self) -> Optional[AuthConfig]:
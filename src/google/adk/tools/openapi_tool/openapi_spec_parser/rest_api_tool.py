@@ -72,6 +72,9 @@ def snake_to_lower_camel(snake_case_string: str):
 
 AuthPreparationState = Literal["pending", "done"]
 
+HttpClientSource = Union[httpx.AsyncClient, Callable[[], httpx.AsyncClient]]
+"""A shared HTTP client, or a callable returning the client to use."""
+
 
 class RestApiTool(BaseTool):
   """A generic tool that interacts with a REST API.
@@ -102,6 +105,7 @@ class RestApiTool(BaseTool):
       ] = None,
       *,
       credential_key: Optional[str] = None,
+      http_client: Optional[HttpClientSource] = None,
   ):
     """Initializes the RestApiTool with the given parameters.
 
@@ -141,6 +145,11 @@ class RestApiTool(BaseTool):
           authentication tokens, or other request metadata.
         credential_key: Optional stable key used for interactive auth and
           credential caching.
+        http_client: Optional shared client used for API calls, so that
+          connections are kept alive across calls, or a callable returning it.
+          The client's own SSL verification settings apply instead of
+          `ssl_verify`. The caller owns the client and must close it. If not
+          provided, each call opens a new client.
     """
     # Gemini restrict the length of function name to be less than 64 characters
     self.name = name[:60]
@@ -166,6 +175,7 @@ class RestApiTool(BaseTool):
     self._default_headers: Dict[str, str] = {}
     self._ssl_verify = ssl_verify
     self._header_provider = header_provider
+    self._http_client = http_client
     self._logger = logger
     if should_parse_operation:
       self._operation_parser = OperationParser(self.operation)
@@ -178,6 +188,7 @@ class RestApiTool(BaseTool):
       header_provider: Optional[
           Callable[[ReadonlyContext], Dict[str, str]]
       ] = None,
+      http_client: Optional[HttpClientSource] = None,
   ) -> "RestApiTool":
     """Initializes the RestApiTool from a ParsedOperation object.
 
@@ -189,6 +200,8 @@ class RestApiTool(BaseTool):
           an argument, allowing dynamic header generation based on the current
           context. Useful for adding custom headers like correlation IDs,
           authentication tokens, or other request metadata.
+        http_client: Optional shared client used for API calls, or a callable
+          returning it.
 
     Returns:
         A RestApiTool object.
@@ -209,6 +222,7 @@ class RestApiTool(BaseTool):
         auth_credential=parsed.auth_credential,
         ssl_verify=ssl_verify,
         header_provider=header_provider,
+        http_client=http_client,
     )
     generated._operation_parser = operation_parser
     return generated
@@ -293,6 +307,18 @@ class RestApiTool(BaseTool):
     """
     self._ssl_verify = ssl_verify
 
+  def configure_http_client(
+      self, http_client: Optional[HttpClientSource] = None
+  ):
+    """Configures the shared client used for API calls.
+
+    Args:
+        http_client: The client to reuse across calls, a callable returning it,
+          or None to open a new client for each call. The caller owns the
+          client and must close it.
+    """
+    self._http_client = http_client
+
   def set_default_headers(self, headers: Dict[str, str]):
     """Sets default headers that are merged into every request."""
     self._default_headers = headers
@@ -500,7 +526,7 @@ class RestApiTool(BaseTool):
 
     # Got all parameters. Call the API.
     request_params = self._prepare_request_params(api_params, api_args)
-    if self._ssl_verify is not None:
+    if self._ssl_verify is not None and self._http_client is None:
       request_params["verify"] = self._ssl_verify
 
     # Add headers from header_provider if configured
@@ -509,7 +535,20 @@ class RestApiTool(BaseTool):
       if provider_headers:
         request_params.setdefault("headers", {}).update(provider_headers)
 
-    response = await _request(**request_params)
+    if self._http_client is not None:
+      http_client = (
+          self._http_client
+          if isinstance(self._http_client, httpx.AsyncClient)
+          else self._http_client()
+      )
+      # A shared client must not carry cookies over from other calls, so they
+      # are sent as a header rather than through the client's cookie jar.
+      cookies = request_params.pop("cookies", None)
+      if cookies:
+        _add_cookie_header(request_params.setdefault("headers", {}), cookies)
+      response = await http_client.request(**request_params)
+    else:
+      response = await _request(**request_params)
 
     # Log the API response
     self._logger.debug(
@@ -563,3 +602,17 @@ async def _request(**request_params) -> httpx.Response:
       verify=request_params.pop("verify", True)
   ) as client:
     return await client.request(**request_params)
+
+
+def _add_cookie_header(
+    headers: Dict[str, Any], cookies: Dict[str, Any]
+) -> None:
+  """Adds cookies to the Cookie header, keeping the cookies already set."""
+  cookie_header = "; ".join(
+      f"{name}={value}" for name, value in cookies.items()
+  )
+  for name, value in headers.items():
+    if name.lower() == "cookie":
+      headers[name] = f"{value}; {cookie_header}" if value else cookie_header
+      return
+  headers["Cookie"] = cookie_header
@@ -0,0 +1,161 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compiled tool bundles of OpenAPI specs, stored on disk."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import ValidationError
+
+from ....utils.feature_decorator import experimental
+from ..._gemini_schema_util import _to_snake_case
+from .openapi_spec_parser import OpenApiSpecParser
+from .openapi_spec_parser import ParsedOperation
+
+logger = logging.getLogger("google_adk." + __name__)
+
+TOOL_BUNDLE_DIR_ENV_VAR = "ADK_TOOL_BUNDLE_DIR"
+"""Environment variable with the default directory of compiled tool bundles."""
+
+_TOOL_BUNDLE_FORMAT_VERSION = 1
+
+
+class BundledOperation(BaseModel):
+  """An operation of a tool bundle, deserialized when its tool is created."""
+
+  name: str
+  """The name of the RestApiTool created from the operation."""
+
+  parsed_operation: Dict[str, Any]
+  """The serialized ParsedOperation, with all references resolved."""
+
+  def to_parsed_operation(self) -> ParsedOperation:
+    return ParsedOperation.model_validate(self.parsed_operation)
+
+
+@experimental
+class ToolBundle(BaseModel):
+  """The parsed operations of an OpenAPI spec, ready to be turned into tools.
+
+  Parsing a large spec resolves every reference and builds every operation,
+  which can take seconds. A bundle stores the result of this work, so that a
+  toolset created from it only deserializes the operations it uses.
+  """
+
+  format_version: int = _TOOL_BUNDLE_FORMAT_VERSION
+  key: str
+  """Identifies the source of the bundle, e.g. the hash of the spec."""
+
+  operations: List[BundledOperation] = Field(default_factory=list)
+  metadata: Dict[str, Any] = Field(default_factory=dict)
+  """Additional information about the source, e.g. its OAuth scopes."""
+
+
+def openapi_spec_bundle_key(spec_dict: Dict[str, Any]) -> str:
+  """Returns the bundle key of an OpenAPI spec, derived from its content."""
+  canonical_spec = json.dumps(spec_dict, sort_keys=True, default=str)
+  return "openapi-" + hashlib.sha256(canonical_spec.encode()).hexdigest()
+
+
+def compile_tool_bundle(
+    spec_dict: Dict[str, Any],
+    *,
+    key: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> ToolBundle:
+  """Parses an OpenAPI spec into a tool bundle.
+
+  Args:
+      spec_dict: The OpenAPI spec.
+      key: The key of the bundle. Defaults to the hash of the spec.
+      metadata: Additional information to store with the bundle.
+
+  Returns:
+      The compiled bundle.
+  """
+  operations = [
+      BundledOperation(
+          # Matches the name given by RestApiTool.from_parsed_operation.
+          name=_to_snake_case(parsed.name)[:60],
+          parsed_operation=parsed.model_dump(
+              mode="json", by_alias=True, exclude_none=True
+          ),
+      )
+      for parsed in OpenApiSpecParser().parse(spec_dict)
+  ]
+  return ToolBundle(
+      key=key or openapi_spec_bundle_key(spec_dict),
+      operations=operations,
+      metadata=metadata or {},
+  )
+
+
+def _bundle_path(bundle_dir: str, key: str) -> str:
+  return os.path.join(bundle_dir, re.sub(r"[^\w.-]", "_", key) + ".json")
+
+
+def save_tool_bundle(bundle: ToolBundle, bundle_dir: str) -> str:
+  """Writes a bundle to a directory and returns the path of the file."""
+  os.makedirs(bundle_dir, exist_ok=True)
+  path = _bundle_path(bundle_dir, bundle.key)
+  # Write to a temporary file first, so concurrent readers never see a
+  # partially written bundle.
+  fd, tmp_path = tempfile.mkstemp(dir=bundle_dir, suffix=".tmp")
+  try:
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+      f.write(bundle.model_dump_json())
+    os.replace(tmp_path, path)
+  except BaseException:
+    os.unlink(tmp_path)
+    raise
+  return path
+
+
+def load_tool_bundle(bundle_dir: str, key: str) -> Optional[ToolBundle]:
+  """Reads a bundle from a directory.
+
+  Returns:
+      The bundle, or None if there is no usable bundle for the key.
+  """
+  path = _bundle_path(bundle_dir, key)
+  try:
+    with open(path, "r", encoding="utf-8") as f:
+      bundle = ToolBundle.model_validate_json(f.read())
+  except FileNotFoundError:
+    return None
+  except (OSError, ValidationError) as e:
+    logger.warning("Ignoring unreadable tool bundle %s: %s", path, e)
+    return None
+  if bundle.format_version != _TOOL_BUNDLE_FORMAT_VERSION or bundle.key != key:
+    logger.info("Ignoring outdated tool bundle %s", path)
+    return None
+  return bundle
+
+
+def get_default_bundle_dir() -> Optional[str]:
+  """Returns the bundle directory set through the environment, if any."""
+  return os.environ.get(TOOL_BUNDLE_DIR_ENV_VAR) or None
@@ -14,20 +14,95 @@
 
 from __future__ import annotations
 
+import copy
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
 from google.auth.credentials import Credentials
 from google.cloud import spanner
+from google.cloud.spanner_v1.database import Database
 
 from ... import version
+from ...utils._lru_cache import LruCache
+from .._google_credentials import get_credentials_key
+from .._google_credentials import refresh_cached_credentials
 
 USER_AGENT = f"adk-spanner-tool google-adk/{version.__version__}"
 
+_MAX_CACHED_CLIENTS = 32
+_MAX_CACHED_DATABASES = 64
+
+# Clients are expensive to create, as each one sets up its own authorized gRPC
+# channel. Entries keep the credentials the client was created with, so that
+# identity-based cache keys stay valid while the entry exists.
+_spanner_clients: LruCache[Hashable, Tuple[Credentials, spanner.Client]] = (
+    LruCache(_MAX_CACHED_CLIENTS)
+)
+# Each database object owns a session pool and caches the database dialect, so
+# reusing it avoids creating sessions and reloading metadata on every call.
+# Entries keep the client the database belongs to, so that its id in the key
+# is not reused while the entry exists.
+_spanner_databases: LruCache[Hashable, Tuple[spanner.Client, Database]] = (
+    LruCache(_MAX_CACHED_DATABASES)
+)
+
 
 def get_spanner_client(
-    *, project: str, credentials: Credentials
+    *,
+    project: Optional[str],
+    credentials: Credentials,
+    user_agent: Optional[str] = None,
 ) -> spanner.Client:
-  """Get a Spanner client."""
+  """Get a Spanner client.
+
+  Clients are cached per project, credentials and user agent, and reused
+  across tool calls.
+
+  Args:
+    project: The GCP project ID.
+    credentials: The credentials to use for the request.
+    user_agent: An additional user agent to use for the request.
+
+  Returns:
+    A Spanner client.
+  """
+  full_user_agent = " ".join(filter(None, [USER_AGENT, user_agent]))
+  key = (project, get_credentials_key(credentials), full_user_agent)
+  cached = _spanner_clients.get(key)
+  if cached is not None:
+    refresh_cached_credentials(cached[0], credentials)
+    return cached[1]
 
   spanner_client = spanner.Client(project=project, credentials=credentials)
-  spanner_client._client_info.user_agent = USER_AGENT
+  # Clients share a default client info, so each one gets its own copy.
+  spanner_client._client_info = copy.copy(spanner_client._client_info)
+  spanner_client._client_info.user_agent = full_user_agent
 
+  _spanner_clients.put(key, (credentials, spanner_client))
   return spanner_client
+
+
+def get_spanner_database(
+    *,
+    project: Optional[str],
+    instance_id: str,
+    database_id: str,
+    credentials: Credentials,
+) -> Database:
+  """Get a Spanner database, with its session pool reused across tool calls."""
+  spanner_client = get_spanner_client(project=project, credentials=credentials)
+  key = (id(spanner_client), instance_id, database_id)
+  cached = _spanner_databases.get(key)
+  if cached is not None:
+    return cached[1]
+
+  database = spanner_client.instance(instance_id).database(database_id)
+  _spanner_databases.put(key, (spanner_client, database))
+  return database
+
+
+def clear_client_cache() -> None:
+  """Drops all cached clients and databases."""
+  _spanner_databases.clear()
+  _spanner_clients.clear()
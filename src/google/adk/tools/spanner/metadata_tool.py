@@ -54,11 +54,12 @@ def list_table_names(
       }
   """
   try:
-    spanner_client = client.get_spanner_client(
-        project=project_id, credentials=credentials
+    database = client.get_spanner_database(
+        project=project_id,
+        instance_id=instance_id,
+        database_id=database_id,
+        credentials=credentials,
     )
-    instance = spanner_client.instance(instance_id)
-    database = instance.database(database_id)
 
     tables = []
     named_schema = named_schema if named_schema else "_default"
@@ -197,11 +198,12 @@ def get_table_schema(
 
   results = {"schema": {}, "metadata": []}
   try:
-    spanner_client = client.get_spanner_client(
-        project=project_id, credentials=credentials
+    database = client.get_spanner_database(
+        project=project_id,
+        instance_id=instance_id,
+        database_id=database_id,
+        credentials=credentials,
     )
-    instance = spanner_client.instance(instance_id)
-    database = instance.database(database_id)
 
     if database.database_dialect == DatabaseDialect.POSTGRESQL:
       return {
@@ -335,11 +337,12 @@ def list_table_indexes(
       }
   """
   try:
-    spanner_client = client.get_spanner_client(
-        project=project_id, credentials=credentials
+    database = client.get_spanner_database(
+        project=project_id,
+        instance_id=instance_id,
+        database_id=database_id,
+        credentials=credentials,
     )
-    instance = spanner_client.instance(instance_id)
-    database = instance.database(database_id)
 
     if database.database_dialect == DatabaseDialect.POSTGRESQL:
       return {
@@ -442,11 +445,12 @@ def list_table_index_columns(
       }
   """
   try:
-    spanner_client = client.get_spanner_client(
-        project=project_id, credentials=credentials
+    database = client.get_spanner_database(
+        project=project_id,
+        instance_id=instance_id,
+        database_id=database_id,
+        credentials=credentials,
     )
-    instance = spanner_client.instance(instance_id)
-    database = instance.database(database_id)
 
     if database.database_dialect == DatabaseDialect.POSTGRESQL:
       return {
@@ -521,11 +525,12 @@ def list_named_schemas(
       }
   """
   try:
-    spanner_client = client.get_spanner_client(
-        project=project_id, credentials=credentials
+    database = client.get_spanner_database(
+        project=project_id,
+        instance_id=instance_id,
+        database_id=database_id,
+        credentials=credentials,
     )
-    instance = spanner_client.instance(instance_id)
-    database = instance.database(database_id)
 
     if database.database_dialect == DatabaseDialect.POSTGRESQL:
       return {
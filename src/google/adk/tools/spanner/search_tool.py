@@ -18,11 +18,13 @@ import json
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 
 from google.auth.credentials import Credentials
 from google.cloud.spanner_admin_database_v1.types import DatabaseDialect
 from google.cloud.spanner_v1.database import Database
+from google.cloud.spanner_v1.snapshot import Snapshot
 
 from . import client
 from . import utils
@@ -52,6 +54,7 @@ _NUM_LEAVES_TO_SEARCH = "num_leaves_to_search"
 
 # Constants
 _DISTANCE_ALIAS = "distance"
+_QUERY_INDEX_ALIAS = "query_index"
 _GOOGLESQL_PARAMETER_TEXT_QUERY = "query"
 _POSTGRESQL_PARAMETER_TEXT_QUERY = "1"
 _GOOGLESQL_PARAMETER_QUERY_EMBEDDING = "embedding"
@@ -117,6 +120,26 @@ def _get_embedding_for_query(
     output_dimensionality: Optional[int] = None,
 ) -> List[float]:
   """Gets the embedding for the query."""
+  with database.snapshot() as snapshot:
+    return _get_embedding_in_snapshot(
+        snapshot,
+        dialect,
+        spanner_gsql_embedding_model_name,
+        spanner_pg_vertex_ai_embedding_model_endpoint,
+        query,
+        output_dimensionality,
+    )
+
+
+def _get_embedding_in_snapshot(
+    snapshot: Snapshot,
+    dialect: DatabaseDialect,
+    spanner_gsql_embedding_model_name: Optional[str],
+    spanner_pg_vertex_ai_embedding_model_endpoint: Optional[str],
+    query: str,
+    output_dimensionality: Optional[int] = None,
+) -> List[float]:
+  """Gets the embedding for the query with the model registered in Spanner."""
   if dialect == DatabaseDialect.POSTGRESQL:
     embedding_query = _generate_postgresql_for_embedding_query(
         spanner_pg_vertex_ai_embedding_model_endpoint,
@@ -128,9 +151,8 @@ def _get_embedding_for_query(
         spanner_gsql_embedding_model_name
     )
     params = {_GOOGLESQL_PARAMETER_TEXT_QUERY: query}
-  with database.snapshot() as snapshot:
-    result_set = snapshot.execute_sql(embedding_query, params=params)
-    return result_set.one()[0]
+  result_set = snapshot.execute_sql(embedding_query, params=params)
+  return result_set.one()[0]
 
 
 def _get_postgresql_distance_function(distance_type: str) -> str:
@@ -163,16 +185,21 @@ def _generate_sql_for_knn(
     additional_filter: Optional[str],
     distance_type: str,
     top_k: int,
+    embedding_parameter: Optional[str] = None,
 ) -> str:
   """Generates a SQL query for kNN search."""
   if dialect == DatabaseDialect.POSTGRESQL:
     distance_function = _get_postgresql_distance_function(distance_type)
-    embedding_parameter = f"${_POSTGRESQL_PARAMETER_QUERY_EMBEDDING}"
+    embedding_parameter = (
+        embedding_parameter or f"${_POSTGRESQL_PARAMETER_QUERY_EMBEDDING}"
+    )
   else:
     distance_function = _get_googlesql_distance_function(
         distance_type, ann=False
     )
-    embedding_parameter = f"@{_GOOGLESQL_PARAMETER_QUERY_EMBEDDING}"
+    embedding_parameter = (
+        embedding_parameter or f"@{_GOOGLESQL_PARAMETER_QUERY_EMBEDDING}"
+    )
   columns = columns + [f"""{distance_function}(
       {embedding_column_to_search},
       {embedding_parameter}) AS {_DISTANCE_ALIAS}
@@ -202,6 +229,7 @@ def _generate_sql_for_ann(
     distance_type: str,
     top_k: int,
     num_leaves_to_search: int,
+    embedding_parameter: Optional[str] = None,
 ):
   """Generates a SQL query for ANN search."""
   if dialect == DatabaseDialect.POSTGRESQL:
@@ -210,9 +238,12 @@ def _generate_sql_for_ann(
         " dialect."
     )
   distance_function = _get_googlesql_distance_function(distance_type, ann=True)
+  embedding_parameter = (
+      embedding_parameter or f"@{_GOOGLESQL_PARAMETER_QUERY_EMBEDDING}"
+  )
   columns = columns + [f"""{distance_function}(
       {embedding_column_to_search},
-      @{_GOOGLESQL_PARAMETER_QUERY_EMBEDDING},
+      {embedding_parameter},
       options => JSON '{{"num_leaves_to_search": {num_leaves_to_search}}}'
   ) AS {_DISTANCE_ALIAS}
   """]
@@ -230,6 +261,192 @@ def _generate_sql_for_ann(
   """
 
 
+def _generate_sql_for_batch(search_sqls: List[str]) -> str:
+  """Combines the search queries of a batch into one, tagging each row."""
+  subqueries = "\n    UNION ALL\n".join(
+      f"SELECT {i} AS {_QUERY_INDEX_ALIAS}, * FROM ({sql}) AS q{i}"
+      for i, sql in enumerate(search_sqls)
+  )
+  return f"""
+    {subqueries}
+    ORDER BY {_QUERY_INDEX_ALIAS}, {_DISTANCE_ALIAS}
+  """
+
+
+def _get_embedding_parameter(
+    dialect: DatabaseDialect, index: Optional[int] = None
+) -> tuple[str, str]:
+  """Returns the SQL placeholder and the parameter name of a query embedding."""
+  if dialect == DatabaseDialect.POSTGRESQL:
+    position = int(_POSTGRESQL_PARAMETER_QUERY_EMBEDDING) + (index or 0)
+    return f"${position}", f"p{position}"
+  name = _GOOGLESQL_PARAMETER_QUERY_EMBEDDING
+  if index is not None:
+    name = f"{name}_{index}"
+  return f"@{name}", name
+
+
+class _SearchOptions(NamedTuple):
+  """The validated embedding and search options of a similarity search."""
+
+  vertex_ai_embedding_model_name: Optional[str]
+  spanner_gsql_embedding_model_name: Optional[str]
+  spanner_pg_vertex_ai_embedding_model_endpoint: Optional[str]
+  output_dimensionality: Optional[int]
+  distance_type: str
+  top_k: int
+  nearest_neighbors_algorithm: str
+  num_leaves_to_search: int
+
+
+def _get_search_options(
+    dialect: DatabaseDialect,
+    embedding_options: Optional[Dict[str, str]],
+    search_options: Optional[Dict[str, Any]],
+) -> _SearchOptions:
+  """Validates the options of a similarity search and applies defaults."""
+  if embedding_options is None:
+    embedding_options = {}
+  if search_options is None:
+    search_options = {}
+
+  exclusive_embedding_model_keys = {
+      _VERTEX_AI_EMBEDDING_MODEL_NAME,
+      _SPANNER_GSQL_EMBEDDING_MODEL_NAME,
+      _SPANNER_PG_VERTEX_AI_EMBEDDING_MODEL_ENDPOINT,
+  }
+  if (
+      len(exclusive_embedding_model_keys.intersection(embedding_options.keys()))
+      != 1
+  ):
+    raise ValueError("Exactly one embedding model option must be specified.")
+
+  vertex_ai_embedding_model_name = embedding_options.get(
+      _VERTEX_AI_EMBEDDING_MODEL_NAME
+  )
+  spanner_gsql_embedding_model_name = embedding_options.get(
+      _SPANNER_GSQL_EMBEDDING_MODEL_NAME
+  )
+  spanner_pg_vertex_ai_embedding_model_endpoint = embedding_options.get(
+      _SPANNER_PG_VERTEX_AI_EMBEDDING_MODEL_ENDPOINT
+  )
+  if (
+      dialect == DatabaseDialect.GOOGLE_STANDARD_SQL
+      and vertex_ai_embedding_model_name is None
+      and spanner_gsql_embedding_model_name is None
+  ):
+    raise ValueError(
+        f"embedding_options['{_VERTEX_AI_EMBEDDING_MODEL_NAME}'] or"
+        f" embedding_options['{_SPANNER_GSQL_EMBEDDING_MODEL_NAME}'] must be"
+        " specified for GoogleSQL dialect Spanner database."
+    )
+  if (
+      dialect == DatabaseDialect.POSTGRESQL
+      and vertex_ai_embedding_model_name is None
+      and spanner_pg_vertex_ai_embedding_model_endpoint is None
+  ):
+    raise ValueError(
+        f"embedding_options['{_VERTEX_AI_EMBEDDING_MODEL_NAME}'] or"
+        f" embedding_options['{_SPANNER_PG_VERTEX_AI_EMBEDDING_MODEL_ENDPOINT}']"
+        " must be specified for PostgreSQL dialect Spanner database."
+    )
+  output_dimensionality = embedding_options.get(_OUTPUT_DIMENSIONALITY)
+  if (
+      output_dimensionality is not None
+      and spanner_gsql_embedding_model_name is not None
+  ):
+    # Currently, Spanner GSQL Model ML.PREDICT does not support
+    # output_dimensionality parameter for inference embedding models.
+    raise ValueError(
+        f"embedding_options[{_OUTPUT_DIMENSIONALITY}] is not supported when"
+        f" embedding_options['{_SPANNER_GSQL_EMBEDDING_MODEL_NAME}'] is"
+        " specified."
+    )
+
+  # Use cosine distance by default.
+  distance_type = search_options.get(_DISTANCE_TYPE)
+  if distance_type is None:
+    distance_type = "COSINE"
+
+  top_k = search_options.get(_TOP_K)
+  if top_k is None:
+    top_k = 4
+
+  # Use EXACT_NEAREST_NEIGHBORS (i.e. kNN) by default.
+  nearest_neighbors_algorithm = search_options.get(
+      _NEAREST_NEIGHBORS_ALGORITHM,
+      EXACT_NEAREST_NEIGHBORS,
+  )
+  if nearest_neighbors_algorithm not in (
+      EXACT_NEAREST_NEIGHBORS,
+      APPROXIMATE_NEAREST_NEIGHBORS,
+  ):
+    raise NotImplementedError(
+        f"Unsupported search_options['{_NEAREST_NEIGHBORS_ALGORITHM}']:"
+        f" {nearest_neighbors_algorithm}"
+    )
+
+  num_leaves_to_search = search_options.get(_NUM_LEAVES_TO_SEARCH)
+  if num_leaves_to_search is None:
+    num_leaves_to_search = 1000
+
+  return _SearchOptions(
+      vertex_ai_embedding_model_name=vertex_ai_embedding_model_name,
+      spanner_gsql_embedding_model_name=spanner_gsql_embedding_model_name,
+      spanner_pg_vertex_ai_embedding_model_endpoint=(
+          spanner_pg_vertex_ai_embedding_model_endpoint
+      ),
+      output_dimensionality=output_dimensionality,
+      distance_type=distance_type,
+      top_k=top_k,
+      nearest_neighbors_algorithm=nearest_neighbors_algorithm,
+      num_leaves_to_search=num_leaves_to_search,
+  )
+
+
+def _generate_search_sql(
+    dialect: DatabaseDialect,
+    table_name: str,
+    embedding_column_to_search: str,
+    columns: List[str],
+    additional_filter: Optional[str],
+    options: _SearchOptions,
+    embedding_parameter: Optional[str] = None,
+) -> str:
+  """Generates the SQL query of a similarity search."""
+  if options.nearest_neighbors_algorithm == EXACT_NEAREST_NEIGHBORS:
+    return _generate_sql_for_knn(
+        dialect,
+        table_name,
+        embedding_column_to_search,
+        columns,
+        additional_filter,
+        options.distance_type,
+        options.top_k,
+        embedding_parameter,
+    )
+  return _generate_sql_for_ann(
+      dialect,
+      table_name,
+      embedding_column_to_search,
+      columns,
+      additional_filter,
+      options.distance_type,
+      options.top_k,
+      options.num_leaves_to_search,
+      embedding_parameter,
+  )
+
+
+def _to_json_safe_row(row: Any) -> Any:
+  try:
+    # if the json serialization of the row succeeds, use it as is
+    json.dumps(row)
+  except (TypeError, ValueError, OverflowError):
+    row = str(row)
+  return row
+
+
 def similarity_search(
     project_id: str,
     instance_id: str,
@@ -361,168 +578,231 @@ def similarity_search(
   """
   # fmt: on
   try:
-    # Get Spanner client
-    spanner_client = client.get_spanner_client(
-        project=project_id, credentials=credentials
+    database = client.get_spanner_database(
+        project=project_id,
+        instance_id=instance_id,
+        database_id=database_id,
+        credentials=credentials,
     )
-    instance = spanner_client.instance(instance_id)
-    database = instance.database(database_id)
+    dialect = database.database_dialect
 
-    assert database.database_dialect in [
+    assert dialect in [
         DatabaseDialect.GOOGLE_STANDARD_SQL,
         DatabaseDialect.POSTGRESQL,
     ], (
-        "Unsupported database dialect: %s" % database.database_dialect
-    )
-
-    if embedding_options is None:
-      embedding_options = {}
-    if search_options is None:
-      search_options = {}
-
-    exclusive_embedding_model_keys = {
-        _VERTEX_AI_EMBEDDING_MODEL_NAME,
-        _SPANNER_GSQL_EMBEDDING_MODEL_NAME,
-        _SPANNER_PG_VERTEX_AI_EMBEDDING_MODEL_ENDPOINT,
-    }
-    if (
-        len(
-            exclusive_embedding_model_keys.intersection(
-                embedding_options.keys()
-            )
-        )
-        != 1
-    ):
-      raise ValueError("Exactly one embedding model option must be specified.")
-
-    vertex_ai_embedding_model_name = embedding_options.get(
-        _VERTEX_AI_EMBEDDING_MODEL_NAME
-    )
-    spanner_gsql_embedding_model_name = embedding_options.get(
-        _SPANNER_GSQL_EMBEDDING_MODEL_NAME
-    )
-    spanner_pg_vertex_ai_embedding_model_endpoint = embedding_options.get(
-        _SPANNER_PG_VERTEX_AI_EMBEDDING_MODEL_ENDPOINT
+        "Unsupported database dialect: %s" % dialect
     )
-    if (
-        database.database_dialect == DatabaseDialect.GOOGLE_STANDARD_SQL
-        and vertex_ai_embedding_model_name is None
-        and spanner_gsql_embedding_model_name is None
-    ):
-      raise ValueError(
-          f"embedding_options['{_VERTEX_AI_EMBEDDING_MODEL_NAME}'] or"
-          f" embedding_options['{_SPANNER_GSQL_EMBEDDING_MODEL_NAME}'] must be"
-          " specified for GoogleSQL dialect Spanner database."
-      )
-    if (
-        database.database_dialect == DatabaseDialect.POSTGRESQL
-        and vertex_ai_embedding_model_name is None
-        and spanner_pg_vertex_ai_embedding_model_endpoint is None
-    ):
-      raise ValueError(
-          f"embedding_options['{_VERTEX_AI_EMBEDDING_MODEL_NAME}'] or"
-          f" embedding_options['{_SPANNER_PG_VERTEX_AI_EMBEDDING_MODEL_ENDPOINT}']"
-          " must be specified for PostgreSQL dialect Spanner database."
-      )
-    output_dimensionality = embedding_options.get(_OUTPUT_DIMENSIONALITY)
-    if (
-        output_dimensionality is not None
-        and spanner_gsql_embedding_model_name is not None
-    ):
-      # Currently, Spanner GSQL Model ML.PREDICT does not support
-      # output_dimensionality parameter for inference embedding models.
-      raise ValueError(
-          f"embedding_options[{_OUTPUT_DIMENSIONALITY}] is not supported when"
-          f" embedding_options['{_SPANNER_GSQL_EMBEDDING_MODEL_NAME}'] is"
-          " specified."
-      )
 
-    # Use cosine distance by default.
-    distance_type = search_options.get(_DISTANCE_TYPE)
-    if distance_type is None:
-      distance_type = "COSINE"
-
-    top_k = search_options.get(_TOP_K)
-    if top_k is None:
-      top_k = 4
-
-    # Use EXACT_NEAREST_NEIGHBORS (i.e. kNN) by default.
-    nearest_neighbors_algorithm = search_options.get(
-        _NEAREST_NEIGHBORS_ALGORITHM,
-        EXACT_NEAREST_NEIGHBORS,
-    )
-    if nearest_neighbors_algorithm not in (
-        EXACT_NEAREST_NEIGHBORS,
-        APPROXIMATE_NEAREST_NEIGHBORS,
-    ):
-      raise NotImplementedError(
-          f"Unsupported search_options['{_NEAREST_NEIGHBORS_ALGORITHM}']:"
-          f" {nearest_neighbors_algorithm}"
-      )
+    options = _get_search_options(dialect, embedding_options, search_options)
 
     # Generate embedding for the query according to the embedding options.
-    if vertex_ai_embedding_model_name:
+    if options.vertex_ai_embedding_model_name:
       embedding = utils.embed_contents(
-          vertex_ai_embedding_model_name,
+          options.vertex_ai_embedding_model_name,
           [query],
-          output_dimensionality,
+          options.output_dimensionality,
       )[0]
     else:
       embedding = _get_embedding_for_query(
           database,
-          database.database_dialect,
-          spanner_gsql_embedding_model_name,
-          spanner_pg_vertex_ai_embedding_model_endpoint,
+          dialect,
+          options.spanner_gsql_embedding_model_name,
+          options.spanner_pg_vertex_ai_embedding_model_endpoint,
           query,
-          output_dimensionality,
-      )
-
-    if nearest_neighbors_algorithm == EXACT_NEAREST_NEIGHBORS:
-      sql = _generate_sql_for_knn(
-          database.database_dialect,
-          table_name,
-          embedding_column_to_search,
-          columns,
-          additional_filter,
-          distance_type,
-          top_k,
-      )
-    else:
-      num_leaves_to_search = search_options.get(_NUM_LEAVES_TO_SEARCH)
-      if num_leaves_to_search is None:
-        num_leaves_to_search = 1000
-      sql = _generate_sql_for_ann(
-          database.database_dialect,
-          table_name,
-          embedding_column_to_search,
-          columns,
-          additional_filter,
-          distance_type,
-          top_k,
-          num_leaves_to_search,
+          options.output_dimensionality,
       )
 
-    if database.database_dialect == DatabaseDialect.POSTGRESQL:
-      params = {f"p{_POSTGRESQL_PARAMETER_QUERY_EMBEDDING}": embedding}
-    else:
-      params = {_GOOGLESQL_PARAMETER_QUERY_EMBEDDING: embedding}
+    sql = _generate_search_sql(
+        dialect,
+        table_name,
+        embedding_column_to_search,
+        columns,
+        additional_filter,
+        options,
+    )
+    _, embedding_parameter_name = _get_embedding_parameter(dialect)
+    params = {embedding_parameter_name: embedding}
 
     with database.snapshot() as snapshot:
       result_set = snapshot.execute_sql(sql, params=params)
-      rows = []
-      result = {}
-      for row in result_set:
-        try:
-          # if the json serialization of the row succeeds, use it as is
-          json.dumps(row)
-        except (TypeError, ValueError, OverflowError):
-          row = str(row)
+      rows = [_to_json_safe_row(row) for row in result_set]
+    return {"status": "SUCCESS", "rows": rows}
+  except Exception as ex:
+    return {
+        "status": "ERROR",
+        "error_details": repr(ex),
+    }
 
-        rows.append(row)
 
-      result["status"] = "SUCCESS"
-      result["rows"] = rows
-      return result
+def batch_similarity_search(
+    project_id: str,
+    instance_id: str,
+    database_id: str,
+    table_name: str,
+    queries: List[str],
+    embedding_column_to_search: str,
+    columns: List[str],
+    embedding_options: Dict[str, str],
+    credentials: Credentials,
+    additional_filter: Optional[str] = None,
+    search_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+  # fmt: off
+  """Similarity search in Spanner for several text queries at once.
+
+  Prefer this function over calling `similarity_search` several times when you
+  need to search for more than one query, as all the queries are embedded
+  together and searched with a single SQL statement.
+
+  Args:
+      project_id (str): The GCP project id in which the spanner database
+        resides.
+      instance_id (str): The instance id of the spanner database.
+      database_id (str): The database id of the spanner database.
+      table_name (str): The name of the table used for vector search.
+      queries (List[str]): The user queries for which the tool will find the
+        top similar content. Each query will be embedded and used for vector
+        search.
+      embedding_column_to_search (str): The name of the column that contains the
+        embeddings of the documents. The tool will do similarity search on this
+        column.
+      columns (List[str]): A list of column names, representing the additional
+        columns to return in the search results.
+      embedding_options (Dict[str, str]): A dictionary of options to use for
+        the embedding service, as for `similarity_search`. **Exactly one of the
+        following three keys MUST be present in this dictionary**:
+        `vertex_ai_embedding_model_name`, `spanner_googlesql_embedding_model_name`,
+        or `spanner_postgresql_vertex_ai_embedding_model_endpoint`. The
+        `output_dimensionality` key is optional.
+      credentials (Credentials): The credentials to use for the request.
+      additional_filter (Optional[str]): An optional filter to apply to the
+        search queries. If provided, this will be added to the WHERE clause of
+        each search.
+      search_options (Optional[Dict[str, Any]]): A dictionary of options to use
+        for the similarity searches, as for `similarity_search`: `top_k`
+        (default 4), `distance_type` (default "COSINE"),
+        `nearest_neighbors_algorithm` (default "EXACT_NEAREST_NEIGHBORS") and
+        `num_leaves_to_search`.
+
+  Returns:
+      Dict[str, Any]: A dictionary representing the results of the searches.
+        On success, it contains {"status": "SUCCESS", "results": [...]}, with
+        one {"query": ..., "rows": [...]} entry per query, in the order of
+        `queries`. The last column of each row is the distance between the
+        query and the column embedding (i.e. the embedding_column_to_search).
+        On error, it contains {"status": "ERROR", "error_details": "..."}.
+
+  Examples:
+      Search for products matching two descriptions:
+        >>> batch_similarity_search(
+        ...   project_id="my-project",
+        ...   instance_id="my-instance",
+        ...   database_id="my-database",
+        ...   table_name="my-product-table",
+        ...   queries=["Tools to clean my house.", "Tools to fix my bike."],
+        ...   embedding_column_to_search="product_description_embedding",
+        ...   columns=["product_name"],
+        ...   credentials=credentials,
+        ...   embedding_options={
+        ...     "vertex_ai_embedding_model_name": "text-embedding-005"
+        ...   },
+        ...   search_options={"top_k": 1}
+        ... )
+        {
+          "status": "SUCCESS",
+          "results": [
+            {
+              "query": "Tools to clean my house.",
+              "rows": [("Powerful Robot Vacuum", 0.31)],
+            },
+            {
+              "query": "Tools to fix my bike.",
+              "rows": [("Bike Repair Kit", 0.28)],
+            },
+          ],
+        }
+  """
+  # fmt: on
+  try:
+    if not queries:
+      raise ValueError("At least one query must be specified.")
+
+    database = client.get_spanner_database(
+        project=project_id,
+        instance_id=instance_id,
+        database_id=database_id,
+        credentials=credentials,
+    )
+    dialect = database.database_dialect
+
+    assert dialect in [
+        DatabaseDialect.GOOGLE_STANDARD_SQL,
+        DatabaseDialect.POSTGRESQL,
+    ], (
+        "Unsupported database dialect: %s" % dialect
+    )
+
+    options = _get_search_options(dialect, embedding_options, search_options)
+    unique_queries = list(dict.fromkeys(queries))
+
+    if options.vertex_ai_embedding_model_name:
+      # All queries are embedded with a single request to the model.
+      embeddings = utils.embed_contents(
+          options.vertex_ai_embedding_model_name,
+          unique_queries,
+          options.output_dimensionality,
+      )
+
+    # A multi-use snapshot reads the embeddings from models registered in
+    # Spanner and runs the search in the same transaction.
+    with database.snapshot(multi_use=True) as snapshot:
+      if not options.vertex_ai_embedding_model_name:
+        embeddings = [
+            _get_embedding_in_snapshot(
+                snapshot,
+                dialect,
+                options.spanner_gsql_embedding_model_name,
+                options.spanner_pg_vertex_ai_embedding_model_endpoint,
+                query,
+                options.output_dimensionality,
+            )
+            for query in unique_queries
+        ]
+
+      search_sqls = []
+      params = {}
+      for index, embedding in enumerate(embeddings):
+        embedding_parameter, embedding_parameter_name = (
+            _get_embedding_parameter(dialect, index)
+        )
+        search_sqls.append(
+            _generate_search_sql(
+                dialect,
+                table_name,
+                embedding_column_to_search,
+                columns,
+                additional_filter,
+                options,
+                embedding_parameter,
+            )
+        )
+        params[embedding_parameter_name] = embedding
+
+      result_set = snapshot.execute_sql(
+          _generate_sql_for_batch(search_sqls), params=params
+      )
+      rows_by_query = [[] for _ in unique_queries]
+      for row in result_set:
+        rows_by_query[row[0]].append(_to_json_safe_row(row[1:]))
+
+    rows_by_unique_query = dict(zip(unique_queries, rows_by_query))
+    return {
+        "status": "SUCCESS",
+        "results": [
+            {"query": query, "rows": rows_by_unique_query[query]}
+            for query in queries
+        ],
+    }
   except Exception as ex:
     return {
         "status": "ERROR",
@@ -530,6 +810,52 @@ def similarity_search(
     }
 
 
+def _get_vector_store_search_args(
+    settings: SpannerToolSettings,
+) -> Dict[str, Any]:
+  """Returns the similarity search arguments of the vector store settings."""
+  if not settings or not settings.vector_store_settings:
+    raise ValueError("Spanner vector store settings are not set.")
+
+  # Get the embedding model settings.
+  embedding_options = {
+      _VERTEX_AI_EMBEDDING_MODEL_NAME: (
+          settings.vector_store_settings.vertex_ai_embedding_model_name
+      ),
+      _OUTPUT_DIMENSIONALITY: settings.vector_store_settings.vector_length,
+  }
+
+  # Get the search settings.
+  search_options = {
+      _TOP_K: settings.vector_store_settings.top_k,
+      _DISTANCE_TYPE: settings.vector_store_settings.distance_type,
+      _NEAREST_NEIGHBORS_ALGORITHM: (
+          settings.vector_store_settings.nearest_neighbors_algorithm
+      ),
+  }
+  if (
+      settings.vector_store_settings.nearest_neighbors_algorithm
+      == APPROXIMATE_NEAREST_NEIGHBORS
+  ):
+    search_options[_NUM_LEAVES_TO_SEARCH] = (
+        settings.vector_store_settings.num_leaves_to_search
+    )
+
+  return {
+      "project_id": settings.vector_store_settings.project_id,
+      "instance_id": settings.vector_store_settings.instance_id,
+      "database_id": settings.vector_store_settings.database_id,
+      "table_name": settings.vector_store_settings.table_name,
+      "embedding_column_to_search": (
+          settings.vector_store_settings.embedding_column
+      ),
+      "columns": settings.vector_store_settings.selected_columns,
+      "embedding_options": embedding_options,
+      "additional_filter": settings.vector_store_settings.additional_filter,
+      "search_options": search_options,
+  }
+
+
 def vector_store_similarity_search(
     query: str,
     credentials: Credentials,
@@ -578,45 +904,67 @@ def vector_store_similarity_search(
   """
 
   try:
-    if not settings or not settings.vector_store_settings:
-      raise ValueError("Spanner vector store settings are not set.")
-
-    # Get the embedding model settings.
-    embedding_options = {
-        _VERTEX_AI_EMBEDDING_MODEL_NAME: (
-            settings.vector_store_settings.vertex_ai_embedding_model_name
-        ),
-        _OUTPUT_DIMENSIONALITY: settings.vector_store_settings.vector_length,
+    return similarity_search(
+        query=query,
+        credentials=credentials,
+        **_get_vector_store_search_args(settings),
+    )
+  except Exception as ex:
+    return {
+        "status": "ERROR",
+        "error_details": repr(ex),
     }
 
-    # Get the search settings.
-    search_options = {
-        _TOP_K: settings.vector_store_settings.top_k,
-        _DISTANCE_TYPE: settings.vector_store_settings.distance_type,
-        _NEAREST_NEIGHBORS_ALGORITHM: (
-            settings.vector_store_settings.nearest_neighbors_algorithm
-        ),
-    }
-    if (
-        settings.vector_store_settings.nearest_neighbors_algorithm
-        == APPROXIMATE_NEAREST_NEIGHBORS
-    ):
-      search_options[_NUM_LEAVES_TO_SEARCH] = (
-          settings.vector_store_settings.num_leaves_to_search
-      )
 
-    return similarity_search(
-        project_id=settings.vector_store_settings.project_id,
-        instance_id=settings.vector_store_settings.instance_id,
-        database_id=settings.vector_store_settings.database_id,
-        table_name=settings.vector_store_settings.table_name,
-        query=query,
-        embedding_column_to_search=settings.vector_store_settings.embedding_column,
-        columns=settings.vector_store_settings.selected_columns,
-        embedding_options=embedding_options,
+def vector_store_batch_similarity_search(
+    queries: List[str],
+    credentials: Credentials,
+    settings: SpannerToolSettings,
+) -> Dict[str, Any]:
+  """Performs semantic similarity searches for several queries at once to retrieve relevant context from the Spanner vector store.
+
+  Prefer this function over calling `vector_store_similarity_search` several
+  times when you need to search for more than one query, as all the queries
+  are embedded and searched in a single round trip.
+
+  Args:
+      queries (List[str]): The search strings based on the user's question.
+      credentials (Credentials): The credentials to use for the request.
+      settings (SpannerToolSettings): The configuration for the tool.
+
+  Returns:
+      Dict[str, Any]: A dictionary representing the results of the searches.
+        On success, it contains {"status": "SUCCESS", "results": [...]}, with
+        one {"query": ..., "rows": [...]} entry per query, in the order of
+        `queries`. The last column of each row is the distance between the
+        query and the row result.
+        On error, it contains {"status": "ERROR", "error_details": "..."}.
+
+  Examples:
+        >>> vector_store_batch_similarity_search(
+        ...   queries=["Spanner query optimization", "Spanner schema design"],
+        ...   credentials=credentials,
+        ...   settings=settings
+        ... )
+        {
+          "status": "SUCCESS",
+          "results": [
+            {
+              "query": "Spanner query optimization",
+              "rows": [("Optimizing Query Performance", 0.12), ...],
+            },
+            {
+              "query": "Spanner schema design",
+              "rows": [("Schema Design Best Practices", 0.1), ...],
+            },
+          ],
+        }
+  """
+  try:
+    return batch_similarity_search(
+        queries=queries,
         credentials=credentials,
-        additional_filter=settings.vector_store_settings.additional_filter,
-        search_options=search_options,
+        **_get_vector_store_search_args(settings),
     )
   except Exception as ex:
     return {
@@ -15,15 +15,19 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Any
 from typing import List
 from typing import Literal
 from typing import Optional
 
 from pydantic import BaseModel
+from pydantic import field_validator
 from pydantic import model_validator
+from pydantic import PrivateAttr
 
 from ...features import experimental
 from ...features import FeatureName
+from .._query_result_cache import QueryResultCache
 
 # Vector similarity search nearest neighbors search algorithms.
 EXACT_NEAREST_NEIGHBORS = "EXACT_NEAREST_NEIGHBORS"
@@ -263,5 +267,39 @@ class SpannerToolSettings(BaseModel):
   query_result_mode: QueryResultMode = QueryResultMode.DEFAULT
   """Mode for Spanner execute sql query result."""
 
+  query_result_cache_ttl_seconds: Optional[float] = None
+  """How long the results of `execute_sql` queries are cached, in seconds.
+
+  If set, `execute_sql` returns the cached result of a query it ran before with
+  the same database, parameters and credentials, instead of running it again.
+  The cache is shared by the tools using these settings. By default, results
+  are not cached.
+  """
+
+  query_result_cache_max_bytes: int = 16 * 1024 * 1024
+  """Maximum size of the query result cache, in bytes of JSON.
+
+  The least recently used results are evicted beyond this size.
+  """
+
+  _query_result_cache: Optional[QueryResultCache] = PrivateAttr(default=None)
+
   vector_store_settings: Optional[SpannerVectorStoreSettings] = None
   """Settings for Spanner vector store and vector similarity search."""
+
+  @field_validator(
+      "query_result_cache_ttl_seconds", "query_result_cache_max_bytes"
+  )
+  @classmethod
+  def validate_query_result_cache(cls, v, info):
+    """Validate the query result cache settings."""
+    if v is not None and v <= 0:
+      raise ValueError(f"{info.field_name} must be positive.")
+    return v
+
+  def model_post_init(self, context: Any, /) -> None:
+    if self.query_result_cache_ttl_seconds is not None:
+      self._query_result_cache = QueryResultCache(
+          ttl_seconds=self.query_result_cache_ttl_seconds,
+          max_bytes=self.query_result_cache_max_bytes,
+      )
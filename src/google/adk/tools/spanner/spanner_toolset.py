@@ -49,7 +49,9 @@ class SpannerToolset(BaseToolset):
     - spanner_get_table_schema
     - spanner_execute_sql
     - spanner_similarity_search
+    - spanner_batch_similarity_search
     - spanner_vector_store_similarity_search
+    - spanner_vector_store_batch_similarity_search
   """
 
   def __init__(
@@ -117,22 +119,30 @@ class SpannerToolset(BaseToolset):
               tool_settings=self._tool_settings,
           )
       )
-      all_tools.append(
+      all_tools.extend(
           GoogleTool(
-              func=search_tool.similarity_search,
+              func=func,
               credentials_config=self._credentials_config,
               tool_settings=self._tool_settings,
           )
+          for func in [
+              search_tool.similarity_search,
+              search_tool.batch_similarity_search,
+          ]
       )
       if self._tool_settings.vector_store_settings:
-        # Only add the vector store similarity search tool if the vector store
-        # settings are specified.
-        all_tools.append(
+        # Only add the vector store similarity search tools if the vector
+        # store settings are specified.
+        all_tools.extend(
             GoogleTool(
-                func=search_tool.vector_store_similarity_search,
+                func=func,
                 credentials_config=self._credentials_config,
                 tool_settings=self._tool_settings,
             )
+            for func in [
+                search_tool.vector_store_similarity_search,
+                search_tool.vector_store_batch_similarity_search,
+            ]
         )
 
     return [
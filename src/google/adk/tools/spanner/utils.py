@@ -14,10 +14,12 @@
 
 from __future__ import annotations
 
+import array
 import asyncio
 import itertools
 import json
 import logging
+import threading
 from typing import Generator
 from typing import Iterable
 from typing import Optional
@@ -29,6 +31,9 @@ from google.cloud.spanner_admin_database_v1.types import DatabaseDialect
 from . import client
 from ...features import experimental
 from ...features import FeatureName
+from ...utils._lru_cache import LruCache
+from .._google_credentials import get_credentials_key
+from .._query_result_cache import QueryResultCache
 from ..tool_context import ToolContext
 from .settings import QueryResultMode
 from .settings import SpannerToolSettings
@@ -42,6 +47,17 @@ logger = logging.getLogger("google_adk." + __name__)
 
 DEFAULT_MAX_EXECUTED_QUERY_RESULT_ROWS = 50
 
+_MAX_CACHED_EMBEDDINGS = 1024
+
+# Agents often search for the same text repeatedly within a session. Embeddings
+# are stored as float arrays, which take a fraction of the memory of lists.
+_embedding_cache: LruCache[tuple[str, Optional[int], str], array.array] = (
+    LruCache(_MAX_CACHED_EMBEDDINGS)
+)
+
+_default_genai_client: Optional[Client] = None
+_default_genai_client_lock = threading.Lock()
+
 
 def execute_sql(
     project_id: str,
@@ -76,13 +92,28 @@ def execute_sql(
             query not returned in the result.
   """
 
+  query_result_cache = settings._query_result_cache if settings else None
+  if query_result_cache is not None:
+    cache_key = QueryResultCache.make_key(
+        (project_id, instance_id, database_id),
+        get_credentials_key(credentials),
+        query,
+        # Types are part of the key, as they change how values are bound.
+        {"params": params, "params_types": params_types},
+    )
+    cached_result = query_result_cache.get(cache_key)
+    if cached_result is not None:
+      cached_result["query_result_cache"] = query_result_cache.stats(hit=True)
+      return cached_result
+
   try:
     # Get Spanner client
-    spanner_client = client.get_spanner_client(
-        project=project_id, credentials=credentials
+    database = client.get_spanner_database(
+        project=project_id,
+        instance_id=instance_id,
+        database_id=database_id,
+        credentials=credentials,
     )
-    instance = spanner_client.instance(instance_id)
-    database = instance.database(database_id)
 
     if database.database_dialect == DatabaseDialect.POSTGRESQL:
       return {
@@ -118,6 +149,9 @@ def execute_sql(
       result = {"status": "SUCCESS", "rows": rows}
       if counter <= 0:
         result["result_is_likely_truncated"] = True
+      if query_result_cache is not None:
+        query_result_cache.put(cache_key, result)
+        result["query_result_cache"] = query_result_cache.stats(hit=False)
       return result
   except Exception as ex:
     return {
@@ -126,27 +160,86 @@ def execute_sql(
     }
 
 
+def _get_default_genai_client() -> Client:
+  """Returns the GenAI client shared by calls that do not supply one."""
+  global _default_genai_client
+  from google.genai import Client
+
+  with _default_genai_client_lock:
+    if _default_genai_client is None:
+      _default_genai_client = Client()
+    return _default_genai_client
+
+
+def _get_cached_embeddings(
+    vertex_ai_embedding_model_name: str,
+    contents: list[str],
+    output_dimensionality: Optional[int],
+) -> tuple[dict[str, list[float]], list[str]]:
+  """Returns the cached embeddings of the contents, and the unique misses."""
+  embeddings = {}
+  for content in contents:
+    if content in embeddings:
+      continue
+    cached = _embedding_cache.get(
+        (vertex_ai_embedding_model_name, output_dimensionality, content)
+    )
+    if cached is not None:
+      embeddings[content] = list(cached)
+  missing = list(dict.fromkeys(c for c in contents if c not in embeddings))
+  return embeddings, missing
+
+
+def _cache_embeddings(
+    vertex_ai_embedding_model_name: str,
+    output_dimensionality: Optional[int],
+    missing: list[str],
+    response_embeddings: list,
+    embeddings: dict[str, list[float]],
+) -> None:
+  for content, embedding in zip(missing, response_embeddings):
+    embeddings[content] = list(embedding.values)
+    _embedding_cache.put(
+        (vertex_ai_embedding_model_name, output_dimensionality, content),
+        array.array("d", embedding.values),
+    )
+
+
 def embed_contents(
     vertex_ai_embedding_model_name: str,
     contents: list[str],
     output_dimensionality: Optional[int] = None,
     genai_client: Client | None = None,
 ) -> list[list[float]]:
-  """Embed the given contents into list of vectors using the Vertex AI embedding model endpoint."""
+  """Embed the given contents into list of vectors using the Vertex AI embedding model endpoint.
+
+  Embeddings are cached per model and content, and only the contents without a
+  cached embedding are sent to the model, in a single request.
+  """
   try:
-    from google.genai import Client
     from google.genai.types import EmbedContentConfig
 
-    genai_client = genai_client or Client()
-    config = EmbedContentConfig()
-    if output_dimensionality:
-      config.output_dimensionality = output_dimensionality
-    response = genai_client.models.embed_content(
-        model=vertex_ai_embedding_model_name,
-        contents=contents,
-        config=config,
+    embeddings, missing = _get_cached_embeddings(
+        vertex_ai_embedding_model_name, contents, output_dimensionality
     )
-    return [list(e.values) for e in response.embeddings]
+    if missing:
+      genai_client = genai_client or _get_default_genai_client()
+      config = EmbedContentConfig()
+      if output_dimensionality:
+        config.output_dimensionality = output_dimensionality
+      response = genai_client.models.embed_content(
+          model=vertex_ai_embedding_model_name,
+          contents=missing,
+          config=config,
+      )
+      _cache_embeddings(
+          vertex_ai_embedding_model_name,
+          output_dimensionality,
+          missing,
+          response.embeddings,
+          embeddings,
+      )
+    return [embeddings[content] for content in contents]
   except Exception as ex:
     raise RuntimeError(f"Failed to embed content: {ex!r}") from ex
 
@@ -157,21 +250,35 @@ async def embed_contents_async(
     output_dimensionality: Optional[int] = None,
     genai_client: Client | None = None,
 ) -> list[list[float]]:
-  """Embed the given contents into list of vectors using the Vertex AI embedding model endpoint."""
+  """Embed the given contents into list of vectors using the Vertex AI embedding model endpoint.
+
+  Embeddings are cached per model and content, and only the contents without a
+  cached embedding are sent to the model, in a single request.
+  """
   try:
-    from google.genai import Client
     from google.genai.types import EmbedContentConfig
 
-    genai_client = genai_client or Client()
-    config = EmbedContentConfig()
-    if output_dimensionality:
-      config.output_dimensionality = output_dimensionality
-    response = await genai_client.aio.models.embed_content(
-        model=vertex_ai_embedding_model_name,
-        contents=contents,
-        config=config,
+    embeddings, missing = _get_cached_embeddings(
+        vertex_ai_embedding_model_name, contents, output_dimensionality
     )
-    return [list(e.values) for e in response.embeddings]
+    if missing:
+      genai_client = genai_client or _get_default_genai_client()
+      config = EmbedContentConfig()
+      if output_dimensionality:
+        config.output_dimensionality = output_dimensionality
+      response = await genai_client.aio.models.embed_content(
+          model=vertex_ai_embedding_model_name,
+          contents=missing,
+          config=config,
+      )
+      _cache_embeddings(
+          vertex_ai_embedding_model_name,
+          output_dimensionality,
+          missing,
+          response.embeddings,
+          embeddings,
+      )
+    return [embeddings[content] for content in contents]
   except Exception as ex:
     raise RuntimeError(f"Failed to embed content: {ex!r}") from ex
 
@@ -220,6 +327,7 @@ class SpannerVectorStore:
       self._spanner_client = client.get_spanner_client(
           project=self._vector_store_settings.project_id,
           credentials=credentials,
+          user_agent=self.SPANNER_VECTOR_STORE_USER_AGENT,
       )
     else:
       self._spanner_client = spanner_client
@@ -230,10 +338,10 @@ class SpannerVectorStore:
         self._spanner_client._client_info.user_agent = " ".join(
             [client_user_agent, client.USER_AGENT]
         )
-    self._spanner_client._client_info.user_agent = " ".join([
-        self._spanner_client._client_info.user_agent,
-        self.SPANNER_VECTOR_STORE_USER_AGENT,
-    ])
+      self._spanner_client._client_info.user_agent = " ".join([
+          self._spanner_client._client_info.user_agent,
+          self.SPANNER_VECTOR_STORE_USER_AGENT,
+      ])
 
     instance = self._spanner_client.instance(
         self._vector_store_settings.instance_id
@@ -0,0 +1,150 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Declarative memoization of idempotent tool results."""
+
+from __future__ import annotations
+
+from enum import Enum
+import json
+import time
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import NamedTuple
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import PrivateAttr
+
+from ..utils._lru_cache import LruCache
+from ..utils.feature_decorator import experimental
+
+if TYPE_CHECKING:
+  from .tool_context import ToolContext
+
+
+class MemoizationScope(str, Enum):
+  """The calls that share memoized results."""
+
+  INVOCATION = 'invocation'
+  """Calls within the same invocation."""
+  SESSION = 'session'
+  """Calls within the same session."""
+  USER = 'user'
+  """Calls by the same user of the same app."""
+  APP = 'app'
+  """Calls within the same app."""
+  GLOBAL = 'global'
+  """All calls in the process."""
+
+
+class _Entry(NamedTuple):
+  response: Any
+  expires_at: Optional[float]
+
+
+@experimental
+class ToolMemoizationConfig(BaseModel):
+  """Memoization policy of a tool whose results only depend on its arguments.
+
+  Memoized results are returned as regular function responses, without
+  running the tool or its side effects. Results of calls that change state,
+  save artifacts or request actions, and results of failed calls, are never
+  memoized.
+
+  Attributes:
+    scope: The calls that share memoized results.
+    ttl_seconds: How long results are reused. None means until evicted.
+    key_func: Maps the call arguments to the memoization key. Defaults to the
+      arguments themselves.
+    max_entries: The number of results kept before the least recently used one
+      is evicted.
+    bypass: Whether to run the tool instead of using memoized results. A
+      boolean, or a callable that takes the call arguments and returns a
+      boolean.
+  """
+
+  model_config = ConfigDict(
+      extra='forbid',
+      arbitrary_types_allowed=True,
+  )
+
+  scope: MemoizationScope = MemoizationScope.SESSION
+  ttl_seconds: Optional[float] = Field(default=None, gt=0)
+  key_func: Optional[Callable[[dict[str, Any]], Hashable]] = None
+  max_entries: int = Field(default=128, ge=1)
+  bypass: Union[bool, Callable[[dict[str, Any]], bool]] = False
+
+  _cache: LruCache[Hashable, _Entry] = PrivateAttr()
+  _timer: Callable[[], float] = PrivateAttr(default=time.monotonic)
+
+  def model_post_init(self, context: Any, /) -> None:
+    self._cache = LruCache(self.max_entries)
+
+  def should_bypass(self, args: dict[str, Any]) -> bool:
+    """Returns whether the call with `args` should run the tool."""
+    if callable(self.bypass):
+      return bool(self.bypass(args))
+    return self.bypass
+
+  def make_key(
+      self, tool_name: str, args: dict[str, Any], tool_context: ToolContext
+  ) -> Hashable:
+    """Returns the memoization key of a call."""
+    if self.key_func is not None:
+      args_key = self.key_func(args)
+    else:
+      args_key = json.dumps(args, sort_keys=True, default=repr)
+    return (tool_name, self._get_scope_key(tool_context), args_key)
+
+  def get(self, key: Hashable) -> tuple[bool, Any]:
+    """Returns whether a fresh result is memoized for `key`, and the result."""
+    entry = self._cache.get(key)
+    if entry is None:
+      return False, None
+    if entry.expires_at is not None and entry.expires_at <= self._timer():
+      self._cache.pop(key)
+      return False, None
+    return True, entry.response
+
+  def put(self, key: Hashable, response: Any) -> None:
+    """Memoizes `response` for `key`."""
+    expires_at = (
+        self._timer() + self.ttl_seconds
+        if self.ttl_seconds is not None
+        else None
+    )
+    self._cache.put(key, _Entry(response, expires_at))
+
+  def clear(self) -> None:
+    """Removes all memoized results."""
+    self._cache.clear()
+
+  def _get_scope_key(self, tool_context: ToolContext) -> Hashable:
+    invocation_context = tool_context._invocation_context
+    session = invocation_context.session
+    if self.scope == MemoizationScope.INVOCATION:
+      return (session.id, invocation_context.invocation_id)
+    if self.scope == MemoizationScope.SESSION:
+      return (session.app_name, session.user_id, session.id)
+    if self.scope == MemoizationScope.USER:
+      return (session.app_name, session.user_id)
+    if self.scope == MemoizationScope.APP:
+      return session.app_name
+    return None
@@ -0,0 +1,99 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for resources bound to an event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import AsyncGenerator
+from typing import Awaitable
+from typing import Callable
+import weakref
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+# Strong references to the pending shutdown hooks of each loop, as loops only
+# keep weak references to their async generators.
+_shutdown_hooks: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, set[AsyncGenerator[None, None]]
+] = weakref.WeakKeyDictionary()
+_shutdown_hooks_lock = threading.Lock()
+
+
+async def _run_on_shutdown(
+    callback: Callable[[], Awaitable[None]],
+) -> AsyncGenerator[None, None]:
+  try:
+    yield
+  finally:
+    try:
+      await callback()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.warning('Error in event loop shutdown callback: %s', e)
+
+
+def call_on_loop_shutdown(callback: Callable[[], Awaitable[None]]) -> None:
+  """Awaits `callback` on the running event loop when the loop shuts down.
+
+  `asyncio.run`, like other loop runners, finalizes the async generators of a
+  loop before closing it. The callback runs in the finalizer of such a
+  generator, so resources bound to the loop, e.g. HTTP connections, can be
+  released while the loop can still run their cleanup. The callback is not
+  run for loops closed without `loop.shutdown_asyncgens()`.
+
+  Args:
+    callback: The coroutine function to await.
+
+  Raises:
+    RuntimeError: If there is no running event loop.
+  """
+  loop = asyncio.get_running_loop()
+  hook = _run_on_shutdown(callback)
+  # Starting the generator on the running loop registers it with the loop.
+  try:
+    hook.asend(None).send(None)
+  except StopIteration:
+    pass
+  with _shutdown_hooks_lock:
+    _shutdown_hooks.setdefault(loop, set()).add(hook)
+
+
+async def close_on_loop(
+    loop: asyncio.AbstractEventLoop,
+    close: Callable[[], Awaitable[None]],
+    description: str,
+) -> None:
+  """Awaits `close` on `loop`, the event loop a resource is bound to.
+
+  Args:
+    loop: The event loop the resource was created on.
+    close: The coroutine function closing the resource.
+    description: Describes the resource in log messages.
+  """
+  try:
+    if loop is asyncio.get_running_loop():
+      await close()
+    elif loop.is_closed():
+      logger.debug(
+          'Not closing %s: its event loop is closed, resources may be leaked.',
+          description,
+      )
+    else:
+      # The loop is running in another thread.
+      asyncio.run_coroutine_threadsafe(close(), loop)
+  except Exception as e:  # pylint: disable=broad-exception-caught
+    logger.warning('Error closing %s: %s', description, e)
@@ -0,0 +1,83 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A small thread-safe LRU cache used by in-process caches across ADK."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import Generic
+from typing import Hashable
+from typing import Optional
+from typing import TypeVar
+
+_K = TypeVar('_K', bound=Hashable)
+_V = TypeVar('_V')
+
+
+class LruCache(Generic[_K, _V]):
+  """A thread-safe, entry-bounded least-recently-used cache.
+
+  Attributes:
+    max_entries: The maximum number of entries kept before the least recently
+      used entry is evicted.
+    hits: The number of successful lookups.
+    misses: The number of failed lookups.
+  """
+
+  def __init__(self, max_entries: int):
+    if max_entries <= 0:
+      raise ValueError('max_entries must be positive.')
+    self.max_entries = max_entries
+    self.hits = 0
+    self.misses = 0
+    self._entries: OrderedDict[_K, _V] = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, key: _K) -> Optional[_V]:
+    """Returns the cached value for `key` and marks it as recently used."""
+    with self._lock:
+      if key not in self._entries:
+        self.misses += 1
+        return None
+      self._entries.move_to_end(key)
+      self.hits += 1
+      return self._entries[key]
+
+  def put(self, key: _K, value: _V) -> None:
+    """Stores `value` under `key`, evicting the oldest entries if needed."""
+    with self._lock:
+      self._entries[key] = value
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+
+  def pop(self, key: _K) -> Optional[_V]:
+    """Removes and returns the value for `key` if present."""
+    with self._lock:
+      return self._entries.pop(key, None)
+
+  def clear(self) -> None:
+    """Removes all entries. Hit and miss counters are preserved."""
+    with self._lock:
+      self._entries.clear()
+
+  def __contains__(self, key: object) -> bool:
+    with self._lock:
+      return key in self._entries
+
+  def __len__(self) -> int:
+    with self._lock:
+      return len(self._entries)
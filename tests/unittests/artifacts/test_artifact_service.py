@@ -16,10 +16,12 @@
 
 """Tests for the artifact service."""
 
+import contextlib
 from datetime import datetime
 import enum
 import json
 from pathlib import Path
+import time
 from typing import Any
 from typing import Optional
 from typing import Union
@@ -33,6 +35,8 @@ from google.adk.artifacts.file_artifact_service import FileArtifactService
 from google.adk.artifacts.gcs_artifact_service import GcsArtifactService
 from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
 from google.adk.errors.input_validation_error import InputValidationError
+from google.api_core.exceptions import NotFound
+from google.api_core.exceptions import PreconditionFailed
 from google.genai import types
 import pytest
 
@@ -67,16 +71,24 @@ class MockBlob:
     self.content_type: Optional[str] = None
     self.time_created = FIXED_DATETIME
     self.metadata: dict[str, Any] = {}
+    self.metageneration = 0
 
   def upload_from_string(
-      self, data: Union[str, bytes], content_type: Optional[str] = None
+      self,
+      data: Union[str, bytes],
+      content_type: Optional[str] = None,
+      if_generation_match: Optional[int] = None,
   ) -> None:
     """Mocks uploading data to the blob (from a string or bytes).
 
     Args:
         data: The data to upload (string or bytes).
         content_type:  The content type of the data (optional).
+        if_generation_match: If 0, only upload if the blob does not exist.
     """
+    if if_generation_match == 0 and self.content is not None:
+      raise PreconditionFailed("Blob exists.")
+    self.metageneration = 1
     if isinstance(data, str):
       self.content = data.encode("utf-8")
     elif isinstance(data, bytes):
@@ -87,9 +99,45 @@ class MockBlob:
     if content_type:
       self.content_type = content_type
 
-  def download_as_bytes(self) -> bytes:
+  def upload_from_file(
+      self,
+      file_obj: Any,
+      rewind: bool = False,
+      content_type: Optional[str] = None,
+      if_generation_match: Optional[int] = None,
+  ) -> None:
+    """Mocks uploading the content of a file object to the blob."""
+    if rewind:
+      file_obj.seek(0)
+    self.upload_from_string(
+        file_obj.read(),
+        content_type=content_type,
+        if_generation_match=if_generation_match,
+    )
+
+  def reload(self) -> None:
+    """Mocks reloading the blob's properties."""
+
+  def patch(self) -> None:
+    """Mocks updating the blob's metadata."""
+    if self.content is None:
+      raise NotFound("Blob not found.")
+    self.metageneration += 1
+
+  @property
+  def size(self) -> Optional[int]:
+    """The size of the blob's content, or None if it has no content."""
+    return None if self.content is None else len(self.content)
+
+  def download_as_bytes(
+      self, start: Optional[int] = None, end: Optional[int] = None
+  ) -> bytes:
     """Mocks downloading the blob's content as bytes.
 
+    Args:
+        start: The offset of the first byte to download (optional).
+        end: The offset of the last byte to download, inclusive (optional).
+
     Returns:
         bytes: The content of the blob as bytes.
 
@@ -98,10 +146,15 @@ class MockBlob:
     """
     if self.content is None:
       return b""
-    return self.content
+    return self.content[start : None if end is None else end + 1]
 
-  def delete(self) -> None:
+  def delete(self, if_metageneration_match: Optional[int] = None) -> None:
     """Mocks deleting a blob."""
+    if if_metageneration_match is not None:
+      if self.content is None:
+        raise NotFound("Blob not found.")
+      if if_metageneration_match != self.metageneration:
+        raise PreconditionFailed("Metageneration mismatch.")
     self.content = None
     self.content_type = None
 
@@ -145,6 +198,8 @@ class MockClient:
   def __init__(self) -> None:
     """Initializes MockClient."""
     self.buckets: dict[str, MockBucket] = {}
+    self.list_blobs_fields: list[Optional[str]] = []
+    self.batch_count = 0
 
   def bucket(self, bucket_name: str) -> MockBucket:
     """Mocks getting a Bucket object."""
@@ -152,15 +207,28 @@ class MockClient:
       self.buckets[bucket_name] = MockBucket(bucket_name)
     return self.buckets[bucket_name]
 
-  def list_blobs(self, bucket: MockBucket, prefix: Optional[str] = None):
+  def list_blobs(
+      self,
+      bucket: MockBucket,
+      prefix: Optional[str] = None,
+      max_results: Optional[int] = None,
+      fields: Optional[str] = None,
+  ):
     """Mocks listing blobs in a bucket, optionally with a prefix."""
-    if prefix:
-      return [
-          blob
-          for name, blob in bucket.blobs.items()
-          if name.startswith(prefix) and blob.content is not None
-      ]
-    return [blob for blob in bucket.blobs.values() if blob.content is not None]
+    self.list_blobs_fields.append(fields)
+    blobs = [
+        blob
+        for name, blob in bucket.blobs.items()
+        if name.startswith(prefix or "") and blob.content is not None
+    ]
+    return blobs[:max_results]
+
+  @contextlib.contextmanager
+  def batch(self, raise_exception: bool = True):
+    """Mocks a batch request, whose calls are made when it exits."""
+    del raise_exception
+    self.batch_count += 1
+    yield
 
 
 def mock_gcs_artifact_service():
@@ -766,3 +834,659 @@ async def test_file_save_artifact_rejects_absolute_path_within_scope(tmp_path):
         filename=str(absolute_in_scope),
         artifact=part,
     )
+
+
+@pytest.mark.asyncio
+async def test_file_loads_use_manifest_instead_of_metadata_files(tmp_path):
+  """Versions and metadata are read from the manifest of the scope."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  for data in (b"v0", b"v1"):
+    await artifact_service.save_artifact(
+        app_name="myapp",
+        user_id="user123",
+        session_id="sess789",
+        filename="docs/report.bin",
+        artifact=types.Part.from_bytes(data=data, mime_type="image/png"),
+        custom_metadata={"data": data.decode()},
+    )
+  session_root = (
+      tmp_path / "artifacts" / "users" / "user123" / "sessions" / "sess789"
+  )
+  manifest = session_root / "manifest.jsonl"
+  assert len(manifest.read_text(encoding="utf-8").splitlines()) == 2
+  for metadata_path in session_root.glob("artifacts/**/metadata.json"):
+    metadata_path.unlink()
+
+  loaded = await artifact_service.load_artifact(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess789",
+      filename="docs/report.bin",
+  )
+  version = await artifact_service.get_artifact_version(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess789",
+      filename="docs/report.bin",
+  )
+
+  assert loaded == types.Part.from_bytes(data=b"v1", mime_type="image/png")
+  assert version.version == 1
+  assert version.custom_metadata == {"data": "v1"}
+
+
+@pytest.mark.asyncio
+async def test_file_manifests_are_shared_between_instances(tmp_path):
+  """Instances on the same root see each other's saves and deletes."""
+  writer = FileArtifactService(root_dir=tmp_path / "artifacts")
+  reader = FileArtifactService(root_dir=tmp_path / "artifacts")
+
+  async def save(text):
+    return await writer.save_artifact(
+        app_name="myapp",
+        user_id="user123",
+        filename="user:notes.txt",
+        artifact=types.Part(text=text),
+    )
+
+  async def load():
+    return await reader.load_artifact(
+        app_name="myapp", user_id="user123", filename="user:notes.txt"
+    )
+
+  assert await load() is None
+  await save("first")
+  assert await load() == types.Part(text="first")
+  await save("second")
+  assert await load() == types.Part(text="second")
+  await writer.delete_artifact(
+      app_name="myapp", user_id="user123", filename="user:notes.txt"
+  )
+  assert await load() is None
+  assert await save("again") == 0
+  assert await reader.list_artifact_keys(
+      app_name="myapp", user_id="user123", session_id="sess789"
+  ) == ["user:notes.txt"]
+
+
+@pytest.mark.asyncio
+async def test_file_manifests_are_rebuilt_from_disk(tmp_path):
+  """Missing manifests are rebuilt, and unrecorded versions are recovered."""
+  root_dir = tmp_path / "artifacts"
+  artifact_service = FileArtifactService(root_dir=root_dir)
+  for text in ("v0", "v1"):
+    await artifact_service.save_artifact(
+        app_name="myapp",
+        user_id="user123",
+        session_id="sess789",
+        filename="report.txt",
+        artifact=types.Part(text=text),
+    )
+  session_root = root_dir / "users" / "user123" / "sessions" / "sess789"
+  (session_root / "manifest.jsonl").unlink()
+
+  # Stores without manifests, e.g. written by earlier versions, are indexed
+  # on first access.
+  artifact_service = FileArtifactService(root_dir=root_dir)
+  assert await artifact_service.list_versions(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess789",
+      filename="report.txt",
+  ) == [0, 1]
+
+  # A version written without being recorded is only listed after a rebuild.
+  versions_dir = session_root / "artifacts" / "report.txt" / "versions"
+  (versions_dir / "2").mkdir()
+  (versions_dir / "2" / "report.txt").write_text("v2", encoding="utf-8")
+  assert (
+      await artifact_service.load_artifact(
+          app_name="myapp",
+          user_id="user123",
+          session_id="sess789",
+          filename="report.txt",
+      )
+  ) == types.Part(text="v1")
+  assert (
+      await artifact_service.save_artifact(
+          app_name="myapp",
+          user_id="user123",
+          session_id="sess789",
+          filename="report.txt",
+          artifact=types.Part(text="v3"),
+      )
+      == 3
+  )
+
+  await artifact_service.rebuild_manifests()
+
+  assert await artifact_service.list_versions(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess789",
+      filename="report.txt",
+  ) == [0, 1, 2, 3]
+  assert (
+      await artifact_service.load_artifact(
+          app_name="myapp",
+          user_id="user123",
+          session_id="sess789",
+          filename="report.txt",
+          version=2,
+      )
+  ) == types.Part(text="v2")
+
+
+@pytest.mark.asyncio
+async def test_file_load_and_list_with_many_artifacts(tmp_path):
+  """Tests loads and listings of a session with many artifacts."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  num_artifacts, num_versions = 20, 5
+  for i in range(num_artifacts):
+    for version in range(num_versions if i == 0 else 1):
+      await artifact_service.save_artifact(
+          app_name="myapp",
+          user_id="user123",
+          session_id="sess789",
+          filename=f"dir{i % 10}/file{i}.txt",
+          artifact=types.Part(text=f"content {version}"),
+      )
+
+  latest = await artifact_service.load_artifact(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess789",
+      filename="dir0/file0.txt",
+  )
+  keys = await artifact_service.list_artifact_keys(
+      app_name="myapp", user_id="user123", session_id="sess789"
+  )
+
+  assert latest == types.Part(text=f"content {num_versions - 1}")
+  assert sorted(keys) == sorted(
+      f"dir{i % 10}/file{i}.txt" for i in range(num_artifacts)
+  )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
+)
+async def test_artifact_writer_and_reader(
+    service_type, artifact_service_factory
+):
+  """Tests writing and reading artifacts in chunks."""
+  artifact_service = artifact_service_factory(service_type)
+  payload = bytes(range(256)) * 40
+
+  async with await artifact_service.open_artifact_writer(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="data.bin",
+      mime_type="application/octet-stream",
+      custom_metadata={"source": "stream"},
+  ) as writer:
+    for i in range(0, len(payload), 1000):
+      await writer.write(payload[i : i + 1000])
+  with pytest.raises(RuntimeError):
+    async with await artifact_service.open_artifact_writer(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="data.bin",
+        mime_type="application/octet-stream",
+    ) as writer:
+      await writer.write(b"discarded")
+      raise RuntimeError("aborted")
+
+  assert await artifact_service.list_versions(
+      app_name="app0", user_id="user0", session_id="123", filename="data.bin"
+  ) == [0]
+  assert await artifact_service.load_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="data.bin"
+  ) == types.Part.from_bytes(data=payload, mime_type="application/octet-stream")
+  artifact_version = await artifact_service.get_artifact_version(
+      app_name="app0", user_id="user0", session_id="123", filename="data.bin"
+  )
+  assert artifact_version.custom_metadata == {"source": "stream"}
+
+  async with await artifact_service.open_artifact_reader(
+      app_name="app0", user_id="user0", session_id="123", filename="data.bin"
+  ) as reader:
+    assert reader.version == 0
+    assert reader.size == len(payload)
+    assert reader.mime_type == "application/octet-stream"
+    assert await reader.read() == payload
+    chunks = [
+        chunk async for chunk in reader.iter_bytes(100, 2600, chunk_size=1000)
+    ]
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+    assert b"".join(chunks) == payload[100:2600]
+    assert [chunk async for chunk in reader.iter_bytes(len(payload))] == []
+    with pytest.raises(ValueError):
+      async for _ in reader.iter_bytes(0, len(payload) + 1):
+        pass
+
+  assert (
+      await artifact_service.open_artifact_reader(
+          app_name="app0",
+          user_id="user0",
+          session_id="123",
+          filename="data.bin",
+          version=1,
+      )
+      is None
+  )
+  assert (
+      await artifact_service.open_artifact_reader(
+          app_name="app0", user_id="user0", session_id="123", filename="x"
+      )
+      is None
+  )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type",
+    [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.FILE],
+)
+async def test_artifact_reader_reads_text_artifacts(
+    service_type, artifact_service_factory
+):
+  """Tests reading text artifacts saved with save_artifact."""
+  artifact_service = artifact_service_factory(service_type)
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="notes.txt",
+      artifact=types.Part(text="héllo"),
+  )
+
+  async with await artifact_service.open_artifact_reader(
+      app_name="app0", user_id="user0", session_id="123", filename="notes.txt"
+  ) as reader:
+    assert reader.mime_type is None
+    assert await reader.read() == "héllo".encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_reader_reads_empty_artifacts(tmp_path):
+  """Tests reading empty payloads, which cannot be memory-mapped."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="empty.bin",
+      artifact=types.Part.from_bytes(data=b"", mime_type="image/png"),
+  )
+
+  async with await artifact_service.open_artifact_reader(
+      app_name="app0", user_id="user0", session_id="123", filename="empty.bin"
+  ) as reader:
+    assert (reader.size, reader.mime_type) == (0, "image/png")
+    assert await reader.read() == b""
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_writer_abort_leaves_no_files(tmp_path):
+  """Tests that aborted writes leave no temporary files behind."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  writer = await artifact_service.open_artifact_writer(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="data.bin",
+      mime_type="application/octet-stream",
+  )
+  await writer.write(b"partial")
+  await writer.abort()
+
+  assert not [path for path in tmp_path.rglob("*") if path.is_file()][1:]
+  assert not await artifact_service.list_artifact_keys(
+      app_name="app0", user_id="user0", session_id="123"
+  )
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_reader_reads_bounded_chunks(tmp_path):
+  """Tests that a large artifact is read in chunks of at most chunk_size."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  payload = bytes(range(256)) * 1024
+  async with await artifact_service.open_artifact_writer(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="large.bin",
+      mime_type="application/octet-stream",
+  ) as writer:
+    for offset in range(0, len(payload), 100_000):
+      await writer.write(payload[offset : offset + 100_000])
+
+  async with await artifact_service.open_artifact_reader(
+      app_name="app0", user_id="user0", session_id="123", filename="large.bin"
+  ) as reader:
+    chunks = [chunk async for chunk in reader.iter_bytes(chunk_size=64 * 1024)]
+
+  assert b"".join(chunks) == payload
+  assert [len(chunk) for chunk in chunks] == [64 * 1024] * 4
+
+
+def _deduplicating_artifact_service(service_type, tmp_path):
+  if service_type == ArtifactServiceType.GCS:
+    with mock.patch("google.cloud.storage.Client", return_value=MockClient()):
+      return GcsArtifactService(bucket_name="test_bucket", deduplicate=True)
+  return FileArtifactService(root_dir=tmp_path / "artifacts", deduplicate=True)
+
+
+def _stored_blobs(artifact_service):
+  if isinstance(artifact_service, GcsArtifactService):
+    return [
+        blob.content
+        for name, blob in artifact_service.bucket.blobs.items()
+        if name.startswith(".blobs/") and ".refs/" not in name and blob.content
+    ]
+  return [
+      path.read_bytes()
+      for path in (artifact_service.root_dir / "blobs").rglob("*")
+      if path.is_file()
+  ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type", [ArtifactServiceType.GCS, ArtifactServiceType.FILE]
+)
+async def test_deduplicated_artifacts(service_type, tmp_path):
+  """Tests that identical payloads are stored once, until deleted."""
+  artifact_service = _deduplicating_artifact_service(service_type, tmp_path)
+  payload = b"%PDF invoice" * 100
+  for session_id, filename, mime_type in [
+      ("s1", "invoice.pdf", "application/pdf"),
+      ("s2", "invoice.pdf", "application/pdf"),
+      ("s2", "copy.bin", "application/octet-stream"),
+  ]:
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id=session_id,
+        filename=filename,
+        artifact=types.Part.from_bytes(data=payload, mime_type=mime_type),
+        custom_metadata={"session": session_id},
+    )
+  async with await artifact_service.open_artifact_writer(
+      app_name="app0",
+      user_id="user0",
+      session_id="s3",
+      filename="streamed.pdf",
+      mime_type="application/pdf",
+  ) as writer:
+    await writer.write(payload[:500])
+    await writer.write(payload[500:])
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="s3",
+      filename="notes.txt",
+      artifact=types.Part(text="unique"),
+  )
+
+  assert sorted(_stored_blobs(artifact_service)) == [payload, b"unique"]
+  assert await artifact_service.load_artifact(
+      app_name="app0", user_id="user0", session_id="s2", filename="copy.bin"
+  ) == types.Part.from_bytes(data=payload, mime_type="application/octet-stream")
+  artifact_version = await artifact_service.get_artifact_version(
+      app_name="app0", user_id="user0", session_id="s2", filename="copy.bin"
+  )
+  assert artifact_version.custom_metadata == {"session": "s2"}
+  assert artifact_version.mime_type == "application/octet-stream"
+  async with await artifact_service.open_artifact_reader(
+      app_name="app0", user_id="user0", session_id="s3", filename="streamed.pdf"
+  ) as reader:
+    assert reader.mime_type == "application/pdf"
+    assert await reader.read() == payload
+
+  for session_id, filename in [
+      ("s1", "invoice.pdf"),
+      ("s2", "invoice.pdf"),
+      ("s2", "copy.bin"),
+  ]:
+    await artifact_service.delete_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id=session_id,
+        filename=filename,
+    )
+  assert sorted(_stored_blobs(artifact_service)) == [payload, b"unique"]
+  assert await artifact_service.load_artifact(
+      app_name="app0", user_id="user0", session_id="s3", filename="streamed.pdf"
+  ) == types.Part.from_bytes(data=payload, mime_type="application/pdf")
+
+  await artifact_service.delete_artifact(
+      app_name="app0", user_id="user0", session_id="s3", filename="streamed.pdf"
+  )
+  assert _stored_blobs(artifact_service) == [b"unique"]
+
+
+@pytest.mark.asyncio
+async def test_file_deduplicated_payloads_are_hard_links(tmp_path):
+  """Tests that version files link to blobs, and unlinked blobs are deleted."""
+  artifact_service = FileArtifactService(
+      root_dir=tmp_path / "artifacts", deduplicate=True
+  )
+  for session_id in ["s1", "s2"]:
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id=session_id,
+        filename="image.png",
+        artifact=types.Part.from_bytes(data=b"png", mime_type="image/png"),
+    )
+  [blob_path] = (artifact_service.root_dir / "blobs").rglob("*/*/*")
+  assert blob_path.stat().st_nlink == 3
+  canonical_uri = (
+      await artifact_service.get_artifact_version(
+          app_name="app0",
+          user_id="user0",
+          session_id="s1",
+          filename="image.png",
+      )
+  ).canonical_uri
+  assert Path(unquote(urlparse(canonical_uri).path)).samefile(blob_path)
+
+  assert await artifact_service.collect_garbage() == 0
+  # Deleted by other means than the service.
+  for path in (artifact_service.root_dir / "users").rglob("image.png"):
+    if path.is_file():
+      path.unlink()
+  assert await artifact_service.collect_garbage() == 1
+  assert not blob_path.exists()
+
+
+def _disk_usage(root: Path) -> int:
+  """Returns the bytes used by the files beneath root, counting links once."""
+  inodes = {}
+  for path in root.rglob("*"):
+    if path.is_file():
+      stat = path.stat()
+      inodes[stat.st_ino] = stat.st_size
+  return sum(inodes.values())
+
+
+@pytest.mark.asyncio
+async def test_file_deduplication_storage_savings(tmp_path):
+  """Tests storage of a workload re-saving the same files."""
+  num_sessions, num_files = 10, 4
+  files = [bytes([i]) * (20 * 1024) for i in range(num_files)]
+
+  async def save_all(artifact_service):
+    for session in range(num_sessions):
+      # Every session saves some of the same uploaded files.
+      for i, data in enumerate(files[: num_files // 2 + session % 3]):
+        await artifact_service.save_artifact(
+            app_name="app0",
+            user_id="user0",
+            session_id=f"session{session}",
+            filename=f"upload{i}.pdf",
+            artifact=types.Part.from_bytes(
+                data=data, mime_type="application/pdf"
+            ),
+        )
+
+  usages = {}
+  for deduplicate in [False, True]:
+    artifact_service = FileArtifactService(
+        root_dir=tmp_path / str(deduplicate), deduplicate=deduplicate
+    )
+    await save_all(artifact_service)
+    usages[deduplicate] = _disk_usage(artifact_service.root_dir)
+
+  assert usages[True] < usages[False] / 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("deduplicate", [False, True])
+async def test_gcs_deletes_are_batched(deduplicate):
+  """Tests that versions and their references are deleted in batches."""
+  client = MockClient()
+  with mock.patch("google.cloud.storage.Client", return_value=client):
+    artifact_service = GcsArtifactService(
+        bucket_name="test_bucket", deduplicate=deduplicate
+    )
+  for i in range(150):
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="data.bin",
+        artifact=types.Part.from_bytes(
+            data=bytes([i % 3]), mime_type="application/octet-stream"
+        ),
+    )
+
+  await artifact_service.delete_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="data.bin"
+  )
+
+  assert not await artifact_service.list_versions(
+      app_name="app0", user_id="user0", session_id="123", filename="data.bin"
+  )
+  assert not [
+      name
+      for name, blob in client.bucket("test_bucket").blobs.items()
+      if blob.content is not None
+  ]
+  assert client.batch_count == (4 if deduplicate else 2)
+
+
+@pytest.mark.asyncio
+async def test_gcs_listings_request_only_used_fields():
+  """Tests that listings project the fields of the listed blobs."""
+  client = MockClient()
+  with mock.patch("google.cloud.storage.Client", return_value=client):
+    artifact_service = GcsArtifactService(bucket_name="test_bucket")
+  for filename in ["a.txt", "user:b.txt"]:
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename=filename,
+        artifact=types.Part(text="text"),
+        custom_metadata={"key": "value"},
+    )
+  client.list_blobs_fields.clear()
+
+  assert await artifact_service.list_artifact_keys(
+      app_name="app0", user_id="user0", session_id="123"
+  ) == ["a.txt", "user:b.txt"]
+  [artifact_version] = await artifact_service.list_artifact_versions(
+      app_name="app0", user_id="user0", session_id="123", filename="a.txt"
+  )
+  await artifact_service.load_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="a.txt"
+  )
+
+  assert artifact_version.custom_metadata == {"key": "value"}
+  assert artifact_version.mime_type == "text/plain"
+  assert len(client.list_blobs_fields) == 4
+  assert None not in client.list_blobs_fields
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+)
+async def test_load_artifacts(service_type, artifact_service_factory):
+  """Tests loading the latest versions of many artifacts at once."""
+  artifact_service = artifact_service_factory(service_type)
+  for filename, text in [("a.txt", "a0"), ("a.txt", "a1"), ("user:b.txt", "b")]:
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename=filename,
+        artifact=types.Part.from_bytes(
+            data=text.encode(), mime_type="text/plain"
+        ),
+    )
+
+  artifacts = await artifact_service.load_artifacts(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filenames=["a.txt", "user:b.txt", "missing.txt"],
+  )
+
+  assert {
+      filename: artifact.inline_data.data if artifact else None
+      for filename, artifact in artifacts.items()
+  } == {"a.txt": b"a1", "user:b.txt": b"b", "missing.txt": None}
+
+
+@pytest.mark.asyncio
+async def test_gcs_load_artifacts_concurrency():
+  """Tests that load_artifacts downloads concurrently, up to the limit."""
+  latency_seconds, num_artifacts, max_concurrency = 0.01, 16, 4
+  with mock.patch("google.cloud.storage.Client", return_value=MockClient()):
+    artifact_service = GcsArtifactService(
+        bucket_name="test_bucket", max_concurrency=max_concurrency
+    )
+  filenames = [f"image{i}.png" for i in range(num_artifacts)]
+  for filename in filenames:
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename=filename,
+        artifact=types.Part.from_bytes(data=b"png", mime_type="image/png"),
+    )
+
+  in_flight = []
+  max_in_flight = 0
+  download_as_bytes = MockBlob.download_as_bytes
+
+  def slow_download(blob, *args, **kwargs):
+    nonlocal max_in_flight
+    in_flight.append(blob)
+    max_in_flight = max(max_in_flight, len(in_flight))
+    time.sleep(latency_seconds)
+    in_flight.remove(blob)
+    return download_as_bytes(blob, *args, **kwargs)
+
+  with mock.patch.object(
+      MockBlob, "download_as_bytes", autospec=True, side_effect=slow_download
+  ):
+    artifacts = await artifact_service.load_artifacts(
+        app_name="app0", user_id="user0", session_id="123", filenames=filenames
+    )
+
+  assert list(artifacts) == filenames
+  assert all(artifacts.values())
+  assert 1 < max_in_flight <= max_concurrency
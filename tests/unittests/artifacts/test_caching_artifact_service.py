@@ -0,0 +1,277 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the caching artifact service."""
+
+from unittest import mock
+
+from google.adk.artifacts.caching_artifact_service import CachingArtifactService
+from google.adk.artifacts.file_artifact_service import FileArtifactService
+from google.adk.artifacts.gcs_artifact_service import GcsArtifactService
+from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+from google.genai import types
+import pytest
+
+from .test_artifact_service import MockBlob
+from .test_artifact_service import MockClient
+
+APP_NAME = "app0"
+USER_ID = "user0"
+SESSION_ID = "session0"
+
+
+class FakeTimer:
+
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self):
+    return self.now
+
+
+@pytest.fixture
+def gcs_service():
+  with mock.patch("google.cloud.storage.Client", return_value=MockClient()):
+    return GcsArtifactService(bucket_name="test_bucket")
+
+
+@pytest.fixture
+def downloads():
+  """Counts the blob downloads of the fake storage client."""
+  download_as_bytes = MockBlob.download_as_bytes
+  with mock.patch.object(
+      MockBlob,
+      "download_as_bytes",
+      autospec=True,
+      side_effect=download_as_bytes,
+  ) as mock_download:
+    yield mock_download
+
+
+async def _save(artifact_service, filename, data, mime_type="image/png"):
+  return await artifact_service.save_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename=filename,
+      artifact=types.Part.from_bytes(data=data, mime_type=mime_type),
+  )
+
+
+async def _load(artifact_service, filename, version=None):
+  return await artifact_service.load_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename=filename,
+      version=version,
+  )
+
+
+@pytest.mark.asyncio
+async def test_versions_are_downloaded_once(gcs_service, downloads):
+  timer = FakeTimer()
+  artifact_service = CachingArtifactService(gcs_service, timer=timer)
+  await _save(artifact_service, "image.png", b"v0")
+  await _save(gcs_service, "image.png", b"v1")
+
+  for _ in range(3):
+    assert await _load(artifact_service, "image.png", 0) == (
+        types.Part.from_bytes(data=b"v0", mime_type="image/png")
+    )
+  # The latest version saved through the cache is known for a while, even if
+  # another service saved a later one.
+  assert (await _load(artifact_service, "image.png")).inline_data.data == b"v0"
+  timer.now += 10
+  assert (await _load(artifact_service, "image.png")).inline_data.data == b"v1"
+  assert (await _load(artifact_service, "image.png")).inline_data.data == b"v1"
+  assert await _load(artifact_service, "missing.png") is None
+
+  assert downloads.call_count == 2
+  assert artifact_service.memory_hits == 4
+  assert artifact_service.misses == 2
+  assert artifact_service.hit_rate == pytest.approx(4 / 6)
+  assert artifact_service.latest_version_hits == 2
+  assert artifact_service.latest_version_misses == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_is_bounded_by_bytes(gcs_service, downloads):
+  artifact_service = CachingArtifactService(gcs_service, max_memory_bytes=250)
+  for i in range(3):
+    await _save(artifact_service, f"file{i}.bin", bytes([i]) * 100)
+  await _save(artifact_service, "large.bin", b"x" * 300)
+
+  for i in [0, 1, 2, 1, 2]:
+    await _load(artifact_service, f"file{i}.bin", 0)
+  await _load(artifact_service, "large.bin", 0)
+  await _load(artifact_service, "large.bin", 0)
+
+  assert artifact_service.memory_hits == 2
+  assert downloads.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_survives_memory_evictions_and_restarts(
+    gcs_service, downloads, tmp_path
+):
+  def caching_service():
+    return CachingArtifactService(
+        gcs_service,
+        max_memory_bytes=150,
+        disk_cache_dir=tmp_path / "cache",
+        max_disk_bytes=1000,
+    )
+
+  artifact_service = caching_service()
+  await _save(artifact_service, "a.bin", b"a" * 100)
+  await artifact_service.save_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      filename="user:notes.txt",
+      artifact=types.Part(text="notes" * 20),
+  )
+
+  await _load(artifact_service, "a.bin", 0)
+  # Evicts a.bin from memory.
+  await _load(artifact_service, "user:notes.txt", 0)
+  assert await _load(artifact_service, "a.bin", 0) == types.Part.from_bytes(
+      data=b"a" * 100, mime_type="image/png"
+  )
+  restarted_service = caching_service()
+  assert await restarted_service.load_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id="another-session",
+      filename="user:notes.txt",
+      version=0,
+  ) == types.Part.from_bytes(data=b"notes" * 20, mime_type="text/plain")
+
+  assert downloads.call_count == 2
+  assert artifact_service.disk_hits == 1
+  assert restarted_service.disk_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_deleted_artifacts_are_evicted(tmp_path):
+  artifact_service = CachingArtifactService(
+      InMemoryArtifactService(), disk_cache_dir=tmp_path / "cache"
+  )
+  await _save(artifact_service, "image.png", b"old")
+  assert (await _load(artifact_service, "image.png")).inline_data.data == b"old"
+
+  await artifact_service.delete_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename="image.png",
+  )
+  assert await _load(artifact_service, "image.png") is None
+  await _save(artifact_service, "image.png", b"new")
+
+  assert (await _load(artifact_service, "image.png", 0)).inline_data.data == (
+      b"new"
+  )
+  assert not [
+      path for path in (tmp_path / "cache").rglob("*") if path.is_file()
+  ][1:]
+
+
+@pytest.mark.asyncio
+async def test_streamed_writes_update_latest_version():
+  artifact_service = CachingArtifactService(InMemoryArtifactService())
+  await _save(artifact_service, "data.bin", b"v0")
+  await _load(artifact_service, "data.bin")
+
+  async with await artifact_service.open_artifact_writer(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename="data.bin",
+      mime_type="application/octet-stream",
+  ) as writer:
+    await writer.write(b"v1")
+
+  assert (await _load(artifact_service, "data.bin")).inline_data.data == b"v1"
+
+
+@pytest.mark.asyncio
+async def test_loaded_artifacts_are_copies(gcs_service):
+  artifact_service = CachingArtifactService(gcs_service)
+  await _save(artifact_service, "image.png", b"v0")
+
+  for _ in range(2):
+    artifact = await _load(artifact_service, "image.png", 0)
+    assert artifact.inline_data.data == b"v0"
+    artifact.inline_data.data = b"modified"
+
+  assert artifact_service.memory_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_ignores_recreated_versions(tmp_path):
+  backing_service = InMemoryArtifactService()
+
+  def caching_service():
+    return CachingArtifactService(
+        backing_service, disk_cache_dir=tmp_path / "cache"
+    )
+
+  artifact_service = caching_service()
+  await _save(artifact_service, "image.png", b"old")
+  assert (await _load(artifact_service, "image.png", 0)).inline_data.data == (
+      b"old"
+  )
+  # Another process deletes the artifact and saves it again as version 0.
+  await backing_service.delete_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename="image.png",
+  )
+  await _save(backing_service, "image.png", b"new")
+
+  restarted_service = caching_service()
+  assert (
+      await _load(restarted_service, "image.png", 0)
+  ).inline_data.data == b"new"
+  assert restarted_service.disk_hits == 0
+  assert restarted_service.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_file_artifacts_are_served_from_disk_cache(tmp_path):
+  file_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  payloads = [bytes([i]) * 1024 for i in range(5)]
+  for i, data in enumerate(payloads):
+    await _save(file_service, f"image{i}.png", data)
+
+  def caching_service():
+    return CachingArtifactService(
+        file_service, disk_cache_dir=tmp_path / "cache"
+    )
+
+  artifact_service = caching_service()
+  for _ in range(3):
+    for i in range(len(payloads)):
+      await _load(artifact_service, f"image{i}.png", 0)
+  restarted_service = caching_service()
+  for i, data in enumerate(payloads):
+    assert (
+        await _load(restarted_service, f"image{i}.png", 0)
+    ).inline_data.data == data
+
+  assert artifact_service.misses == len(payloads)
+  assert artifact_service.memory_hits == 2 * len(payloads)
+  assert restarted_service.disk_hits == len(payloads)
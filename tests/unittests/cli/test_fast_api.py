@@ -30,6 +30,7 @@ from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.run_config import RunConfig
 from google.adk.apps.app import App
 from google.adk.artifacts.base_artifact_service import ArtifactVersion
+from google.adk.artifacts.base_artifact_service import BaseArtifactService
 from google.adk.cli import fast_api as fast_api_module
 from google.adk.cli.fast_api import get_fast_api_app
 from google.adk.errors.input_validation_error import InputValidationError
@@ -394,6 +395,8 @@ def mock_artifact_service():
           return entry["metadata"]
       return None
 
+    open_artifact_reader = BaseArtifactService.open_artifact_reader
+
   return MockArtifactService()
 
 
@@ -1303,6 +1306,108 @@ def test_list_artifact_versions_metadata(
   assert data[1]["customMetadata"] == {"foo": "bar"}
 
 
+def test_stream_artifact_content(
+    test_app, create_test_session, mock_artifact_service
+):
+  """Test streaming the payload of an artifact, whole and in byte ranges."""
+  info = create_test_session
+  payload = bytes(range(100))
+  mock_artifact_service.add_artifact(
+      app_name=info["app_name"],
+      user_id=info["user_id"],
+      session_id=info["session_id"],
+      filename="data.bin",
+      artifact=types.Part.from_bytes(data=payload, mime_type="image/png"),
+  )
+  mock_artifact_service.add_artifact(
+      app_name=info["app_name"],
+      user_id=info["user_id"],
+      session_id=info["session_id"],
+      filename="data.bin",
+      artifact=types.Part(text="v1"),
+  )
+  url = (
+      f"/apps/{info['app_name']}/users/{info['user_id']}/sessions/"
+      f"{info['session_id']}/artifacts/data.bin/content"
+  )
+
+  response = test_app.get(url, params={"version": 0})
+  assert response.status_code == 200
+  assert response.content == payload
+  assert response.headers["content-type"] == "image/png"
+  assert response.headers["accept-ranges"] == "bytes"
+  assert response.headers["x-content-type-options"] == "nosniff"
+  assert response.headers["content-disposition"] == (
+      "attachment; filename*=UTF-8''data.bin"
+  )
+
+  response = test_app.get(
+      url, params={"version": 0}, headers={"Range": "bytes=10-19"}
+  )
+  assert response.status_code == 206
+  assert response.content == payload[10:20]
+  assert response.headers["content-range"] == "bytes 10-19/100"
+
+  response = test_app.get(
+      url, params={"version": 0}, headers={"Range": "bytes=-5"}
+  )
+  assert response.status_code == 206
+  assert response.content == payload[-5:]
+
+  response = test_app.get(
+      url, params={"version": 0}, headers={"Range": "bytes=100-"}
+  )
+  assert response.status_code == 416
+  assert response.headers["content-range"] == "bytes */100"
+
+  response = test_app.get(url, headers={"Range": "bytes=0-0,5-6"})
+  assert response.status_code == 200
+  assert response.content == b"v1"
+  assert response.headers["content-type"].startswith("text/plain")
+
+  response = test_app.get(url, params={"version": 2})
+  assert response.status_code == 404
+
+
+def test_stream_artifact_content_closes_reader(
+    test_app, create_test_session, mock_artifact_service
+):
+  """Test that the artifact reader is closed once the response is sent."""
+  info = create_test_session
+  mock_artifact_service.add_artifact(
+      app_name=info["app_name"],
+      user_id=info["user_id"],
+      session_id=info["session_id"],
+      filename="data.bin",
+      artifact=types.Part.from_bytes(data=b"payload", mime_type="text/html"),
+  )
+  readers = []
+  open_artifact_reader = mock_artifact_service.open_artifact_reader
+
+  async def open_tracked_reader(**kwargs):
+    reader = await open_artifact_reader(**kwargs)
+    reader.aclose = AsyncMock(wraps=reader.aclose)
+    readers.append(reader)
+    return reader
+
+  url = (
+      f"/apps/{info['app_name']}/users/{info['user_id']}/sessions/"
+      f"{info['session_id']}/artifacts/data.bin/content"
+  )
+  with patch.object(
+      mock_artifact_service,
+      "open_artifact_reader",
+      side_effect=open_tracked_reader,
+  ):
+    response = test_app.get(url)
+    assert response.status_code == 200
+    response = test_app.get(url, headers={"Range": "bytes=100-"})
+    assert response.status_code == 416
+
+  assert all(reader.aclose.await_count >= 1 for reader in readers)
+  assert len(readers) == 2
+
+
 def test_get_eval_set_result_not_found(test_app):
   """Test getting an eval set result that doesn't exist."""
   url = "/apps/test_app_name/eval_results/test_eval_result_id_not_found"
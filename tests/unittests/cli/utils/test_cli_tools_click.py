@@ -922,3 +922,52 @@ def test_cli_deploy_cloud_run_gcloud_arg_conflict(
       " command."
   )
   assert expected_msg in result.output
+
+
+# cli compile_tools
+def test_cli_compile_tools_writes_bundles(tmp_path: Path) -> None:
+  """`adk compile_tools` should write one bundle per OpenAPI spec."""
+  spec_path = tmp_path / "spec.json"
+  spec_path.write_text(
+      json.dumps({
+          "openapi": "3.0.0",
+          "info": {"title": "Test", "version": "1.0"},
+          "paths": {
+              "/ping": {
+                  "get": {
+                      "operationId": "ping",
+                      "responses": {"200": {"description": "OK"}},
+                  }
+              }
+          },
+      })
+  )
+  output_dir = tmp_path / "bundles"
+
+  with mock.patch(
+      "google.adk.cli.cli_compile_tools.compile_google_api_tool_bundle"
+  ) as compile_google_api:
+    result = CliRunner().invoke(
+        cli_tools_click.main,
+        [
+            "compile_tools",
+            "--openapi_spec",
+            str(spec_path),
+            "--output_dir",
+            str(output_dir),
+        ],
+    )
+
+  assert result.exit_code == 0, (result.output, repr(result.exception))
+  assert len(list(output_dir.iterdir())) == 1
+  compile_google_api.assert_not_called()
+
+
+def test_cli_compile_tools_requires_a_source(tmp_path: Path) -> None:
+  result = CliRunner().invoke(
+      cli_tools_click.main,
+      ["compile_tools", "--output_dir", str(tmp_path)],
+  )
+
+  assert result.exit_code != 0
+  assert "--openapi_spec or --google_api" in result.output
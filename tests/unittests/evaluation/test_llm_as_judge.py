@@ -28,6 +28,7 @@ from google.adk.evaluation.llm_as_judge import AutoRaterScore
 from google.adk.evaluation.llm_as_judge import LlmAsJudge
 from google.adk.evaluation.llm_as_judge_utils import get_eval_status
 from google.adk.evaluation.llm_as_judge_utils import get_text_from_content
+from google.adk.models.base_llm import BaseLlm
 from google.adk.models.llm_response import LlmResponse
 from google.genai import types as genai_types
 import pytest
@@ -132,19 +133,29 @@ def test_llm_as_judge_init_unregistered_model():
     )
 
 
-@pytest.fixture
-def mock_judge_model(mocker):
-  mock_judge_model = mocker.MagicMock()
+class FakeJudgeModel(BaseLlm):
+  batch_sizes: list[int] = []
+  max_concurrencies: list[int] = []
+  silent: bool = False
+
+  async def generate_content_batch(self, llm_requests, **kwargs):
+    self.batch_sizes.append(len(llm_requests))
+    self.max_concurrencies.append(kwargs.get("max_concurrency"))
+    return await super().generate_content_batch(llm_requests, **kwargs)
 
-  async def mock_generate_content_async(llm_request):
+  async def generate_content_async(self, llm_request, stream=False):
+    if self.silent:
+      return
     yield LlmResponse(
         content=genai_types.Content(
             parts=[genai_types.Part(text="auto rater response")],
         )
     )
 
-  mock_judge_model.generate_content_async = mock_generate_content_async
-  return mock_judge_model
+
+@pytest.fixture
+def mock_judge_model():
+  return FakeJudgeModel(model="fake-judge")
 
 
 @pytest.mark.asyncio
@@ -237,3 +248,27 @@ async def test_evaluate_invocations_with_mock(
   assert mock_llm_as_judge.format_auto_rater_prompt.call_count == 2
   assert mock_llm_as_judge.convert_auto_rater_response_to_score.call_count == 6
   assert mock_llm_as_judge.aggregate_invocation_results.call_count == 1
+  # All samples of both invocations are sent as one batch, one at a time.
+  assert mock_judge_model.batch_sizes == [6]
+  assert mock_judge_model.max_concurrencies == [1]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_invocations_without_judge_responses(
+    mock_llm_as_judge, mock_judge_model
+):
+  mock_judge_model.silent = True
+  mock_llm_as_judge._judge_model = mock_judge_model
+  invocation = Invocation(
+      invocation_id="id1",
+      user_content=genai_types.Content(
+          parts=[genai_types.Part(text="user content")], role="user"
+      ),
+  )
+
+  result = await mock_llm_as_judge.evaluate_invocations(
+      [invocation], [invocation]
+  )
+
+  assert result.overall_eval_status == EvalStatus.NOT_EVALUATED
+  assert result.per_invocation_results == []
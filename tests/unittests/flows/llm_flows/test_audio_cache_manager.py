@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
+import asyncio
+import gc
+import gzip
+import math
 import time
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
@@ -24,6 +29,32 @@ import pytest
 from ... import testing_utils
 
 
+class _CountingArtifactService:
+  """Counts the saved audio without keeping it."""
+
+  def __init__(self):
+    self.saved_bytes = 0
+    self.filenames = []
+
+  async def save_artifact(self, *, filename, artifact, **kwargs):
+    await asyncio.sleep(0)
+    self.saved_bytes += len(artifact.inline_data.data)
+    self.filenames.append(filename)
+    return len(self.filenames) - 1
+
+
+def _pcm_chunk(seconds: float, sample_rate: int = 16000) -> bytearray:
+  """Returns a 440Hz tone as 16-bit mono PCM."""
+  samples = array.array(
+      'h',
+      (
+          int(8000 * math.sin(2 * math.pi * 440 * i / sample_rate))
+          for i in range(int(seconds * sample_rate))
+      ),
+  )
+  return bytearray(samples.tobytes())
+
+
 class TestAudioCacheConfig:
   """Test the AudioCacheConfig class."""
 
@@ -45,6 +76,11 @@ class TestAudioCacheConfig:
     assert config.max_cache_duration_seconds == 120.0
     assert config.auto_flush_threshold == 50
 
+  def test_unsupported_compression(self):
+    """Test that unsupported compressions are rejected."""
+    with pytest.raises(ValueError, match='Unsupported audio compression'):
+      AudioCacheConfig(compression='flac')
+
 
 class TestAudioCacheManager:
   """Test the AudioCacheManager class."""
@@ -268,6 +304,12 @@ class TestAudioCacheManager:
         'output_bytes': 0,
         'total_chunks': 0,
         'total_bytes': 0,
+        'pending_segments': 0,
+        'pending_bytes': 0,
+        'flushed_segments': 0,
+        'flushed_bytes': 0,
+        'stored_bytes': 0,
+        'dropped_bytes': 0,
     }
     assert stats == expected
 
@@ -298,6 +340,12 @@ class TestAudioCacheManager:
         'output_bytes': 3,
         'total_chunks': 3,
         'total_bytes': 18,  # 15 + 3
+        'pending_segments': 0,
+        'pending_bytes': 0,
+        'flushed_segments': 0,
+        'flushed_bytes': 0,
+        'stored_bytes': 0,
+        'dropped_bytes': 0,
     }
     assert stats == expected
 
@@ -438,3 +486,289 @@ class TestAudioCacheManager:
     assert len(events) == 1
     assert events[0].author == 'my_test_agent'  # Agent name, not 'model'
     assert events[0].content.role == 'model'  # Role is still 'model'
+
+  @pytest.mark.asyncio
+  async def test_segments_flushed_at_byte_cap(self):
+    """Test that full caches are saved as segments in the background."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=10))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    artifact_service = _CountingArtifactService()
+    invocation_context.artifact_service = artifact_service
+
+    for i in range(5):
+      manager.cache_audio(
+          invocation_context,
+          types.Blob(data=b'0123456' + bytes([i]), mime_type='audio/pcm'),
+          'input',
+      )
+      await asyncio.sleep(0)
+
+    # Every second chunk fills the cache.
+    assert len(invocation_context.input_realtime_cache) == 1
+    stats = manager.get_cache_stats(invocation_context)
+    assert stats['flushed_segments'] == 2
+    assert stats['flushed_bytes'] == 32
+    assert stats['input_bytes'] == 8
+
+    events = await manager.flush_caches(invocation_context)
+
+    assert len(events) == 3
+    assert [event.timestamp for event in events] == sorted(
+        event.timestamp for event in events
+    )
+    assert artifact_service.saved_bytes == 40
+    assert invocation_context.input_realtime_cache == []
+    assert await manager.flush_caches(invocation_context) == []
+
+  @pytest.mark.asyncio
+  async def test_segments_flushed_after_max_duration(self):
+    """Test that caches spanning the max duration are flushed."""
+    manager = AudioCacheManager(
+        AudioCacheConfig(max_cache_duration_seconds=0.0)
+    )
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    invocation_context.artifact_service = _CountingArtifactService()
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'audio', mime_type='audio/pcm'),
+        'output',
+    )
+    await asyncio.sleep(0)
+
+    assert not invocation_context.output_realtime_cache
+    events = await manager.flush_caches(invocation_context)
+    assert len(events) == 1
+    assert events[0].content.role == 'model'
+
+  @pytest.mark.asyncio
+  async def test_slow_saves_drop_oldest_segments(self):
+    """Test that segments waiting for a slow save are bounded."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=4))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    release = asyncio.Event()
+    saved = []
+
+    async def save_artifact(*, artifact, **kwargs):
+      await release.wait()
+      saved.append(artifact.inline_data.data)
+      return 0
+
+    invocation_context.artifact_service = Mock(save_artifact=save_artifact)
+
+    for chunk in (b'aaaa', b'bbbb', b'cccc', b'dddd'):
+      manager.cache_audio(
+          invocation_context,
+          types.Blob(data=chunk, mime_type='audio/pcm'),
+          'input',
+      )
+      await asyncio.sleep(0)
+
+    stats = manager.get_cache_stats(invocation_context)
+    assert stats['pending_segments'] == 2
+    assert stats['dropped_bytes'] == 8
+
+    release.set()
+    events = await manager.flush_caches(invocation_context)
+
+    assert len(events) == 2
+    assert saved == [b'aaaa', b'dddd']
+
+  @pytest.mark.asyncio
+  async def test_cache_without_artifact_service_is_bounded(self):
+    """Test that caches keep the most recent audio if it can't be saved."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=8))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    invocation_context.artifact_service = None
+
+    for chunk in (b'aaaa', b'bbbb', b'cccc'):
+      manager.cache_audio(
+          invocation_context,
+          types.Blob(data=chunk, mime_type='audio/pcm'),
+          'input',
+      )
+
+    assert [
+        entry.data.data for entry in invocation_context.input_realtime_cache
+    ] == [b'bbbb', b'cccc']
+    assert manager.get_cache_stats(invocation_context)['dropped_bytes'] == 4
+
+  @pytest.mark.asyncio
+  async def test_failed_segments_are_retried_in_order(self):
+    """Test that segments failing to save are retried before the cache."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=4))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.side_effect = Exception('unavailable')
+    invocation_context.artifact_service = mock_artifact_service
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'aaaa', mime_type='audio/pcm'),
+        'input',
+    )
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'bb', mime_type='audio/pcm'),
+        'input',
+    )
+
+    assert await manager.flush_caches(invocation_context) == []
+    assert len(invocation_context.input_realtime_cache) == 1
+
+    mock_artifact_service.save_artifact.side_effect = None
+    mock_artifact_service.save_artifact.return_value = 0
+    events = await manager.flush_caches(invocation_context)
+
+    assert len(events) == 2
+    saved = [
+        call.kwargs['artifact'].inline_data.data
+        for call in mock_artifact_service.save_artifact.call_args_list[-2:]
+    ]
+    assert saved == [b'aaaa', b'bb']
+    assert invocation_context.input_realtime_cache == []
+
+  @pytest.mark.asyncio
+  async def test_gzip_compression(self):
+    """Test that audio is gzipped when compression is enabled."""
+    manager = AudioCacheManager(AudioCacheConfig(compression='gzip'))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.return_value = 1
+    invocation_context.artifact_service = mock_artifact_service
+    audio_data = bytes(_pcm_chunk(1.0))
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=audio_data, mime_type='audio/pcm'),
+        'input',
+    )
+    events = await manager.flush_caches(invocation_context)
+
+    call_args = mock_artifact_service.save_artifact.call_args
+    saved_artifact = call_args.kwargs['artifact']
+    assert gzip.decompress(saved_artifact.inline_data.data) == audio_data
+    assert saved_artifact.inline_data.mime_type == 'audio/pcm'
+    assert call_args.kwargs['filename'].endswith('.pcm.gz')
+    assert call_args.kwargs['custom_metadata'] == {'content_encoding': 'gzip'}
+    assert events[0].content.parts[0].file_data.file_uri.endswith('.pcm.gz#1')
+    stats = manager.get_cache_stats(invocation_context)
+    assert stats['stored_bytes'] < stats['flushed_bytes'] == len(audio_data)
+
+  @pytest.mark.asyncio
+  async def test_long_stream_is_saved_in_bounded_segments(self):
+    """Test that a long audio stream is saved while buffering at most a cap."""
+    cap = 16 * 1024
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=cap))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    artifact_service = _CountingArtifactService()
+    invocation_context.artifact_service = artifact_service
+    chunk = _pcm_chunk(0.1)
+    chunk_count = 50
+    total_bytes = chunk_count * len(chunk)
+
+    max_held_bytes = 0
+    for _ in range(chunk_count):
+      manager.cache_audio(
+          invocation_context,
+          types.Blob(data=bytes(chunk), mime_type='audio/pcm'),
+          'input',
+      )
+      stream = manager._streams[(invocation_context.invocation_id, 'input')]
+      max_held_bytes = max(
+          max_held_bytes,
+          stream.buffered_bytes + stream.pending_bytes + stream.uploading_bytes,
+      )
+      await asyncio.sleep(0)
+    events = await manager.flush_caches(invocation_context)
+
+    assert artifact_service.saved_bytes == total_bytes
+    assert manager.get_cache_stats(invocation_context)['dropped_bytes'] == 0
+    assert len(events) == len(artifact_service.filenames) > 1
+    assert max_held_bytes < 2 * cap + len(chunk)
+
+  @pytest.mark.asyncio
+  async def test_retry_and_new_segments_are_not_saved_concurrently(self):
+    """Test that segments flushed during a retry wait for the retry."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=4))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    saves_in_flight = 0
+    max_saves_in_flight = 0
+    saved = []
+    fail = True
+    retry_started = asyncio.Event()
+
+    async def save_artifact(*, artifact, **kwargs):
+      nonlocal saves_in_flight, max_saves_in_flight
+      if fail:
+        raise ValueError('unavailable')
+      saves_in_flight += 1
+      max_saves_in_flight = max(max_saves_in_flight, saves_in_flight)
+      retry_started.set()
+      await asyncio.sleep(0.01)
+      saves_in_flight -= 1
+      saved.append(artifact.inline_data.data)
+      return len(saved) - 1
+
+    invocation_context.artifact_service = Mock()
+    invocation_context.artifact_service.save_artifact = save_artifact
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'aaaa', mime_type='audio/pcm'),
+        'input',
+    )
+    await asyncio.sleep(0)
+    fail = False
+
+    flush = asyncio.create_task(
+        manager.flush_caches(invocation_context, flush_model_audio=False)
+    )
+    await retry_started.wait()
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'bbbb', mime_type='audio/pcm'),
+        'input',
+    )
+    events = await flush
+
+    assert saved == [b'aaaa', b'bbbb']
+    assert max_saves_in_flight == 1
+    assert len(events) == 2
+
+  @pytest.mark.asyncio
+  async def test_streams_are_dropped_with_their_invocation(self):
+    """Test that abandoned invocations do not keep their stream state."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=4))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    invocation_context.artifact_service = _CountingArtifactService()
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'aaaa', mime_type='audio/pcm'),
+        'input',
+    )
+    stream = manager._streams[(invocation_context.invocation_id, 'input')]
+    await stream.task
+    assert stream.events
+
+    del invocation_context, stream
+    gc.collect()
+
+    assert not manager._streams
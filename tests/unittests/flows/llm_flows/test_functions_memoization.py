@@ -0,0 +1,256 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for memoization of tool results."""
+
+from typing import Any
+from unittest import mock
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import Agent
+from google.adk.flows.llm_flows.functions import handle_function_call_list_async
+from google.adk.telemetry import tracing
+from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.tool_context import ToolContext
+from google.adk.tools.tool_memoization import MemoizationScope
+from google.adk.tools.tool_memoization import ToolMemoizationConfig
+from google.genai import types
+import pytest
+
+from ... import testing_utils
+
+
+class _Vendors:
+  """A lookup tool that counts how often it runs."""
+
+  def __init__(self):
+    self.calls = 0
+
+  def list_vendors(self, category: str) -> list[str]:
+    """Lists the vendors of a category."""
+    self.calls += 1
+    return [f'{category}-vendor-{self.calls}']
+
+
+async def _create_context(tool: FunctionTool) -> InvocationContext:
+  agent = Agent(
+      name='agent',
+      model=testing_utils.MockModel.create(responses=[]),
+      tools=[tool],
+  )
+  return await testing_utils.create_invocation_context(agent=agent)
+
+
+async def _call(
+    invocation_context: InvocationContext,
+    tool: FunctionTool,
+    **args: Any,
+) -> dict[str, Any]:
+  event = await handle_function_call_list_async(
+      invocation_context,
+      [types.FunctionCall(name=tool.name, args=args, id='call-id')],
+      {tool.name: tool},
+  )
+  return event.content.parts[0].function_response.response
+
+
+@pytest.mark.asyncio
+async def test_memoized_results_are_function_responses():
+  vendors = _Vendors()
+  tool = FunctionTool(vendors.list_vendors, memoization=ToolMemoizationConfig())
+  invocation_context = await _create_context(tool)
+
+  first = await _call(invocation_context, tool, category='paper')
+  second = await _call(invocation_context, tool, category='paper')
+  other = await _call(invocation_context, tool, category='ink')
+
+  assert first == second == {'result': ['paper-vendor-1']}
+  assert other == {'result': ['ink-vendor-2']}
+  assert vendors.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_tools_without_policy_are_not_memoized():
+  vendors = _Vendors()
+  tool = FunctionTool(vendors.list_vendors)
+  invocation_context = await _create_context(tool)
+
+  await _call(invocation_context, tool, category='paper')
+  await _call(invocation_context, tool, category='paper')
+
+  assert vendors.calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('scope', 'expected_calls'),
+    [
+        (MemoizationScope.INVOCATION, 4),
+        (MemoizationScope.SESSION, 3),
+        (MemoizationScope.USER, 2),
+        (MemoizationScope.APP, 1),
+        (MemoizationScope.GLOBAL, 1),
+    ],
+)
+async def test_scopes(scope, expected_calls):
+  vendors = _Vendors()
+  tool = FunctionTool(
+      vendors.list_vendors, memoization=ToolMemoizationConfig(scope=scope)
+  )
+  invocation_context = await _create_context(tool)
+  next_invocation = invocation_context.model_copy(
+      update={'invocation_id': 'next_invocation'}
+  )
+  other_session = await _create_context(tool)
+  other_user = invocation_context.model_copy(
+      update={
+          'session': await invocation_context.session_service.create_session(
+              app_name='test_app', user_id='other_user'
+          )
+      }
+  )
+
+  for context in (
+      invocation_context,
+      invocation_context,
+      next_invocation,
+      other_session,
+      other_user,
+  ):
+    await _call(context, tool, category='paper')
+
+  assert vendors.calls == expected_calls
+
+
+@pytest.mark.asyncio
+async def test_ttl_key_func_and_max_entries():
+  vendors = _Vendors()
+  memoization = ToolMemoizationConfig(
+      ttl_seconds=10,
+      key_func=lambda args: args['category'].lower(),
+      max_entries=1,
+  )
+  now = 0.0
+  memoization._timer = lambda: now
+  tool = FunctionTool(vendors.list_vendors, memoization=memoization)
+  invocation_context = await _create_context(tool)
+
+  await _call(invocation_context, tool, category='paper')
+  assert (await _call(invocation_context, tool, category='PAPER')) == {
+      'result': ['paper-vendor-1']
+  }
+  assert vendors.calls == 1
+
+  now = 10.0
+  await _call(invocation_context, tool, category='paper')
+  assert vendors.calls == 2
+
+  await _call(invocation_context, tool, category='ink')
+  await _call(invocation_context, tool, category='paper')
+  assert vendors.calls == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'bypass', [True, lambda args: args['category'] == 'paper']
+)
+async def test_bypass(bypass):
+  vendors = _Vendors()
+  tool = FunctionTool(
+      vendors.list_vendors, memoization=ToolMemoizationConfig(bypass=bypass)
+  )
+  invocation_context = await _create_context(tool)
+
+  await _call(invocation_context, tool, category='paper')
+  await _call(invocation_context, tool, category='paper')
+
+  assert vendors.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_calls_with_side_effects_or_errors_are_not_memoized():
+  calls = 0
+
+  def remember_vendor(vendor: str, tool_context: ToolContext) -> str:
+    nonlocal calls
+    calls += 1
+    tool_context.state['vendor'] = vendor
+    return vendor
+
+  def flaky_lookup(vendor: str) -> str:
+    nonlocal calls
+    calls += 1
+    if calls == 3:
+      raise ValueError('unavailable')
+    return vendor
+
+  tool = FunctionTool(remember_vendor, memoization=ToolMemoizationConfig())
+  invocation_context = await _create_context(tool)
+  await _call(invocation_context, tool, vendor='acme')
+  await _call(invocation_context, tool, vendor='acme')
+  assert calls == 2
+
+  tool = FunctionTool(flaky_lookup, memoization=ToolMemoizationConfig())
+  with pytest.raises(ValueError):
+    await _call(invocation_context, tool, vendor='acme')
+  await _call(invocation_context, tool, vendor='acme')
+  await _call(invocation_context, tool, vendor='acme')
+  assert calls == 4
+
+
+@pytest.mark.asyncio
+async def test_memoized_results_cannot_be_altered():
+
+  def after_tool_callback(tool, args, tool_context, tool_response):
+    tool_response.append('altered')
+
+  vendors = _Vendors()
+  tool = FunctionTool(vendors.list_vendors, memoization=ToolMemoizationConfig())
+  invocation_context = await _create_context(tool)
+  invocation_context.agent.after_tool_callback = after_tool_callback
+
+  await _call(invocation_context, tool, category='paper')
+  second = await _call(invocation_context, tool, category='paper')
+
+  assert second == {'result': ['paper-vendor-1', 'altered']}
+
+
+@pytest.mark.asyncio
+async def test_hits_and_misses_are_traced(monkeypatch):
+  spans = {}
+
+  def start_as_current_span(name):
+    span = spans.setdefault(name, mock.MagicMock())
+    span.__enter__.return_value = span
+    return span
+
+  monkeypatch.setattr(
+      tracing.tracer, 'start_as_current_span', start_as_current_span
+  )
+  vendors = _Vendors()
+  tool = FunctionTool(vendors.list_vendors, memoization=ToolMemoizationConfig())
+  invocation_context = await _create_context(tool)
+
+  await _call(invocation_context, tool, category='paper')
+  await _call(invocation_context, tool, category='paper')
+
+  span = spans['tool_memoization list_vendors']
+  assert [
+      c.args
+      for c in span.set_attribute.call_args_list
+      if c.args[0] == 'gcp.vertex.agent.tool_memoization.hit'
+  ] == [
+      ('gcp.vertex.agent.tool_memoization.hit', False),
+      ('gcp.vertex.agent.tool_memoization.hit', True),
+  ]
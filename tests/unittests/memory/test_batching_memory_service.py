@@ -0,0 +1,140 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest import mock
+
+from google.adk.events.event import Event
+from google.adk.memory.batching_memory_service import BatchingMemoryService
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+from google.adk.sessions.session import Session
+from google.genai import types
+import pytest
+
+MOCK_APP_NAME = 'test-app'
+MOCK_USER_ID = 'test-user'
+
+
+def _session(session_id, user_id=MOCK_USER_ID):
+  return Session(
+      app_name=MOCK_APP_NAME,
+      user_id=user_id,
+      id=session_id,
+      last_update_time=1000,
+  )
+
+
+def _append_turn(session, text):
+  session.events.append(
+      Event(
+          id=f'{session.id}-{len(session.events)}',
+          invocation_id='inv',
+          author='user',
+          timestamp=12345 + len(session.events),
+          content=types.Content(parts=[types.Part(text=text)]),
+      )
+  )
+
+
+def _spy(memory_service):
+  return mock.patch.object(
+      memory_service,
+      'add_session_to_memory',
+      wraps=memory_service.add_session_to_memory,
+  )
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_coalesced_and_written_on_timer():
+  inner = InMemoryMemoryService()
+  service = BatchingMemoryService(inner, flush_interval_seconds=0.05)
+  first, second = _session('session-1'), _session('session-2')
+
+  with _spy(inner) as add_session_to_memory:
+    for turn in range(3):
+      _append_turn(first, f'first session turn {turn}')
+      await service.add_session_to_memory(first)
+    _append_turn(second, 'second session turn')
+    await service.add_session_to_memory(second)
+    assert add_session_to_memory.call_count == 0
+
+    await asyncio.sleep(0.2)
+
+  assert sorted(c.args[0].id for c in add_session_to_memory.call_args_list) == [
+      'session-1',
+      'session-2',
+  ]
+  result = await inner.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='turn'
+  )
+  assert len(result.memories) == 4
+
+
+@pytest.mark.asyncio
+async def test_search_writes_pending_sessions_of_the_user():
+  inner = InMemoryMemoryService()
+  service = BatchingMemoryService(inner, flush_interval_seconds=60)
+  mine, theirs = _session('session-1'), _session('session-2', 'other-user')
+  _append_turn(mine, 'likes tea')
+  _append_turn(theirs, 'likes tea too')
+  await service.add_session_to_memory(mine)
+  await service.add_session_to_memory(theirs)
+
+  result = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='tea'
+  )
+
+  assert [m.content.parts[0].text for m in result.memories] == ['likes tea']
+  assert list(service._pending_sessions) == [
+      (MOCK_APP_NAME, 'other-user', 'session-2')
+  ]
+  await service.close()
+  assert not service._pending_sessions
+
+
+@pytest.mark.asyncio
+async def test_max_pending_sessions_triggers_write_and_failures_are_logged(
+    caplog,
+):
+  inner = InMemoryMemoryService()
+  service = BatchingMemoryService(inner, max_pending_sessions=2)
+  sessions = [_session('session-1'), _session('session-2')]
+
+  with mock.patch.object(
+      inner,
+      'add_session_to_memory',
+      side_effect=[None, RuntimeError('unavailable')],
+  ) as add_session_to_memory:
+    for session in sessions:
+      await service.add_session_to_memory(session)
+
+  assert add_session_to_memory.call_count == 2
+  assert 'Failed to add session session-2 to memory.' in caplog.text
+  await service.close()
+
+
+def test_queued_sessions_are_written_when_the_event_loop_shuts_down():
+  inner = InMemoryMemoryService()
+  service = BatchingMemoryService(inner, flush_interval_seconds=60)
+  session = _session('session-1')
+  _append_turn(session, 'written at shutdown')
+
+  asyncio.run(service.add_session_to_memory(session))
+
+  result = asyncio.run(
+      inner.search_memory(
+          app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='shutdown'
+      )
+  )
+  assert len(result.memories) == 1
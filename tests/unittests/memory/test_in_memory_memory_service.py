@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest import mock
+
 from google.adk.events.event import Event
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.sessions.session import Session
@@ -327,3 +329,209 @@ async def test_search_memory_is_scoped_by_user():
   assert (
       result_other_user.memories[0].content.parts[0].text == 'This is a secret.'
   )
+
+
+def _texts(result):
+  return [memory.content.parts[0].text for memory in result.memories]
+
+
+@pytest.mark.asyncio
+async def test_search_memory_ranks_by_relevance():
+  """Tests that memories matching more, and rarer, query words rank first."""
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      memories=[
+          'The vendor list is long.',
+          'Acme is the priority vendor.',
+          'The weather is nice.',
+          'Acme ships fast.',
+      ],
+  )
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='acme vendor'
+  )
+
+  assert _texts(result) == [
+      'Acme is the priority vendor.',
+      'Acme ships fast.',
+      'The vendor list is long.',
+  ]
+
+
+@pytest.mark.asyncio
+async def test_search_memory_limits_results():
+  """Tests that max_results keeps the most relevant memories."""
+  memory_service = InMemoryMemoryService(max_results=1)
+  await memory_service.add_session_to_memory(MOCK_SESSION_1)
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='ADK toolkit'
+  )
+
+  assert _texts(result) == ['The ADK is a great toolkit.']
+
+
+@pytest.mark.asyncio
+async def test_add_memory_is_searchable():
+  """Tests that explicit memories are searchable with their metadata."""
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      memories=['Prefers email over calls.', ''],
+      custom_metadata={'source': 'profile'},
+  )
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='email'
+  )
+
+  assert _texts(result) == ['Prefers email over calls.']
+  assert result.memories[0].custom_metadata == {'source': 'profile'}
+  assert result.memories[0].timestamp is not None
+
+
+@pytest.mark.asyncio
+async def test_readding_session_replaces_its_memories():
+  """Tests that re-adding a session drops memories of its removed events."""
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_session_to_memory(MOCK_SESSION_1)
+  updated_session = MOCK_SESSION_1.model_copy(
+      update={'events': MOCK_SESSION_1.events[2:]}
+  )
+
+  await memory_service.add_session_to_memory(updated_session)
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='ADK'
+  )
+  assert _texts(result) == ['I agree. The Agent Development Kit (ADK) rocks!']
+  assert len(memory_service._indexes[f'{MOCK_APP_NAME}/{MOCK_USER_ID}']) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_memory_with_many_memories():
+  """Tests that indexed search finds the same memories as a full scan."""
+  import random
+  import re
+
+  rng = random.Random(0)
+  vocabulary = [f'word{chr(97 + i)}' for i in range(26)]
+  memories = [' '.join(rng.choices(vocabulary, k=5)) for _ in range(200)]
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, memories=memories
+  )
+
+  for _ in range(10):
+    query = ' '.join(rng.choices(vocabulary, k=2))
+    words_in_query = set(re.findall(r'[A-Za-z]+', query.lower()))
+    expected = [
+        memory
+        for memory in memories
+        if words_in_query & set(re.findall(r'[A-Za-z]+', memory.lower()))
+    ]
+
+    result = await memory_service.search_memory(
+        app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query=query
+    )
+
+    assert expected
+    assert sorted(_texts(result)) == sorted(expected)
+
+
+def _turn_event(i):
+  return Event(
+      id=f'event-{i}',
+      invocation_id=f'inv-{i}',
+      author='user' if i % 2 else 'model',
+      timestamp=12345 + i,
+      content=types.Content(parts=[types.Part(text=f'turn {i} about paris')]),
+  )
+
+
+@pytest.mark.asyncio
+async def test_add_session_to_memory_only_indexes_new_events():
+  memory_service = InMemoryMemoryService()
+  session = Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id='session-1',
+      last_update_time=1000,
+      events=[_turn_event(0), _turn_event(1)],
+  )
+  await memory_service.add_session_to_memory(session)
+  session.events.append(_turn_event(2))
+
+  with mock.patch.object(
+      memory_service,
+      '_index_events',
+      wraps=memory_service._index_events,
+  ) as index_events:
+    await memory_service.add_session_to_memory(session)
+
+  assert [e.id for e in index_events.call_args.args[2]] == ['event-2']
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='paris'
+  )
+  assert len(result.memories) == 3
+
+
+@pytest.mark.asyncio
+async def test_add_session_to_memory_replaces_rewound_session():
+  memory_service = InMemoryMemoryService()
+  session = Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id='session-1',
+      last_update_time=1000,
+      events=[_turn_event(0), _turn_event(1), _turn_event(2)],
+  )
+  await memory_service.add_session_to_memory(session)
+  session.events[1:] = [_turn_event(3)]
+  await memory_service.add_session_to_memory(session)
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='paris'
+  )
+
+  assert sorted(m.content.parts[0].text for m in result.memories) == [
+      'turn 0 about paris',
+      'turn 3 about paris',
+  ]
+
+
+@pytest.mark.asyncio
+async def test_add_session_to_memory_after_every_turn():
+  """Tests that each event is indexed once when added after every turn."""
+  num_turns = 20
+  memory_service = InMemoryMemoryService()
+  session = Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id='session-1',
+      last_update_time=1000,
+  )
+
+  indexed_counts = []
+  index_events = memory_service._index_events
+
+  def count_indexed_events(user_key, session_id, events, start):
+    indexed_counts.append(len(events))
+    index_events(user_key, session_id, events, start)
+
+  with mock.patch.object(
+      memory_service, '_index_events', side_effect=count_indexed_events
+  ):
+    for i in range(num_turns):
+      session.events.append(_turn_event(i))
+      await memory_service.add_session_to_memory(session)
+
+  assert indexed_counts == [1] * num_turns
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='paris'
+  )
+  assert len(result.memories) == num_turns
@@ -0,0 +1,309 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+from unittest import mock
+
+from google.adk.events.event import Event
+from google.adk.memory.embedders import HashingEmbedder
+from google.adk.memory.local_vector_memory_service import _Partition
+from google.adk.memory.local_vector_memory_service import LocalVectorMemoryService
+from google.adk.sessions.session import Session
+from google.genai import types
+import numpy as np
+import pytest
+
+MOCK_APP_NAME = 'test-app'
+MOCK_USER_ID = 'test-user'
+MOCK_OTHER_USER_ID = 'another-user'
+
+
+class _CountingEmbedder(HashingEmbedder):
+
+  def __init__(self):
+    super().__init__(dimension=64)
+    self.batches = []
+
+  async def embed(self, texts):
+    self.batches.append(list(texts))
+    return await super().embed(texts)
+
+
+def _session(session_id, texts, user_id=MOCK_USER_ID):
+  return Session(
+      app_name=MOCK_APP_NAME,
+      user_id=user_id,
+      id=session_id,
+      last_update_time=1000,
+      events=[
+          Event(
+              id=f'{session_id}-event-{i}',
+              invocation_id='inv',
+              author='user',
+              timestamp=12345 + i,
+              content=types.Content(parts=[types.Part(text=text)])
+              if text
+              else None,
+          )
+          for i, text in enumerate(texts)
+      ],
+  )
+
+
+def _word(i):
+  """Returns a distinct letters-only word for `i`."""
+  return 'topic' + ''.join(chr(ord('a') + int(d)) for d in str(i))
+
+
+def _texts(response):
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_by_similarity_per_user():
+  service = LocalVectorMemoryService(HashingEmbedder(), top_k=2)
+  await service.add_session_to_memory(
+      _session(
+          'session-1',
+          [
+              'The weather in Paris is sunny.',
+              None,
+              'Paris has many museums and bakeries.',
+              'Tokyo trains are punctual.',
+          ],
+      )
+  )
+  await service.add_session_to_memory(
+      _session(
+          'session-2', ['Paris weather report'], user_id=MOCK_OTHER_USER_ID
+      )
+  )
+
+  response = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='weather in Paris'
+  )
+
+  assert _texts(response) == [
+      'The weather in Paris is sunny.',
+      'Paris has many museums and bakeries.',
+  ]
+  assert response.memories[0].author == 'user'
+  assert response.memories[0].id == 'session-1-event-0'
+  assert response.memories[0].timestamp is not None
+  empty = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id='unknown-user', query='Paris'
+  )
+  assert not empty.memories
+
+
+@pytest.mark.asyncio
+async def test_ingestion_is_batched_and_deduplicated():
+  embedder = _CountingEmbedder()
+  service = LocalVectorMemoryService(embedder, batch_size=2)
+  session = _session('session-1', ['one', 'two', 'three'])
+
+  await service.add_session_to_memory(session)
+  session.events.extend(_session('session-1', ['', '', '', 'four']).events[3:])
+  await service.add_session_to_memory(session)
+
+  assert embedder.batches == [['one', 'two'], ['three'], ['four']]
+
+
+@pytest.mark.asyncio
+async def test_add_memory_keeps_custom_metadata():
+  service = LocalVectorMemoryService(HashingEmbedder())
+
+  await service.add_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      memories=['Prefers window seats on flights.', ' '],
+      custom_metadata={'source': 'profile'},
+  )
+  response = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='window seats'
+  )
+
+  assert _texts(response) == ['Prefers window seats on flights.']
+  assert response.memories[0].custom_metadata == {'source': 'profile'}
+
+
+@pytest.mark.asyncio
+async def test_memories_are_persisted(tmp_path):
+  service = LocalVectorMemoryService(
+      HashingEmbedder(), storage_dir=str(tmp_path), top_k=1
+  )
+  # Enough memories to grow the memory-mapped vectors file.
+  texts = [f'memory about {_word(i)}' for i in range(100)]
+  await service.add_session_to_memory(_session('session/1', texts))
+  await service.add_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      memories=['Loves hiking in the Alps.'],
+  )
+
+  reloaded = LocalVectorMemoryService(
+      HashingEmbedder(), storage_dir=str(tmp_path), top_k=1
+  )
+  response = await reloaded.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query=_word(42)
+  )
+  assert _texts(response) == [f'memory about {_word(42)}']
+  response = await reloaded.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='hiking Alps'
+  )
+  assert _texts(response) == ['Loves hiking in the Alps.']
+
+  await reloaded.add_session_to_memory(_session('session/1', texts))
+  assert len(reloaded._partitions[(MOCK_APP_NAME, MOCK_USER_ID)].entries) == 101
+
+
+@pytest.mark.asyncio
+async def test_dimension_mismatch_raises(tmp_path):
+  service = LocalVectorMemoryService(
+      HashingEmbedder(dimension=8), storage_dir=str(tmp_path)
+  )
+  await service.add_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, memories=['hello']
+  )
+
+  reloaded = LocalVectorMemoryService(
+      HashingEmbedder(dimension=16), storage_dir=str(tmp_path)
+  )
+  with pytest.raises(ValueError):
+    await reloaded.search_memory(
+        app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='hello'
+    )
+
+
+@pytest.mark.asyncio
+async def test_ivf_index_recall():
+  rng = np.random.default_rng(1)
+  centers = rng.normal(size=(20, 32))
+  vectors = centers[rng.integers(0, 20, 4000)] + 0.3 * rng.normal(
+      size=(4000, 32)
+  )
+  queries = centers + 0.3 * rng.normal(size=(20, 32))
+  texts = [f'memory {i}' for i in range(len(vectors))]
+  vector_by_text = dict(zip(texts, vectors))
+  vector_by_text.update({f'q{i}': q for i, q in enumerate(queries)})
+
+  class _TableEmbedder(HashingEmbedder):
+
+    async def embed(self, texts):
+      return [vector_by_text[text] for text in texts]
+
+  exact = LocalVectorMemoryService(_TableEmbedder(), top_k=10)
+  approximate = LocalVectorMemoryService(
+      _TableEmbedder(), top_k=10, ivf_num_lists=32, ivf_num_probes=4
+  )
+  for service in (exact, approximate):
+    await service.add_memory(
+        app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, memories=texts
+    )
+
+  found = 0
+  for i in range(20):
+    expected = await exact.search_memory(
+        app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query=f'q{i}'
+    )
+    actual = await approximate.search_memory(
+        app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query=f'q{i}'
+    )
+    found += len(set(_texts(expected)) & set(_texts(actual)))
+
+  assert found / 200 >= 0.9
+  partition = approximate._partitions[(MOCK_APP_NAME, MOCK_USER_ID)]
+  assert partition._centroids is not None
+
+
+@pytest.mark.asyncio
+async def test_index_training_does_not_block_the_event_loop():
+  service = LocalVectorMemoryService(
+      HashingEmbedder(dimension=16), ivf_num_lists=2, ivf_num_probes=1
+  )
+  await service.add_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      memories=[_word(i) for i in range(64)],
+  )
+  training = threading.Event()
+  released = threading.Event()
+  train = _Partition._train
+  training_threads = []
+
+  def slow_train(partition, num_lists):
+    training_threads.append(threading.current_thread())
+    training.set()
+    # Training on the event loop would keep `released` from being set.
+    assert released.wait(timeout=5)
+    train(partition, num_lists)
+
+  async def release_when_training():
+    while not training.is_set():
+      await asyncio.sleep(0.001)
+    released.set()
+
+  with mock.patch.object(_Partition, '_train', slow_train):
+    response, _ = await asyncio.gather(
+        service.search_memory(
+            app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query=_word(1)
+        ),
+        release_when_training(),
+    )
+
+  assert training_threads
+  assert training_threads[0] is not threading.main_thread()
+  assert _word(1) in _texts(response)
+
+
+@pytest.mark.asyncio
+async def test_add_session_to_memory_only_adds_new_events():
+  service = LocalVectorMemoryService(_CountingEmbedder())
+  session = _session('session-1', ['first turn', 'second turn'])
+  await service.add_session_to_memory(session)
+  session.events.extend(
+      _session('session-1', ['', '', 'third turn']).events[2:]
+  )
+
+  with mock.patch.object(
+      service, '_event_items', wraps=service._event_items
+  ) as event_items:
+    await service.add_session_to_memory(session)
+
+  assert [e.id for e in event_items.call_args.args[1]] == ['session-1-event-2']
+  assert len(service._partitions[(MOCK_APP_NAME, MOCK_USER_ID)].entries) == 3
+
+
+def test_exhaustive_search_matches_cosine_ranking():
+  rng = np.random.default_rng(0)
+  num_memories, dimension = 500, 16
+  service = LocalVectorMemoryService(HashingEmbedder(dimension), top_k=10)
+  partition = service._get_partition(MOCK_APP_NAME, MOCK_USER_ID)
+  vectors = rng.normal(size=(num_memories, dimension)).astype(np.float32)
+  # Row numbers stand in for the entries, to identify the results.
+  partition.append(
+      [str(i) for i in range(num_memories)], list(range(num_memories)), vectors
+  )
+
+  for query in rng.normal(size=(5, dimension)).astype(np.float32):
+    similarities = [
+        float(np.dot(vector, query) / np.linalg.norm(vector))
+        for vector in vectors
+    ]
+    expected = sorted(
+        range(num_memories), key=similarities.__getitem__, reverse=True
+    )[:10]
+
+    assert partition.search(query, 10, None, 8) == expected
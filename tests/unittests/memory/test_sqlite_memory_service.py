@@ -0,0 +1,236 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest import mock
+
+from google.adk.events.event import Event
+from google.adk.memory.sqlite_memory_service import SqliteMemoryService
+from google.adk.sessions.session import Session
+from google.genai import types
+import pytest
+
+MOCK_APP_NAME = 'test-app'
+MOCK_USER_ID = 'test-user'
+MOCK_OTHER_USER_ID = 'another-user'
+
+
+def _event(event_id, text, author='user', timestamp=12345):
+  return Event(
+      id=event_id,
+      invocation_id='inv',
+      author=author,
+      timestamp=timestamp,
+      content=types.Content(parts=[types.Part(text=text)]) if text else None,
+  )
+
+
+def _texts(response):
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+@pytest.fixture
+def service(tmp_path):
+  return SqliteMemoryService(str(tmp_path / 'memory.db'))
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_memories_of_the_user(service):
+  session = Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id='session-1',
+      last_update_time=1000,
+      events=[
+          _event('event-1', 'The weather in Paris is sunny.'),
+          _event('event-2', None),
+          _event('event-3', 'Paris Paris Paris, the city of light.', 'model'),
+          _event('event-4', 'Tokyo trains are punctual.'),
+      ],
+  )
+  await service.add_session_to_memory(session)
+  await service.add_events_to_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_OTHER_USER_ID,
+      events=[_event('event-5', 'Paris again')],
+  )
+
+  response = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='paris weather?'
+  )
+
+  assert _texts(response) == [
+      'The weather in Paris is sunny.',
+      'Paris Paris Paris, the city of light.',
+  ]
+  assert response.memories[0].id == 'event-1'
+  assert response.memories[0].author == 'user'
+  assert response.memories[0].timestamp is not None
+  assert response.memories[1].author == 'model'
+
+
+@pytest.mark.asyncio
+async def test_events_are_added_once(service):
+  session = Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id='session-1',
+      last_update_time=1000,
+      events=[_event('event-1', 'Paris is sunny.')],
+  )
+  await service.add_session_to_memory(session)
+  session.events.append(_event('event-2', 'Paris is rainy.'))
+  await service.add_session_to_memory(session)
+  await service.add_events_to_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      session_id='session-1',
+      events=session.events[1:],
+  )
+
+  response = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='Paris'
+  )
+
+  assert sorted(_texts(response)) == ['Paris is rainy.', 'Paris is sunny.']
+
+
+@pytest.mark.asyncio
+async def test_memories_persist_across_instances(tmp_path):
+  db_path = str(tmp_path / 'memory.db')
+  await SqliteMemoryService(db_path).add_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      memories=['Prefers window seats on flights.', ' '],
+  )
+
+  response = await SqliteMemoryService(f'sqlite:///{db_path}').search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='window'
+  )
+
+  assert _texts(response) == ['Prefers window seats on flights.']
+  assert response.memories[0].timestamp is None
+
+
+@pytest.mark.asyncio
+async def test_search_filters_by_custom_metadata(service):
+  await service.add_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      memories=['Likes green tea.'],
+      custom_metadata={'topic': 'food', 'pinned': True},
+  )
+  await service.add_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      memories=['Likes green cars.'],
+      custom_metadata={'topic': 'cars', 'pinned': False},
+  )
+
+  async def search(metadata_filter):
+    response = await service.search_memory(
+        app_name=MOCK_APP_NAME,
+        user_id=MOCK_USER_ID,
+        query='green',
+        metadata_filter=metadata_filter,
+    )
+    return _texts(response)
+
+  assert await search({'topic': 'food'}) == ['Likes green tea.']
+  assert await search({'pinned': False}) == ['Likes green cars.']
+  assert await search({'topic': 'food', 'pinned': False}) == []
+  assert len(await search(None)) == 2
+  with pytest.raises(ValueError):
+    await search({'topic': ['food']})
+
+
+@pytest.mark.asyncio
+async def test_snippets_and_queries_with_operators(tmp_path):
+  service = SqliteMemoryService(
+      str(tmp_path / 'memory.db'), top_k=1, snippet_tokens=4
+  )
+  long_text = ' '.join(['filler'] * 50 + ['needle', 'found'] + ['filler'] * 50)
+  await service.add_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, memories=[long_text]
+  )
+
+  response = await service.search_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      query='"needle" AND NOT (found*',
+  )
+  empty = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='?!'
+  )
+
+  [snippet] = _texts(response)
+  assert 'needle' in snippet
+  assert len(snippet) < 50
+  assert not empty.memories
+
+
+@pytest.mark.asyncio
+async def test_add_session_to_memory_only_inserts_new_events(service):
+  session = Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id='session-1',
+      last_update_time=1000,
+      events=[_event('event-1', 'first turn'), _event('event-2', 'second')],
+  )
+  await service.add_session_to_memory(session)
+  session.events.append(_event('event-3', 'third turn'))
+
+  with mock.patch.object(
+      service, '_insert_events', wraps=service._insert_events
+  ) as insert_events:
+    await service.add_session_to_memory(session)
+
+  assert [e.id for e in insert_events.call_args.kwargs['events']] == ['event-3']
+  response = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='turn'
+  )
+  assert sorted(_texts(response)) == ['first turn', 'third turn']
+
+
+@pytest.mark.asyncio
+async def test_throughput(service):
+  """Tests ingestion in batches and search over the ingested memories."""
+  words = ['alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot', 'golf']
+  num_events, batch_size = 200, 50
+  events = [
+      _event(
+          f'event-{i}',
+          f'{words[i % 7]} {words[i % 5]} note number {i} about'
+          f' topic{"abcdefghij"[i % 10]}',
+          timestamp=12345 + i,
+      )
+      for i in range(num_events)
+  ]
+
+  for i in range(0, num_events, batch_size):
+    await service.add_events_to_memory(
+        app_name=MOCK_APP_NAME,
+        user_id=MOCK_USER_ID,
+        session_id='session-1',
+        events=events[i : i + batch_size],
+    )
+
+  for i in range(5):
+    response = await service.search_memory(
+        app_name=MOCK_APP_NAME,
+        user_id=MOCK_USER_ID,
+        query=f'{words[i % 7]} topic{"abcdefghij"[i % 10]}',
+    )
+    assert len(response.memories) == 10
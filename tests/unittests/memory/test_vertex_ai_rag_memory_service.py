@@ -0,0 +1,69 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest import mock
+
+from google.adk.events.event import Event
+from google.adk.sessions.session import Session
+from google.genai import types
+import pytest
+
+rag = pytest.importorskip('google.adk.dependencies.vertexai').rag
+
+from google.adk.memory.vertex_ai_rag_memory_service import VertexAiRagMemoryService
+
+
+def _event(i, text='hello'):
+  return Event(
+      id=f'event-{i}',
+      invocation_id='inv',
+      author='user',
+      timestamp=12345 + i,
+      content=types.Content(parts=[types.Part(text=text)]) if text else None,
+  )
+
+
+@pytest.mark.asyncio
+async def test_add_session_to_memory_uploads_new_events_only():
+  service = VertexAiRagMemoryService(rag_corpus='corpus')
+  session = Session(
+      app_name='app',
+      user_id='user',
+      id='session',
+      last_update_time=1000,
+      events=[_event(0), _event(1)],
+  )
+  uploaded = []
+
+  def upload_file(corpus_name, path, display_name):
+    with open(path) as f:
+      uploaded.append(
+          (display_name, [json.loads(line)['timestamp'] for line in f])
+      )
+
+  with mock.patch.object(rag, 'upload_file', side_effect=upload_file):
+    await service.add_session_to_memory(session)
+    session.events.append(_event(2, text=None))
+    await service.add_session_to_memory(session)
+    session.events.append(_event(3))
+    await service.add_session_to_memory(session)
+    session.events[:] = [_event(4)]
+    await service.add_session_to_memory(session)
+
+  assert uploaded == [
+      ('app.user.session', [12345, 12346]),
+      ('app.user.session', [12348]),
+      ('app.user.session', [12349]),
+  ]
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import os
 import sys
+import time
 from unittest import mock
 
 from anthropic import types as anthropic_types
@@ -23,8 +25,10 @@ from google.adk.models.anthropic_llm import AnthropicLlm
 from google.adk.models.anthropic_llm import Claude
 from google.adk.models.anthropic_llm import content_to_message_param
 from google.adk.models.anthropic_llm import function_declaration_to_tool_param
+from google.adk.models.anthropic_llm import message_to_generate_content_response
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
+from google.adk.utils.context_utils import Aclosing
 from google.genai import types
 from google.genai import version as genai_version
 from google.genai.types import Content
@@ -598,3 +602,376 @@ def test_content_to_message_param_with_images(
       )
     else:
       mock_logger.warning.assert_not_called()
+
+
+def _text_stream_events(texts: list[str]) -> list[object]:
+  events = [
+      anthropic_types.RawMessageStartEvent(
+          type="message_start",
+          message=anthropic_types.Message(
+              id="msg_stream",
+              content=[],
+              model="claude-sonnet-4-20250514",
+              role="assistant",
+              stop_reason=None,
+              stop_sequence=None,
+              type="message",
+              usage=anthropic_types.Usage(
+                  input_tokens=5,
+                  output_tokens=1,
+                  cache_read_input_tokens=100,
+                  cache_creation_input_tokens=0,
+              ),
+          ),
+      ),
+      anthropic_types.RawContentBlockStartEvent(
+          type="content_block_start",
+          index=0,
+          content_block=anthropic_types.TextBlock(type="text", text=""),
+      ),
+  ]
+  for text in texts:
+    events.append(
+        anthropic_types.RawContentBlockDeltaEvent(
+            type="content_block_delta",
+            index=0,
+            delta=anthropic_types.TextDelta(type="text_delta", text=text),
+        )
+    )
+  events.append(
+      anthropic_types.RawContentBlockStopEvent(
+          type="content_block_stop", index=0
+      )
+  )
+  return events
+
+
+def _stop_events(stop_reason: str) -> list[object]:
+  return [
+      anthropic_types.RawMessageDeltaEvent(
+          type="message_delta",
+          delta={"stop_reason": stop_reason, "stop_sequence": None},
+          usage=anthropic_types.MessageDeltaUsage(output_tokens=7),
+      ),
+      anthropic_types.RawMessageStopEvent(type="message_stop"),
+  ]
+
+
+class _FakeStream:
+  """Replays stream events, recording how many were consumed."""
+
+  def __init__(self, events: list[object]):
+    self._events = events
+    self.consumed = 0
+    self.closed = False
+
+  def __aiter__(self):
+    return self
+
+  async def __anext__(self):
+    if self.consumed == len(self._events):
+      raise StopAsyncIteration
+    await asyncio.sleep(0)
+    self.consumed += 1
+    return self._events[self.consumed - 1]
+
+  async def close(self):
+    self.closed = True
+
+
+class _FakeMessages:
+
+  def __init__(self, events: list[object]):
+    self._events = events
+    self.calls = []
+    self.streams = []
+
+  async def create(self, **kwargs):
+    self.calls.append(kwargs)
+    assert kwargs.get("stream") is True
+    self.streams.append(_FakeStream(self._events))
+    return self.streams[-1]
+
+
+class _FakeAsyncAnthropic:
+  """Stands in for `AsyncAnthropic` and replays stream events."""
+
+  def __init__(self, events: list[object]):
+    self.messages = _FakeMessages(events)
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_streams_partial_text(llm_request):
+  claude = AnthropicLlm(model="claude-sonnet-4-20250514")
+  events = _text_stream_events(["Hel", "lo", " there"]) + _stop_events(
+      "end_turn"
+  )
+  fake_client = _FakeAsyncAnthropic(events)
+
+  with mock.patch.object(claude, "_anthropic_client", fake_client):
+    consumed_at_first_response = None
+    responses = []
+    async for response in claude.generate_content_async(
+        llm_request, stream=True
+    ):
+      if consumed_at_first_response is None:
+        consumed_at_first_response = fake_client.messages.streams[0].consumed
+      responses.append(response)
+
+  partial_texts = [
+      r.content.parts[0].text for r in responses if r.partial and r.content
+  ]
+  assert partial_texts == ["Hel", "lo", " there"]
+  final = responses[-1]
+  assert not final.partial
+  assert final.content.parts[0].text == "Hello there"
+  assert final.finish_reason == types.FinishReason.STOP
+  assert final.usage_metadata.prompt_token_count == 105
+  assert final.usage_metadata.cached_content_token_count == 100
+  assert final.usage_metadata.candidates_token_count == 7
+  # The first token is yielded with the third event, before the stream ends.
+  assert consumed_at_first_response == 3
+  assert fake_client.messages.streams[0].closed
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_closes_stream_on_early_exit(
+    llm_request,
+):
+  claude = AnthropicLlm(model="claude-sonnet-4-20250514")
+  fake_client = _FakeAsyncAnthropic(
+      _text_stream_events(["Hel", "lo"]) + _stop_events("end_turn")
+  )
+
+  with mock.patch.object(claude, "_anthropic_client", fake_client):
+    async with Aclosing(
+        claude.generate_content_async(llm_request, stream=True)
+    ) as agen:
+      async for _ in agen:
+        break
+
+  stream = fake_client.messages.streams[0]
+  assert stream.closed
+  assert stream.consumed == 3
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_streams_thinking(llm_request):
+  claude = AnthropicLlm(model="claude-sonnet-4-20250514")
+  events = (
+      _text_stream_events([])[:1]
+      + [
+          anthropic_types.RawContentBlockStartEvent(
+              type="content_block_start",
+              index=0,
+              content_block=anthropic_types.ThinkingBlock(
+                  type="thinking", thinking="", signature=""
+              ),
+          ),
+          anthropic_types.RawContentBlockDeltaEvent(
+              type="content_block_delta",
+              index=0,
+              delta=anthropic_types.ThinkingDelta(
+                  type="thinking_delta", thinking="Let me "
+              ),
+          ),
+          anthropic_types.RawContentBlockDeltaEvent(
+              type="content_block_delta",
+              index=0,
+              delta=anthropic_types.ThinkingDelta(
+                  type="thinking_delta", thinking="think."
+              ),
+          ),
+          anthropic_types.RawContentBlockDeltaEvent(
+              type="content_block_delta",
+              index=0,
+              delta=anthropic_types.SignatureDelta(
+                  type="signature_delta", signature="sig"
+              ),
+          ),
+          anthropic_types.RawContentBlockStopEvent(
+              type="content_block_stop", index=0
+          ),
+      ]
+      + _text_stream_events(["Done."])[1:]
+      + _stop_events("end_turn")
+  )
+  fake_client = _FakeAsyncAnthropic(events)
+
+  with mock.patch.object(claude, "_anthropic_client", fake_client):
+    responses = [
+        r async for r in claude.generate_content_async(llm_request, stream=True)
+    ]
+
+  partial_thoughts = [
+      r.content.parts[0].text
+      for r in responses
+      if r.partial and r.content and r.content.parts[0].thought
+  ]
+  assert partial_thoughts == ["Let me ", "think."]
+  final = responses[-1]
+  assert [(p.text, bool(p.thought)) for p in final.content.parts] == [
+      ("Let me think.", True),
+      ("Done.", False),
+  ]
+
+
+def test_thinking_blocks_round_trip_with_their_signature():
+  message = anthropic_types.Message(
+      id="msg_1",
+      content=[
+          anthropic_types.ThinkingBlock(
+              type="thinking", thinking="Hmm.", signature="sig"
+          ),
+          anthropic_types.TextBlock(type="text", text="Answer."),
+      ],
+      model="claude-sonnet-4-20250514",
+      role="assistant",
+      stop_reason="end_turn",
+      stop_sequence=None,
+      type="message",
+      usage=anthropic_types.Usage(input_tokens=1, output_tokens=2),
+  )
+
+  response = message_to_generate_content_response(message)
+  thought = response.content.parts[0]
+  assert thought.thought and thought.text == "Hmm."
+
+  message_param = anthropic_llm.content_to_message_param(response.content)
+  assert message_param["content"] == [
+      {"type": "thinking", "thinking": "Hmm.", "signature": "sig"},
+      {"type": "text", "text": "Answer."},
+  ]
+
+
+def test_thoughts_without_signature_are_not_sent():
+  content = types.Content(
+      role="model",
+      parts=[
+          types.Part(text="Hmm.", thought=True),
+          types.Part.from_text(text="Answer."),
+      ],
+  )
+
+  message_param = anthropic_llm.content_to_message_param(content)
+
+  assert message_param["content"] == [{"type": "text", "text": "Answer."}]
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_streams_tool_use(llm_request):
+  claude = AnthropicLlm(model="claude-sonnet-4-20250514")
+  events = (
+      _text_stream_events(["Checking."])
+      + [
+          anthropic_types.RawContentBlockStartEvent(
+              type="content_block_start",
+              index=1,
+              content_block=anthropic_types.ToolUseBlock(
+                  type="tool_use", id="toolu_1", name="get_weather", input={}
+              ),
+          ),
+          anthropic_types.RawContentBlockDeltaEvent(
+              type="content_block_delta",
+              index=1,
+              delta=anthropic_types.InputJSONDelta(
+                  type="input_json_delta", partial_json='{"city": "Pa'
+              ),
+          ),
+          anthropic_types.RawContentBlockDeltaEvent(
+              type="content_block_delta",
+              index=1,
+              delta=anthropic_types.InputJSONDelta(
+                  type="input_json_delta", partial_json='ris"}'
+              ),
+          ),
+          anthropic_types.RawContentBlockStopEvent(
+              type="content_block_stop", index=1
+          ),
+      ]
+      + _stop_events("tool_use")
+  )
+  fake_client = _FakeAsyncAnthropic(events)
+
+  with mock.patch.object(claude, "_anthropic_client", fake_client):
+    responses = [
+        r async for r in claude.generate_content_async(llm_request, stream=True)
+    ]
+
+  final = responses[-1]
+  assert not final.partial
+  assert [p.text for p in final.content.parts if p.text] == ["Checking."]
+  function_calls = [
+      p.function_call for p in final.content.parts if p.function_call
+  ]
+  assert len(function_calls) == 1
+  assert function_calls[0].name == "get_weather"
+  assert function_calls[0].id == "toolu_1"
+  assert function_calls[0].args == {"city": "Paris"}
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_adds_prompt_cache_breakpoints(
+    llm_request,
+):
+  claude = AnthropicLlm(
+      model="claude-sonnet-4-20250514", enable_prompt_caching=True
+  )
+  llm_request.config.tools = [
+      types.Tool(
+          function_declarations=[
+              types.FunctionDeclaration(name="first", description="1"),
+              types.FunctionDeclaration(name="second", description="2"),
+          ]
+      )
+  ]
+  fake_client = _FakeAsyncAnthropic(
+      _text_stream_events(["ok"]) + _stop_events("end_turn")
+  )
+
+  with mock.patch.object(claude, "_anthropic_client", fake_client):
+    _ = [
+        r async for r in claude.generate_content_async(llm_request, stream=True)
+    ]
+
+  kwargs = fake_client.messages.calls[0]
+  assert "cache_control" not in kwargs["tools"][0]
+  assert kwargs["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+  assert kwargs["system"] == [{
+      "type": "text",
+      "text": "You are a helpful assistant",
+      "cache_control": {"type": "ephemeral"},
+  }]
+  assert kwargs["messages"][-1]["content"][-1]["cache_control"] == {
+      "type": "ephemeral"
+  }
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_without_prompt_caching(llm_request):
+  claude = AnthropicLlm(model="claude-sonnet-4-20250514")
+  fake_client = _FakeAsyncAnthropic(
+      _text_stream_events(["ok"]) + _stop_events("end_turn")
+  )
+
+  with mock.patch.object(claude, "_anthropic_client", fake_client):
+    _ = [
+        r async for r in claude.generate_content_async(llm_request, stream=True)
+    ]
+
+  kwargs = fake_client.messages.calls[0]
+  assert kwargs["system"] == "You are a helpful assistant"
+  assert "cache_control" not in kwargs["messages"][-1]["content"][-1]
+
+
+def test_add_prompt_cache_breakpoints_skips_empty_text_blocks():
+  messages = [
+      {"role": "user", "content": [{"type": "text", "text": "hi"}]},
+      {"role": "assistant", "content": [{"type": "text", "text": ""}]},
+  ]
+
+  system = anthropic_llm.add_prompt_cache_breakpoints(None, messages, [])
+
+  assert system is None
+  assert "cache_control" not in messages[1]["content"][0]
+  assert messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
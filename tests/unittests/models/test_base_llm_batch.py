@@ -0,0 +1,144 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import collections
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+import pytest
+
+
+class _FakeBatchBackend(BaseLlm):
+  """Echoes the request text after a delay that decreases with the index.
+
+  Requests whose text is listed in `failures` fail that many times before
+  succeeding.
+  """
+
+  failures: dict[str, int] = {}
+  in_flight: int = 0
+  max_in_flight: int = 0
+  calls: collections.Counter = collections.Counter()
+
+  async def generate_content_async(self, llm_request, stream=False):
+    text = llm_request.contents[0].parts[0].text
+    self.calls[text] += 1
+    self.in_flight += 1
+    self.max_in_flight = max(self.max_in_flight, self.in_flight)
+    try:
+      await asyncio.sleep(0.001 * (10 - int(text)))
+      if self.failures.get(text, 0) >= self.calls[text]:
+        raise ConnectionError(f"request {text} failed")
+      yield LlmResponse(
+          content=types.Content(
+              role="model", parts=[types.Part.from_text(text=text)]
+          ),
+          partial=stream,
+      )
+    finally:
+      self.in_flight -= 1
+
+
+def _requests(count: int) -> list[LlmRequest]:
+  return [
+      LlmRequest(
+          contents=[
+              types.Content(
+                  role="user", parts=[types.Part.from_text(text=str(i))]
+              )
+          ]
+      )
+      for i in range(count)
+  ]
+
+
+def _texts(responses: list[LlmResponse]) -> list[str]:
+  return [response.content.parts[0].text for response in responses]
+
+
+@pytest.mark.asyncio
+async def test_results_keep_request_order_under_concurrency_limit():
+  backend = _FakeBatchBackend(model="fake")
+
+  responses = await backend.generate_content_batch(
+      _requests(10), max_concurrency=3
+  )
+
+  assert _texts(responses) == [str(i) for i in range(10)]
+  assert backend.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_partial_failures_are_returned_in_place():
+  backend = _FakeBatchBackend(model="fake", failures={"2": 5, "7": 5})
+
+  results = await backend.generate_content_batch(
+      _requests(10), return_exceptions=True
+  )
+
+  assert isinstance(results[2], ConnectionError)
+  assert isinstance(results[7], ConnectionError)
+  succeeded = [r for i, r in enumerate(results) if i not in (2, 7)]
+  assert _texts(succeeded) == [str(i) for i in range(10) if i not in (2, 7)]
+
+
+@pytest.mark.asyncio
+async def test_failure_is_raised_after_all_requests_finish():
+  backend = _FakeBatchBackend(model="fake", failures={"0": 1})
+
+  with pytest.raises(ConnectionError, match="request 0 failed"):
+    await backend.generate_content_batch(_requests(5))
+
+  assert all(backend.calls[str(i)] == 1 for i in range(5))
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_retried():
+  backend = _FakeBatchBackend(model="fake", failures={"1": 2, "4": 1})
+
+  responses = await backend.generate_content_batch(
+      _requests(5), max_attempts=3, retry_delay_seconds=0
+  )
+
+  assert _texts(responses) == ["0", "1", "2", "3", "4"]
+  assert backend.calls == {"0": 1, "1": 3, "2": 1, "3": 1, "4": 2}
+
+
+@pytest.mark.asyncio
+async def test_requests_without_response_return_none():
+
+  class _SilentBackend(BaseLlm):
+
+    async def generate_content_async(self, llm_request, stream=False):
+      return
+      yield  # pylint: disable=unreachable
+
+  responses = await _SilentBackend(model="fake").generate_content_batch(
+      _requests(2)
+  )
+
+  assert responses == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_invalid_arguments():
+  backend = _FakeBatchBackend(model="fake")
+
+  with pytest.raises(ValueError, match="max_concurrency"):
+    await backend.generate_content_batch(_requests(1), max_concurrency=0)
+  with pytest.raises(ValueError, match="max_attempts"):
+    await backend.generate_content_batch(_requests(1), max_attempts=0)
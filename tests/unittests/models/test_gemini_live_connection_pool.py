@@ -0,0 +1,241 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+from unittest import mock
+
+from google.adk.models.gemini_live_connection_pool import GeminiLiveConnectionPool
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+import pytest
+
+_HANDSHAKE_SECONDS = 0.2
+_MODEL = "gemini-live-2.5-flash"
+
+
+class _FakeLiveSession:
+  """A live session that answers every turn with a single text message."""
+
+  def __init__(self):
+    self.closed = False
+    self._turns = asyncio.Queue()
+
+  async def send(self, input=None, end_of_turn=False):
+    del end_of_turn
+    await self._turns.put(input)
+
+  async def receive(self):
+    await self._turns.get()
+    yield types.LiveServerMessage(
+        server_content=types.LiveServerContent(
+            model_turn=types.Content(
+                role="model", parts=[types.Part.from_text(text="hello")]
+            ),
+            turn_complete=True,
+        )
+    )
+
+  async def close(self):
+    await asyncio.sleep(0)
+    self.closed = True
+
+
+class _FakeLiveServer:
+  """Stands in for `client.aio.live.connect` with a slow handshake."""
+
+  def __init__(self, handshake_seconds: float = _HANDSHAKE_SECONDS):
+    self.handshake_seconds = handshake_seconds
+    self.sessions: list[_FakeLiveSession] = []
+    self.fail = False
+
+  @contextlib.asynccontextmanager
+  async def connect(self, *, model, config):
+    del model, config
+    await asyncio.sleep(self.handshake_seconds)
+    if self.fail:
+      raise ConnectionError("handshake failed")
+    session = _FakeLiveSession()
+    self.sessions.append(session)
+    try:
+      yield session
+    finally:
+      await session.close()
+
+
+def _live_request() -> LlmRequest:
+  return LlmRequest(
+      model=_MODEL,
+      config=types.GenerateContentConfig(system_instruction="Be brief."),
+      live_connect_config=types.LiveConnectConfig(
+          response_modalities=[types.Modality.TEXT]
+      ),
+  )
+
+
+async def _first_response(gemini: Gemini) -> None:
+  async with gemini.connect(_live_request()) as connection:
+    await connection.send_content(
+        types.Content(role="user", parts=[types.Part.from_text(text="hi")])
+    )
+    async for _ in connection.receive():
+      break
+
+
+@pytest.fixture
+def live_server():
+  return _FakeLiveServer()
+
+
+@pytest.fixture
+def gemini_with_pool(live_server):
+  pool = GeminiLiveConnectionPool(min_idle_sessions=1)
+  gemini = Gemini(model=_MODEL, live_connection_pool=pool)
+  with mock.patch.object(gemini, "_live_api_client") as live_client:
+    live_client.aio.live.connect = live_server.connect
+    yield gemini
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_session_skips_handshake(gemini_with_pool, live_server):
+  live_server.handshake_seconds = 0
+  pool = gemini_with_pool.live_connection_pool
+
+  await _first_response(gemini_with_pool)
+  # The first call schedules a background refill.
+  await asyncio.gather(*pool._refill_tasks.values())
+  prewarmed_session = live_server.sessions[-1]
+  await _first_response(gemini_with_pool)
+  await pool.close()
+
+  assert pool.misses == 1
+  assert pool.hits == 1
+  assert prewarmed_session.closed
+  assert all(session.closed for session in live_server.sessions)
+
+
+@pytest.mark.asyncio
+async def test_prewarm_fills_pool(live_server):
+  pool = GeminiLiveConnectionPool(min_idle_sessions=2)
+  config = types.LiveConnectConfig(response_modalities=[types.Modality.TEXT])
+
+  await pool.prewarm(live_server.connect, _MODEL, config)
+
+  assert pool.idle_count(_MODEL, config) == 2
+  other_config = types.LiveConnectConfig(
+      response_modalities=[types.Modality.AUDIO]
+  )
+  assert pool.idle_count(_MODEL, other_config) == 0
+  await pool.close()
+  assert pool.idle_count(_MODEL, config) == 0
+  assert all(session.closed for session in live_server.sessions)
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_sessions_are_discarded(live_server):
+  live_server.handshake_seconds = 0
+  healthy = {"value": True}
+  pool = GeminiLiveConnectionPool(
+      min_idle_sessions=1,
+      max_idle_seconds=60,
+      health_check=lambda session: healthy["value"],
+  )
+  config = types.LiveConnectConfig()
+  await pool.prewarm(live_server.connect, _MODEL, config)
+  stale_session = live_server.sessions[0]
+
+  healthy["value"] = False
+  async with pool.session(live_server.connect, _MODEL, config) as session:
+    assert session is not stale_session
+  assert stale_session.closed
+  assert pool.misses == 1
+
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_sessions_handed_out_during_refill_are_not_removed(live_server):
+  live_server.handshake_seconds = 0
+  stale_sessions = []
+  pool = GeminiLiveConnectionPool(
+      min_idle_sessions=2,
+      health_check=lambda session: session not in stale_sessions,
+  )
+  config = types.LiveConnectConfig()
+  await pool.prewarm(live_server.connect, _MODEL, config)
+  stale_sessions.extend(live_server.sessions)
+
+  async def use_session():
+    async with pool.session(live_server.connect, _MODEL, config):
+      pass
+
+  # The refill discards the first stale session while the second one is
+  # taken, and discarded, by the session request.
+  await asyncio.gather(
+      pool.prewarm(live_server.connect, _MODEL, config), use_session()
+  )
+  await asyncio.gather(*pool._refill_tasks.values())
+
+  assert all(session.closed for session in stale_sessions)
+  assert pool.misses == 1
+  assert pool.idle_count(_MODEL, config) == 2
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_max_idle_seconds_expires_sessions(live_server):
+  live_server.handshake_seconds = 0
+  pool = GeminiLiveConnectionPool(min_idle_sessions=1, max_idle_seconds=0)
+  config = types.LiveConnectConfig()
+  await pool.prewarm(live_server.connect, _MODEL, config)
+
+  async with pool.session(live_server.connect, _MODEL, config):
+    pass
+
+  assert pool.hits == 0
+  assert live_server.sessions[0].closed
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_refill_failure_does_not_break_connect(live_server):
+  live_server.handshake_seconds = 0
+  pool = GeminiLiveConnectionPool(min_idle_sessions=1)
+  config = types.LiveConnectConfig()
+  live_server.fail = True
+
+  await pool.prewarm(live_server.connect, _MODEL, config)
+  assert pool.idle_count(_MODEL, config) == 0
+
+  live_server.fail = False
+  async with pool.session(live_server.connect, _MODEL, config) as session:
+    assert isinstance(session, type(live_server.sessions[0]))
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_session_resumption_bypasses_pool(gemini_with_pool):
+  pool = gemini_with_pool.live_connection_pool
+  llm_request = _live_request()
+  llm_request.live_connect_config.session_resumption = (
+      types.SessionResumptionConfig(handle="resume-me")
+  )
+
+  async with gemini_with_pool.connect(llm_request):
+    pass
+
+  assert pool.hits == 0
+  assert pool.misses == 0
+  await pool.close()
@@ -24,6 +24,7 @@ from unittest.mock import AsyncMock
 from unittest.mock import Mock
 import warnings
 
+from google.adk.models import lite_llm
 from google.adk.models.lite_llm import _append_fallback_user_content_if_missing
 from google.adk.models.lite_llm import _content_to_message_param
 from google.adk.models.lite_llm import _FILE_ID_REQUIRED_PROVIDERS
@@ -3943,3 +3944,189 @@ def test_handles_litellm_logger_names(logger_name):
   finally:
     # Clean up
     test_logger.removeHandler(handler)
+
+
+def _build_tool_loop_history(num_messages: int) -> list[types.Content]:
+  contents = [
+      types.Content(
+          role="user",
+          parts=[
+              types.Part.from_text(text="Find vendors."),
+              types.Part.from_bytes(
+                  data=b"\x89PNG" * 256, mime_type="image/png"
+              ),
+          ],
+      )
+  ]
+  for i in range((num_messages - 1) // 2):
+    contents.append(
+        types.Content(
+            role="model",
+            parts=[
+                types.Part(
+                    function_call=types.FunctionCall(
+                        id=f"call_{i}", name="lookup", args={"page": i}
+                    )
+                )
+            ],
+        )
+    )
+    contents.append(
+        types.Content(
+            role="user",
+            parts=[
+                types.Part(
+                    function_response=types.FunctionResponse(
+                        id=f"call_{i}",
+                        name="lookup",
+                        response={"rows": [{"id": j} for j in range(20)]},
+                    )
+                )
+            ],
+        )
+    )
+  return contents
+
+
+async def test_get_completion_inputs_cache_reuses_converted_prefix(mocker):
+  """A 200-message tool loop converts only the new turn."""
+  contents = _build_tool_loop_history(200)
+  llm_request = LlmRequest(
+      contents=contents,
+      config=LLM_REQUEST_WITH_FUNCTION_DECLARATION.config,
+  )
+  cache = lite_llm._CompletionInputsCache()
+  convert_spy = mocker.spy(lite_llm, "_content_to_message_param")
+  tool_spy = mocker.spy(lite_llm, "_function_declaration_to_tool_param")
+
+  uncached_messages, uncached_tools, _, _ = await _get_completion_inputs(
+      llm_request, model="anthropic/claude-3"
+  )
+  convert_spy.reset_mock()
+  tool_spy.reset_mock()
+
+  cold_messages, cold_tools, _, _ = await _get_completion_inputs(
+      llm_request, model="anthropic/claude-3", cache=cache
+  )
+  assert convert_spy.call_count == len(contents)
+  assert tool_spy.call_count == 1
+  assert cold_messages == uncached_messages
+  assert cold_tools == uncached_tools
+
+  convert_spy.reset_mock()
+  tool_spy.reset_mock()
+  next_request = LlmRequest(
+      contents=[c.model_copy(deep=True) for c in contents]
+      + [types.Content(role="user", parts=[types.Part.from_text(text="more")])],
+      config=LLM_REQUEST_WITH_FUNCTION_DECLARATION.config.model_copy(deep=True),
+  )
+  warm_messages, warm_tools, _, _ = await _get_completion_inputs(
+      next_request, model="anthropic/claude-3", cache=cache
+  )
+
+  assert convert_spy.call_count == 1
+  assert tool_spy.call_count == 0
+  assert warm_messages[:-1] == cold_messages
+  assert warm_tools == cold_tools
+  assert cache.messages.hits == len(contents)
+
+
+async def test_get_completion_inputs_cache_detects_mutated_content():
+  cache = lite_llm._CompletionInputsCache()
+  content = types.Content(role="user", parts=[types.Part.from_text(text="a")])
+  llm_request = LlmRequest(contents=[content])
+
+  messages, _, _, _ = await _get_completion_inputs(
+      llm_request, model="openai/gpt-4o", cache=cache
+  )
+  assert messages[0]["content"] == "a"
+
+  content.parts[0].text = "b"
+  messages, _, _, _ = await _get_completion_inputs(
+      llm_request, model="openai/gpt-4o", cache=cache
+  )
+  assert messages[0]["content"] == "b"
+
+
+async def test_get_completion_inputs_cache_returns_independent_copies():
+  cache = lite_llm._CompletionInputsCache()
+  llm_request = LlmRequest(
+      contents=[
+          types.Content(role="user", parts=[types.Part.from_text(text="a")])
+      ]
+  )
+
+  messages, _, _, _ = await _get_completion_inputs(
+      llm_request, model="openai/gpt-4o", cache=cache
+  )
+  messages[0]["content"] = "mutated"
+  messages, _, _, _ = await _get_completion_inputs(
+      llm_request, model="openai/gpt-4o", cache=cache
+  )
+
+  assert messages[0]["content"] == "a"
+
+
+async def test_get_completion_inputs_cache_is_bounded():
+  cache = lite_llm._CompletionInputsCache(max_messages=3)
+  llm_request = LlmRequest(
+      contents=[
+          types.Content(role="user", parts=[types.Part.from_text(text=str(i))])
+          for i in range(10)
+      ]
+  )
+
+  await _get_completion_inputs(llm_request, model="openai/gpt-4o", cache=cache)
+
+  assert len(cache.messages) == 3
+
+
+async def test_generate_content_async_reuses_conversion_cache(
+    mock_acompletion, lite_llm_instance, mocker
+):
+  convert_spy = mocker.spy(lite_llm, "_content_to_message_param")
+  for _ in range(2):
+    async for _ in lite_llm_instance.generate_content_async(
+        LLM_REQUEST_WITH_FUNCTION_DECLARATION.model_copy(deep=True)
+    ):
+      pass
+
+  assert convert_spy.call_count == 1
+  assert mock_acompletion.call_count == 2
+  assert (
+      mock_acompletion.call_args_list[0].kwargs["messages"]
+      == mock_acompletion.call_args_list[1].kwargs["messages"]
+  )
+
+
+async def test_get_completion_inputs_cache_bypassed_for_unserializable_content():
+  class Row:
+
+    def __str__(self):
+      return "row"
+
+  cache = lite_llm._CompletionInputsCache()
+  llm_request = LlmRequest(
+      contents=[
+          types.Content(
+              role="user",
+              parts=[
+                  types.Part(
+                      function_response=types.FunctionResponse(
+                          id="call_1", name="lookup", response={"row": Row()}
+                      )
+                  )
+              ],
+          )
+      ]
+  )
+
+  cached_messages, _, _, _ = await _get_completion_inputs(
+      llm_request, model="openai/gpt-4o", cache=cache
+  )
+  messages, _, _, _ = await _get_completion_inputs(
+      llm_request, model="openai/gpt-4o"
+  )
+
+  assert cached_messages == messages
+  assert len(cache.messages) == 0
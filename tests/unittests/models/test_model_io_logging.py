@@ -0,0 +1,186 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from unittest import mock
+
+from google.adk.models import google_llm
+from google.adk.models import model_io_logging
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.model_io_logging import LazyModelIoMessage
+from google.adk.models.model_io_logging import ModelIoLogOptions
+from google.genai import types
+import pytest
+
+_GEMINI_LOGGER = "google_adk.google.adk.models.google_llm"
+
+
+@pytest.fixture(autouse=True)
+def restore_options():
+  original = model_io_logging.get_model_io_logging_options()
+  yield
+  model_io_logging.configure_model_io_logging(original)
+
+
+def _large_request(num_contents: int = 200) -> LlmRequest:
+  return LlmRequest(
+      model="gemini-2.5-flash",
+      contents=[
+          types.Content(
+              role="user" if i % 2 == 0 else "model",
+              parts=[types.Part.from_text(text="x" * 1000)],
+          )
+          for i in range(num_contents)
+      ],
+      config=types.GenerateContentConfig(
+          system_instruction="You are a helpful assistant",
+          tools=[
+              types.Tool(
+                  function_declarations=[
+                      types.FunctionDeclaration(name=f"tool_{i}")
+                      for i in range(50)
+                  ]
+              )
+          ],
+      ),
+  )
+
+
+async def _generate(gemini: Gemini, llm_request: LlmRequest, stream: bool):
+  response = types.GenerateContentResponse(
+      candidates=[
+          types.Candidate(
+              content=types.Content(
+                  role="model", parts=[types.Part.from_text(text="ok")]
+              ),
+              finish_reason=types.FinishReason.STOP,
+          )
+      ]
+  )
+  with mock.patch.object(gemini, "api_client") as mock_client:
+    if stream:
+
+      async def _stream():
+        for _ in range(3):
+          yield response
+
+      async def _create_stream(**kwargs):
+        return _stream()
+
+      mock_client.aio.models.generate_content_stream = _create_stream
+    else:
+
+      async def _create(**kwargs):
+        return response
+
+      mock_client.aio.models.generate_content = _create
+    return [r async for r in gemini.generate_content_async(llm_request, stream)]
+
+
+@pytest.mark.asyncio
+async def test_no_serialization_when_debug_disabled(caplog):
+  """Model I/O logging does no formatting work when disabled."""
+  caplog.set_level(logging.INFO, logger=_GEMINI_LOGGER)
+  gemini = Gemini(model="gemini-2.5-flash")
+
+  with (
+      mock.patch.object(
+          google_llm, "_build_request_log", wraps=google_llm._build_request_log
+      ) as request_log,
+      mock.patch.object(
+          google_llm,
+          "_build_response_log",
+          wraps=google_llm._build_response_log,
+      ) as response_log,
+      mock.patch.object(
+          types.Content, "model_dump_json", autospec=True
+      ) as content_dump,
+  ):
+    for _ in range(3):
+      await _generate(gemini, _large_request(), stream=True)
+
+  assert request_log.call_count == 0
+  assert response_log.call_count == 0
+  assert content_dump.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_streamed_chunks_are_logged_when_debug_enabled(caplog):
+  caplog.set_level(logging.DEBUG, logger=_GEMINI_LOGGER)
+  gemini = Gemini(model="gemini-2.5-flash")
+
+  await _generate(gemini, _large_request(2), stream=True)
+
+  records = [r for r in caplog.records if hasattr(r, "model_io_direction")]
+  assert [r.model_io_direction for r in records] == [
+      "request",
+      "response",
+      "response",
+      "response",
+  ]
+  assert "LLM Request:" in records[0].getMessage()
+
+
+@pytest.mark.asyncio
+async def test_head_sampling_skips_whole_requests(caplog):
+  caplog.set_level(logging.DEBUG, logger=_GEMINI_LOGGER)
+  model_io_logging.configure_model_io_logging(ModelIoLogOptions(sample_rate=0))
+  gemini = Gemini(model="gemini-2.5-flash")
+
+  with mock.patch.object(google_llm, "_build_request_log") as request_log:
+    await _generate(gemini, _large_request(2), stream=True)
+
+  request_log.assert_not_called()
+  assert not [r for r in caplog.records if hasattr(r, "model_io_direction")]
+
+
+def test_should_log_model_io_respects_sample_rate():
+  logger = logging.getLogger("test_model_io_sampling")
+  logger.setLevel(logging.DEBUG)
+  model_io_logging.configure_model_io_logging(
+      ModelIoLogOptions(sample_rate=0.5)
+  )
+
+  with mock.patch.object(model_io_logging.random, "random", return_value=0.4):
+    assert model_io_logging.should_log_model_io(logger)
+  with mock.patch.object(model_io_logging.random, "random", return_value=0.6):
+    assert not model_io_logging.should_log_model_io(logger)
+
+
+def test_lazy_message_applies_redactors_and_size_cap():
+  build = mock.Mock(return_value="token=secret " + "y" * 100)
+  message = LazyModelIoMessage(
+      build,
+      "arg",
+      options=ModelIoLogOptions(
+          max_chars=20,
+          redactors=[lambda text: text.replace("secret", "<redacted>")],
+      ),
+  )
+
+  build.assert_not_called()
+  text = str(message)
+
+  build.assert_called_once_with("arg")
+  assert text.startswith("token=<redacted> yyy")
+  assert text.endswith("[truncated 97 chars]")
+
+
+def test_lazy_message_without_size_cap():
+  message = LazyModelIoMessage(
+      lambda: "z" * 50, options=ModelIoLogOptions(max_chars=None)
+  )
+
+  assert str(message) == "z" * 50
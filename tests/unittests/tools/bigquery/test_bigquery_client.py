@@ -18,6 +18,7 @@ import os
 from unittest import mock
 
 import google.adk
+from google.adk.tools.bigquery import client as client_lib
 from google.adk.tools.bigquery.client import get_bigquery_client
 import google.auth
 from google.auth.exceptions import DefaultCredentialsError
@@ -201,3 +202,73 @@ def test_bigquery_client_location_custom():
   # Verify that the client has the desired project set
   assert client.project == "test-gcp-project"
   assert client.location == "us-central1"
+
+
+def test_bigquery_client_is_reused():
+  """Repeated tool calls construct a single client."""
+  client_lib.clear_client_cache()
+  credentials = mock.create_autospec(Credentials, instance=True)
+
+  with mock.patch.object(
+      client_lib.bigquery, "Client", autospec=True
+  ) as client_class:
+    clients = [
+        get_bigquery_client(
+            project="test-gcp-project",
+            credentials=credentials,
+            user_agent=["my-agent", "execute_sql"],
+        )
+        for _ in range(30)
+    ]
+
+  assert client_class.call_count == 1
+  assert all(client is clients[0] for client in clients)
+
+
+def test_bigquery_client_cache_key():
+  """Clients are not shared across projects, locations or user agents."""
+  client_lib.clear_client_cache()
+  credentials = mock.create_autospec(Credentials, instance=True)
+
+  def _get(**kwargs):
+    return get_bigquery_client(
+        **{"project": "p1", "credentials": credentials, **kwargs}
+    )
+
+  clients = {
+      id(_get()),
+      id(_get(project="p2")),
+      id(_get(location="EU")),
+      id(_get(user_agent="other-agent")),
+      id(
+          _get(
+              credentials=mock.create_autospec(Credentials, instance=True),
+          )
+      ),
+  }
+
+  assert len(clients) == 5
+
+
+def test_bigquery_client_refreshed_oauth_credentials():
+  """Credentials restored from the token cache reuse the client."""
+  client_lib.clear_client_cache()
+
+  def _restored_credentials(token):
+    return Credentials(
+        token=token,
+        refresh_token="refresh-token",
+        client_id="client-id",
+        client_secret="client-secret",
+        token_uri="https://oauth2.googleapis.com/token",
+    )
+
+  first = get_bigquery_client(
+      project="test-gcp-project", credentials=_restored_credentials("token-1")
+  )
+  second = get_bigquery_client(
+      project="test-gcp-project", credentials=_restored_credentials("token-2")
+  )
+
+  assert second is first
+  assert first._credentials.token == "token-2"
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import datetime
 import decimal
+import json
 import os
 import textwrap
 from typing import Optional
@@ -36,6 +37,7 @@ import google.auth
 from google.auth.exceptions import DefaultCredentialsError
 from google.cloud import bigquery
 from google.oauth2.credentials import Credentials
+import pyarrow as pa
 import pytest
 
 
@@ -2278,3 +2280,226 @@ def test_tool_call_doesnt_mutate_job_labels(tool_call):
     # Test job_labels remain unchanged after tool call
     assert settings.job_labels == original_labels
     assert "adk-bigquery-tool" not in settings.job_labels
+
+
+class _FakeArrowRowIterator:
+  """Serves query results as Arrow record batches and counts fetched batches."""
+
+  def __init__(self, record_batches):
+    self._record_batches = record_batches
+    self.fetched_batches = 0
+    self.bqstorage_client = None
+
+  def to_arrow_iterable(self, bqstorage_client=None):
+    self.bqstorage_client = bqstorage_client
+    for record_batch in self._record_batches:
+      self.fetched_batches += 1
+      yield record_batch
+
+
+def _execute_sql_with_arrow_results(record_batches, **settings):
+  row_iterator = _FakeArrowRowIterator(record_batches)
+  bq_client = mock.create_autospec(bigquery.Client, instance=True)
+  bq_client.query_and_wait.return_value = row_iterator
+  storage_client = mock.sentinel.storage_client
+  with (
+      mock.patch.object(
+          bq_client_lib, "get_bigquery_client", return_value=bq_client
+      ),
+      mock.patch.object(
+          bq_client_lib,
+          "get_bigquery_storage_client",
+          return_value=storage_client,
+      ),
+  ):
+    result = query_tool.execute_sql(
+        "my_project",
+        "SELECT * FROM t",
+        mock.create_autospec(Credentials, instance=True),
+        BigQueryToolConfig(write_mode=WriteMode.ALLOWED, **settings),
+        mock.create_autospec(ToolContext, instance=True),
+    )
+  assert "max_results" not in bq_client.query_and_wait.call_args.kwargs
+  assert row_iterator.bqstorage_client is storage_client
+  return result, row_iterator
+
+
+def _record_batch(start, count):
+  return pa.RecordBatch.from_pydict({
+      "id": list(range(start, start + count)),
+      "ts": [datetime.datetime(2025, 1, 1)] * count,
+      "payload": ["x" * 100] * count,
+  })
+
+
+def test_execute_sql_arrow_results_within_budget():
+  """Rows are converted from Arrow and kept until the byte budget is used."""
+  record_batches = [_record_batch(0, 10), _record_batch(10, 10)]
+
+  result, _ = _execute_sql_with_arrow_results(
+      record_batches, max_query_result_bytes=100_000
+  )
+
+  assert result["status"] == "SUCCESS"
+  assert [row["id"] for row in result["rows"]] == list(range(20))
+  assert result["rows"][0]["ts"] == "2025-01-01 00:00:00"
+  assert "result_is_likely_truncated" not in result
+
+
+def test_execute_sql_arrow_results_truncated_by_bytes():
+  """Only the batches needed to fill the byte budget are fetched."""
+  record_batches = [_record_batch(i * 10, 10) for i in range(100)]
+
+  result, row_iterator = _execute_sql_with_arrow_results(
+      record_batches, max_query_result_bytes=2_000, max_query_result_rows=1000
+  )
+
+  assert result["result_is_likely_truncated"]
+  assert len(json.dumps(result["rows"])) <= 2_000
+  assert 0 < len(result["rows"]) < 20
+  assert row_iterator.fetched_batches <= 2
+
+
+def test_execute_sql_arrow_results_truncated_by_rows():
+  record_batches = [_record_batch(0, 10), _record_batch(10, 10)]
+
+  result, _ = _execute_sql_with_arrow_results(
+      record_batches, max_query_result_bytes=100_000, max_query_result_rows=5
+  )
+
+  assert len(result["rows"]) == 5
+  assert result["result_is_likely_truncated"]
+
+
+def test_max_query_result_bytes_must_be_positive():
+  with pytest.raises(ValueError, match="must be positive"):
+    BigQueryToolConfig(max_query_result_bytes=0)
+
+
+def _mock_read_only_client(rows):
+  bq_client = mock.create_autospec(bigquery.Client, instance=True)
+  dry_run_job = mock.create_autospec(bigquery.QueryJob, instance=True)
+  dry_run_job.statement_type = "SELECT"
+  bq_client.query.return_value = dry_run_job
+  bq_client.query_and_wait.return_value = [
+      bigquery.Row(row, {"id": 0}) for row in rows
+  ]
+  return bq_client
+
+
+def test_execute_sql_caches_read_only_results():
+  """Repeated read-only queries are served from the result cache."""
+  settings = BigQueryToolConfig(query_result_cache_ttl_seconds=60)
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  bq_client = _mock_read_only_client([(1,), (2,)])
+  queries = ["SELECT id FROM t", "SELECT id\n  FROM t;", "SELECT 2"] * 4
+
+  with mock.patch.object(
+      bq_client_lib, "get_bigquery_client", return_value=bq_client
+  ):
+    results = [
+        query_tool.execute_sql(
+            "my_project", query, credentials, settings, tool_context
+        )
+        for query in queries
+    ]
+
+  assert results[0]["rows"] == [{"id": 1}, {"id": 2}]
+  assert results[0]["query_result_cache"]["hit"] is False
+  assert results[1]["rows"] == results[0]["rows"]
+  assert results[1]["query_result_cache"]["hit"] is True
+  assert results[-1]["query_result_cache"] == {
+      "hit": True,
+      "hits": 10,
+      "misses": 2,
+      "hit_rate": 0.8333,
+  }
+  # One dry run and one execution per distinct query.
+  assert bq_client.query.call_count == 2
+  assert bq_client.query_and_wait.call_count == 2
+
+
+def test_execute_sql_cache_is_per_principal():
+  settings = BigQueryToolConfig(query_result_cache_ttl_seconds=60)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  bq_client = _mock_read_only_client([(1,)])
+
+  with mock.patch.object(
+      bq_client_lib, "get_bigquery_client", return_value=bq_client
+  ):
+    for refresh_token in ["alice", "bob"]:
+      query_tool.execute_sql(
+          "my_project",
+          "SELECT id FROM t",
+          Credentials(token="token", refresh_token=refresh_token),
+          settings,
+          tool_context,
+      )
+
+  assert bq_client.query_and_wait.call_count == 2
+
+
+def test_execute_sql_write_mode_bypasses_and_invalidates_cache():
+  read_settings = BigQueryToolConfig(query_result_cache_ttl_seconds=60)
+  write_settings = BigQueryToolConfig(
+      write_mode=WriteMode.ALLOWED, query_result_cache_ttl_seconds=60
+  )
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  bq_client = _mock_read_only_client([(1,)])
+
+  with mock.patch.object(
+      bq_client_lib, "get_bigquery_client", return_value=bq_client
+  ):
+    query_tool.execute_sql(
+        "my_project",
+        "SELECT id FROM t",
+        credentials,
+        read_settings,
+        tool_context,
+    )
+    write_result = query_tool.execute_sql(
+        "my_project",
+        "DELETE FROM t WHERE TRUE",
+        credentials,
+        write_settings,
+        tool_context,
+    )
+    query_tool.execute_sql(
+        "my_project",
+        "SELECT id FROM t",
+        credentials,
+        read_settings,
+        tool_context,
+    )
+
+  assert "query_result_cache" not in write_result
+  assert len(write_settings._query_result_cache) == 0
+  assert bq_client.query_and_wait.call_count == 3
+
+
+def test_execute_sql_without_cache_config_does_not_cache():
+  settings = BigQueryToolConfig()
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  bq_client = _mock_read_only_client([(1,)])
+
+  with mock.patch.object(
+      bq_client_lib, "get_bigquery_client", return_value=bq_client
+  ):
+    for _ in range(2):
+      result = query_tool.execute_sql(
+          "my_project", "SELECT id FROM t", credentials, settings, tool_context
+      )
+
+  assert settings._query_result_cache is None
+  assert "query_result_cache" not in result
+  assert bq_client.query_and_wait.call_count == 2
+
+
+def test_query_result_cache_settings_must_be_positive():
+  with pytest.raises(ValueError, match="must be positive"):
+    BigQueryToolConfig(query_result_cache_ttl_seconds=0)
+  with pytest.raises(ValueError, match="must be positive"):
+    BigQueryToolConfig(query_result_cache_max_bytes=-1)
@@ -460,3 +460,62 @@ class TestGoogleApiToolset:
     )
 
     assert tool_set.tool_name_prefix == tool_name_prefix
+
+  @mock.patch(
+      "google.adk.tools.google_api_tool.google_api_toolset.GoogleApiToOpenApiConverter"
+  )
+  async def test_bundle_dir_skips_conversion(
+      self, mock_converter_class, tmp_path
+  ):
+    """A saved bundle is used instead of converting the discovery document."""
+    mock_converter = mock_converter_class.return_value
+    mock_converter.get_google_api_spec.return_value = {"revision": "1"}
+    mock_converter.convert.return_value = {
+        "openapi": "3.0.0",
+        "info": {"title": "Calendar", "version": "v3"},
+        "servers": [{"url": "https://www.googleapis.com/calendar/v3"}],
+        "paths": {
+            f"/calendars/{name}": {
+                "get": {
+                    "operationId": f"calendar.calendars.{name}",
+                    "responses": {"200": {"description": "OK"}},
+                }
+            }
+            for name in ("get", "list")
+        },
+        "components": {
+            "securitySchemes": {
+                "oauth2": {
+                    "type": "oauth2",
+                    "flows": {
+                        "authorizationCode": {
+                            "authorizationUrl": "https://example.com/auth",
+                            "tokenUrl": "https://example.com/token",
+                            "scopes": {DEFAULT_SCOPE: "Calendar"},
+                        }
+                    },
+                }
+            }
+        },
+    }
+    GoogleApiToolset(TEST_API_NAME, TEST_API_VERSION, bundle_dir=str(tmp_path))
+
+    tool_set = GoogleApiToolset(
+        TEST_API_NAME,
+        TEST_API_VERSION,
+        tool_filter=["calendar_calendars_list"],
+        bundle_dir=str(tmp_path),
+    )
+    tools = await tool_set.get_tools()
+
+    mock_converter.convert.assert_called_once()
+    assert [tool.name for tool in tools] == ["calendar_calendars_list"]
+    assert tools[0]._rest_api_tool.auth_scheme.scopes == [DEFAULT_SCOPE]
+    # Only the selected tool was created from the bundle.
+    assert list(tool_set._openapi_toolset._pending_operations) == [0]
+
+    # A changed discovery document is converted again.
+    mock_converter.get_google_api_spec.return_value = {"revision": "2"}
+    GoogleApiToolset(TEST_API_NAME, TEST_API_VERSION, bundle_dir=str(tmp_path))
+    assert mock_converter.convert.call_count == 2
+    assert len(list(tmp_path.iterdir())) == 2
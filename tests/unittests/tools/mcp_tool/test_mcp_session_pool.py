@@ -0,0 +1,233 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import collections
+import contextlib
+from unittest import mock
+
+import anyio
+from google.adk.tools.mcp_tool.mcp_session_manager import MCPSessionManager
+from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+from google.adk.tools.mcp_tool.mcp_session_pool import McpSessionPool
+from google.adk.tools.mcp_tool.mcp_session_pool import McpSessionPoolOptions
+from google.adk.tools.mcp_tool.mcp_toolset import McpToolset
+from mcp import ClientSession
+from mcp import StdioServerParameters
+from mcp import types as mcp_types
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_client_server_memory_streams
+import pytest
+
+_CONNECTION_PARAMS = StdioConnectionParams(
+    server_params=StdioServerParameters(command="unused"), timeout=5
+)
+
+
+class _LocalMcpServer:
+  """An in-process MCP server whose `slow` tool tracks concurrency."""
+
+  def __init__(self):
+    self.connections = 0
+    self.calls_per_connection = collections.Counter()
+    self.in_flight = 0
+    self.max_in_flight = 0
+    self.tool_names = ["slow", "add_tool"]
+    self.server = Server("local-test-server")
+
+    @self.server.list_tools()
+    async def _list_tools():
+      return [
+          mcp_types.Tool(name=name, inputSchema={"type": "object"})
+          for name in self.tool_names
+      ]
+
+    @self.server.call_tool()
+    async def _call_tool(name, arguments):
+      del arguments
+      self.calls_per_connection[id(self.server.request_context.session)] += 1
+      if name == "add_tool":
+        self.tool_names.append("new_tool")
+        await self.server.request_context.session.send_tool_list_changed()
+      self.in_flight += 1
+      self.max_in_flight = max(self.max_in_flight, self.in_flight)
+      try:
+        await asyncio.sleep(0.05)
+      finally:
+        self.in_flight -= 1
+      return [mcp_types.TextContent(type="text", text="ok")]
+
+  @contextlib.asynccontextmanager
+  async def client(self, headers=None):
+    del headers
+    self.connections += 1
+    async with create_client_server_memory_streams() as (
+        client_streams,
+        server_streams,
+    ):
+      async with anyio.create_task_group() as task_group:
+        task_group.start_soon(
+            lambda: self.server.run(
+                *server_streams,
+                self.server.create_initialization_options(),
+            )
+        )
+        try:
+          yield client_streams
+        finally:
+          task_group.cancel_scope.cancel()
+
+
+@pytest.fixture
+def local_server():
+  server = _LocalMcpServer()
+  with mock.patch.object(
+      MCPSessionManager, "_create_client", side_effect=server.client
+  ):
+    yield server
+
+
+async def _call_slow(pool, count):
+  session = await pool.create_session()
+  return await asyncio.gather(
+      *(session.call_tool("slow", arguments={}) for _ in range(count)),
+      return_exceptions=True,
+  )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_spread_across_sessions(local_server):
+  pool = McpSessionPool(
+      _CONNECTION_PARAMS, options=McpSessionPoolOptions(size=3)
+  )
+
+  results = await _call_slow(pool, 6)
+  await pool.close()
+
+  assert all(not result.isError for result in results)
+  assert local_server.connections == 3
+  assert sorted(local_server.calls_per_connection.values()) == [2, 2, 2]
+  assert pool.metrics.requests == 6
+
+
+@pytest.mark.asyncio
+async def test_sequential_requests_reuse_one_session(local_server):
+  pool = McpSessionPool(
+      _CONNECTION_PARAMS, options=McpSessionPoolOptions(size=3)
+  )
+  session = await pool.create_session()
+
+  for _ in range(3):
+    await session.call_tool("slow", arguments={})
+  await pool.close()
+
+  assert local_server.connections == 1
+  assert pool.in_flight() == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_requests_wait_for_capacity(local_server):
+  pool = McpSessionPool(
+      _CONNECTION_PARAMS,
+      options=McpSessionPoolOptions(size=1, max_requests_per_session=2),
+  )
+
+  results = await _call_slow(pool, 5)
+  await pool.close()
+
+  assert all(not result.isError for result in results)
+  assert local_server.max_in_flight == 2
+  assert pool.metrics.queued_requests == 3
+
+
+@pytest.mark.asyncio
+async def test_full_wait_queue_rejects_requests(local_server):
+  pool = McpSessionPool(
+      _CONNECTION_PARAMS,
+      options=McpSessionPoolOptions(
+          size=1, max_requests_per_session=1, max_queued_requests=1
+      ),
+  )
+
+  results = await _call_slow(pool, 3)
+  await pool.close()
+
+  errors = [r for r in results if isinstance(r, ConnectionError)]
+  assert len(errors) == 1
+  assert "wait queue is full" in str(errors[0])
+  assert pool.metrics.rejected_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_ping_reconnects_session(local_server):
+  pool = McpSessionPool(
+      _CONNECTION_PARAMS, options=McpSessionPoolOptions(ping_interval=None)
+  )
+  await pool.create_session()
+
+  await pool.check_sessions()
+  assert pool.metrics.ping_failures == 0
+
+  with mock.patch.object(
+      ClientSession, "send_ping", side_effect=ConnectionError("no pong")
+  ):
+    await pool.check_sessions()
+
+  assert pool.metrics.ping_failures == 1
+  assert pool.metrics.reconnects == 1
+  assert local_server.connections == 2
+  await _call_slow(pool, 1)
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_background_pings_run_until_close(local_server):
+  del local_server
+  pool = McpSessionPool(
+      _CONNECTION_PARAMS, options=McpSessionPoolOptions(ping_interval=0.01)
+  )
+
+  with mock.patch.object(
+      pool, "check_sessions", wraps=pool.check_sessions
+  ) as check_sessions:
+    await pool.create_session()
+    await asyncio.sleep(0.1)
+    await pool.close()
+    calls = check_sessions.call_count
+    await asyncio.sleep(0.05)
+
+  assert calls >= 2
+  assert check_sessions.call_count == calls
+
+
+@pytest.mark.asyncio
+async def test_toolset_uses_pool(local_server):
+  toolset = McpToolset(
+      connection_params=_CONNECTION_PARAMS,
+      session_pool_options=McpSessionPoolOptions(size=2),
+  )
+
+  tools = await toolset.get_tools()
+  session = await toolset._mcp_session_manager.create_session()
+  await session.call_tool("add_tool", arguments={})
+  tools_after_change = await toolset.get_tools()
+  await toolset.close()
+
+  assert isinstance(toolset._mcp_session_manager, McpSessionPool)
+  assert [tool.name for tool in tools] == ["slow", "add_tool"]
+  assert [tool.name for tool in tools_after_change] == [
+      "slow",
+      "add_tool",
+      "new_tool",
+  ]
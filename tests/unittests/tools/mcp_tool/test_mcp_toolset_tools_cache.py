@@ -0,0 +1,201 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+from unittest import mock
+
+import anyio
+from google.adk.tools.mcp_tool import mcp_tool
+from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+from google.adk.tools.mcp_tool.mcp_toolset import McpToolset
+from mcp import StdioServerParameters
+from mcp import types as mcp_types
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_client_server_memory_streams
+import pytest
+
+
+class _LocalMcpServer:
+  """An in-process stand-in for a stdio MCP server that counts listings."""
+
+  def __init__(self):
+    self.list_tools_calls = 0
+    self.tool_names = ["read_file", "write_file", "add_tool"]
+    self.server = Server("local-test-server")
+
+    @self.server.list_tools()
+    async def _list_tools():
+      self.list_tools_calls += 1
+      return [
+          mcp_types.Tool(
+              name=name,
+              description=f"{name} tool",
+              inputSchema={
+                  "type": "object",
+                  "properties": {"path": {"type": "string"}},
+              },
+          )
+          for name in self.tool_names
+      ]
+
+    @self.server.call_tool()
+    async def _call_tool(name, arguments):
+      del arguments
+      if name == "add_tool":
+        self.tool_names.append("delete_file")
+        await self.server.request_context.session.send_tool_list_changed()
+      return [mcp_types.TextContent(type="text", text="ok")]
+
+  @contextlib.asynccontextmanager
+  async def client(self):
+    async with create_client_server_memory_streams() as (
+        client_streams,
+        server_streams,
+    ):
+      async with anyio.create_task_group() as task_group:
+        task_group.start_soon(
+            lambda: self.server.run(
+                *server_streams,
+                self.server.create_initialization_options(),
+            )
+        )
+        try:
+          yield client_streams
+        finally:
+          task_group.cancel_scope.cancel()
+
+
+@pytest.fixture
+def local_server():
+  return _LocalMcpServer()
+
+
+@contextlib.asynccontextmanager
+async def _toolset(local_server, **kwargs):
+  toolset = McpToolset(
+      connection_params=StdioConnectionParams(
+          server_params=StdioServerParameters(command="unused"), timeout=5
+      ),
+      **kwargs,
+  )
+  with mock.patch.object(
+      toolset._mcp_session_manager,
+      "_create_client",
+      side_effect=lambda headers=None: local_server.client(),
+  ):
+    try:
+      yield toolset
+    finally:
+      await toolset.close()
+
+
+async def _tool_names(toolset):
+  return [tool.name for tool in await toolset.get_tools()]
+
+
+@pytest.mark.asyncio
+async def test_get_tools_lists_tools_once(local_server):
+  async with _toolset(local_server) as toolset:
+    first_tools = await toolset.get_tools()
+    for _ in range(20):
+      tools = await toolset.get_tools()
+
+  assert local_server.list_tools_calls == 1
+  assert [tool.name for tool in tools] == [
+      "read_file",
+      "write_file",
+      "add_tool",
+  ]
+  assert all(a is b for a, b in zip(first_tools, tools))
+
+
+@pytest.mark.asyncio
+async def test_tool_filter_is_applied_to_cached_tools(local_server):
+  async with _toolset(local_server, tool_filter=["write_file"]) as toolset:
+    assert await _tool_names(toolset) == ["write_file"]
+    assert await _tool_names(toolset) == ["write_file"]
+
+  assert local_server.list_tools_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_list_changed_notification_invalidates_cache(local_server):
+  async with _toolset(local_server) as toolset:
+    await toolset.get_tools()
+    session = await toolset._mcp_session_manager.create_session()
+    await session.call_tool("add_tool", {})
+
+    tool_names = await _tool_names(toolset)
+    await toolset.get_tools()
+
+  assert tool_names == ["read_file", "write_file", "add_tool", "delete_file"]
+  assert local_server.list_tools_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_clear_tools_cache(local_server):
+  async with _toolset(local_server) as toolset:
+    await toolset.get_tools()
+    toolset.clear_tools_cache()
+    await toolset.get_tools()
+
+  assert local_server.list_tools_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_tools_cache_ttl(local_server):
+  async with _toolset(local_server, tools_cache_ttl=60) as toolset:
+    await toolset.get_tools()
+    await toolset.get_tools()
+    assert local_server.list_tools_calls == 1
+
+    with mock.patch("time.monotonic", return_value=10**9):
+      await toolset.get_tools()
+
+  assert local_server.list_tools_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_tools_disabled(local_server):
+  async with _toolset(local_server, cache_tools=False) as toolset:
+    for _ in range(3):
+      await toolset.get_tools()
+
+  assert local_server.list_tools_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_reconnected_session_lists_tools_again(local_server):
+  async with _toolset(local_server) as toolset:
+    await toolset.get_tools()
+    await toolset._mcp_session_manager.close()
+    await toolset.get_tools()
+
+  assert local_server.list_tools_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_declaration_is_derived_once(local_server):
+  async with _toolset(local_server) as toolset:
+    tool = (await toolset.get_tools())[0]
+    with mock.patch.object(
+        mcp_tool, "_to_gemini_schema", wraps=mcp_tool._to_gemini_schema
+    ) as to_gemini_schema:
+      declarations = [tool._get_declaration() for _ in range(10)]
+
+  assert to_gemini_schema.call_count == 1
+  assert all(d.name == "read_file" for d in declarations)
+  # Renaming a returned declaration does not affect later ones.
+  declarations[0].name = "prefixed_read_file"
+  assert tool._get_declaration().name == "read_file"
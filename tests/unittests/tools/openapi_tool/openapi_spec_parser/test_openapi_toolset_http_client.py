@@ -0,0 +1,217 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset import OpenAPIToolset
+import httpx
+import pytest
+import uvicorn
+
+
+class _LocalApi:
+  """A local stand-in API that records the cookies of each request."""
+
+  def __init__(self):
+    self.cookie_headers = []
+
+  async def __call__(self, scope, receive, send):
+    if scope["type"] != "http":
+      return
+    self.cookie_headers.append(dict(scope["headers"]).get(b"cookie"))
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"set-cookie", b"session=from-server"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": b'{"ok": true}'})
+
+
+@pytest.fixture(scope="module")
+def local_api():
+  api = _LocalApi()
+  server = uvicorn.Server(
+      uvicorn.Config(api, host="127.0.0.1", port=0, log_level="error")
+  )
+  thread = threading.Thread(target=server.run, daemon=True)
+  thread.start()
+  while not server.started:
+    time.sleep(0.01)
+  port = server.servers[0].sockets[0].getsockname()[1]
+  yield api, f"http://127.0.0.1:{port}"
+  server.should_exit = True
+  thread.join()
+
+
+@pytest.fixture
+def api(local_api):
+  api, base_url = local_api
+  api.cookie_headers.clear()
+  return api, base_url
+
+
+def _spec(base_url: str) -> dict:
+  return {
+      "openapi": "3.0.0",
+      "info": {"title": "Local API", "version": "1.0"},
+      "servers": [{"url": base_url}],
+      "paths": {
+          "/ping": {
+              "get": {
+                  "operationId": "ping",
+                  "responses": {"200": {"description": "OK"}},
+              }
+          }
+      },
+  }
+
+
+async def _call_ping(toolset: OpenAPIToolset, count: int) -> None:
+  tool = toolset.get_tool("ping")
+  for _ in range(count):
+    assert await tool.call(args={}, tool_context=None) == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_tools_share_one_client_per_event_loop(api):
+  _, base_url = api
+  toolset = OpenAPIToolset(spec_dict=_spec(base_url))
+  client = toolset._get_http_client()
+
+  with mock.patch.object(client, "request", wraps=client.request) as request:
+    await _call_ping(toolset, 3)
+  await toolset.close()
+
+  assert request.call_count == 3
+  assert client.is_closed
+
+
+def test_clients_are_closed_with_their_event_loop(api):
+  _, base_url = api
+  toolset = OpenAPIToolset(spec_dict=_spec(base_url))
+  clients = []
+
+  async def call_ping():
+    clients.append(toolset._get_http_client())
+    await _call_ping(toolset, 1)
+
+  # Like consecutive `Runner.run` calls, each with its own event loop.
+  asyncio.run(call_ping())
+  assert clients[0].is_closed
+  asyncio.run(call_ping())
+
+  assert clients[1] is not clients[0]
+  assert clients[1].is_closed
+  assert not toolset._http_clients
+
+
+@pytest.mark.asyncio
+async def test_close_closes_owned_client(api):
+  _, base_url = api
+  toolset = OpenAPIToolset(spec_dict=_spec(base_url))
+  await _call_ping(toolset, 1)
+  client = toolset._get_http_client()
+
+  await toolset.close()
+
+  assert client.is_closed
+  # Tools keep working after close with a new client.
+  await _call_ping(toolset, 1)
+  assert toolset._get_http_client() is not client
+  await toolset.close()
+
+
+@pytest.mark.asyncio
+async def test_injected_client_is_used_and_not_closed(api):
+  _, base_url = api
+  async with httpx.AsyncClient() as client:
+    toolset = OpenAPIToolset(spec_dict=_spec(base_url), http_client=client)
+    with mock.patch.object(client, "request", wraps=client.request) as request:
+      await _call_ping(toolset, 3)
+    await toolset.close()
+
+    assert not client.is_closed
+    assert request.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_configure_ssl_verify_all_replaces_owned_client(api):
+  _, base_url = api
+  toolset = OpenAPIToolset(spec_dict=_spec(base_url))
+  await _call_ping(toolset, 1)
+  client = toolset._get_http_client()
+
+  toolset.configure_ssl_verify_all(False)
+  await _call_ping(toolset, 1)
+
+  assert toolset._get_http_client() is not client
+  await toolset.close()
+  assert client.is_closed
+  assert not toolset._http_clients
+
+
+def _spec_with_cookie_param(base_url: str) -> dict:
+  spec = _spec(base_url)
+  spec["paths"]["/ping"]["get"]["parameters"] = [{
+      "name": "user",
+      "in": "cookie",
+      "required": False,
+      "schema": {"type": "string"},
+  }]
+  return spec
+
+
+@pytest.mark.asyncio
+async def test_shared_client_does_not_keep_cookies(api):
+  api, base_url = api
+  toolset = OpenAPIToolset(spec_dict=_spec_with_cookie_param(base_url))
+  tool = toolset.get_tool("ping")
+
+  await tool.call(args={"user": "alice"}, tool_context=None)
+  await tool.call(args={}, tool_context=None)
+  await toolset.close()
+
+  assert api.cookie_headers == [b"user=alice", None]
+
+
+@pytest.mark.asyncio
+async def test_cookie_params_are_merged_with_cookie_header(api):
+  api, base_url = api
+  toolset = OpenAPIToolset(
+      spec_dict=_spec_with_cookie_param(base_url),
+      header_provider=lambda context: {"cookie": "tenant=acme"},
+  )
+  tool = toolset.get_tool("ping")
+
+  await tool.call(args={"user": "alice"}, tool_context=mock.MagicMock())
+  await toolset.close()
+
+  assert api.cookie_headers == [b"tenant=acme; user=alice"]
+
+
+def test_client_is_created_lazily(api):
+  _, base_url = api
+  toolset = OpenAPIToolset(
+      spec_dict=_spec(base_url),
+      ssl_verify="/path/to/missing-ca-bundle.crt",
+      http_client_limits=httpx.Limits(max_keepalive_connections=5),
+  )
+
+  assert not toolset._http_clients
@@ -0,0 +1,226 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from typing import Dict
+from unittest import mock
+
+from google.adk.tools.openapi_tool.auth.auth_helpers import token_to_scheme_credential
+from google.adk.tools.openapi_tool.openapi_spec_parser import openapi_toolset
+from google.adk.tools.openapi_tool.openapi_spec_parser import tool_bundle as tool_bundle_lib
+from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_spec_parser import OpenApiSpecParser
+from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset import OpenAPIToolset
+from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import RestApiTool
+from google.adk.tools.openapi_tool.openapi_spec_parser.tool_bundle import compile_tool_bundle
+from google.adk.tools.openapi_tool.openapi_spec_parser.tool_bundle import load_tool_bundle
+from google.adk.tools.openapi_tool.openapi_spec_parser.tool_bundle import openapi_spec_bundle_key
+from google.adk.tools.openapi_tool.openapi_spec_parser.tool_bundle import save_tool_bundle
+import pytest
+import yaml
+
+
+@pytest.fixture
+def openapi_spec() -> Dict:
+  yaml_path = os.path.join(os.path.dirname(__file__), "test.yaml")
+  with open(yaml_path, "r", encoding="utf-8") as f:
+    return yaml.safe_load(f)
+
+
+def _large_spec(num_operations: int) -> Dict:
+  """A spec whose operations share a deeply referenced schema."""
+  schemas = {
+      f"Level{i}": {
+          "type": "object",
+          "properties": {
+              "value": {"type": "string"},
+              "child": {"$ref": f"#/components/schemas/Level{i + 1}"},
+          },
+      }
+      for i in range(10)
+  }
+  schemas["Level10"] = {"type": "object"}
+  paths = {
+      f"/items{i}": {
+          "post": {
+              "operationId": f"createItem{i}",
+              "description": f"Creates item {i}.",
+              "parameters": [{
+                  "name": "dryRun",
+                  "in": "query",
+                  "required": True,
+                  "schema": {"type": "boolean"},
+              }],
+              "requestBody": {
+                  "content": {
+                      "application/json": {
+                          "schema": {"$ref": "#/components/schemas/Level0"}
+                      }
+                  }
+              },
+              "responses": {"200": {"description": "OK"}},
+          }
+      }
+      for i in range(num_operations)
+  }
+  return {
+      "openapi": "3.0.0",
+      "info": {"title": "Large API", "version": "1.0"},
+      "servers": [{"url": "https://example.com"}],
+      "paths": paths,
+      "components": {"schemas": schemas},
+  }
+
+
+def _declarations(tools):
+  return [tool._get_declaration().model_dump() for tool in tools]
+
+
+@pytest.mark.asyncio
+async def test_bundle_round_trip_matches_spec(openapi_spec, tmp_path):
+  bundle = compile_tool_bundle(openapi_spec)
+  save_tool_bundle(bundle, str(tmp_path))
+  loaded = load_tool_bundle(
+      str(tmp_path), openapi_spec_bundle_key(openapi_spec)
+  )
+
+  from_spec = await OpenAPIToolset(spec_dict=openapi_spec).get_tools()
+  from_bundle = await OpenAPIToolset(tool_bundle=loaded).get_tools()
+
+  assert [t.name for t in from_bundle] == [t.name for t in from_spec]
+  assert [t.endpoint for t in from_bundle] == [t.endpoint for t in from_spec]
+  assert _declarations(from_bundle) == _declarations(from_spec)
+
+
+@pytest.mark.asyncio
+async def test_tools_are_created_when_selected(openapi_spec):
+  bundle = compile_tool_bundle(openapi_spec)
+
+  with mock.patch.object(
+      RestApiTool,
+      "from_parsed_operation",
+      wraps=RestApiTool.from_parsed_operation,
+  ) as from_parsed_operation:
+    toolset = OpenAPIToolset(
+        tool_bundle=bundle, tool_filter=["calendar_calendars_get"]
+    )
+    assert from_parsed_operation.call_count == 0
+
+    tools = await toolset.get_tools()
+    assert [t.name for t in tools] == ["calendar_calendars_get"]
+    assert from_parsed_operation.call_count == 1
+
+    assert toolset.get_tool("calendar_calendars_get") is tools[0]
+    assert toolset.get_tool("calendar_calendars_delete") is not None
+    assert toolset.get_tool("missing") is None
+    assert from_parsed_operation.call_count == 2
+
+
+def test_lazily_created_tools_use_toolset_settings(openapi_spec):
+  auth_scheme, auth_credential = token_to_scheme_credential(
+      "apikey", "query", "key", "secret"
+  )
+  toolset = OpenAPIToolset(
+      tool_bundle=compile_tool_bundle(openapi_spec),
+      auth_scheme=auth_scheme,
+      auth_credential=auth_credential,
+      credential_key="calendar_key",
+  )
+  toolset.configure_ssl_verify_all(False)
+
+  tool = toolset.get_tool("calendar_calendars_get")
+
+  assert tool.auth_scheme == auth_scheme
+  assert tool.auth_credential == auth_credential
+  assert tool.credential_key == "calendar_key"
+  assert tool._ssl_verify is False
+
+
+def test_bundle_dir_compiles_once(openapi_spec, tmp_path):
+  OpenAPIToolset(spec_dict=openapi_spec, bundle_dir=str(tmp_path))
+  assert len(os.listdir(tmp_path)) == 1
+
+  with mock.patch.object(OpenApiSpecParser, "parse") as parse:
+    toolset = OpenAPIToolset(spec_dict=openapi_spec, bundle_dir=str(tmp_path))
+    assert len(toolset._tools) == 5
+
+  parse.assert_not_called()
+
+
+def test_bundle_dir_from_environment(openapi_spec, tmp_path, monkeypatch):
+  monkeypatch.setenv(tool_bundle_lib.TOOL_BUNDLE_DIR_ENV_VAR, str(tmp_path))
+
+  OpenAPIToolset(spec_dict=openapi_spec)
+
+  assert os.listdir(tmp_path) == [
+      openapi_spec_bundle_key(openapi_spec) + ".json"
+  ]
+
+
+def test_changed_spec_gets_a_new_bundle(openapi_spec, tmp_path):
+  OpenAPIToolset(spec_dict=openapi_spec, bundle_dir=str(tmp_path))
+  openapi_spec["info"]["title"] = "Changed"
+
+  OpenAPIToolset(spec_dict=openapi_spec, bundle_dir=str(tmp_path))
+
+  assert len(os.listdir(tmp_path)) == 2
+
+
+def test_unusable_bundles_are_ignored(openapi_spec, tmp_path):
+  key = openapi_spec_bundle_key(openapi_spec)
+  path = save_tool_bundle(compile_tool_bundle(openapi_spec), str(tmp_path))
+
+  with open(path, "w", encoding="utf-8") as f:
+    f.write("{not json")
+  assert load_tool_bundle(str(tmp_path), key) is None
+
+  outdated = compile_tool_bundle(openapi_spec)
+  outdated.format_version = 0
+  save_tool_bundle(outdated, str(tmp_path))
+  assert load_tool_bundle(str(tmp_path), key) is None
+
+  assert load_tool_bundle(str(tmp_path), "missing") is None
+
+
+def test_required_parameters_survive_bundling():
+  bundle = compile_tool_bundle(_large_spec(1))
+  tool = OpenAPIToolset(tool_bundle=bundle).get_tool("create_item0")
+
+  declaration = tool._get_declaration()
+
+  assert declaration.parameters.required == ["dry_run"]
+
+
+def test_cold_start_from_bundle(tmp_path):
+  """A bundle creates only the selected tools, without parsing the spec."""
+  spec = _large_spec(20)
+  bundle_dir = str(tmp_path)
+  save_tool_bundle(compile_tool_bundle(spec), bundle_dir)
+  key = openapi_spec_bundle_key(spec)
+
+  with (
+      mock.patch.object(openapi_toolset.OpenApiSpecParser, "parse") as parse,
+      mock.patch.object(
+          openapi_toolset.RestApiTool,
+          "from_parsed_operation",
+          wraps=RestApiTool.from_parsed_operation,
+      ) as from_parsed_operation,
+  ):
+    bundle = load_tool_bundle(bundle_dir, key)
+    toolset = OpenAPIToolset(tool_bundle=bundle, tool_filter=["create_item7"])
+    assert from_parsed_operation.call_count == 0
+
+    toolset.get_tool("create_item7")
+    assert from_parsed_operation.call_count == 1
+
+  parse.assert_not_called()
@@ -18,6 +18,8 @@ from unittest.mock import MagicMock
 from google.adk.tools.spanner import client
 from google.adk.tools.spanner import search_tool
 from google.adk.tools.spanner import utils
+from google.adk.tools.spanner.settings import SpannerToolSettings
+from google.adk.tools.spanner.settings import SpannerVectorStoreSettings
 from google.cloud.spanner_admin_database_v1.types import DatabaseDialect
 import pytest
 
@@ -519,3 +521,177 @@ def test_similarity_search_unsupported_algorithm_error(
   )
   assert result["status"] == "ERROR"
   assert "Unsupported search_options" in result["error_details"]
+
+
+def _mock_database(mock_get_spanner_client, dialect):
+  mock_spanner_client = MagicMock()
+  mock_database = MagicMock()
+  mock_snapshot = MagicMock()
+  mock_database.snapshot.return_value.__enter__.return_value = mock_snapshot
+  mock_database.database_dialect = dialect
+  mock_spanner_client.instance.return_value.database.return_value = (
+      mock_database
+  )
+  mock_get_spanner_client.return_value = mock_spanner_client
+  return mock_database, mock_snapshot
+
+
+@mock.patch.object(utils, "embed_contents")
+@mock.patch.object(client, "get_spanner_client")
+def test_batch_similarity_search_knn_success(
+    mock_get_spanner_client,
+    mock_embed_contents,
+    mock_spanner_ids,
+    mock_credentials,
+):
+  """Test batch_similarity_search embeds and searches all queries at once."""
+  mock_database, mock_snapshot = _mock_database(
+      mock_get_spanner_client, DatabaseDialect.GOOGLE_STANDARD_SQL
+  )
+  mock_embed_contents.return_value = [[0.1], [0.2]]
+  mock_snapshot.execute_sql.return_value = iter(
+      [[0, "a", 0.1], [0, "b", 0.2], [1, "c", 0.3]]
+  )
+
+  result = search_tool.batch_similarity_search(
+      project_id=mock_spanner_ids["project_id"],
+      instance_id=mock_spanner_ids["instance_id"],
+      database_id=mock_spanner_ids["database_id"],
+      table_name=mock_spanner_ids["table_name"],
+      queries=["first", "second", "first"],
+      embedding_column_to_search="embedding_col",
+      columns=["col1"],
+      embedding_options={"vertex_ai_embedding_model_name": "test-model"},
+      credentials=mock_credentials,
+      search_options={"top_k": 2},
+  )
+
+  assert result == {
+      "status": "SUCCESS",
+      "results": [
+          {"query": "first", "rows": [["a", 0.1], ["b", 0.2]]},
+          {"query": "second", "rows": [["c", 0.3]]},
+          {"query": "first", "rows": [["a", 0.1], ["b", 0.2]]},
+      ],
+  }
+  mock_embed_contents.assert_called_once_with(
+      "test-model", ["first", "second"], None
+  )
+  mock_database.snapshot.assert_called_once_with(multi_use=True)
+  mock_snapshot.execute_sql.assert_called_once()
+  sql = mock_snapshot.execute_sql.call_args.args[0]
+  assert sql.count("UNION ALL") == 1
+  assert sql.count("LIMIT 2") == 2
+  assert "COSINE_DISTANCE(\n      embedding_col,\n      @embedding_0)" in sql
+  assert "ORDER BY query_index, distance" in sql
+  assert mock_snapshot.execute_sql.call_args.kwargs == {
+      "params": {"embedding_0": [0.1], "embedding_1": [0.2]}
+  }
+
+
+@mock.patch.object(client, "get_spanner_client")
+def test_batch_similarity_search_spanner_model_postgresql(
+    mock_get_spanner_client, mock_spanner_ids, mock_credentials
+):
+  """Test batch_similarity_search with a model registered in Spanner."""
+  _, mock_snapshot = _mock_database(
+      mock_get_spanner_client, DatabaseDialect.POSTGRESQL
+  )
+  embedding_results = [MagicMock(), MagicMock()]
+  embedding_results[0].one.return_value = ([0.1],)
+  embedding_results[1].one.return_value = ([0.2],)
+  mock_snapshot.execute_sql.side_effect = embedding_results + [
+      iter([[1, "pg_result", 0.5]])
+  ]
+
+  result = search_tool.batch_similarity_search(
+      project_id=mock_spanner_ids["project_id"],
+      instance_id=mock_spanner_ids["instance_id"],
+      database_id=mock_spanner_ids["database_id"],
+      table_name=mock_spanner_ids["table_name"],
+      queries=["first", "second"],
+      embedding_column_to_search="embedding_col",
+      columns=["col1"],
+      embedding_options={
+          "spanner_postgresql_vertex_ai_embedding_model_endpoint": (
+              "test-endpoint"
+          )
+      },
+      credentials=mock_credentials,
+  )
+
+  assert result["status"] == "SUCCESS", result
+  assert result["results"] == [
+      {"query": "first", "rows": []},
+      {"query": "second", "rows": [["pg_result", 0.5]]},
+  ]
+  call_args = mock_snapshot.execute_sql.call_args
+  assert "$1" in call_args.args[0] and "$2" in call_args.args[0]
+  assert call_args.kwargs == {"params": {"p1": [0.1], "p2": [0.2]}}
+
+
+def test_batch_similarity_search_requires_queries(
+    mock_spanner_ids, mock_credentials
+):
+  result = search_tool.batch_similarity_search(
+      project_id=mock_spanner_ids["project_id"],
+      instance_id=mock_spanner_ids["instance_id"],
+      database_id=mock_spanner_ids["database_id"],
+      table_name=mock_spanner_ids["table_name"],
+      queries=[],
+      embedding_column_to_search="embedding_col",
+      columns=["col1"],
+      embedding_options={"vertex_ai_embedding_model_name": "test-model"},
+      credentials=mock_credentials,
+  )
+
+  assert result["status"] == "ERROR"
+  assert "At least one query" in result["error_details"]
+
+
+@mock.patch.object(search_tool, "batch_similarity_search")
+def test_vector_store_batch_similarity_search(
+    mock_batch_similarity_search, mock_credentials
+):
+  """Test vector_store_batch_similarity_search uses the vector store settings."""
+  settings = SpannerToolSettings(
+      vector_store_settings=SpannerVectorStoreSettings(
+          project_id="test-project",
+          instance_id="test-instance",
+          database_id="test-database",
+          table_name="test-table",
+          content_column="content",
+          embedding_column="embedding",
+          vector_length=3,
+          vertex_ai_embedding_model_name="test-model",
+      )
+  )
+  mock_batch_similarity_search.return_value = {"status": "SUCCESS"}
+
+  result = search_tool.vector_store_batch_similarity_search(
+      queries=["first", "second"],
+      credentials=mock_credentials,
+      settings=settings,
+  )
+
+  assert result == {"status": "SUCCESS"}
+  mock_batch_similarity_search.assert_called_once_with(
+      queries=["first", "second"],
+      credentials=mock_credentials,
+      project_id="test-project",
+      instance_id="test-instance",
+      database_id="test-database",
+      table_name="test-table",
+      embedding_column_to_search="embedding",
+      columns=["content"],
+      embedding_options={
+          "vertex_ai_embedding_model_name": "test-model",
+          "output_dimensionality": 3,
+      },
+      additional_filter=None,
+      search_options={
+          "top_k": 4,
+          "distance_type": "COSINE",
+          "nearest_neighbors_algorithm": "EXACT_NEAREST_NEIGHBORS",
+      },
+  )
@@ -18,6 +18,7 @@ import os
 import re
 from unittest import mock
 
+from google.adk.tools.spanner import client as client_lib
 from google.adk.tools.spanner.client import get_spanner_client
 from google.auth.exceptions import DefaultCredentialsError
 from google.oauth2.credentials import Credentials
@@ -136,3 +137,56 @@ def test_spanner_client_user_agent():
         r"adk-spanner-tool google-adk/([0-9A-Za-z._\-+/]+)",
         client._client_info.user_agent,
     )
+
+
+def test_spanner_client_is_cached():
+  """Test that clients and databases are reused across calls."""
+  client_lib.clear_client_cache()
+  credentials = mock.create_autospec(Credentials, instance=True)
+  with mock.patch(
+      "google.cloud.spanner.Client", autospec=True
+  ) as mock_client_class:
+    mock_client_class.return_value._client_info = mock.Mock()
+
+    first = get_spanner_client(project="test-project", credentials=credentials)
+    second = get_spanner_client(project="test-project", credentials=credentials)
+    other_project = get_spanner_client(
+        project="other-project", credentials=credentials
+    )
+    databases = [
+        client_lib.get_spanner_database(
+            project="test-project",
+            instance_id="test-instance",
+            database_id="test-database",
+            credentials=credentials,
+        )
+        for _ in range(3)
+    ]
+
+  assert first is second
+  assert mock_client_class.call_count == 2
+  assert other_project is first  # The mocked class returns one instance.
+  assert databases[0] is databases[1] is databases[2]
+  first.instance.assert_called_once_with("test-instance")
+  first.instance.return_value.database.assert_called_once_with("test-database")
+  client_lib.clear_client_cache()
+
+
+def test_spanner_client_cache_is_per_user_agent():
+  """Test that an additional user agent gets its own client."""
+  client_lib.clear_client_cache()
+  credentials = mock.create_autospec(Credentials, instance=True)
+
+  default = get_spanner_client(project="test-project", credentials=credentials)
+  vector_store = get_spanner_client(
+      project="test-project",
+      credentials=credentials,
+      user_agent="adk-spanner-vector-store",
+  )
+
+  assert default is not vector_store
+  assert default._client_info.user_agent == client_lib.USER_AGENT
+  assert vector_store._client_info.user_agent == (
+      f"{client_lib.USER_AGENT} adk-spanner-vector-store"
+  )
+  client_lib.clear_client_cache()
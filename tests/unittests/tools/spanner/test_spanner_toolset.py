@@ -38,7 +38,7 @@ async def test_spanner_toolset_tools_default():
   tools = await toolset.get_tools()
   assert tools is not None
 
-  assert len(tools) == 7
+  assert len(tools) == 8
   assert all([isinstance(tool, GoogleTool) for tool in tools])
 
   expected_tool_names = set([
@@ -49,6 +49,7 @@ async def test_spanner_toolset_tools_default():
       "get_table_schema",
       "execute_sql",
       "similarity_search",
+      "batch_similarity_search",
   ])
   actual_tool_names = set([tool.name for tool in tools])
   assert actual_tool_names == expected_tool_names
@@ -217,7 +218,7 @@ async def test_spanner_toolset_with_vector_store_search():
   tools = await toolset.get_tools()
   assert tools is not None
 
-  assert len(tools) == 8
+  assert len(tools) == 10
   assert all([isinstance(tool, GoogleTool) for tool in tools])
 
   expected_tool_names = set([
@@ -228,7 +229,9 @@ async def test_spanner_toolset_with_vector_store_search():
       "get_table_schema",
       "execute_sql",
       "similarity_search",
+      "batch_similarity_search",
       "vector_store_similarity_search",
+      "vector_store_batch_similarity_search",
   ])
   actual_tool_names = set([tool.name for tool in tools])
   assert actual_tool_names == expected_tool_names
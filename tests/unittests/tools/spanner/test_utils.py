@@ -411,3 +411,100 @@ def test_create_vector_search_index_fails(
     vector_store = spanner_utils.SpannerVectorStore(spanner_tool_settings)
     with pytest.raises(RuntimeError, match="DDL failed"):
       vector_store.create_vector_search_index()
+
+
+def test_execute_sql_caches_results(mock_spanner_client, mock_spanner_database):
+  """Test that execute_sql reuses results of the same query and parameters."""
+  settings = SpannerToolSettings(query_result_cache_ttl_seconds=60)
+  snapshot = mock.MagicMock()
+  snapshot.execute_sql.return_value = [[1, "a"]]
+  mock_spanner_database.snapshot.return_value.__enter__.return_value = snapshot
+  credentials = mock.Mock()
+
+  def _execute_sql(query, params):
+    return spanner_utils.execute_sql(
+        project_id="test-project",
+        instance_id="test-instance",
+        database_id="test-database",
+        query=query,
+        credentials=credentials,
+        settings=settings,
+        tool_context=mock.Mock(),
+        params=params,
+    )
+
+  with mock.patch.object(
+      spanner_utils.client,
+      "get_spanner_client",
+      autospec=True,
+      return_value=mock_spanner_client,
+  ):
+    first = _execute_sql("SELECT id, name FROM t WHERE id = @id", {"id": 1})
+    second = _execute_sql("SELECT id, name\nFROM t WHERE id = @id;", {"id": 1})
+    third = _execute_sql("SELECT id, name FROM t WHERE id = @id", {"id": 2})
+
+  assert first["rows"] == second["rows"] == [[1, "a"]]
+  assert first["query_result_cache"]["hit"] is False
+  assert second["query_result_cache"]["hit"] is True
+  assert third["query_result_cache"] == {
+      "hit": False,
+      "hits": 1,
+      "misses": 2,
+      "hit_rate": 0.3333,
+  }
+  assert snapshot.execute_sql.call_count == 2
+
+
+def _fake_genai_client():
+  genai_client = mock.MagicMock()
+  genai_client.models.embed_content.side_effect = (
+      lambda model, contents, config: mock.Mock(
+          embeddings=[mock.Mock(values=[float(len(c)), 0.5]) for c in contents]
+      )
+  )
+  return genai_client
+
+
+def test_embed_contents_caches_embeddings():
+  """Repeated search queries are embedded only once."""
+  genai_client = _fake_genai_client()
+  turns = [["alpha", "beta"], ["alpha", "gamma", "gamma"], ["beta", "alpha"]]
+
+  results = [
+      spanner_utils.embed_contents(
+          "cache-test-model", contents, 2, genai_client
+      )
+      for contents in turns
+  ]
+
+  assert results[1] == [[5.0, 0.5], [5.0, 0.5], [5.0, 0.5]]
+  assert results[2] == [[4.0, 0.5], [5.0, 0.5]]
+  sent_contents = [
+      call.kwargs["contents"]
+      for call in genai_client.models.embed_content.call_args_list
+  ]
+  assert sent_contents == [["alpha", "beta"], ["gamma"]]
+
+
+def test_embed_contents_cache_is_per_model_and_dimensionality():
+  genai_client = _fake_genai_client()
+
+  spanner_utils.embed_contents("cache-test-model-a", ["text"], 2, genai_client)
+  spanner_utils.embed_contents("cache-test-model-b", ["text"], 2, genai_client)
+  spanner_utils.embed_contents("cache-test-model-a", ["text"], 4, genai_client)
+
+  assert genai_client.models.embed_content.call_count == 3
+
+
+def test_embed_contents_reuses_default_genai_client(monkeypatch):
+  monkeypatch.setattr(spanner_utils, "_default_genai_client", None)
+  genai_client = _fake_genai_client()
+
+  with mock.patch(
+      "google.genai.Client", autospec=True, return_value=genai_client
+  ) as mock_client_class:
+    spanner_utils.embed_contents("default-client-model", ["one"])
+    spanner_utils.embed_contents("default-client-model", ["two"])
+
+  mock_client_class.assert_called_once_with()
+  assert genai_client.models.embed_content.call_count == 2
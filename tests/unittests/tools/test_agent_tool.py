@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from typing import Any
 from typing import Optional
 
@@ -30,6 +31,7 @@ from google.adk.plugins.base_plugin import BasePlugin
 from google.adk.plugins.plugin_manager import PluginManager
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.tools.agent_tool import AgentTool
+from google.adk.tools.base_toolset import BaseToolset
 from google.adk.tools.tool_context import ToolContext
 from google.adk.utils.variant_utils import GoogleLLMVariant
 from google.genai import types
@@ -138,6 +140,12 @@ async def test_agent_tool_inherits_parent_app_name(monkeypatch):
       """Mock close method."""
       pass
 
+    def _collect_toolset(self, agent):
+      return set()
+
+    async def _cleanup_toolsets(self, toolsets_to_close):
+      pass
+
   monkeypatch.setattr('google.adk.runners.Runner', StubRunner)
 
   tool_agent = Agent(
@@ -944,6 +952,121 @@ async def test_run_async_handles_none_parts_in_response():
   assert tool_result == ''
 
 
+async def _create_tool_context(
+    artifact_service: Optional[InMemoryArtifactService] = None,
+    state: Optional[dict[str, Any]] = None,
+) -> ToolContext:
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name='test_app', user_id='test_user', state=state
+  )
+  invocation_context = InvocationContext(
+      invocation_id='invocation_id',
+      agent=Agent(name='root_agent'),
+      session=session,
+      session_service=session_service,
+      artifact_service=artifact_service,
+  )
+  return ToolContext(invocation_context=invocation_context)
+
+
+@mark.asyncio
+async def test_runner_is_reused_across_calls():
+  tool_agent = Agent(
+      name='tool_agent',
+      model=testing_utils.MockModel.create(responses=['r1', 'r2', 'r3']),
+  )
+  agent_tool = AgentTool(agent=tool_agent)
+  tool_context = await _create_tool_context()
+
+  results = [
+      await agent_tool.run_async(
+          args={'request': 'test'}, tool_context=tool_context
+      )
+      for _ in range(3)
+  ]
+
+  assert results == ['r1', 'r2', 'r3']
+  assert len(agent_tool._runners) == 1
+  runner = agent_tool._runners.get(next(iter(agent_tool._runners._entries)))
+  # Sessions of finished calls are deleted.
+  assert not any(
+      sessions
+      for users in runner.session_service.sessions.values()
+      for sessions in users.values()
+  )
+
+
+@mark.asyncio
+async def test_concurrent_calls_forward_artifacts_to_their_own_context():
+
+  async def save_name(callback_context: CallbackContext):
+    await asyncio.sleep(0)
+    await callback_context.save_artifact(
+        'name', Part.from_text(text=callback_context.state['name'])
+    )
+
+  agent_tool = AgentTool(
+      agent=SequentialAgent(name='tool_agent', before_agent_callback=save_name)
+  )
+  artifact_service = InMemoryArtifactService()
+  tool_contexts = [
+      await _create_tool_context(artifact_service, state={'name': name})
+      for name in ('first', 'second')
+  ]
+
+  await asyncio.gather(*(
+      agent_tool.run_async(args={'request': 'test'}, tool_context=context)
+      for context in tool_contexts
+  ))
+
+  assert len(agent_tool._runners) == 1
+  for name, context in zip(('first', 'second'), tool_contexts):
+    assert await artifact_service.load_artifact(
+        app_name='test_app',
+        user_id='test_user',
+        session_id=context._invocation_context.session.id,
+        filename='name',
+    ) == Part.from_text(text=name)
+
+
+@mark.asyncio
+async def test_toolsets_are_closed_after_each_call():
+
+  class _Toolset(BaseToolset):
+
+    def __init__(self):
+      super().__init__()
+      self.close_count = 0
+
+    async def get_tools(self, readonly_context=None):
+      return []
+
+    async def close(self):
+      self.close_count += 1
+
+  toolset = _Toolset()
+  sub_agent = Agent(
+      name='sub_agent',
+      model=testing_utils.MockModel.create(responses=[]),
+      tools=[toolset],
+  )
+  tool_agent = Agent(
+      name='tool_agent',
+      model=testing_utils.MockModel.create(responses=['r1', 'r2']),
+      sub_agents=[sub_agent],
+  )
+  agent_tool = AgentTool(agent=tool_agent)
+  tool_context = await _create_tool_context()
+
+  for _ in range(2):
+    await agent_tool.run_async(
+        args={'request': 'test'}, tool_context=tool_context
+    )
+
+  assert toolset.close_count == 2
+
+
 class TestAgentToolWithCompositeAgents:
   """Tests for AgentTool wrapping composite agents (SequentialAgent, etc.)."""
 
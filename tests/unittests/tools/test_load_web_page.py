@@ -0,0 +1,215 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from google.adk.tools import load_web_page as load_web_page_lib
+from google.adk.tools.load_web_page import load_web_page
+from google.adk.tools.load_web_page import load_web_page_async
+from google.adk.tools.load_web_page import load_web_pages
+import pytest
+import uvicorn
+
+_PAGE = b"<html><body><p>This is a page about the weather.</p></body></html>"
+
+
+class _LocalSite:
+  """A local site that serves pages with validators and records requests."""
+
+  def __init__(self):
+    self.requests = []
+    self.active = 0
+    self.max_active = 0
+
+  async def __call__(self, scope, receive, send):
+    if scope["type"] != "http":
+      return
+    headers = dict(scope["headers"])
+    self.requests.append((scope["path"], headers))
+    self.active += 1
+    self.max_active = max(self.max_active, self.active)
+    try:
+      await self._respond(scope["path"], headers, send)
+    finally:
+      self.active -= 1
+
+  async def _respond(self, path, headers, send):
+    if path == "/etag":
+      if headers.get(b"if-none-match") == b'"v1"':
+        await _send(send, 304, b"")
+      else:
+        await _send(send, 200, _PAGE, [(b"etag", b'"v1"')])
+    elif path == "/last-modified":
+      modified = b"Wed, 21 Oct 2026 07:28:00 GMT"
+      if headers.get(b"if-modified-since") == modified:
+        await _send(send, 304, b"")
+      else:
+        await _send(send, 200, _PAGE, [(b"last-modified", modified)])
+    elif path == "/large":
+      line = b"<p>one more line of a very long page</p>\n"
+      await send({
+          "type": "http.response.start",
+          "status": 200,
+          "headers": [(b"content-type", b"text/html")],
+      })
+      for _ in range(10_000):
+        await send({
+            "type": "http.response.body",
+            "body": line * 10,
+            "more_body": True,
+        })
+      await send({"type": "http.response.body", "body": b""})
+    elif path == "/redirect":
+      await _send(send, 302, b"", [(b"location", b"/etag")])
+    elif path.startswith("/slow"):
+      await asyncio.sleep(0.05)
+      await _send(send, 200, _PAGE)
+    else:
+      await _send(send, 404, b"")
+
+
+async def _send(send, status, body, headers=()):
+  await send({
+      "type": "http.response.start",
+      "status": status,
+      "headers": [(b"content-type", b"text/html"), *headers],
+  })
+  await send({"type": "http.response.body", "body": body})
+
+
+@pytest.fixture(scope="module")
+def local_site():
+  site = _LocalSite()
+  server = uvicorn.Server(
+      uvicorn.Config(site, host="127.0.0.1", port=0, log_level="error")
+  )
+  thread = threading.Thread(target=server.run, daemon=True)
+  thread.start()
+  while not server.started:
+    time.sleep(0.01)
+  port = server.servers[0].sockets[0].getsockname()[1]
+  yield site, f"http://127.0.0.1:{port}"
+  server.should_exit = True
+  thread.join()
+
+
+@pytest.fixture
+def site(local_site):
+  site, base_url = local_site
+  site.requests.clear()
+  site.max_active = 0
+  load_web_page_lib._page_cache.clear()
+  return site, base_url
+
+
+@pytest.mark.parametrize("path", ["/etag", "/last-modified"])
+def test_unmodified_pages_are_served_from_cache(site, path):
+  site, base_url = site
+
+  first = load_web_page(base_url + path)
+  second = load_web_page(base_url + path)
+
+  assert first == second == "This is a page about the weather."
+  assert len(site.requests) == 2
+  assert b"if-none-match" not in site.requests[0][1]
+  assert (
+      b"if-none-match" in site.requests[1][1]
+      or b"if-modified-since" in site.requests[1][1]
+  )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/etag", "/last-modified"])
+async def test_async_unmodified_pages_are_served_from_cache(site, path):
+  site, base_url = site
+  client = load_web_page_lib._get_async_client()
+
+  with mock.patch.object(client, "stream", wraps=client.stream) as stream:
+    first = await load_web_page_async(base_url + path)
+    second = await load_web_page_async(base_url + path)
+
+  assert first == second == "This is a page about the weather."
+  assert len(site.requests) == 2
+  # Both fetches go through the connection pool of the shared client.
+  assert stream.call_count == 2
+
+
+def test_async_clients_are_closed_with_their_event_loop(site):
+  _, base_url = site
+  clients = []
+
+  async def fetch():
+    clients.append(load_web_page_lib._get_async_client())
+    return await load_web_page_async(base_url + "/slow")
+
+  assert asyncio.run(fetch()) == "This is a page about the weather."
+  assert clients[0].is_closed
+  assert asyncio.run(fetch()) == "This is a page about the weather."
+
+  assert clients[1] is not clients[0]
+  assert clients[1].is_closed
+
+
+@pytest.mark.asyncio
+async def test_pages_without_validators_are_not_cached(site):
+  _, base_url = site
+
+  await load_web_page_async(base_url + "/slow")
+
+  assert len(load_web_page_lib._page_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_large_pages_are_truncated(site, monkeypatch):
+  _, base_url = site
+  monkeypatch.setattr(load_web_page_lib, "_MAX_RESPONSE_BYTES", 4096)
+
+  text = await load_web_page_async(base_url + "/large")
+  sync_text = load_web_page(base_url + "/large")
+
+  assert text.startswith("one more line of a very long page")
+  assert len(text) < 4096
+  assert sync_text == text
+
+
+@pytest.mark.asyncio
+async def test_failures_and_redirects(site):
+  _, base_url = site
+
+  assert await load_web_page_async(base_url + "/redirect") == (
+      f"Failed to fetch url: {base_url}/redirect"
+  )
+  assert load_web_page(base_url + "/missing") == (
+      f"Failed to fetch url: {base_url}/missing"
+  )
+  assert await load_web_page_async("http://127.0.0.1:1/") == (
+      "Failed to fetch url: http://127.0.0.1:1/"
+  )
+
+
+@pytest.mark.asyncio
+async def test_load_web_pages_fetches_concurrently(site, monkeypatch):
+  site, base_url = site
+  monkeypatch.setattr(load_web_page_lib, "_MAX_CONCURRENT_FETCHES", 4)
+  urls = [f"{base_url}/slow/{i}" for i in range(12)]
+
+  texts = await load_web_pages(urls + urls[:2])
+
+  assert list(texts) == urls
+  assert set(texts.values()) == {"This is a page about the weather."}
+  assert len(site.requests) == len(urls)
+  assert 1 < site.max_active <= 4
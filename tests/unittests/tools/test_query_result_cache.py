@@ -0,0 +1,137 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.tools._query_result_cache import invalidate_query_results
+from google.adk.tools._query_result_cache import normalize_sql
+from google.adk.tools._query_result_cache import QueryResultCache
+import pytest
+
+
+class _FakeTimer:
+
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self):
+    return self.now
+
+
+def _result(rows):
+  return {"status": "SUCCESS", "rows": rows}
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT a FROM t WHERE b = 1",
+        "  SELECT a\tFROM t   WHERE b = 1;",
+        "SELECT a FROM t WHERE b = 1 ; ",
+        "SELECT a -- the column\n FROM t /* the\ntable */ WHERE b = 1",
+        "SELECT a # the column\nFROM t WHERE b = 1",
+    ],
+)
+def test_normalize_sql_collapses_whitespace_and_comments(query):
+  assert normalize_sql(query) == "SELECT a FROM t WHERE b = 1"
+
+
+def test_normalize_sql_keeps_literals():
+  assert normalize_sql("SELECT 'a  -- b', `c  d` FROM t") == (
+      "SELECT 'a  -- b', `c  d` FROM t"
+  )
+  assert normalize_sql("SELECT 1 -- note\n  , 2") == "SELECT 1 , 2"
+  assert normalize_sql("SELECT 'a'") != normalize_sql("SELECT 'A'")
+
+
+def test_key_depends_on_scope_principal_and_params():
+  key = QueryResultCache.make_key("p", "user", "SELECT 1", {"x": 1})
+
+  assert key == QueryResultCache.make_key("p", "user", " SELECT 1 ", {"x": 1})
+  assert key != QueryResultCache.make_key("q", "user", "SELECT 1", {"x": 1})
+  assert key != QueryResultCache.make_key("p", "other", "SELECT 1", {"x": 1})
+  assert key != QueryResultCache.make_key("p", "user", "SELECT 1", {"x": 2})
+
+
+def test_get_returns_copies():
+  cache = QueryResultCache(ttl_seconds=60, max_bytes=1024)
+  cache.put(("p", 1), _result([{"a": 1}]))
+
+  cache.get(("p", 1))["rows"].append({"a": 2})
+
+  assert cache.get(("p", 1)) == _result([{"a": 1}])
+
+
+def test_entries_expire():
+  timer = _FakeTimer()
+  cache = QueryResultCache(ttl_seconds=10, max_bytes=1024, timer=timer)
+  cache.put(("p", 1), _result([]))
+
+  timer.now = 9.9
+  assert cache.get(("p", 1)) is not None
+  timer.now = 10.0
+  assert cache.get(("p", 1)) is None
+  assert len(cache) == 0
+  assert cache.total_bytes == 0
+
+
+def test_least_recently_used_entries_are_evicted_beyond_max_bytes():
+  entry_size = len('{"status": "SUCCESS", "rows": [0]}')
+  cache = QueryResultCache(ttl_seconds=60, max_bytes=3 * entry_size)
+  for i in range(3):
+    cache.put(("p", i), _result([i]))
+  cache.get(("p", 0))
+
+  cache.put(("p", 3), _result([3]))
+
+  assert ("p", 1) not in cache._entries
+  assert [key[1] for key in cache._entries] == [2, 0, 3]
+  assert cache.total_bytes == 3 * entry_size
+
+
+def test_results_larger_than_max_bytes_are_not_cached():
+  cache = QueryResultCache(ttl_seconds=60, max_bytes=10)
+
+  cache.put(("p", 1), _result(["x" * 100]))
+
+  assert len(cache) == 0
+
+
+def test_hit_rate():
+  cache = QueryResultCache(ttl_seconds=60, max_bytes=1024)
+  assert cache.hit_rate == 0.0
+
+  cache.get(("p", 1))
+  cache.put(("p", 1), _result([]))
+  cache.get(("p", 1))
+  cache.get(("p", 1))
+
+  assert cache.stats(hit=True) == {
+      "hit": True,
+      "hits": 2,
+      "misses": 1,
+      "hit_rate": 0.6667,
+  }
+
+
+def test_invalidate_by_scope_across_caches():
+  caches = [QueryResultCache(ttl_seconds=60, max_bytes=1024) for _ in range(2)]
+  for cache in caches:
+    cache.put(("p", 1), _result([]))
+    cache.put(("q", 1), _result([]))
+
+  invalidate_query_results("p")
+  assert [len(cache) for cache in caches] == [1, 1]
+
+  invalidate_query_results()
+  assert [len(cache) for cache in caches] == [0, 0]
+  assert caches[0].total_bytes == 0
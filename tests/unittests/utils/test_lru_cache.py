@@ -0,0 +1,55 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.utils._lru_cache import LruCache
+import pytest
+
+
+def test_get_tracks_hits_and_misses():
+  cache = LruCache(max_entries=2)
+  cache.put('a', 1)
+
+  assert cache.get('a') == 1
+  assert cache.get('b') is None
+  assert cache.hits == 1
+  assert cache.misses == 1
+
+
+def test_put_evicts_least_recently_used():
+  cache = LruCache(max_entries=2)
+  cache.put('a', 1)
+  cache.put('b', 2)
+  cache.get('a')
+  cache.put('c', 3)
+
+  assert 'a' in cache
+  assert 'b' not in cache
+  assert 'c' in cache
+  assert len(cache) == 2
+
+
+def test_pop_and_clear():
+  cache = LruCache(max_entries=2)
+  cache.put('a', 1)
+  cache.put('b', 2)
+
+  assert cache.pop('a') == 1
+  assert cache.pop('a') is None
+  cache.clear()
+  assert len(cache) == 0
+
+
+def test_rejects_non_positive_bound():
+  with pytest.raises(ValueError):
+    LruCache(max_entries=0)